@@ -5,6 +5,7 @@ Base classes that implement the CLI framework
 import importlib
 import logging
 from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 
 import click
 
@@ -274,3 +275,63 @@ class BaseCommand(click.MultiCommand):
                 return None
 
         return mod.cli if mod else click.Command(name=cmd_name, short_help=SAM_CLI_COMMANDS.get(cmd_name, ""))
+
+
+class LazyGroup(click.Group):
+    """
+    Command group which imports the package of a subcommand only when that subcommand is needed. The group lists
+    its subcommands, and renders its help text, from a registry of command names, packages and short help texts,
+    so that ``sam local --help`` doesn't pay for importing every ``sam local`` subcommand.
+
+    Like with ``BaseCommand``, a subcommand package is expected to expose its Click object as ``cli``.
+
+        >>> @click.group(
+        ...     cls=LazyGroup,
+        ...     lazy_subcommands={"invoke": ("samcli.commands.local.invoke.cli", "Invoke functions locally.")},
+        ... )
+        ... def cli():
+        ...     pass
+    """
+
+    def __init__(self, *args, lazy_subcommands: Optional[Dict[str, Tuple[str, str]]] = None, **kwargs):
+        """
+        Parameters
+        ----------
+        lazy_subcommands : Optional[Dict[str, Tuple[str, str]]]
+            Subcommand names, mapped to the package of the subcommand and its short help text
+        args
+            Other Arguments passed to super class
+        kwargs
+            Other Arguments passed to super class
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name not in self.commands and cmd_name in self.lazy_subcommands:
+            pkg_name, _ = self.lazy_subcommands[cmd_name]
+            self.add_command(importlib.import_module(pkg_name).cli, cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        names = self.list_commands(ctx)
+        if not names:
+            return
+
+        limit = formatter.width - 6 - max(len(name) for name in names)
+        rows = []
+        for name in names:
+            if name in self.commands:
+                command = self.commands[name]
+                if command.hidden:
+                    continue
+                rows.append((name, command.get_short_help_str(limit)))
+            else:
+                _, short_help = self.lazy_subcommands[name]
+                rows.append((name, short_help))
+
+        with formatter.section("Commands"):
+            formatter.write_dl(rows)
@@ -7,7 +7,7 @@ from typing import Dict, List
 # The ordering of the option lists matter, they are the order in which options will be displayed.
 
 BETA_OPTIONS: List[str] = ["beta_features"]
-OTHER_OPTIONS: List[str] = ["debug", "help"]
+OTHER_OPTIONS: List[str] = ["debug", "timings", "help"]
 
 ALL_COMMON_OPTIONS: List[str] = BETA_OPTIONS + OTHER_OPTIONS
 
@@ -31,6 +31,32 @@ def debug_option(f):
     )(f)
 
 
+def timings_option(f):
+    """
+    Configures --timings option for CLI
+
+    :param f: Callback Function to be passed to Click
+    """
+
+    def callback(ctx, param, value):
+        from samcli.lib.utils.timings import enable_timings
+
+        if value:
+            enable_timings()
+        return value
+
+    return click.option(
+        "--timings",
+        expose_value=False,
+        is_eager=True,
+        is_flag=True,
+        envvar="SAM_CLI_TIMINGS",
+        help="Print a breakdown of where time was spent once the command finishes. Set the "
+        "SAM_CLI_TIMINGS_TRACE_FILE environment variable to also export it as a Chrome trace-event JSON file.",
+        callback=callback,
+    )(f)
+
+
 def region_option(f):
     """
     Configures --region option for CLI
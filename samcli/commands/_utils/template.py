@@ -2,13 +2,17 @@
 Utilities to manipulate template
 """
 
+import copy
 import itertools
 import os
 import pathlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
 
 import jmespath
 import yaml
-from botocore.utils import set_value_from_jmespath
 
 from samcli.commands.exceptions import UserException
 from samcli.lib.samlib.resource_metadata_normalizer import ASSET_PATH_METADATA_KEY, ResourceMetadataNormalizer
@@ -22,6 +26,7 @@ from samcli.lib.utils.resources import (
     RESOURCES_WITH_LOCAL_PATHS,
     get_packageable_resource_paths,
 )
+from samcli.lib.utils.timings import traced
 from samcli.yamlhelper import yaml_dump, yaml_parse
 
 
@@ -33,6 +38,41 @@ class TemplateFailedParsingException(UserException):
     pass
 
 
+# Maximum number of parsed templates kept in memory by get_template_data
+TEMPLATE_PARSE_CACHE_SIZE = 32
+# A file modified this recently can be modified again without its modification time changing, on file systems with a
+# coarse timestamp granularity, so it isn't memoized
+_RACY_MODIFICATION_WINDOW_NS = 2 * 10**9
+
+_TemplateCacheKey = Tuple[str, int, int]
+_template_parse_cache: "OrderedDict[_TemplateCacheKey, Dict]" = OrderedDict()
+_template_parse_cache_lock = threading.Lock()
+
+
+def _get_template_cache_key(template_file) -> Optional[_TemplateCacheKey]:
+    """
+    Returns the key used to memoize the parsed template, made of the absolute path, the modification time and the
+    size of the file. Returns None if the file can't be stat'ed or was modified too recently, in which case the
+    result won't be cached.
+    """
+    try:
+        stat_result = os.stat(template_file)
+    except (OSError, TypeError, ValueError):
+        return None
+    if time.time_ns() - stat_result.st_mtime_ns < _RACY_MODIFICATION_WINDOW_NS:
+        return None
+    return os.path.abspath(template_file), stat_result.st_mtime_ns, stat_result.st_size
+
+
+def clear_template_cache() -> None:
+    """
+    Drops all parsed templates memoized by get_template_data
+    """
+    with _template_parse_cache_lock:
+        _template_parse_cache.clear()
+
+
+@traced("template.load")
 def get_template_data(template_file):
     """
     Read the template file, parse it as JSON/YAML and return the template as a dictionary.
@@ -45,17 +85,46 @@ def get_template_data(template_file):
     Returns
     -------
     Template data as a dictionary
+
+    Parsed templates are memoized by path, modification time and size. Callers are free to modify the returned
+    dictionary since a copy of the memoized template is returned on every call.
     """
+    template_dict, memoized = _load_template_data(template_file)
+    return copy.deepcopy(template_dict) if memoized else template_dict
 
+
+def _load_template_data(template_file) -> Tuple[Any, bool]:
+    """
+    Returns the parsed template, and whether it is the memoized template, which callers must not modify.
+    Reading the memoized template directly saves copying it for callers which only read the template.
+    """
     if not pathlib.Path(template_file).exists():
         raise TemplateNotFoundException("Template file not found at {}".format(template_file))
 
+    cache_key = _get_template_cache_key(template_file)
+    if cache_key:
+        with _template_parse_cache_lock:
+            cached_template = _template_parse_cache.get(cache_key)
+            if cached_template is not None:
+                _template_parse_cache.move_to_end(cache_key)
+        if cached_template is not None:
+            return cached_template, True
+
     with open(template_file, "r", encoding="utf-8") as fp:
         try:
-            return yaml_parse(fp.read())
+            template_dict = yaml_parse(fp.read())
         except (ValueError, yaml.YAMLError) as ex:
             raise TemplateFailedParsingException("Failed to parse template: {}".format(str(ex))) from ex
 
+    if cache_key and isinstance(template_dict, dict):
+        with _template_parse_cache_lock:
+            _template_parse_cache[cache_key] = template_dict
+            while len(_template_parse_cache) > TEMPLATE_PARSE_CACHE_SIZE:
+                _template_parse_cache.popitem(last=False)
+        return template_dict, True
+
+    return template_dict, False
+
 
 def move_template(src_template_path, dest_template_path, template_dict):
     """
@@ -132,6 +201,7 @@ def _update_relative_paths(template_dict, original_root, new_root):
     Updated dictionary
 
     """
+    from botocore.utils import set_value_from_jmespath
 
     for resource_type, properties in template_dict.get("Metadata", {}).items():
         if resource_type not in METADATA_WITH_LOCAL_PATHS:
@@ -293,7 +363,7 @@ def get_template_artifacts_format(template_file):
     :return: list of artifact formats
     """
 
-    template_dict = get_template_data(template_file=template_file)
+    template_dict, _ = _load_template_data(template_file)
 
     # Get a list of Resources where the artifacts format matter for packaging.
     packageable_resources = get_packageable_resource_paths()
@@ -324,7 +394,7 @@ def get_template_function_resource_ids(template_file, artifact):
     :return: list of artifact formats
     """
 
-    template_dict = get_template_data(template_file=template_file)
+    template_dict, _ = _load_template_data(template_file)
     _function_resource_ids = []
     for resource_id, resource in template_dict.get("Resources", {}).items():
         if resource.get("Properties", {}).get("PackageType", ZIP) == artifact and resource.get("Type") in [
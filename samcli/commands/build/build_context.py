@@ -6,7 +6,9 @@ import logging
 import os
 import pathlib
 import shutil
-from typing import Dict, Optional, List, Tuple
+import uuid
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, List, Tuple
 
 import click
 
@@ -27,6 +29,7 @@ from samcli.lib.build.app_builder import (
     ApplicationBuildResult,
 )
 from samcli.lib.build.build_graph import DEFAULT_DEPENDENCIES_DIR
+from samcli.lib.build.constants import HOOK_BUILD_ALL_RESOURCES_ENV_VAR
 from samcli.lib.build.bundler import EsbuildBundlerManager
 from samcli.lib.build.exceptions import (
     BuildInsideContainerError,
@@ -281,7 +284,8 @@ class BuildContext:
             for f in self.get_resources_to_build().functions:
                 EventTracker.track_event(EventName.BUILD_FUNCTION_RUNTIME.value, f.runtime)
 
-            self._build_result = builder.build()
+            with self._hook_build_all_resources_env():
+                self._build_result = builder.build()
 
             self._handle_build_post_processing(builder, self._build_result)
 
@@ -613,6 +617,22 @@ Commands you can use next
         )
         return result
 
+    @contextmanager
+    def _hook_build_all_resources_env(self) -> Iterator[None]:
+        """
+        Lets the build scripts of the hook package know that all the resources of the project are being built,
+        so that they can build them together. They build each resource on its own otherwise.
+        """
+        if not self._hook_name or self.is_building_specific_resource or self._exclude:
+            yield
+            return
+
+        os.environ[HOOK_BUILD_ALL_RESOURCES_ENV_VAR] = uuid.uuid4().hex
+        try:
+            yield
+        finally:
+            os.environ.pop(HOOK_BUILD_ALL_RESOURCES_ENV_VAR, None)
+
     @property
     def is_building_specific_resource(self) -> bool:
         """
@@ -19,7 +19,6 @@ import logging
 import os
 from typing import Dict, List, Optional
 
-import boto3
 import click
 
 from samcli.commands.deploy import exceptions as deploy_exceptions
@@ -35,8 +34,11 @@ from samcli.lib.intrinsic_resolver.intrinsics_symbol_table import IntrinsicsSymb
 from samcli.lib.package.s3_uploader import S3Uploader
 from samcli.lib.providers.sam_stack_provider import SamLocalStackProvider
 from samcli.lib.utils.boto_utils import get_boto_config_with_user_agent
+from samcli.lib.utils.lazy_import import lazy_import
 from samcli.yamlhelper import yaml_parse
 
+boto3 = lazy_import("boto3")
+
 LOG = logging.getLogger(__name__)
 
 
@@ -64,7 +64,7 @@ class InitTemplates:
             if template.get("init_location") is not None:
                 return template["init_location"]
             if template.get("directory") is not None:
-                return os.path.normpath(os.path.join(self._git_repo.local_path, template["directory"]))
+                return self.get_app_template_location(template["directory"])
             raise InvalidInitTemplateError("Invalid template. This should not be possible, please raise an issue.")
         except StopIteration as ex:
             msg = "Can't find application template " + app_template + " - check valid values in interactive init."
@@ -100,6 +100,7 @@ class InitTemplates:
                     clone_name=cloned_folder_name,
                     replace_existing=True,
                     commit=APP_TEMPLATES_REPO_COMMIT,
+                    shallow=True,
                 )
             except CloneRepoUnstableStateException as ex:
                 raise AppTemplateUpdateException(str(ex)) from ex
@@ -195,7 +196,19 @@ class InitTemplates:
         return False
 
     def get_app_template_location(self, template_directory):
-        return os.path.normpath(os.path.join(self._git_repo.local_path, template_directory))
+        location = os.path.normpath(os.path.join(self._git_repo.local_path, template_directory))
+        if not os.path.exists(location):
+            # the templates repo is cloned without the template directories, check out the selected one
+            try:
+                self._git_repo.checkout_paths([template_directory])
+            except (OSError, CloneRepoException) as ex:
+                LOG.debug("Unable to check out app template %s", template_directory, exc_info=ex)
+                msg = (
+                    f"Can't check out application template {template_directory} "
+                    f"from {self._git_repo.local_path}: {ex}"
+                )
+                raise InvalidInitTemplateError(msg) from ex
+        return location
 
     def get_manifest_path(self):
         if self._git_repo.local_path and Path(self._git_repo.local_path, self.manifest_file_name).exists():
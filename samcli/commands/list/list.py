@@ -4,19 +4,25 @@ Command group for "list" suite for commands.
 
 import click
 
-from samcli.commands.list.endpoints.command import cli as testable_resources_cli
-from samcli.commands.list.resources.command import cli as resources_cli
-from samcli.commands.list.stack_outputs.command import cli as stack_outputs_cli
+from samcli.cli.command import LazyGroup
 
 
-@click.group()
+# Individual commands under this group, which are only imported when invoked
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "resources": (
+            "samcli.commands.list.resources.command",
+            "Get a list of resources that will be deployed to CloudFormation.",
+        ),
+        "stack-outputs": (
+            "samcli.commands.list.stack_outputs.command",
+            "Get the stack outputs as defined in the SAM/CloudFormation template.",
+        ),
+        "endpoints": ("samcli.commands.list.endpoints.command", "Get a summary of the cloud endpoints in the stack."),
+    },
+)
 def cli():
     """
     Get local and deployed state of serverless application.
     """
-
-
-# Add individual commands under this group
-cli.add_command(resources_cli)
-cli.add_command(stack_outputs_cli)
-cli.add_command(testable_resources_cli)
@@ -22,6 +22,7 @@ from samcli.lib.utils import osutils
 from samcli.lib.utils.async_utils import AsyncContext
 from samcli.lib.utils.packagetype import ZIP
 from samcli.lib.utils.stream_writer import StreamWriter
+from samcli.local.docker.container_reaper import ContainerReaper
 from samcli.local.docker.exceptions import PortAlreadyInUse
 from samcli.local.docker.lambda_image import LambdaImage
 from samcli.local.docker.manager import ContainerManager
@@ -100,6 +101,7 @@ class InvokeContext:
         container_host_interface: Optional[str] = None,
         add_host: Optional[dict] = None,
         invoke_images: Optional[str] = None,
+        lazy_resolution: bool = False,
     ) -> None:
         """
         Initialize the context
@@ -154,6 +156,9 @@ class InvokeContext:
             Optional. Docker extra hosts support from --add-host parameters
         invoke_images dict
             Optional. A dictionary that defines the custom invoke image URI of each function
+        lazy_resolution bool
+            Optional. If True, only resolve the template resources of the invoked function, for commands invoking a
+            single function. Default False
         """
         self._template_file = template_file
         self._function_identifier = function_identifier
@@ -185,6 +190,7 @@ class InvokeContext:
         self._extra_hosts: Optional[Dict] = add_host
 
         self._invoke_images = invoke_images
+        self._lazy_resolution = lazy_resolution
 
         self._containers_mode = ContainersMode.COLD
         self._containers_initializing_mode = ContainersInitializationMode.LAZY
@@ -208,6 +214,7 @@ class InvokeContext:
         self._layers_downloader: Optional[LayerDownloader] = None
         self._container_manager: Optional[ContainerManager] = None
         self._lambda_runtimes: Optional[Dict[ContainersMode, LambdaRuntime]] = None
+        self._container_reaper: Optional[ContainerReaper] = None
 
         self._local_lambda_runner: Optional[LocalLambdaRunner] = None
 
@@ -279,7 +286,8 @@ class InvokeContext:
         if self._containers_initializing_mode == ContainersInitializationMode.EAGER:
             self._initialize_all_functions_containers()
 
-        for func in self._function_provider.get_all():
+        # with lazy resolution, invoking a function with inline code fails with a clear error instead
+        for func in [] if self._lazy_resolution else self._function_provider.get_all():
             if func.packagetype == ZIP and func.inlinecode:
                 LOG.warning(
                     "Warning: Inline code found for function %s."
@@ -301,6 +309,9 @@ class InvokeContext:
 
         if self._containers_mode == ContainersMode.WARM:
             self._clean_running_containers_and_related_resources()
+        elif self._container_reaper:
+            # wait for the teardown of the containers of the finished invokes, even when Ctrl+C was pressed
+            self._container_reaper.drain()
 
     def _initialize_all_functions_containers(self) -> None:
         """
@@ -375,9 +386,11 @@ class InvokeContext:
             image_builder = LambdaImage(
                 layer_downloader, self._skip_pull_image, self._force_image_build, invoke_images=self._invoke_images
             )
+            # the containers of the cold invokes are torn down in the background, off the path of the responses
+            self._container_reaper = ContainerReaper(cast(ContainerManager, self._container_manager))
             self._lambda_runtimes = {
                 ContainersMode.WARM: WarmLambdaRuntime(self._container_manager, image_builder),
-                ContainersMode.COLD: LambdaRuntime(self._container_manager, image_builder),
+                ContainersMode.COLD: LambdaRuntime(self._container_manager, image_builder, self._container_reaper),
             }
 
         return self._lambda_runtimes[self._containers_mode]
@@ -468,6 +481,7 @@ class InvokeContext:
                 self._template_file,
                 parameter_overrides=self._parameter_overrides,
                 global_parameter_overrides=self._global_parameter_overrides,
+                lazy_resolution=self._lazy_resolution,
             )
             return stacks
         except (TemplateNotFoundException, TemplateFailedParsingException) as ex:
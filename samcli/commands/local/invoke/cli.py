@@ -200,6 +200,8 @@ def do_cli(  # pylint: disable=R0914
             container_host_interface=container_host_interface,
             add_host=add_host,
             invoke_images=processed_invoke_images,
+            # only the invoked function and its layers are needed
+            lazy_resolution=True,
         ) as context:
             # Invoke the function
             context.local_lambda_runner.invoke(
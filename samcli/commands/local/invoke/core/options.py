@@ -46,7 +46,7 @@ ARTIFACT_LOCATION_OPTIONS: List[str] = [
     "layer_cache_basedir",
 ]
 
-OTHER_OPTIONS: List[str] = ["debug"]
+OTHER_OPTIONS: List[str] = ["debug", "timings"]
 
 TERRAFORM_HOOK_OPTIONS: List[str] = ["terraform_plan_file"]
 
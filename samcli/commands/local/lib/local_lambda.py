@@ -4,10 +4,8 @@ Implementation of Local Lambda runner
 
 import logging
 import os
-from typing import Any, Dict, Optional, cast
-
-import boto3
-from botocore.credentials import Credentials
+import threading
+from typing import TYPE_CHECKING, Any, Dict, NamedTuple, Optional, Union, cast
 
 from samcli.commands.local.lib.debug_context import DebugContext
 from samcli.commands.local.lib.exceptions import (
@@ -20,6 +18,7 @@ from samcli.lib.providers.provider import Function
 from samcli.lib.providers.sam_function_provider import SamFunctionProvider
 from samcli.lib.utils.architecture import validate_architecture_runtime
 from samcli.lib.utils.codeuri import resolve_code_path
+from samcli.lib.utils.lazy_import import lazy_import
 from samcli.lib.utils.packagetype import IMAGE, ZIP
 from samcli.lib.utils.stream_writer import StreamWriter
 from samcli.local.docker.container import ContainerConnectionTimeoutException, ContainerResponseException
@@ -28,9 +27,24 @@ from samcli.local.lambdafn.env_vars import EnvironmentVariables
 from samcli.local.lambdafn.exceptions import FunctionNotFound
 from samcli.local.lambdafn.runtime import LambdaRuntime
 
+if TYPE_CHECKING:  # pragma: no cover
+    from botocore.credentials import Credentials
+
+boto3 = lazy_import("boto3")
+
 LOG = logging.getLogger(__name__)
 
 
+class _CachedInvokeConfig(NamedTuple):
+    """
+    Invoke configuration of a function, with the inputs it was built from
+    """
+
+    function: Function
+    aws_creds: Dict[str, str]
+    config: FunctionConfig
+
+
 class LocalLambdaRunner:
     """
     Runs Lambda functions locally. This class is a wrapper around the `samcli.local` library which takes care
@@ -74,18 +88,33 @@ class LocalLambdaRunner:
         self.cwd = cwd
         self.aws_profile = aws_profile
         self.aws_region = aws_region
+        self._invoke_configs: Dict[str, _CachedInvokeConfig] = {}
+        self._invoke_config_lock = threading.Lock()
+        self._invoke_config_hits = 0
+        self._invoke_config_misses = 0
         self.env_vars_values = env_vars_values or {}
         self.debug_context = debug_context
-        self._boto3_session_creds: Optional[Credentials] = None
+        self._boto3_session_creds: Optional["Credentials"] = None
         self._boto3_region: Optional[str] = None
         self.container_host = container_host
         self.container_host_interface = container_host_interface
         self.extra_hosts = extra_hosts
 
+    @property
+    def env_vars_values(self) -> Dict[Any, Any]:
+        return self._env_vars_values
+
+    @env_vars_values.setter
+    def env_vars_values(self, env_vars_values: Dict[Any, Any]) -> None:
+        # the invoke configurations include the environment variables, they are rebuilt with the new values
+        with self._invoke_config_lock:
+            self._env_vars_values = env_vars_values
+            self._invoke_configs = {}
+
     def invoke(
         self,
         function_identifier: str,
-        event: str,
+        event: Union[str, bytes],
         stdout: Optional[StreamWriter] = None,
         stderr: Optional[StreamWriter] = None,
     ) -> None:
@@ -99,8 +128,8 @@ class LocalLambdaRunner:
         ----------
         function_identifier str
             Identifier of the Lambda function to invoke, it can be logicalID, function name or full path
-        event str
-            Event data passed to the function. Must be a valid JSON String.
+        event Union[str, bytes]
+            Event data passed to the function. Must be a valid JSON String, or its UTF-8 encoded bytes.
         stdout samcli.lib.utils.stream_writer.StreamWriter
             Stream writer to write the output of the Lambda function to.
         stderr samcli.lib.utils.stream_writer.StreamWriter
@@ -187,7 +216,41 @@ class LocalLambdaRunner:
 
     def get_invoke_config(self, function: Function) -> FunctionConfig:
         """
-        Returns invoke configuration to pass to Lambda Runtime to invoke the given function
+        Returns invoke configuration to pass to Lambda Runtime to invoke the given function.
+
+        The configuration is cached for each function, and only built again when the function changed in the
+        template, or when the AWS credentials changed. It must not be modified.
+
+        :param samcli.commands.local.lib.provider.Function function: Lambda function to generate the configuration for
+        :return samcli.local.lambdafn.config.FunctionConfig: Function configuration to pass to Lambda runtime
+        """
+        aws_creds = self.get_aws_creds()
+        with self._invoke_config_lock:
+            cached = self._invoke_configs.get(function.full_path)
+            if cached and cached.function == function and cached.aws_creds == aws_creds:
+                self._invoke_config_hits += 1
+                self._log_invoke_config_cache_stats("Reusing", function)
+                return cached.config
+            self._invoke_config_misses += 1
+
+        config = self._make_invoke_config(function)
+        with self._invoke_config_lock:
+            self._invoke_configs[function.full_path] = _CachedInvokeConfig(function, aws_creds, config)
+            self._log_invoke_config_cache_stats("Built", function)
+        return config
+
+    def _log_invoke_config_cache_stats(self, action: str, function: Function) -> None:
+        LOG.debug(
+            "%s the invoke configuration of %s (cache hits: %d, misses: %d)",
+            action,
+            function.full_path,
+            self._invoke_config_hits,
+            self._invoke_config_misses,
+        )
+
+    def _make_invoke_config(self, function: Function) -> FunctionConfig:
+        """
+        Builds the invoke configuration of the given function
 
         :param samcli.commands.local.lib.provider.Function function: Lambda function to generate the configuration for
         :return samcli.local.lambdafn.config.FunctionConfig: Function configuration to pass to Lambda runtime
@@ -307,7 +370,7 @@ class LocalLambdaRunner:
             aws_creds=aws_creds,
         )  # EnvironmentVariables is not yet annotated with type hints, disable mypy check for now. type: ignore
 
-    def _get_session_creds(self) -> Optional[Credentials]:
+    def _get_session_creds(self) -> Optional["Credentials"]:
         if self._boto3_session_creds is None:
             # to pass command line arguments for region & profile to setup boto3 default session
             LOG.debug("Loading AWS credentials from session with profile '%s'", self.aws_profile)
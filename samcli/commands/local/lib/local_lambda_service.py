@@ -4,6 +4,7 @@ Connects the CLI with Local Lambda Invoke Service.
 
 import logging
 
+from samcli.local.lambda_service.event_invoker import DEFAULT_EVENT_INVOKE_WORKERS, EventInvoker
 from samcli.local.lambda_service.local_lambda_invoke_service import LocalLambdaInvokeService
 
 LOG = logging.getLogger(__name__)
@@ -15,7 +16,7 @@ class LocalLambdaService:
     that are defined in a SAM file.
     """
 
-    def __init__(self, lambda_invoke_context, port, host, ssl_context=None):
+    def __init__(self, lambda_invoke_context, port, host, ssl_context=None, event_failure_destination=None):
         """
         Initialize the Local Lambda Invoke service.
 
@@ -25,6 +26,8 @@ class LocalLambdaService:
         :param string host: Local hostname or IP address to bind to
         :param tuple(string, string) ssl_context: Optional, path to ssl certificate and key files to start service
             in https
+        :param string event_failure_destination: Optional, directory where the events of the Event invocations
+            which failed are written
         """
 
         self.port = port
@@ -32,6 +35,7 @@ class LocalLambdaService:
         self.ssl_context = ssl_context
         self.lambda_runner = lambda_invoke_context.local_lambda_runner
         self.stderr_stream = lambda_invoke_context.stderr
+        self.event_failure_destination = event_failure_destination
 
     def start(self):
         """
@@ -46,12 +50,20 @@ class LocalLambdaService:
         # contains the response to the API which is sent out as HTTP response. Only stderr needs to be printed
         # to the console or a log file. stderr from Docker container contains runtime logs and output of print
         # statements from the Lambda function
+        event_invoker = EventInvoker(
+            self.lambda_runner,
+            failure_destination=self.event_failure_destination,
+            stderr=self.stderr_stream,
+            # a function being debugged can only run in the main thread, which handles the requests then
+            max_workers=0 if self.lambda_runner.is_debugging() else DEFAULT_EVENT_INVOKE_WORKERS,
+        )
         service = LocalLambdaInvokeService(
             lambda_runner=self.lambda_runner,
             port=self.port,
             host=self.host,
             ssl_context=self.ssl_context,
             stderr=self.stderr_stream,
+            event_invoker=event_invoker,
         )
 
         service.create()
@@ -61,4 +73,8 @@ class LocalLambdaService:
             " through the endpoint."
         )
 
-        service.run()
+        try:
+            service.run()
+        finally:
+            # let the Event invocations in progress complete, so that their containers are torn down
+            event_invoker.shutdown()
@@ -7,11 +7,13 @@ import os
 import tempfile
 from urllib.parse import parse_qs, urlparse
 
-import boto3
 import botocore
 
+from samcli.lib.utils.lazy_import import lazy_import
 from samcli.yamlhelper import yaml_parse
 
+boto3 = lazy_import("boto3")
+
 LOG = logging.getLogger(__name__)
 _FN_TRANSFORM = "Fn::Transform"
 
@@ -5,21 +5,23 @@ setting up stdin/stdout etc
 
 import click
 
-from .generate_event.cli import cli as generate_event_cli
-from .invoke.cli import cli as invoke_cli
-from .start_api.cli import cli as start_api_cli
-from .start_lambda.cli import cli as start_lambda_cli
+from samcli.cli.command import LazyGroup
 
 
-@click.group()
+# Individual commands under this group, which are only imported when invoked
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "invoke": ("samcli.commands.local.invoke.cli", "Invoke AWS serverless functions locally."),
+        "start-api": (
+            "samcli.commands.local.start_api.cli",
+            "Run & test AWS serverless functions locally as a HTTP API.",
+        ),
+        "generate-event": ("samcli.commands.local.generate_event.cli", "Generate events for Lambda functions."),
+        "start-lambda": ("samcli.commands.local.start_lambda.cli", "Emulate AWS serverless functions locally."),
+    },
+)
 def cli():
     """
     Run your Serverless application locally for quick development & testing
     """
-
-
-# Add individual commands under this group
-cli.add_command(invoke_cli)
-cli.add_command(start_api_cli)
-cli.add_command(generate_event_cli)
-cli.add_command(start_lambda_cli)
@@ -59,6 +59,14 @@ DESCRIPTION = """
 )
 @skip_prepare_infra_option
 @service_common_options(3001)
+@click.option(
+    "--event-failure-destination",
+    default=None,
+    type=click.Path(file_okay=False, dir_okay=True, writable=True),
+    help="Local directory where the on-failure destination records of the Event invocations are written, when all "
+    "their attempts failed or they exceeded their maximum age. It stands in for the DestinationConfig of the "
+    "EventInvokeConfig of the functions.",
+)
 @invoke_common_options
 @warm_containers_common_options
 @local_common_options
@@ -74,6 +82,7 @@ def cli(
     # start-lambda Specific Options
     host,
     port,
+    event_failure_destination,
     # Common Options for Lambda Invoke
     template_file,
     env_vars,
@@ -132,6 +141,7 @@ def cli(
         add_host,
         invoke_image,
         hook_name,
+        event_failure_destination,
     )  # pragma: no cover
 
 
@@ -160,6 +170,7 @@ def do_cli(  # pylint: disable=R0914
     add_host,
     invoke_image,
     hook_name,
+    event_failure_destination=None,
 ):
     """
     Implementation of the ``cli`` method, just separated out for unit testing purposes
@@ -206,7 +217,12 @@ def do_cli(  # pylint: disable=R0914
             add_host=add_host,
             invoke_images=processed_invoke_images,
         ) as invoke_context:
-            service = LocalLambdaService(lambda_invoke_context=invoke_context, port=port, host=host)
+            service = LocalLambdaService(
+                lambda_invoke_context=invoke_context,
+                port=port,
+                host=host,
+                event_failure_destination=event_failure_destination,
+            )
             service.start()
             command_suggestions = generate_next_command_recommendation(
                 [
@@ -42,6 +42,7 @@ CONTAINER_OPTION_NAMES: List[str] = [
 ARTIFACT_LOCATION_OPTIONS: List[str] = [
     "log_file",
     "layer_cache_basedir",
+    "event_failure_destination",
 ]
 
 EXTENSION_OPTIONS: List[str] = ["hook_name", "skip_prepare_infra"]
@@ -2,6 +2,8 @@
 Consumers that will print out events to console
 """
 
+from typing import List
+
 import click
 
 from samcli.lib.observability.cw_logs.cw_log_event import CWLogEvent
@@ -26,3 +28,9 @@ class CWConsoleEventConsumer(ObservabilityEventConsumer[CWLogEvent]):
 
     def consume(self, event: CWLogEvent):
         click.echo(event.message, nl=self._add_newline)
+
+    def consume_all(self, events: List[CWLogEvent]):
+        # a single write for the whole batch
+        if events:
+            separator = "\n" if self._add_newline else ""
+            click.echo(separator.join(event.message for event in events), nl=self._add_newline)
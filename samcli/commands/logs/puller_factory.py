@@ -21,6 +21,7 @@ from samcli.lib.observability.cw_logs.cw_log_formatters import (
 )
 from samcli.lib.observability.cw_logs.cw_log_group_provider import LogGroupProvider
 from samcli.lib.observability.cw_logs.cw_log_puller import CWLogPuller
+from samcli.lib.observability.cw_logs.cw_log_tail_scheduler import CWLogTailScheduler
 from samcli.lib.observability.observability_info_puller import (
     ObservabilityCombinedPuller,
     ObservabilityEventConsumer,
@@ -78,7 +79,7 @@ def generate_puller(
     """
     if additional_cw_log_groups is None:
         additional_cw_log_groups = []
-    pullers: List[ObservabilityPuller] = []
+    cw_log_pullers: List[CWLogPuller] = []
 
     # populate all puller instances for given resources
     for resource_information in resource_information_list:
@@ -92,7 +93,7 @@ def generate_puller(
             continue
 
         consumer = generate_consumer(filter_pattern, output, resource_information.logical_resource_id)
-        pullers.append(
+        cw_log_pullers.append(
             CWLogPuller(
                 boto_client_provider("logs"),
                 consumer,
@@ -106,7 +107,7 @@ def generate_puller(
         consumer = generate_consumer(filter_pattern, output)
         logs_client = boto_client_provider("logs")
         _validate_cw_log_group_name(cw_log_group, logs_client)
-        pullers.append(
+        cw_log_pullers.append(
             CWLogPuller(
                 logs_client,
                 consumer,
@@ -114,6 +115,9 @@ def generate_puller(
             )
         )
 
+    # tail all the log groups together, within a shared budget of CloudWatch Logs API requests
+    pullers: List[ObservabilityPuller] = [CWLogTailScheduler(cw_log_pullers)] if cw_log_pullers else []
+
     # if tracing flag is set, add the xray traces puller to fetch debug traces
     if include_tracing:
         trace_puller = generate_trace_puller(boto_client_provider("xray"), output)
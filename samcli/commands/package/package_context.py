@@ -19,9 +19,7 @@ import logging
 import os
 from typing import List, Optional
 
-import boto3
 import click
-import docker
 
 from samcli.commands.package.exceptions import PackageFailedError
 from samcli.lib.constants import DOCKER_MIN_API_VERSION
@@ -34,10 +32,14 @@ from samcli.lib.package.uploaders import Uploaders
 from samcli.lib.providers.provider import ResourceIdentifier, Stack, get_resource_full_path_by_id
 from samcli.lib.providers.sam_stack_provider import SamLocalStackProvider
 from samcli.lib.utils.boto_utils import get_boto_config_with_user_agent
+from samcli.lib.utils.lazy_import import lazy_import
 from samcli.lib.utils.preview_runtimes import PREVIEW_RUNTIMES
 from samcli.lib.utils.resources import AWS_LAMBDA_FUNCTION, AWS_SERVERLESS_FUNCTION
 from samcli.yamlhelper import yaml_dump
 
+boto3 = lazy_import("boto3")
+docker = lazy_import("docker")
+
 LOG = logging.getLogger(__name__)
 
 
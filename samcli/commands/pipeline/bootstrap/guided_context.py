@@ -10,7 +10,6 @@ from typing import Callable, List, Optional, Tuple
 from xmlrpc.client import boolean
 
 import click
-from botocore.credentials import EnvProvider
 
 from samcli.commands.exceptions import AWSServiceClientError
 from samcli.commands.pipeline.bootstrap.oidc_config import (
@@ -91,6 +90,8 @@ class GuidedContext:
                 """
             )
         )
+        from botocore.credentials import EnvProvider
+
         has_env_creds = os.getenv(EnvProvider.ACCESS_KEY) and os.getenv(EnvProvider.SECRET_KEY)
         click.echo(f"\t1 - Environment variables{' (not available)' if not has_env_creds else ''}")
         for i, profile in enumerate(profiles):
@@ -5,17 +5,21 @@ setting up stdin/stdout etc
 
 import click
 
-from .bootstrap.cli import cli as bootstrap_cli
-from .init.cli import cli as init_cli
+from samcli.cli.command import LazyGroup
 
 
-@click.group()
+# Individual commands under this group, which are only imported when invoked
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "bootstrap": (
+            "samcli.commands.pipeline.bootstrap.cli",
+            "Generates the required AWS resources to connect your CI/CD system.",
+        ),
+        "init": ("samcli.commands.pipeline.init.cli", "Generates a CI/CD pipeline configuration file."),
+    },
+)
 def cli() -> None:
     """
     Manage the continuous delivery of the application
     """
-
-
-# Add individual commands under this group
-cli.add_command(bootstrap_cli)
-cli.add_command(init_cli)
@@ -3,7 +3,6 @@
 import json
 import logging
 
-import boto3
 import click
 
 from samcli.cli.cli_config_file import ConfigProvider, configuration_option, save_params_option
@@ -13,8 +12,10 @@ from samcli.commands._utils.command_exception_handler import command_exception_h
 from samcli.commands._utils.options import template_common_option
 from samcli.commands._utils.template import TemplateFailedParsingException, TemplateNotFoundException, get_template_data
 from samcli.lib.telemetry.metric import track_command
+from samcli.lib.utils.lazy_import import lazy_import
 from samcli.lib.utils.version_checker import check_newer_version
-from samcli.vendor.serverlessrepo.publish import CREATE_APPLICATION
+
+boto3 = lazy_import("boto3")
 
 LOG = logging.getLogger(__name__)
 
@@ -131,6 +132,8 @@ def _gen_success_message(publish_output):
     str
         Detailed success message
     """
+    from samcli.vendor.serverlessrepo.publish import CREATE_APPLICATION
+
     application_id = publish_output.get("application_id")
     details = json.dumps(publish_output.get("details"), indent=2)
 
@@ -2,6 +2,7 @@
 
 import logging
 from io import TextIOWrapper
+from typing import List, Optional
 
 import click
 
@@ -17,9 +18,10 @@ from samcli.lib.cli_validation.remote_invoke_options_validations import (
     stack_name_or_resource_id_atleast_one_option_validation,
 )
 from samcli.lib.remote_invoke.remote_invoke_executors import RemoteInvokeOutputFormat
+from samcli.lib.remote_invoke.remote_invoke_load_generator import DEFAULT_LOAD_CONCURRENCY
 from samcli.lib.telemetry.event import EventTracker
 from samcli.lib.telemetry.metric import track_command
-from samcli.lib.utils.resources import AWS_LAMBDA_FUNCTION
+from samcli.lib.utils.resources import AWS_LAMBDA_FUNCTION, AWS_STEPFUNCTIONS_STATEMACHINE
 from samcli.lib.utils.version_checker import check_newer_version
 
 LOG = logging.getLogger(__name__)
@@ -34,11 +36,15 @@ DESCRIPTION = """
   An event body can be passed using either -e (--event) or --event-file parameter.
   
   This command can be used to invoke a Lambda Function and get the output payload, start a State Machine execution
-  and wait for the output of the final step, send a message to SQS Queue, or put a data record to
-  Kinesis Data Streams.
+  and wait for the output of the final step (or only start it with --async), send a message to SQS Queue, or put a
+  data record to Kinesis Data Streams.
 
-  Returned response will be written to stdout. Lambda logs and Step Function execution
-  errors will be written to stderr.
+  Returned response will be written to stdout. Lambda logs, Step Function execution history
+  and errors will be written to stderr.
+
+  To generate load, send the event many times with --repeat, or the events of a JSON lines file with --events-file.
+  Events are sent in batches where the service supports it, with --concurrency requests in flight and optionally at
+  --rate events per second, and a summary of the latencies and errors is written instead of the responses.
 """
 
 
@@ -66,6 +72,11 @@ DESCRIPTION = """
     type=click.File("r", encoding="utf-8"),
     help="The file that contains the event that will be sent to the resource.",
 )
+@click.option(
+    "--events-file",
+    type=click.File("r", encoding="utf-8"),
+    help="The file that contains the events to send in load mode, one event per line.",
+)
 @click.option(
     "--test-event-name",
     help="Name of the remote test event to send to the resource",
@@ -77,6 +88,33 @@ DESCRIPTION = """
     default=RemoteInvokeOutputFormat.TEXT.name.lower(),
     type=RemoteInvokeOutputFormatType(RemoteInvokeOutputFormat),
 )
+@click.option(
+    "--async",
+    "asynchronous",
+    is_flag=True,
+    default=False,
+    help="Start the execution of a Step Functions state machine and print its ARN, without waiting for the "
+    "execution to complete.",
+)
+@click.option(
+    "--repeat",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of times the event, or all the events of --events-file, are sent. "
+    "Sending an event more than once generates load, and writes a summary instead of the responses.",
+)
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=DEFAULT_LOAD_CONCURRENCY,
+    help="Maximum number of requests in flight when generating load.",
+)
+@click.option(
+    "--rate",
+    type=click.FloatRange(min=0, min_open=True),
+    help="Number of events sent per second when generating load. Events are sent as fast as --concurrency allows "
+    "by default.",
+)
 @remote_invoke_parameter_option
 @stack_name_or_resource_id_atleast_one_option_validation
 @event_and_event_file_options_validation
@@ -94,7 +132,12 @@ def cli(
     resource_id: str,
     event: str,
     event_file: TextIOWrapper,
+    events_file: Optional[TextIOWrapper],
     output: RemoteInvokeOutputFormat,
+    asynchronous: bool,
+    repeat: int,
+    concurrency: int,
+    rate: Optional[float],
     test_event_name: str,
     parameter: dict,
     save_params: bool,
@@ -110,7 +153,12 @@ def cli(
         resource_id,
         event,
         event_file,
+        events_file,
         output,
+        asynchronous,
+        repeat,
+        concurrency,
+        rate,
         parameter,
         test_event_name,
         ctx.region,
@@ -125,7 +173,12 @@ def do_cli(
     resource_id: str,
     event: str,
     event_file: TextIOWrapper,
+    events_file: Optional[TextIOWrapper],
     output: RemoteInvokeOutputFormat,
+    asynchronous: bool,
+    repeat: int,
+    concurrency: int,
+    rate: Optional[float],
     parameter: dict,
     test_event_name: str,
     region: str,
@@ -174,15 +227,46 @@ def do_cli(
                 LOG.info("Note: remote event is only supported for AWS Lambda Function resource.")
                 test_event_name = ""
 
+            if (
+                asynchronous
+                and remote_invoke_context.resource_summary
+                and remote_invoke_context.resource_summary.resource_type != AWS_STEPFUNCTIONS_STATEMACHINE
+            ):
+                LOG.info("Note: --async is only supported for Step Functions state machines.")
+                asynchronous = False
+
             event_type = RemoteInvokeEventType.get_event_type(
                 event=event,
-                event_file=event_file,
+                event_file=event_file or events_file,
                 test_event_name=test_event_name,
             )
             EventTracker.track_event("RemoteInvokeEventType", event_type)
 
+            if events_file or repeat > 1:
+                if asynchronous:
+                    LOG.info("Note: --async is ignored when generating load.")
+                if events_file:
+                    remote_invoke_inputs = [
+                        RemoteInvokeExecutionInfo(
+                            payload=payload, payload_file=None, parameters=parameter, output_format=output
+                        )
+                        for payload in _read_events(events_file)
+                    ]
+                else:
+                    remote_invoke_inputs = [
+                        RemoteInvokeExecutionInfo(
+                            payload=event, payload_file=event_file, parameters=parameter, output_format=output
+                        )
+                    ]
+                remote_invoke_context.run_load(remote_invoke_inputs, output, repeat, concurrency, rate)
+                return
+
             remote_invoke_input = RemoteInvokeExecutionInfo(
-                payload=event, payload_file=event_file, parameters=parameter, output_format=output
+                payload=event,
+                payload_file=event_file,
+                parameters=parameter,
+                output_format=output,
+                asynchronous=asynchronous,
             )
 
             remote_invoke_context.run(remote_invoke_input=remote_invoke_input)
@@ -195,3 +279,10 @@ def do_cli(
         NoRegionError,
     ) as ex:
         raise UserException(str(ex), wrapped_from=ex.__class__.__name__) from ex
+
+
+def _read_events(events_file: TextIOWrapper) -> List[str]:
+    """
+    Reads the events of a JSON lines file, one event per non-empty line
+    """
+    return [line.strip() for line in events_file if line.strip()]
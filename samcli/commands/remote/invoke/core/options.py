@@ -12,20 +12,23 @@ from samcli.cli.row_modifiers import RowDefinition
 
 INFRASTRUCTURE_OPTION_NAMES: List[str] = ["stack_name"]
 
-INPUT_EVENT_OPTIONS: List[str] = ["event", "event_file", "test_event_name"]
+INPUT_EVENT_OPTIONS: List[str] = ["event", "event_file", "events_file", "test_event_name"]
 
-ADDITIONAL_OPTIONS: List[str] = ["parameter", "output"]
+ADDITIONAL_OPTIONS: List[str] = ["parameter", "output", "asynchronous"]
+
+LOAD_OPTIONS: List[str] = ["repeat", "concurrency", "rate"]
 
 AWS_CREDENTIAL_OPTION_NAMES: List[str] = ["region", "profile"]
 
 CONFIGURATION_OPTION_NAMES: List[str] = ["config_env", "config_file"] + SAVE_PARAMS_OPTIONS
 
-OTHER_OPTIONS: List[str] = ["debug"]
+OTHER_OPTIONS: List[str] = ["debug", "timings"]
 
 ALL_OPTIONS: List[str] = (
     INFRASTRUCTURE_OPTION_NAMES
     + INPUT_EVENT_OPTIONS
     + ADDITIONAL_OPTIONS
+    + LOAD_OPTIONS
     + AWS_CREDENTIAL_OPTION_NAMES
     + CONFIGURATION_OPTION_NAMES
     + ALL_COMMON_OPTIONS
@@ -37,6 +40,7 @@ OPTIONS_INFO: Dict[str, Dict] = {
     },
     "Input Event Options": {"option_names": {opt: {"rank": idx} for idx, opt in enumerate(INPUT_EVENT_OPTIONS)}},
     "Additional Options": {"option_names": {opt: {"rank": idx} for idx, opt in enumerate(ADDITIONAL_OPTIONS)}},
+    "Load Options": {"option_names": {opt: {"rank": idx} for idx, opt in enumerate(LOAD_OPTIONS)}},
     "AWS Credential Options": {
         "option_names": {opt: {"rank": idx} for idx, opt in enumerate(AWS_CREDENTIAL_OPTION_NAMES)}
     },
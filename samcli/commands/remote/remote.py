@@ -5,17 +5,18 @@ cloud resources such as Lambda Function.
 
 import click
 
-from samcli.commands.remote.invoke.cli import cli as invoke_cli
-from samcli.commands.remote.test_event.test_event import cli as event_cli
+from samcli.cli.command import LazyGroup
 
 
-@click.group()
+# Individual commands under this group, which are only imported when invoked
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "invoke": ("samcli.commands.remote.invoke.cli", "Invoke a deployed resource in the cloud"),
+        "test-event": ("samcli.commands.remote.test_event.test_event", "Manage remote test events"),
+    },
+)
 def cli():
     """
     Interact with your Serverless application in the cloud for quick development & testing
     """
-
-
-# Add individual commands under this group
-cli.add_command(invoke_cli)
-cli.add_command(event_cli)
@@ -2,9 +2,10 @@
 Context object used by `sam remote invoke` command
 """
 
+import json
 import logging
 from dataclasses import dataclass
-from typing import Optional, cast
+from typing import List, Optional, cast
 
 from botocore.exceptions import ClientError
 
@@ -22,6 +23,7 @@ from samcli.lib.remote_invoke.remote_invoke_executors import (
     RemoteInvokeConsumer,
     RemoteInvokeExecutionInfo,
     RemoteInvokeLogOutput,
+    RemoteInvokeOutputFormat,
     RemoteInvokeResponse,
 )
 from samcli.lib.remote_invoke.sqs_invoke_executors import get_queue_url_from_arn
@@ -112,6 +114,56 @@ class RemoteInvokeContext:
 
         remote_invoke_executor.execute(remote_invoke_input)
 
+    def run_load(
+        self,
+        remote_invoke_inputs: List[RemoteInvokeExecutionInfo],
+        output_format: RemoteInvokeOutputFormat,
+        repeat: int,
+        concurrency: int,
+        rate: Optional[float] = None,
+    ) -> None:
+        """
+        Sends each of the inputs repeat times to the resource in batches, with concurrent requests, and writes a
+        summary of the latencies and the errors of the requests to stdout. The responses are not written.
+
+        Parameters
+        ----------
+        remote_invoke_inputs: List[RemoteInvokeExecutionInfo]
+            Inputs to send, in order
+        output_format: RemoteInvokeOutputFormat
+            Format of the summary
+        repeat: int
+            Number of times all the inputs are sent
+        concurrency: int
+            Maximum number of requests in flight
+        rate: Optional[float]
+            Events sent per second, as fast as the concurrency allows if not set
+        """
+        if not self.resource_summary:
+            raise self.missing_resource_exception()
+
+        remote_invoke_executor_factory = RemoteInvokeExecutorFactory(self._boto_client_provider)
+        remote_invoke_executor = remote_invoke_executor_factory.create_remote_invoke_executor(
+            self.resource_summary,
+            output_format,
+            DefaultRemoteInvokeResponseConsumer(self.stdout),
+            DefaultRemoteInvokeLogConsumer(self.stderr),
+        )
+        if not remote_invoke_executor:
+            raise ResourceNotSupportedForRemoteInvoke(
+                f"Resource type {self.resource_summary.resource_type} is not supported for remote invoke."
+            )
+        if not remote_invoke_executor.supports_load:
+            raise ResourceNotSupportedForRemoteInvoke(
+                f"Resource type {self.resource_summary.resource_type} doesn't support sending events in load mode."
+            )
+
+        report = remote_invoke_executor.execute_load(remote_invoke_inputs, repeat, concurrency, rate)
+        if output_format == RemoteInvokeOutputFormat.JSON:
+            self.stdout.write_str(json.dumps(report.to_dict(), indent=2) + "\n")
+        else:
+            self.stdout.write_str(report.format() + "\n")
+
     @property
     def resource_summary(self):
         if not self._resource_summary:
@@ -2,20 +2,21 @@
 
 import click
 
-from samcli.commands.remote.test_event.delete.cli import cli as delete_cli
-from samcli.commands.remote.test_event.get.cli import cli as get_cli
-from samcli.commands.remote.test_event.list.cli import cli as list_cli
-from samcli.commands.remote.test_event.put.cli import cli as put_cli
+from samcli.cli.command import LazyGroup
 
 
-@click.group("test-event")
+# Individual commands under this group, which are only imported when invoked
+@click.group(
+    "test-event",
+    cls=LazyGroup,
+    lazy_subcommands={
+        "delete": ("samcli.commands.remote.test_event.delete.cli", "Delete a remote test event for a function"),
+        "get": ("samcli.commands.remote.test_event.get.cli", "Get the contents of a remote test event"),
+        "put": ("samcli.commands.remote.test_event.put.cli", "Put a remote test event."),
+        "list": ("samcli.commands.remote.test_event.list.cli", "List remote test events for a function"),
+    },
+)
 def cli():
     """
     Manage remote test events
     """
-
-
-cli.add_command(delete_cli)
-cli.add_command(get_cli)
-cli.add_command(put_cli)
-cli.add_command(list_cli)
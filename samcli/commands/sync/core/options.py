@@ -43,7 +43,7 @@ ADDITIONAL_OPTIONS: List[str] = [
     "build_in_source",
     "watch_exclude",
 ]
-OTHER_OPTIONS: List[str] = ["debug", "help"]
+OTHER_OPTIONS: List[str] = ["debug", "timings", "help"]
 
 ALL_OPTIONS: List[str] = (
     REQUIRED_OPTIONS
@@ -4,10 +4,8 @@ CLI Command for Validating a SAM Template
 
 import os
 
-import boto3
 import click
 from botocore.exceptions import NoCredentialsError
-from samtranslator.translator.arn_generator import NoRegionFound
 
 from samcli.cli.cli_config_file import ConfigProvider, configuration_option, save_params_option
 from samcli.cli.context import Context
@@ -64,6 +62,8 @@ def do_cli(ctx, template, lint):
     """
     Implementation of the ``cli`` method, just separated out for unit testing purposes
     """
+    import boto3
+    from samtranslator.translator.arn_generator import NoRegionFound
     from samtranslator.translator.managed_policy_translator import ManagedPolicyLoader
 
     from samcli.commands.exceptions import UserException
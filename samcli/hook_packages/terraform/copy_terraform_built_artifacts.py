@@ -10,6 +10,12 @@ It consists of 5 steps:
 5. parse the output to locate the built artifact, and move it to the SAM CLI 
 build artifact directory (find_and_copy_assets)
 
+With --batch, when `sam build` builds all the resources of the project, steps 1 to 4 run once
+for all the SAM CLI Metadata resources listed in sam_metadata_targets.json, by the first build of
+the sam command to get to them. The other builds reuse the output of the batched apply
+(get_batched_terraform_output). If the batched apply fails, or another build holds the batch lock
+for too long, each build falls back to applying its own SAM CLI Metadata resource.
+
 Note: This script intentionally does not use Python3 specific syntax.
 
 """
@@ -42,6 +48,7 @@ Note: This script intentionally does not use Python3 specific syntax.
 # pylint: skip-file
 
 import argparse
+import errno
 import json
 import logging
 import os
@@ -49,6 +56,7 @@ import re
 import shutil
 import subprocess
 import sys
+import time
 import zipfile
 
 from zip import unzip  # type: ignore
@@ -66,6 +74,16 @@ TF_ENVIRONMENT_VARIABLES = [
     "TF_CLI_ARGS_plan",
     "TF_CLI_ARGS_apply",
 ]
+TF_BATCH_TARGETS_FILENAME = "sam_metadata_targets.json"
+# The files of the batched apply are named after the id of the sam build, so that the files left by an earlier
+# sam command that was killed are never used
+TF_BATCH_OUTPUT_FILENAME = "terraform_batch_output.{}.json"
+TF_BATCH_FAILED_FILENAME = "terraform_batch_output.{}.failed"
+TF_BATCH_LOCK_FILENAME = "terraform_batch_output.{}.lock"
+# Set by `sam build` to the id of the build while it builds all the resources of the project
+BUILD_ALL_RESOURCES_ENV_VAR = "SAM_CLI_HOOK_BUILD_ALL_RESOURCES"
+BATCH_LOCK_POLL_INTERVAL = 0.5
+BATCH_LOCK_TIMEOUT = 30 * 60
 
 
 class ResolverException(Exception):
@@ -272,6 +290,125 @@ def find_and_copy_assets(directory_path, expression, data_object):
         cli_exit()
 
 
+def _metadata_file_path(filename):
+    """
+    Returns the path of a file generated next to this script in the metadata directory
+    """
+    return os.path.join(os.path.dirname(os.path.realpath(__file__)), filename)
+
+
+def get_build_id():
+    """
+    Returns the id of the sam build if it builds all the resources of the project, None otherwise
+    """
+    build_id = os.environ.get(BUILD_ALL_RESOURCES_ENV_VAR, "")
+    # the id is part of file names
+    return build_id if re.match(r"^[A-Za-z0-9_-]+$", build_id) else None
+
+
+def acquire_batch_lock(build_id):
+    """
+    Waits until no other build is applying the SAM CLI Metadata resources, and takes the lock.
+    The lock file is created atomically, which works the same way on all the platforms.
+    Returns False if the lock couldn't be taken in BATCH_LOCK_TIMEOUT seconds.
+    """
+    lock_path = _metadata_file_path(TF_BATCH_LOCK_FILENAME.format(build_id))
+    deadline = time.time() + BATCH_LOCK_TIMEOUT
+    while True:
+        try:
+            os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            return True
+        except OSError as ex:
+            if ex.errno != errno.EEXIST:
+                raise
+            if time.time() >= deadline:
+                return False
+            time.sleep(BATCH_LOCK_POLL_INTERVAL)
+
+
+def release_batch_lock(build_id):
+    os.remove(_metadata_file_path(TF_BATCH_LOCK_FILENAME.format(build_id)))
+
+
+def init_terraform():
+    """
+    Runs `terraform init` with a temporary local backend
+    """
+    LOG.info("Create TF backend override")
+    create_backend_override()
+
+    LOG.info("Running `terraform init` with backend override")
+    subprocess.check_call(["terraform", "init", "-reconfigure", "-input=false", "-force-copy"])
+
+
+def apply_all_targets():
+    """
+    Applies all the SAM CLI Metadata resources with a single `terraform apply`, and returns the terraform output
+    """
+    with open(_metadata_file_path(TF_BATCH_TARGETS_FILENAME), "r") as targets_file:
+        targets = json.load(targets_file)
+
+    init_terraform()
+
+    LOG.info("Running `terraform apply` on %s targets", len(targets))
+    apply_command = ["terraform", "apply"]
+    for target in targets:
+        apply_command.extend(["-target", target, "-replace", target])
+    apply_command.append("-auto-approve")
+    subprocess.check_call(apply_command)
+
+    LOG.info("Generating terraform output")
+    return subprocess.check_output(["terraform", "show", "-json"])
+
+
+def apply_target(target):
+    """
+    Applies a single SAM CLI Metadata resource, and returns the terraform output
+    """
+    init_terraform()
+
+    LOG.info("Running `terraform apply` on the target '%s'", target)
+    subprocess.check_call(["terraform", "apply", "-target", target, "-replace", target, "-auto-approve"])
+
+    LOG.info("Generating terraform output")
+    return subprocess.check_output(["terraform", "show", "-json"])
+
+
+def get_batched_terraform_output(build_id):
+    """
+    Returns the terraform output after all the SAM CLI Metadata resources were applied, applying them if no other
+    build of the sam build did it yet. Returns None if the batched apply failed or the lock couldn't be taken, the
+    caller then applies its own target.
+    The files of the batched apply are removed by the prepare hook.
+    """
+    output_path = _metadata_file_path(TF_BATCH_OUTPUT_FILENAME.format(build_id))
+    failed_path = _metadata_file_path(TF_BATCH_FAILED_FILENAME.format(build_id))
+
+    if not acquire_batch_lock(build_id):
+        LOG.warning("Timed out waiting for the batched `terraform apply`, applying the target on its own")
+        return None
+    try:
+        if os.path.exists(output_path):
+            LOG.info("Using the output of the batched `terraform apply`")
+            with open(output_path, "rb") as output_file:
+                return output_file.read()
+        if os.path.exists(failed_path):
+            return None
+
+        try:
+            terraform_out = apply_all_targets()
+        except (subprocess.CalledProcessError, OSError, ValueError):
+            LOG.warning("Batched `terraform apply` failed, applying each target on its own", exc_info=True)
+            open(failed_path, "w").close()
+            return None
+
+        with open(output_path, "wb") as output_file:
+            output_file.write(terraform_out)
+        return terraform_out
+    finally:
+        release_batch_lock(build_id)
+
+
 def create_backend_override():
     """
     Copies and rename the override tf file from the metadata directory to the root
@@ -336,6 +473,12 @@ if __name__ == "__main__":
         required=False,
         help="Terraform resource path for the SAM CLI Metadata resource. This option is not to be used with --json",
     )
+    argparser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Apply all the SAM CLI Metadata resources at once, and share the output between the builds, "
+        "when sam builds all the resources of the project. This option is only used with --target",
+    )
     argparser.add_argument(
         "--json",
         type=str,
@@ -361,17 +504,10 @@ if __name__ == "__main__":
         cli_exit()
 
     if target:
-        LOG.info("Create TF backend override")
-        create_backend_override()
-
-        LOG.info("Running `terraform init` with backend override")
-        subprocess.check_call(["terraform", "init", "-reconfigure", "-input=false", "-force-copy"])
-
-        LOG.info("Running `terraform apply` on the target '%s'", target)
-        subprocess.check_call(["terraform", "apply", "-target", target, "-replace", target, "-auto-approve"])
-
-        LOG.info("Generating terraform output")
-        terraform_out = subprocess.check_output(["terraform", "show", "-json"])
+        build_id = get_build_id() if arguments.batch else None
+        terraform_out = get_batched_terraform_output(build_id) if build_id else None
+        if terraform_out is None:
+            terraform_out = apply_target(target)
 
     if json_str:
         terraform_out = json_str
@@ -7,11 +7,14 @@ This module contains the main prepare method
 import json
 import logging
 import os
+from contextlib import contextmanager
 from pathlib import Path
 from subprocess import CalledProcessError, run
-from typing import Any, Dict
+from typing import Any, Dict, Iterator
 
 from samcli.hook_packages.terraform.hooks.prepare.constants import CFN_CODE_PROPERTIES
+from samcli.hook_packages.terraform.hooks.prepare.makefile_generator import remove_batch_apply_state
+from samcli.hook_packages.terraform.hooks.prepare.plan_cache import TerraformPlanCache, is_plan_cache_enabled
 from samcli.hook_packages.terraform.hooks.prepare.translate import translate_to_cfn
 from samcli.lib.hook.exceptions import (
     PrepareHookException,
@@ -98,13 +101,16 @@ def prepare(params: dict) -> dict:
 
     plan_file = params.get("PlanFile")
 
+    # clean up the files of the batched applies of the previous builds
+    remove_batch_apply_state(output_dir_path)
+
     if skip_prepare_infra and os.path.exists(metadata_file_path):
         LOG.info("Skipping preparation stage, the metadata file already exists at %s", metadata_file_path)
     else:
         try:
             # initialize terraform application
             if not plan_file:
-                tf_json = _generate_plan_file(skip_prepare_infra, terraform_application_dir)
+                tf_json = _get_plan(skip_prepare_infra, terraform_application_dir, output_dir_path)
             else:
                 LOG.info(f"Using provided plan file: {plan_file}")
                 with open(plan_file, "r") as f:
@@ -161,10 +167,10 @@ def _update_resources_paths(cfn_resources: Dict[str, Any], terraform_application
                     resource["Properties"][attribute] = str(Path(terraform_application_dir).joinpath(original_path))
 
 
-def _generate_plan_file(skip_prepare_infra: bool, terraform_application_dir: str) -> dict:
+def _get_plan(skip_prepare_infra: bool, terraform_application_dir: str, output_dir_path: str) -> dict:
     """
-    Call the relevant Terraform commands to generate, load and return the Terraform plan file
-    which the AWS SAM CLI will then parse to extract the fields required to run local emulators.
+    Returns the Terraform plan in JSON format, from the plan cache if the Terraform configuration didn't change since
+    the plan was cached, otherwise from terraform and then stored in the plan cache.
 
     Parameters
     ----------
@@ -172,11 +178,42 @@ def _generate_plan_file(skip_prepare_infra: bool, terraform_application_dir: str
             Flag to skip skip prepare hook if we already have the metadata file. Default is False.
     terraform_application_dir: str
             The path where the hook can find the TF application.
+    output_dir_path: str
+            The directory of the metadata file, where the plan cache is stored.
     Returns
     -------
     dict
         The Terraform plan file in JSON format
     """
+    if not is_plan_cache_enabled():
+        _init_terraform_application(skip_prepare_infra, terraform_application_dir)
+        return _generate_plan_file(terraform_application_dir)
+
+    plan_cache = TerraformPlanCache(terraform_application_dir, output_dir_path)
+    tf_json = plan_cache.load()
+    if tf_json is not None:
+        LOG.info("Terraform configuration unchanged, using the cached Terraform plan")
+        return tf_json
+
+    _init_terraform_application(skip_prepare_infra, terraform_application_dir)
+    # init creates or updates the lock file and the modules manifest, the plan is stored with the key of its inputs
+    plan_cache.refresh_key()
+    tf_json = _generate_plan_file(terraform_application_dir)
+    plan_cache.store(tf_json)
+    return tf_json
+
+
+def _init_terraform_application(skip_prepare_infra: bool, terraform_application_dir: str) -> None:
+    """
+    Call terraform init to install the providers and modules of the Terraform application
+
+    Parameters
+    ----------
+    skip_prepare_infra: bool
+            Flag to skip skip prepare hook if we already have the metadata file. Default is False.
+    terraform_application_dir: str
+            The path where the hook can find the TF application.
+    """
     log_msg = (
         (
             "The option to skip infrastructure preparation was provided, but AWS SAM CLI could not find "
@@ -186,7 +223,7 @@ def _generate_plan_file(skip_prepare_infra: bool, terraform_application_dir: str
         else "Initializing Terraform application"
     )
     LOG.info(log_msg)
-    try:
+    with _terraform_command_errors():
         invoke_subprocess_with_loading_pattern(
             command_args={
                 "args": ["terraform", "init", "-input=false"],
@@ -195,8 +232,25 @@ def _generate_plan_file(skip_prepare_infra: bool, terraform_application_dir: str
             is_running_terraform_command=True,
         )
 
-        # get json output of terraform plan
-        LOG.info("Creating terraform plan and getting JSON output")
+
+def _generate_plan_file(terraform_application_dir: str) -> dict:
+    """
+    Call the relevant Terraform commands to generate, load and return the Terraform plan file
+    which the AWS SAM CLI will then parse to extract the fields required to run local emulators.
+    The Terraform application must be initialized first.
+
+    Parameters
+    ----------
+    terraform_application_dir: str
+            The path where the hook can find the TF application.
+    Returns
+    -------
+    dict
+        The Terraform plan file in JSON format
+    """
+    # get json output of terraform plan
+    LOG.info("Creating terraform plan and getting JSON output")
+    with _terraform_command_errors():
         with osutils.tempfile_platform_independent() as temp_file:
             invoke_subprocess_with_loading_pattern(
                 # input false to avoid SAM CLI to stuck in case if the
@@ -214,6 +268,17 @@ def _generate_plan_file(skip_prepare_infra: bool, terraform_application_dir: str
                 capture_output=True,
                 cwd=terraform_application_dir,
             )
+
+    return dict(json.loads(result.stdout))
+
+
+@contextmanager
+def _terraform_command_errors() -> Iterator[None]:
+    """
+    Converts the failures of the terraform commands run in the context into prepare hook errors
+    """
+    try:
+        yield
     except CalledProcessError as e:
         stderr_output = str(e.stderr)
 
@@ -237,8 +302,6 @@ def _generate_plan_file(skip_prepare_infra: bool, terraform_application_dir: str
             raise TerraformCloudException(TF_CLOUD_HELP_MESSAGE)
         raise PrepareHookException(f"Error occurred when invoking a process:\n{e}") from e
 
-    return dict(json.loads(result.stdout))
-
 
 def _validate_environment_variables() -> None:
     """
@@ -4,6 +4,7 @@ Terraform Makefile and make rule generation
 This module generates the Makefile for the project and the rules for each of the Lambda functions found
 """
 
+import json
 import logging
 import os
 import shutil
@@ -21,6 +22,20 @@ LOG = logging.getLogger(__name__)
 TERRAFORM_BUILD_SCRIPT = "copy_terraform_built_artifacts.py"
 ZIP_UTILS_MODULE = "zip.py"
 TF_BACKEND_OVERRIDE_FILENAME = "z_samcli_backend_override"
+# Set to 0 or false to apply the sam metadata resource of each Lambda resource on its own while building
+TF_BATCH_APPLY_ENV_VAR = "SAM_CLI_TERRAFORM_BATCH_APPLY"
+TF_BATCH_TARGETS_FILENAME = "sam_metadata_targets.json"
+# Prefix of the files written by the build script while applying all the sam metadata resources at once, they are
+# named after the sam build which wrote them
+TF_BATCH_APPLY_STATE_FILENAME_PREFIX = "terraform_batch_output."
+
+
+def is_batch_apply_enabled() -> bool:
+    """
+    Returns False if applying all the sam metadata resources at once is disabled with the
+    SAM_CLI_TERRAFORM_BATCH_APPLY environment variable
+    """
+    return os.environ.get(TF_BATCH_APPLY_ENV_VAR, "1").strip().lower() not in ("0", "false")
 
 
 def generate_makefile_rule_for_lambda_resource(
@@ -54,17 +69,19 @@ def generate_makefile_rule_for_lambda_resource(
     """
     target = _get_makefile_build_target(logical_id)
     resource_address = sam_metadata_resource.resource.get("address", "")
-    python_command_recipe = _format_makefile_recipe(
-        _build_makerule_python_command(
-            python_command_name, output_dir, resource_address, sam_metadata_resource, terraform_application_dir
-        )
+    python_command = _build_makerule_python_command(
+        python_command_name, output_dir, resource_address, sam_metadata_resource, terraform_application_dir
     )
+    if is_batch_apply_enabled():
+        python_command += " --batch"
+    python_command_recipe = _format_makefile_recipe(python_command)
     return f"{target}{python_command_recipe}"
 
 
 def generate_makefile(
     makefile_rules: List[str],
     output_directory_path: str,
+    sam_metadata_addresses: Optional[List[str]] = None,
 ) -> None:
     """
     Generates a makefile with the given rules in the given directory
@@ -75,6 +92,9 @@ def generate_makefile(
         the list of rules to write in the Makefile
     output_directory_path: str
         the output directory path to write the generated makefile
+    sam_metadata_addresses: Optional[List[str]]
+        the addresses of the sam metadata resources the rules apply, which are applied at once by the first rule
+        to run when the batched apply is enabled
     """
 
     # create output directory if it doesn't exist
@@ -101,6 +121,30 @@ def generate_makefile(
     with open(makefile_path, "w+") as makefile:
         makefile.writelines(makefile_rules)
 
+    # list the targets of the batched apply
+    targets_path = os.path.join(output_directory_path, TF_BATCH_TARGETS_FILENAME)
+    with open(targets_path, "w+") as targets_file:
+        json.dump(sam_metadata_addresses or [], targets_file)
+
+
+def remove_batch_apply_state(output_directory_path: str) -> None:
+    """
+    Removes the files of the batched applies of the previous sam commands, including the locks left by
+    the commands that were killed
+
+    Parameters
+    ----------
+    output_directory_path: str
+        the output directory path of the generated makefile
+    """
+    if not os.path.isdir(output_directory_path):
+        return
+    for filename in os.listdir(output_directory_path):
+        if filename.startswith(TF_BATCH_APPLY_STATE_FILENAME_PREFIX):
+            state_file_path = os.path.join(output_directory_path, filename)
+            LOG.debug("Removing the batched apply state file %s", state_file_path)
+            os.remove(state_file_path)
+
 
 def _generate_backend_override_file(output_directory_path: str):
     """
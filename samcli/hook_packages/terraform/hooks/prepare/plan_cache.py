@@ -0,0 +1,198 @@
+"""
+Persistent cache of the Terraform plan in JSON format, used by the prepare hook
+
+Running terraform init, plan and show takes a long time on large projects, while the plan only changes when the
+configuration does. The plan is cached next to the metadata file, keyed on a digest of:
+
+- the Terraform configuration files (*.tf, *.tf.json, *.tfvars, *.tfvars.json) of the application and of the local
+  modules it uses,
+- the dependency lock file, the installed modules manifest and the selected workspace,
+- the environment variables which change the plan (TF_*, except the logging ones, and the AWS profile and region).
+
+A change to any of them is a cache miss, and the new plan replaces the cached one. Changes the digest can't see, like
+a change of the remote state, of a data source or of a file read with file(), need the cache to be disabled with
+SAM_CLI_TERRAFORM_PLAN_CACHE=0, or the cache file to be deleted.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from typing import Dict, Iterator, Optional, Set
+
+LOG = logging.getLogger(__name__)
+
+TERRAFORM_PLAN_CACHE_FILE = "terraform-plan-cache.json"
+# Set to 0 or false to always run terraform to generate the plan
+TERRAFORM_PLAN_CACHE_ENV_VAR = "SAM_CLI_TERRAFORM_PLAN_CACHE"
+# Version of the cache file format, and of the inputs of the digest. Cache files of another version are ignored
+TERRAFORM_PLAN_CACHE_VERSION = 1
+
+TF_CONFIGURATION_FILE_SUFFIXES = (".tf", ".tf.json", ".tfvars", ".tfvars.json")
+TF_LOCK_FILE = ".terraform.lock.hcl"
+TF_DEFAULT_DATA_DIR = ".terraform"
+# Files of the data directory which change the plan, the manifest of the installed modules and the selected workspace
+TF_DATA_DIR_FILES = [os.path.join("modules", "modules.json"), "environment"]
+# Environment variables which only change the logging of terraform
+TF_LOGGING_ENVIRONMENT_VARIABLES = {"TF_LOG", "TF_LOG_CORE", "TF_LOG_PATH", "TF_LOG_PROVIDER"}
+AWS_ENVIRONMENT_VARIABLES = ["AWS_PROFILE", "AWS_REGION", "AWS_DEFAULT_REGION"]
+
+
+def is_plan_cache_enabled() -> bool:
+    """
+    Returns False if the plan cache is disabled with the SAM_CLI_TERRAFORM_PLAN_CACHE environment variable
+    """
+    return os.environ.get(TERRAFORM_PLAN_CACHE_ENV_VAR, "1").strip().lower() not in ("0", "false")
+
+
+class TerraformPlanCache:
+    """
+    Cache of the Terraform plan of an application, holding the plan of the latest configuration only
+    """
+
+    def __init__(self, terraform_application_dir: str, cache_dir: str):
+        """
+        Parameters
+        ----------
+        terraform_application_dir: str
+            The path of the root module of the Terraform application
+        cache_dir: str
+            The directory where the cache file is stored
+        """
+        self._terraform_application_dir = terraform_application_dir
+        self._cache_file = os.path.join(cache_dir, TERRAFORM_PLAN_CACHE_FILE)
+        self._key: Optional[str] = None
+
+    @property
+    def key(self) -> str:
+        """
+        Digest of the inputs of the plan, computed once per instance
+        """
+        if self._key is None:
+            self._key = self._compute_key()
+        return self._key
+
+    def refresh_key(self) -> None:
+        """
+        Computes the digest again on next use, after its inputs were changed, for instance by terraform init
+        """
+        self._key = None
+
+    def load(self) -> Optional[dict]:
+        """
+        Returns the cached plan if it was generated from the current inputs, None otherwise
+        """
+        try:
+            with open(self._cache_file, "r") as cache_file:
+                cache = json.load(cache_file)
+        except FileNotFoundError:
+            LOG.debug("No cached Terraform plan found at %s", self._cache_file)
+            return None
+        except (OSError, ValueError) as ex:
+            LOG.debug("Ignoring the unreadable Terraform plan cache %s", self._cache_file, exc_info=ex)
+            return None
+
+        if not isinstance(cache, dict) or cache.get("Version") != TERRAFORM_PLAN_CACHE_VERSION:
+            LOG.debug("Ignoring the Terraform plan cache %s of another version", self._cache_file)
+            return None
+        if cache.get("Key") != self.key:
+            LOG.debug("The Terraform configuration changed since the plan was cached")
+            return None
+        plan = cache.get("Plan")
+        return plan if isinstance(plan, dict) else None
+
+    def store(self, plan: dict) -> None:
+        """
+        Replaces the cached plan with the plan generated from the current inputs. Failing to write the cache file is
+        logged and ignored, the next prepare generates the plan again
+        """
+        temp_cache_file = f"{self._cache_file}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self._cache_file), exist_ok=True)
+            with open(temp_cache_file, "w") as cache_file:
+                json.dump({"Version": TERRAFORM_PLAN_CACHE_VERSION, "Key": self.key, "Plan": plan}, cache_file)
+            # replace the cache file in one step, a concurrent prepare never reads a partially written file
+            os.replace(temp_cache_file, self._cache_file)
+        except OSError as ex:
+            LOG.debug("Failed to store the Terraform plan cache %s", self._cache_file, exc_info=ex)
+            if os.path.exists(temp_cache_file):
+                os.remove(temp_cache_file)
+
+    def _compute_key(self) -> str:
+        digest = hashlib.sha256()
+        digest.update(f"version:{TERRAFORM_PLAN_CACHE_VERSION}\0".encode("utf-8"))
+
+        for name, value in sorted(self._environment().items()):
+            digest.update(f"env:{name}={value}\0".encode("utf-8"))
+
+        data_dir = self._data_dir()
+        for file_path in self._input_files(data_dir):
+            relative_path = os.path.relpath(file_path, self._terraform_application_dir)
+            digest.update(f"file:{relative_path}\0".encode("utf-8"))
+            try:
+                with open(file_path, "rb") as input_file:
+                    for block in iter(lambda: input_file.read(1024 * 1024), b""):
+                        digest.update(block)
+            except OSError:
+                digest.update(b"missing")
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    @staticmethod
+    def _environment() -> Dict[str, str]:
+        return {
+            name: value
+            for name, value in os.environ.items()
+            if (name.startswith("TF_") and name not in TF_LOGGING_ENVIRONMENT_VARIABLES)
+            or name in AWS_ENVIRONMENT_VARIABLES
+        }
+
+    def _data_dir(self) -> str:
+        return os.path.normpath(
+            os.path.join(self._terraform_application_dir, os.environ.get("TF_DATA_DIR", TF_DEFAULT_DATA_DIR))
+        )
+
+    def _input_files(self, data_dir: str) -> Iterator[str]:
+        """
+        Yields the paths of the files the plan depends on, in a stable order
+        """
+        module_dirs = [self._terraform_application_dir, *self._local_module_dirs(data_dir)]
+        seen: Set[str] = set()
+        for module_dir in module_dirs:
+            for file_path in sorted(self._configuration_files(module_dir, data_dir)):
+                if file_path not in seen:
+                    seen.add(file_path)
+                    yield file_path
+
+        yield os.path.join(self._terraform_application_dir, TF_LOCK_FILE)
+        for data_dir_file in TF_DATA_DIR_FILES:
+            yield os.path.join(data_dir, data_dir_file)
+
+    @staticmethod
+    def _configuration_files(module_dir: str, data_dir: str) -> Iterator[str]:
+        for root, dirs, files in os.walk(module_dir):
+            # skip the installed providers and modules, and the hidden directories like .git or .aws-sam
+            dirs[:] = [name for name in dirs if not name.startswith(".") and os.path.join(root, name) != data_dir]
+            for name in files:
+                if name.endswith(TF_CONFIGURATION_FILE_SUFFIXES):
+                    yield os.path.join(root, name)
+
+    def _local_module_dirs(self, data_dir: str) -> Iterator[str]:
+        """
+        Yields the directories of the local modules outside of the application directory, from the manifest of the
+        installed modules. Changes to the other modules change the manifest
+        """
+        try:
+            with open(os.path.join(data_dir, "modules", "modules.json"), "r") as manifest_file:
+                modules = json.load(manifest_file).get("Modules", [])
+        except (OSError, ValueError, AttributeError):
+            return
+
+        application_dir = os.path.join(self._terraform_application_dir, "")
+        for module in modules:
+            module_dir = module.get("Dir") if isinstance(module, dict) else None
+            if not isinstance(module_dir, str):
+                continue
+            module_dir = os.path.normpath(os.path.join(self._terraform_application_dir, module_dir))
+            if not os.path.join(module_dir, "").startswith(application_dir) and os.path.isdir(module_dir):
+                yield module_dir
@@ -6,7 +6,7 @@ e.g. linking layers to functions
 import logging
 import re
 from dataclasses import dataclass
-from typing import Callable, Dict, List, Optional, Type, Union
+from typing import Callable, Dict, List, Optional, Tuple, Type, Union
 
 from samcli.hook_packages.terraform.hooks.prepare.constants import TF_AWS_API_GATEWAY_REST_API
 from samcli.hook_packages.terraform.hooks.prepare.exceptions import (
@@ -168,6 +168,9 @@ class ResourceLinker:
 
     def __init__(self, resource_pair):
         self._resource_pair = resource_pair
+        # map between the destination resources linking attributes values, and their logical ids and types, built
+        # once for all the source resources of the pair
+        self._linking_attributes_index: Optional[Dict[str, Tuple[str, str]]] = None
 
     def link_resources(self) -> None:
         """
@@ -331,17 +334,52 @@ class ResourceLinker:
             self._resource_pair.tf_destination_value_extractor_from_link_field_value_function(value) for value in values
         ]
 
+        child_resources_linking_attributes_logical_id_mapping = self._get_linking_attributes_index()
+
+        dest_resources = [
+            (
+                LogicalIdReference(
+                    value=child_resources_linking_attributes_logical_id_mapping[value][0],
+                    resource_type=child_resources_linking_attributes_logical_id_mapping[value][1],
+                )
+                if value in child_resources_linking_attributes_logical_id_mapping
+                else ExistingResourceReference(value)
+            )
+            for value in values
+        ]
+
+        if not dest_resources:
+            LOG.debug("Skipping linking call back, no destination resources discovered.")
+            return
+
+        LOG.debug("The value of the source resource linking field after mapping %s", dest_resources)
+        self._resource_pair.cfn_resource_update_call_back_function(cfn_resource, dest_resources)
+
+    def _get_linking_attributes_index(self) -> Dict[str, Tuple[str, str]]:
+        """
+        Returns the map between the destination resources linking attributes values, and the destination resources
+        logical ids and types. The map is built on first use, and then reused for all the source resources, so that
+        linking N source resources to M destination resources takes O(N + M) instead of O(N * M).
+
+        Returns
+        --------
+        Dict[str, Tuple[str, str]]:
+            the logical id and the type of the destination resource, keyed by the value of its linking attribute
+        """
+        if self._linking_attributes_index is not None:
+            return self._linking_attributes_index
+
         # build map between the destination linking field property values, and resources' logical ids
         expected_destinations_map = {
             expected_destination.terraform_resource_type_prefix: expected_destination.terraform_attribute_name
             for expected_destination in self._resource_pair.expected_destinations
         }
-        child_resources_linking_attributes_logical_id_mapping = {}
+        linking_attributes_index = {}
         for logical_id, destination_resource in self._resource_pair.destination_resource_tf.items():
             destination_attribute = expected_destinations_map.get(f"{destination_resource.get('type', '')}.", "")
             linking_attribute_value = destination_resource.get("values", {}).get(destination_attribute)
             if linking_attribute_value:
-                child_resources_linking_attributes_logical_id_mapping[linking_attribute_value] = (
+                linking_attributes_index[linking_attribute_value] = (
                     logical_id,
                     destination_resource.get("type", {}),
                 )
@@ -354,27 +392,10 @@ class ResourceLinker:
                     for expected_destination in self._resource_pair.expected_destinations
                 ]
             ),
-            child_resources_linking_attributes_logical_id_mapping,
+            linking_attributes_index,
         )
-
-        dest_resources = [
-            (
-                LogicalIdReference(
-                    value=child_resources_linking_attributes_logical_id_mapping[value][0],
-                    resource_type=child_resources_linking_attributes_logical_id_mapping[value][1],
-                )
-                if value in child_resources_linking_attributes_logical_id_mapping
-                else ExistingResourceReference(value)
-            )
-            for value in values
-        ]
-
-        if not dest_resources:
-            LOG.debug("Skipping linking call back, no destination resources discovered.")
-            return
-
-        LOG.debug("The value of the source resource linking field after mapping %s", dest_resources)
-        self._resource_pair.cfn_resource_update_call_back_function(cfn_resource, dest_resources)
+        self._linking_attributes_index = linking_attributes_index
+        return linking_attributes_index
 
     def _process_resolved_resources(
         self,
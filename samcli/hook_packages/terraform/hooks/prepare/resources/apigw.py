@@ -187,11 +187,12 @@ def add_integrations_to_methods(
     gateway_integrations_cfn: Dict[str, List]
         Dict containing Internal API Gateway integrations to be appended to the CFN dict
     """
+    gateway_integrations_index = _index_gateway_integrations(gateway_integrations_cfn)
     for config_address, cfn_dicts in gateway_methods_cfn.items():
         for method_resource in cfn_dicts:
             resource_properties = method_resource.get("Properties", {})
             search_key = _gateway_method_integration_identifier(resource_properties)
-            integration_properties = _find_gateway_integration(search_key, gateway_integrations_cfn)
+            integration_properties = _find_gateway_integration(search_key, gateway_integrations_index)
             if not integration_properties:
                 LOG.debug("A corresponding gateway integration for the gateway method %s was not found", config_address)
                 continue
@@ -223,11 +224,12 @@ def add_integration_responses_to_methods(
     gateway_integration_responses_cfn: Dict[str, List]
         Dict containing Internal API Gateway integration responses to be appended to the CFN dict
     """
+    gateway_integration_responses_index = _index_gateway_integrations(gateway_integration_responses_cfn)
     for config_address, cfn_dicts in gateway_methods_cfn.items():
         for method_resource in cfn_dicts:
             method_resource_properties = method_resource.get("Properties", {})
             search_key = _gateway_method_integration_identifier(method_resource_properties)
-            integration_response_properties = _find_gateway_integration(search_key, gateway_integration_responses_cfn)
+            integration_response_properties = _find_gateway_integration(search_key, gateway_integration_responses_index)
             if not integration_response_properties:
                 LOG.debug(
                     "A corresponding gateway integration response for the gateway method %s was not found",
@@ -238,30 +240,51 @@ def add_integration_responses_to_methods(
             _create_gateway_method_integration_response(method_resource, integration_response_properties)
 
 
-def _find_gateway_integration(search_key: set, gateway_integrations_cfn: Dict[str, List]) -> Optional[dict]:
+def _index_gateway_integrations(gateway_integrations_cfn: Dict[str, List]) -> Dict[frozenset, dict]:
     """
-    Iterate through all internal API Gateway integration or integration response and search of an
-    integration / integration  response whose unique identifier matches the given search key.
+    Iterate through all internal API Gateway integration or integration response once, and map their unique
+    identifiers to their properties, so that each API Gateway method finds its integration without iterating
+    through all of them.
 
     Parameters
     ----------
-    search_key: set
-        Set containing the unique identifier of the API Gateway integration to match
     gateway_integrations_cfn: Dict[str, List]
-        Dict containing all Internal API Gateway integration resources to search through
+        Dict containing all Internal API Gateway integration resources to index
 
     Returns
     -------
-        Properties of the internal API Gateway integration / integration response if found, otherwise returns None
+        Properties of the internal API Gateway integrations / integration responses, keyed by their unique identifier.
+        The first integration is kept when several have the same identifier
 
     """
+    gateway_integrations_index: Dict[frozenset, dict] = {}
     for _, gateway_integrations in gateway_integrations_cfn.items():
         for resource in gateway_integrations:
             resource_properties = resource.get("Properties", {})
-            integration_key = _gateway_method_integration_identifier(resource_properties)
-            if integration_key == search_key:
-                return dict(resource_properties)
-    return None
+            integration_key = frozenset(_gateway_method_integration_identifier(resource_properties))
+            gateway_integrations_index.setdefault(integration_key, resource_properties)
+    return gateway_integrations_index
+
+
+def _find_gateway_integration(search_key: set, gateway_integrations_index: Dict[frozenset, dict]) -> Optional[dict]:
+    """
+    Search for the internal API Gateway integration or integration response whose unique identifier matches the given
+    search key.
+
+    Parameters
+    ----------
+    search_key: set
+        Set containing the unique identifier of the API Gateway integration to match
+    gateway_integrations_index: Dict[frozenset, dict]
+        Internal API Gateway integrations properties keyed by their unique identifier, see _index_gateway_integrations
+
+    Returns
+    -------
+        Properties of the internal API Gateway integration / integration response if found, otherwise returns None
+
+    """
+    resource_properties = gateway_integrations_index.get(frozenset(search_key))
+    return dict(resource_properties) if resource_properties is not None else None
 
 
 def _gateway_method_integration_identifier(resource_properties: dict) -> set:
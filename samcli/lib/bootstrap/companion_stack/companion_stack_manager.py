@@ -3,14 +3,9 @@
 """
 
 import logging
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
-import boto3
-from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError, NoRegionError
-from mypy_boto3_cloudformation.client import CloudFormationClient
-from mypy_boto3_cloudformation.type_defs import WaiterConfigTypeDef
-from mypy_boto3_s3.client import S3Client
 
 from samcli.commands.exceptions import AWSServiceClientError, RegionError
 from samcli.lib.bootstrap.companion_stack.companion_stack_builder import CompanionStackBuilder
@@ -19,9 +14,19 @@ from samcli.lib.package.artifact_exporter import mktempfile
 from samcli.lib.package.s3_uploader import S3Uploader
 from samcli.lib.providers.sam_function_provider import SamFunctionProvider
 from samcli.lib.providers.sam_stack_provider import SamLocalStackProvider
+from samcli.lib.utils.lazy_import import lazy_import
 from samcli.lib.utils.packagetype import IMAGE
 from samcli.lib.utils.s3 import parse_s3_url
 
+if TYPE_CHECKING:  # pragma: no cover
+    from botocore.config import Config
+    from mypy_boto3_cloudformation.client import CloudFormationClient
+    from mypy_boto3_cloudformation.type_defs import WaiterConfigTypeDef
+    from mypy_boto3_s3.client import S3Client
+
+boto3 = lazy_import("boto3")
+botocore_config = lazy_import("botocore.config")
+
 LOG = logging.getLogger(__name__)
 
 
@@ -33,18 +38,18 @@ class CompanionStackManager:
 
     _companion_stack: CompanionStack
     _builder: CompanionStackBuilder
-    _boto_config: Config
-    _update_stack_waiter_config: WaiterConfigTypeDef
-    _delete_stack_waiter_config: WaiterConfigTypeDef
+    _boto_config: "Config"
+    _update_stack_waiter_config: "WaiterConfigTypeDef"
+    _delete_stack_waiter_config: "WaiterConfigTypeDef"
     _s3_bucket: str
     _s3_prefix: str
-    _cfn_client: CloudFormationClient
-    _s3_client: S3Client
+    _cfn_client: "CloudFormationClient"
+    _s3_client: "S3Client"
 
     def __init__(self, stack_name, region, s3_bucket, s3_prefix):
         self._companion_stack = CompanionStack(stack_name)
         self._builder = CompanionStackBuilder(self._companion_stack)
-        self._boto_config = Config(region_name=region if region else None)
+        self._boto_config = botocore_config.Config(region_name=region if region else None)
         self._update_stack_waiter_config = {"Delay": 10, "MaxAttempts": 120}
         self._delete_stack_waiter_config = {"Delay": 10, "MaxAttempts": 120}
         self._s3_bucket = s3_bucket
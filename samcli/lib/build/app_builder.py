@@ -7,15 +7,14 @@ import io
 import json
 import logging
 import pathlib
-from typing import List, Optional, Dict, cast, NamedTuple
-import docker
-import docker.errors
+from typing import TYPE_CHECKING, List, Optional, Dict, cast, NamedTuple
 from aws_lambda_builders import (
     RPC_PROTOCOL_VERSION as lambda_builders_protocol_version,
 )
 from aws_lambda_builders.builder import LambdaBuilder
 from aws_lambda_builders.exceptions import LambdaBuilderError
 from samcli.lib.constants import DOCKER_MIN_API_VERSION
+from samcli.lib.utils.lazy_import import lazy_import
 from samcli.lib.build.build_graph import FunctionBuildDefinition, LayerBuildDefinition, BuildGraph
 from samcli.lib.build.build_strategy import (
     DefaultBuildStrategy,
@@ -63,6 +62,11 @@ from samcli.lib.build.workflow_config import (
     UnsupportedRuntimeException,
 )
 
+if TYPE_CHECKING:  # pragma: no cover
+    from docker import DockerClient
+
+docker = lazy_import("docker")
+
 LOG = logging.getLogger(__name__)
 
 FIRST_COMPATIBLE_RUNTIME_INDEX = 0
@@ -97,7 +101,7 @@ class ApplicationBuilder:
         parallel: bool = False,
         mode: Optional[str] = None,
         stream_writer: Optional[StreamWriter] = None,
-        docker_client: Optional[docker.DockerClient] = None,
+        docker_client: Optional["DockerClient"] = None,
         container_env_var: Optional[Dict] = None,
         container_env_var_file: Optional[str] = None,
         build_images: Optional[Dict] = None,
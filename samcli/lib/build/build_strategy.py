@@ -2,7 +2,6 @@
 Keeps implementation of different build strategies
 """
 
-import hashlib
 import logging
 import os.path
 import pathlib
@@ -14,7 +13,7 @@ from typing import Callable, Dict, List, Any, Optional, cast, Set, Tuple, TypeVa
 from samcli.commands._utils.experimental import is_experimental_enabled, ExperimentalFlag
 from samcli.lib.utils import osutils
 from samcli.lib.utils.async_utils import AsyncContext
-from samcli.lib.utils.hash import dir_checksum
+from samcli.lib.utils.hash import load_directory_digest
 from samcli.lib.utils.packagetype import ZIP, IMAGE
 from samcli.lib.build.dependency_hash_generator import DependencyHashGenerator
 from samcli.lib.build.build_graph import (
@@ -28,9 +27,13 @@ from samcli.lib.build.exceptions import MissingBuildMethodException
 from samcli.lib.build.utils import warn_on_invalid_architecture
 
 from samcli.lib.utils.architecture import X86_64, ARM64
+from samcli.lib.utils.timings import span
 
 LOG = logging.getLogger(__name__)
 
+# Suffix of the files in the cache folder where the digest of the source code of each function or layer is persisted
+SOURCE_DIGEST_FILE_SUFFIX = ".source_digest.json"
+
 # type definition which can be used in generic types for both FunctionBuildDefinition & LayerBuildDefinition
 FunctionOrLayerBuildDefinition = TypeVar(
     "FunctionOrLayerBuildDefinition", FunctionBuildDefinition, LayerBuildDefinition
@@ -164,19 +167,20 @@ class DefaultBuildStrategy(BuildStrategy):
         container_env_vars = deepcopy(build_definition.env_vars)
 
         # when a function is passed here, it is ZIP function, codeuri and runtime are not None
-        result = self._build_function(
-            build_definition.get_function_name(),
-            build_definition.codeuri,  # type: ignore
-            build_definition.packagetype,
-            build_definition.runtime,  # type: ignore
-            build_definition.architecture,
-            build_definition.get_handler_name(),
-            single_build_dir,
-            build_definition.metadata,
-            container_env_vars,
-            build_definition.dependencies_dir if self._cached else None,
-            build_definition.download_dependencies,
-        )
+        with span("build.function", function=build_definition.get_function_name()):
+            result = self._build_function(
+                build_definition.get_function_name(),
+                build_definition.codeuri,  # type: ignore
+                build_definition.packagetype,
+                build_definition.runtime,  # type: ignore
+                build_definition.architecture,
+                build_definition.get_handler_name(),
+                single_build_dir,
+                build_definition.metadata,
+                container_env_vars,
+                build_definition.dependencies_dir if self._cached else None,
+                build_definition.download_dependencies,
+            )
         function_build_results[single_full_path] = result
 
         # copy results to other functions
@@ -236,20 +240,21 @@ class DefaultBuildStrategy(BuildStrategy):
         single_build_dir = layer.get_build_dir(self._build_dir)
         # when a layer is passed here, it is ZIP function, codeuri and runtime are not None
         # codeuri and compatible_runtimes are not None
-        return {
-            layer.full_path: self._build_layer(
-                layer.name,
-                layer.codeuri,  # type: ignore
-                layer.build_method,
-                layer.compatible_runtimes,  # type: ignore
-                layer.build_architecture,
-                single_build_dir,
-                layer_definition.env_vars,
-                layer_definition.dependencies_dir if self._cached else None,
-                layer_definition.download_dependencies,
-                layer.metadata,
-            )
-        }
+        with span("build.layer", layer=layer.name):
+            return {
+                layer.full_path: self._build_layer(
+                    layer.name,
+                    layer.codeuri,  # type: ignore
+                    layer.build_method,
+                    layer.compatible_runtimes,  # type: ignore
+                    layer.build_architecture,
+                    single_build_dir,
+                    layer_definition.env_vars,
+                    layer_definition.dependencies_dir if self._cached else None,
+                    layer_definition.download_dependencies,
+                    layer.metadata,
+                )
+            }
 
 
 class CachedBuildStrategy(BuildStrategy):
@@ -289,7 +294,7 @@ class CachedBuildStrategy(BuildStrategy):
             return self._delegate_build_strategy.build_single_function_definition(build_definition)
 
         code_dir = str(pathlib.Path(self._base_dir, cast(str, build_definition.codeuri)).resolve())
-        source_hash = dir_checksum(code_dir, ignore_list=[".aws-sam"], hash_generator=hashlib.sha256())
+        source_hash = self._calculate_source_hash(build_definition, code_dir)
         cache_function_dir = pathlib.Path(self._cache_dir, build_definition.uuid)
         function_build_results = {}
 
@@ -347,7 +352,7 @@ class CachedBuildStrategy(BuildStrategy):
         """
 
         code_dir = str(pathlib.Path(self._base_dir, cast(str, layer_definition.codeuri)).resolve())
-        source_hash = dir_checksum(code_dir, ignore_list=[".aws-sam"], hash_generator=hashlib.sha256())
+        source_hash = self._calculate_source_hash(layer_definition, code_dir)
         cache_function_dir = pathlib.Path(self._cache_dir, layer_definition.uuid)
         layer_build_result = {}
 
@@ -385,6 +390,23 @@ class CachedBuildStrategy(BuildStrategy):
 
         return layer_build_result
 
+    def _calculate_source_hash(self, build_definition: AbstractBuildDefinition, code_dir: str) -> str:
+        """
+        Returns the hash of the source code of a function or layer. The checksums of its files are persisted in the
+        cache folder, so that only the files which changed since the previous build are read again.
+        """
+        digest_path = str(pathlib.Path(self._cache_dir, f"{build_definition.uuid}{SOURCE_DIGEST_FILE_SUFFIX}"))
+        digest, previous_digest = load_directory_digest(
+            digest_path, code_dir, ignore_list=[".aws-sam"], algorithm="sha256"
+        )
+        if previous_digest:
+            LOG.debug(
+                "Source files changed since the previous build of (%s): %s",
+                build_definition.get_resource_full_paths(),
+                digest.changed_files(previous_digest),
+            )
+        return digest.digest
+
     def _clean_redundant_cached(self) -> None:
         """
         clean the redundant cached folder
@@ -393,6 +415,11 @@ class CachedBuildStrategy(BuildStrategy):
         uuids.update({ld.uuid for ld in self._build_graph.get_layer_build_definitions()})
         clean_redundant_folders(self._cache_dir, uuids)
 
+        for digest_file in pathlib.Path(self._cache_dir).glob(f"*{SOURCE_DIGEST_FILE_SUFFIX}"):
+            if digest_file.name[: -len(SOURCE_DIGEST_FILE_SUFFIX)] not in uuids:
+                LOG.debug("Cleaning up redundant source digest %s", digest_file)
+                digest_file.unlink()
+
 
 class ParallelBuildStrategy(BuildStrategy):
     """
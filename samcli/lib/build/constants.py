@@ -21,3 +21,6 @@ DEPRECATED_RUNTIMES: Set[str] = {
     "ruby2.7",
 }
 BUILD_PROPERTIES = "BuildProperties"
+# Set to the id of the build while sam builds all the resources of a project prepared by a hook package, so that the
+# build scripts of the hook package can build the resources together
+HOOK_BUILD_ALL_RESOURCES_ENV_VAR = "SAM_CLI_HOOK_BUILD_ALL_RESOURCES"
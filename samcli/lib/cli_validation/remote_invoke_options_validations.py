@@ -15,8 +15,8 @@ LOG = logging.getLogger(__name__)
 
 def event_and_event_file_options_validation(func):
     """
-    This function validates the cases when both --event and --event-file are provided and
-    logs if "-" is provided for --event-file and event is read from stdin.
+    This function validates the cases when more than one of --event, --event-file, --events-file and
+    --test-event-name are provided, and logs if "-" is provided for --event-file and event is read from stdin.
 
     Parameters
     ----------
@@ -34,17 +34,19 @@ def event_and_event_file_options_validation(func):
 
         event = ctx.params.get("event")
         event_file = ctx.params.get("event_file")
+        events_file = ctx.params.get("events_file")
         test_event_name = ctx.params.get("test_event_name")
 
         def more_than_one():
-            return (event and event_file) or (event and test_event_name) or (event_file and test_event_name)
+            return len([option for option in (event, event_file, events_file, test_event_name) if option]) > 1
 
         validator = Validator(
             validation_function=more_than_one,
             exception=click.BadOptionUsage(
                 option_name="--event-file",
                 ctx=ctx,
-                message="Only one of '--event-file', '--event' and '--test-event-name' can be provided. "
+                message="Only one of '--event-file', '--event', '--events-file' and '--test-event-name' can be "
+                "provided. "
                 "Please check that you don't have more than one specified in the command or in a configuration file",
             ),
         )
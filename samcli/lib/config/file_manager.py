@@ -5,14 +5,19 @@ Class to represent the parsing of different file types into Python objects.
 import json
 import logging
 from abc import ABC, abstractmethod
+from io import StringIO
 from pathlib import Path
-from typing import Any, Dict, Type
-
-import tomlkit
-from ruamel.yaml import YAML, YAMLError
-from ruamel.yaml.compat import StringIO
+from typing import TYPE_CHECKING, Any, Dict, Optional, Type, cast
 
 from samcli.lib.config.exceptions import FileParseException
+from samcli.lib.utils.lazy_import import lazy_import
+
+if TYPE_CHECKING:  # pragma: no cover
+    from tomlkit import TOMLDocument
+
+# tomlkit and ruamel.yaml are only needed once a config file is read or written
+tomlkit = lazy_import("tomlkit")
+ruamel_yaml = lazy_import("ruamel.yaml")
 
 LOG = logging.getLogger(__name__)
 COMMENT_KEY = "__comment__"
@@ -157,9 +162,9 @@ class TomlFileManager(FileManager):
         return document
 
     @staticmethod
-    def _to_toml(document: dict) -> tomlkit.TOMLDocument:
+    def _to_toml(document: dict) -> "TOMLDocument":
         """Ensure that a dictionary-like object is a TOMLDocument."""
-        return tomlkit.parse(tomlkit.dumps(document))
+        return cast("TOMLDocument", tomlkit.parse(tomlkit.dumps(document)))
 
 
 class YamlFileManager(FileManager):
@@ -167,9 +172,18 @@ class YamlFileManager(FileManager):
     Static class to read and write yaml files.
     """
 
-    yaml = YAML()
+    _yaml: Optional[Any] = None
     file_format = "YAML"
 
+    @classmethod
+    def yaml(cls) -> Any:
+        """
+        Returns the ruamel.yaml parser, which is created on first use
+        """
+        if cls._yaml is None:
+            cls._yaml = ruamel_yaml.YAML()
+        return cls._yaml
+
     @staticmethod
     def read(filepath: Path) -> Any:
         """
@@ -188,10 +202,10 @@ class YamlFileManager(FileManager):
         """
         yaml_doc = {}
         try:
-            yaml_doc = YamlFileManager.yaml.load(filepath.read_text())
+            yaml_doc = YamlFileManager.yaml().load(filepath.read_text())
         except OSError as e:
             LOG.debug(f"OSError occurred while reading {YamlFileManager.file_format} file: {str(e)}")
-        except YAMLError as e:
+        except ruamel_yaml.YAMLError as e:
             raise FileParseException(e) from e
 
         return yaml_doc
@@ -218,7 +232,7 @@ class YamlFileManager(FileManager):
             yaml_doc.yaml_set_start_comment(document[COMMENT_KEY])
             yaml_doc.pop(COMMENT_KEY)
 
-        YamlFileManager.yaml.dump(yaml_doc, filepath)
+        YamlFileManager.yaml().dump(yaml_doc, filepath)
 
     @staticmethod
     def put_comment(document: Any, comment: str) -> Any:
@@ -257,8 +271,8 @@ class YamlFileManager(FileManager):
             A dictionary-like YAML object, as derived from `yaml.load()`.
         """
         with StringIO() as stream:
-            YamlFileManager.yaml.dump(document, stream)
-            return YamlFileManager.yaml.load(stream.getvalue())
+            YamlFileManager.yaml().dump(document, stream)
+            return YamlFileManager.yaml().load(stream.getvalue())
 
 
 class JsonFileManager(FileManager):
@@ -19,7 +19,7 @@ import logging
 import math
 import sys
 import time
-from collections import OrderedDict, deque
+from collections import OrderedDict
 from datetime import datetime
 from typing import Dict, List, Optional
 
@@ -34,12 +34,14 @@ from samcli.commands.deploy.exceptions import (
     DeployStackOutPutFailedError,
     DeployStackStatusMissingError,
 )
+from samcli.lib.deploy.stack_event_streamer import StackEventStreamer
 from samcli.lib.deploy.utils import DeployColor, FailureMode
 from samcli.lib.package.local_files_utils import get_uploaded_s3_object_name, mktempfile
 from samcli.lib.package.s3_uploader import S3Uploader
 from samcli.lib.utils.colors import Colored, Colors
 from samcli.lib.utils.s3 import parse_s3_url
-from samcli.lib.utils.time import to_datetime, utc_to_timestamp
+from samcli.lib.utils.time import utc_to_timestamp
+from samcli.lib.utils.timings import traced
 
 LOG = logging.getLogger(__name__)
 
@@ -76,6 +78,11 @@ OUTPUTS_TABLE_HEADER_NAME = "CloudFormation outputs from deployed stack"
 
 # 500ms of sleep time between stack checks and describe stack events.
 DEFAULT_CLIENT_SLEEP = 0.5
+# Sleep time between describe stack events grows up to 5s while no new events arrive
+MAX_CLIENT_SLEEP = 5
+
+# Status of the stack once the stack operation succeeded
+STACK_OPERATION_SUCCESS_STATUS = {"CREATE": "CREATE_COMPLETE", "UPDATE": "UPDATE_COMPLETE"}
 
 
 class Deployer:
@@ -140,6 +147,7 @@ class Deployer:
             LOG.debug("Unable to get stack details.", exc_info=e)
             raise e
 
+    @traced("deploy.changeset.create")
     def create_changeset(
         self, stack_name, cfn_template, parameter_values, capabilities, role_arn, notification_arns, s3_uploader, tags
     ):
@@ -296,6 +304,7 @@ class Deployer:
 
         return changes
 
+    @traced("deploy.changeset.wait")
     def wait_for_changeset(self, changeset_id, stack_name):
         """
         Waits until the changeset creation completes
@@ -332,6 +341,7 @@ class Deployer:
 
             raise ChangeSetError(stack_name=stack_name, msg=f"ex: {ex} Status: {status}. Reason: {reason}") from ex
 
+    @traced("deploy.changeset.execute")
     def execute_changeset(self, changeset_id, stack_name, disable_rollback):
         """
         Calls CloudFormation to execute changeset
@@ -369,102 +379,88 @@ class Deployer:
     )
     def describe_stack_events(
         self, stack_name: str, time_stamp_marker: float, on_failure: FailureMode = FailureMode.ROLLBACK, **kwargs
-    ):
+    ) -> Optional[str]:
         """
-        Calls CloudFormation to get current stack events
+        Calls CloudFormation to get current stack events, of the stack and of its nested stacks, until the stack
+        operation completes
         :param stack_name: Name or ID of the stack
         :param time_stamp_marker: last event time on the stack to start streaming events from.
         :param on_failure: The action to take if the stack fails to deploy
         :param kwargs: Other arguments to pass to pprint_columns()
+        :return: the status the stack operation completed with, or None if the events couldn't be streamed up to the
+            completion of the operation
         """
 
         stack_change_in_progress = True
-        events = set()
+        stack_status = None
         retry_attempts = 0
-
-        while stack_change_in_progress and retry_attempts <= self.max_attempts:
-            try:
-                # Only sleep if there have been no retry_attempts
-                LOG.debug("Trial # %d to get the stack %s create events", retry_attempts, stack_name)
-                time.sleep(0 if retry_attempts else self.client_sleep)
-                paginator = self._client.get_paginator("describe_stack_events")
-                response_iterator = paginator.paginate(StackName=stack_name)
-
-                # Event buffer
-                new_events = deque()  # type: deque
-
-                for event_items in response_iterator:
-                    for event in event_items["StackEvents"]:
-                        LOG.debug("Stack Event: %s", event)
-                        # Skip already shown old event entries or former deployments
-                        if utc_to_timestamp(event["Timestamp"]) <= time_stamp_marker:
+        with StackEventStreamer(self._client, stack_name, time_stamp_marker) as streamer:
+            poll_sleep = self.client_sleep
+
+            while stack_change_in_progress and retry_attempts <= self.max_attempts:
+                try:
+                    # Only sleep if there have been no retry_attempts
+                    LOG.debug("Trial # %d to get the stack %s create events", retry_attempts, stack_name)
+                    time.sleep(0 if retry_attempts else poll_sleep)
+                    new_events = streamer.poll()
+                    LOG.debug("Exit from the describe event loop")
+
+                    # Poll often while the stack operation makes progress, and back off while it doesn't
+                    if new_events:
+                        poll_sleep = self.client_sleep
+                    else:
+                        poll_sleep = min(poll_sleep * 2, max(self.client_sleep, MAX_CLIENT_SLEEP))
+
+                    for new_event in new_events:
+                        row_color = self.deploy_color.get_stack_events_status_color(status=new_event["ResourceStatus"])
+                        pprint_columns(
+                            columns=[
+                                new_event["ResourceStatus"],
+                                new_event["ResourceType"],
+                                new_event["LogicalResourceId"],
+                                new_event.get("ResourceStatusReason", "-"),
+                            ],
+                            width=kwargs["width"],
+                            margin=kwargs["margin"],
+                            format_string=DESCRIBE_STACK_EVENTS_FORMAT_STRING,
+                            format_args=kwargs["format_args"],
+                            columns_dict=DESCRIBE_STACK_EVENTS_DEFAULT_ARGS.copy(),
+                            color=row_color,
+                        )
+                        # Skip events from another consecutive deployment triggered during sleep by another process
+                        if self._is_root_stack_event(new_event) and self._check_stack_not_in_progress(
+                            new_event["ResourceStatus"]
+                        ):
                             LOG.debug(
-                                "Skip previous event as time_stamp_marker: %s is after the event time stamp: %s",
-                                to_datetime(time_stamp_marker),
-                                event["Timestamp"],
+                                "Stack %s is not in progress. Its status is %s, and event is %s",
+                                stack_name,
+                                new_event["ResourceStatus"],
+                                new_event,
                             )
+                            stack_status = new_event["ResourceStatus"]
+                            stack_change_in_progress = False
                             break
-                        if event["EventId"] not in events:
-                            events.add(event["EventId"])
-                            # Events are in reverse chronological order
-                            # Pushing in front reverse the order to display older events first
-                            new_events.appendleft(event)
-                    else:  # go to next loop (page of events) if not break from inside loop
-                        LOG.debug("Still in describe_stack_events loop, got to next page")
-                        continue
-                    break  # reached here only if break from inner loop!
-                LOG.debug("Exit from the describe event loop")
-                # Override timestamp marker with latest event (last in deque)
-                if len(new_events) > 0:
-                    time_stamp_marker = utc_to_timestamp(new_events[-1]["Timestamp"])
-
-                for new_event in new_events:
-                    row_color = self.deploy_color.get_stack_events_status_color(status=new_event["ResourceStatus"])
-                    pprint_columns(
-                        columns=[
-                            new_event["ResourceStatus"],
-                            new_event["ResourceType"],
-                            new_event["LogicalResourceId"],
-                            new_event.get("ResourceStatusReason", "-"),
-                        ],
-                        width=kwargs["width"],
-                        margin=kwargs["margin"],
-                        format_string=DESCRIBE_STACK_EVENTS_FORMAT_STRING,
-                        format_args=kwargs["format_args"],
-                        columns_dict=DESCRIBE_STACK_EVENTS_DEFAULT_ARGS.copy(),
-                        color=row_color,
-                    )
-                    # Skip events from another consecutive deployment triggered during sleep by another process
-                    if self._is_root_stack_event(new_event) and self._check_stack_not_in_progress(
-                        new_event["ResourceStatus"]
+
+                    # Reset retry attempts if iteration is a success to use client_sleep again
+                    retry_attempts = 0
+                except botocore.exceptions.ClientError as ex:
+                    if (
+                        "Stack with id {0} does not exist".format(stack_name) in str(ex)
+                        and on_failure == FailureMode.DELETE
                     ):
-                        LOG.debug(
-                            "Stack %s is not in progress. Its status is %s, and event is %s",
-                            stack_name,
-                            new_event["ResourceStatus"],
-                            new_event,
-                        )
-                        stack_change_in_progress = False
-                        break
-
-                # Reset retry attempts if iteration is a success to use client_sleep again
-                retry_attempts = 0
-            except botocore.exceptions.ClientError as ex:
-                if (
-                    "Stack with id {0} does not exist".format(stack_name) in str(ex)
-                    and on_failure == FailureMode.DELETE
-                ):
-                    LOG.debug("Stack %s does not exist", stack_name)
-                    return
-
-                LOG.debug("Trial # %d failed due to exception %s", retry_attempts, str(ex))
-
-                retry_attempts = retry_attempts + 1
-                if retry_attempts > self.max_attempts:
-                    LOG.error("Describing stack events for %s failed: %s", stack_name, str(ex))
-                    return
-                # Sleep in exponential backoff mode
-                time.sleep(math.pow(self.backoff, retry_attempts))
+                        LOG.debug("Stack %s does not exist", stack_name)
+                        return None
+
+                    LOG.debug("Trial # %d failed due to exception %s", retry_attempts, str(ex))
+
+                    retry_attempts = retry_attempts + 1
+                    if retry_attempts > self.max_attempts:
+                        LOG.error("Describing stack events for %s failed: %s", stack_name, str(ex))
+                        return None
+                    # Sleep in exponential backoff mode
+                    time.sleep(math.pow(self.backoff, retry_attempts))
+
+        return stack_status
 
     @staticmethod
     def _is_root_stack_event(event: Dict) -> bool:
@@ -478,6 +474,7 @@ class Deployer:
     def _check_stack_not_in_progress(status: str) -> bool:
         return "IN_PROGRESS" not in status
 
+    @traced("deploy.changeset.wait_for_execute")
     def wait_for_execute(
         self,
         stack_name: str,
@@ -509,30 +506,26 @@ class Deployer:
         )
         sys.stdout.flush()
 
-        self.describe_stack_events(stack_name, time_stamp_marker, on_failure)
+        stack_status = self.describe_stack_events(stack_name, time_stamp_marker, on_failure)
 
-        # Pick the right waiter
-        if stack_operation == "CREATE":
-            waiter = self._client.get_waiter("stack_create_complete")
-        elif stack_operation == "UPDATE":
-            waiter = self._client.get_waiter("stack_update_complete")
-        else:
+        if stack_operation not in STACK_OPERATION_SUCCESS_STATUS:
             raise RuntimeError("Invalid stack operation type {0}".format(stack_operation))
 
-        # Poll every 30 seconds. Polling too frequently risks hitting rate limits
-        # on CloudFormation's DescribeStacks API
-        waiter_config = {"Delay": 30, "MaxAttempts": 120}
-
         try:
-            waiter.wait(StackName=stack_name, WaiterConfig=waiter_config)
-        except botocore.exceptions.WaiterError as ex:
-            LOG.debug("Execute stack waiter exception", exc_info=ex)
+            if stack_status:
+                # the events showed that the stack operation completed, no need to wait for it
+                if stack_status != STACK_OPERATION_SUCCESS_STATUS[stack_operation]:
+                    raise deploy_exceptions.DeployFailedError(
+                        stack_name=stack_name, msg=f"Stack operation completed with status {stack_status}"
+                    )
+            else:
+                self._wait_for_stack_operation(stack_name, stack_operation)
+        except deploy_exceptions.DeployFailedError:
             if disable_rollback and on_failure is not FailureMode.DELETE:
                 # This will only display the message if disable rollback is set or if DO_NOTHING is specified
                 msg = self._gen_deploy_failed_with_rollback_disabled_msg(stack_name)
                 LOG.info(self._colored.color_log(msg=msg, color=Colors.FAILURE), extra=dict(markup=True))
-
-            raise deploy_exceptions.DeployFailedError(stack_name=stack_name, msg=str(ex))
+            raise
 
         try:
             outputs = self.get_stack_outputs(stack_name=stack_name, echo=False)
@@ -543,6 +536,31 @@ class Deployer:
             if on_failure != FailureMode.DELETE:
                 raise ex
 
+    def _wait_for_stack_operation(self, stack_name: str, stack_operation: str) -> None:
+        """
+        Waits for the stack operation to complete with the stack_*_complete waiters
+
+        Raises
+        ------
+        DeployFailedError
+            If the stack operation failed
+        """
+        # Pick the right waiter
+        if stack_operation == "CREATE":
+            waiter = self._client.get_waiter("stack_create_complete")
+        else:
+            waiter = self._client.get_waiter("stack_update_complete")
+
+        # Poll every 30 seconds. Polling too frequently risks hitting rate limits
+        # on CloudFormation's DescribeStacks API
+        waiter_config = {"Delay": 30, "MaxAttempts": 120}
+
+        try:
+            waiter.wait(StackName=stack_name, WaiterConfig=waiter_config)
+        except botocore.exceptions.WaiterError as ex:
+            LOG.debug("Execute stack waiter exception", exc_info=ex)
+            raise deploy_exceptions.DeployFailedError(stack_name=stack_name, msg=str(ex))
+
     def create_and_wait_for_changeset(
         self, stack_name, cfn_template, parameter_values, capabilities, role_arn, notification_arns, s3_uploader, tags
     ):
@@ -0,0 +1,218 @@
+"""
+Streams the events of a CloudFormation stack and of all its nested stacks
+"""
+
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional, Set
+
+import botocore
+
+from samcli.lib.utils.resources import AWS_CLOUDFORMATION_STACK
+from samcli.lib.utils.time import to_datetime, utc_to_timestamp
+
+LOG = logging.getLogger(__name__)
+
+# Maximum number of nested stacks whose events are described at the same time
+NESTED_STACKS_MAX_WORKERS = 8
+
+
+@dataclass
+class _TailedStack:
+    """
+    Stack whose events are streamed
+
+    Attributes
+    ----------
+    stack_name: str
+        Name or ID of the stack
+    path: str
+        Logical IDs of the nested stack resources leading to the stack from the root stack, separated by "/".
+        Empty for the root stack
+    time_stamp_marker: float
+        Time of the latest event streamed, older events are not streamed
+    event_ids: Set[str]
+        IDs of the events streamed
+    started_at: float
+        Time of the latest event of the parent stack reporting the nested stack in progress
+    """
+
+    stack_name: str
+    path: str
+    time_stamp_marker: float
+    event_ids: Set[str] = field(default_factory=set)
+    started_at: float = 0.0
+
+
+class StackEventStreamer:
+    """
+    Tails the events of a stack and of its nested stacks. Nested stacks are discovered from the events of their parent
+    stack, and their events are described concurrently until their own operation completes.
+
+    The streamer is a context manager, which shuts down the threads describing the nested stacks on exit.
+    """
+
+    def __init__(self, cloudformation_client, stack_name: str, time_stamp_marker: float):
+        """
+        Parameters
+        ----------
+        cloudformation_client
+            CloudFormation client
+        stack_name: str
+            Name or ID of the root stack
+        time_stamp_marker: float
+            Only the events which happened after this time are streamed
+        """
+        self._client = cloudformation_client
+        self._time_stamp_marker = time_stamp_marker
+        self._root_stack = _TailedStack(stack_name=stack_name, path="", time_stamp_marker=time_stamp_marker)
+        # nested stacks being tailed, keyed by stack ID
+        self._nested_stacks: Dict[str, _TailedStack] = {}
+        # nested stacks whose operation completed, tailed again if their parent stack updates them again
+        self._finished_nested_stacks: Dict[str, _TailedStack] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def __enter__(self) -> "StackEventStreamer":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Shuts down the threads describing the nested stacks
+        """
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def poll(self) -> List[Dict]:
+        """
+        Describes the new events of the root stack and of the nested stacks found so far.
+
+        The events of the nested stacks have the path of their stack prepended to their LogicalResourceId
+        (ex. "NestedStack/MyFunction"). The events of a nested stack about the nested stack itself are left out, the
+        events of the nested stack resource in the parent stack report them already.
+
+        Returns
+        -------
+        List[Dict]
+            New stack events, in chronological order
+
+        Raises
+        ------
+        botocore.exceptions.ClientError
+            If the events of the root stack can't be described. Errors for nested stacks are logged, and their events
+            are described again on the next poll
+        """
+        events = self._get_new_events(self._root_stack)
+        self._track_nested_stacks(self._root_stack, events)
+
+        nested_stacks = list(self._nested_stacks.items())
+        if nested_stacks:
+            if not self._executor:
+                self._executor = ThreadPoolExecutor(max_workers=NESTED_STACKS_MAX_WORKERS)
+            for (stack_id, nested_stack), nested_events in zip(
+                nested_stacks,
+                self._executor.map(self._get_new_nested_stack_events, [stack for _, stack in nested_stacks]),
+            ):
+                self._track_nested_stacks(nested_stack, nested_events)
+                self._untrack_finished_nested_stack(stack_id, nested_stack, nested_events)
+                events.extend(
+                    {**event, "LogicalResourceId": f"{nested_stack.path}/{event['LogicalResourceId']}"}
+                    for event in nested_events
+                    if event.get("PhysicalResourceId") != event.get("StackId")
+                )
+            events.sort(key=lambda event: utc_to_timestamp(event["Timestamp"]))
+        return events
+
+    def _get_new_nested_stack_events(self, stack: _TailedStack) -> List[Dict]:
+        try:
+            return self._get_new_events(stack)
+        except botocore.exceptions.ClientError as ex:
+            LOG.debug("Unable to describe the events of nested stack %s", stack.path, exc_info=ex)
+            return []
+
+    def _get_new_events(self, stack: _TailedStack) -> List[Dict]:
+        paginator = self._client.get_paginator("describe_stack_events")
+        response_iterator = paginator.paginate(StackName=stack.stack_name)
+
+        # Event buffer
+        new_events: Deque[Dict] = deque()
+
+        for event_items in response_iterator:
+            for event in event_items["StackEvents"]:
+                LOG.debug("Stack Event: %s", event)
+                # Skip already shown old event entries or former deployments
+                if utc_to_timestamp(event["Timestamp"]) <= stack.time_stamp_marker:
+                    LOG.debug(
+                        "Skip previous event as time_stamp_marker: %s is after the event time stamp: %s",
+                        to_datetime(stack.time_stamp_marker),
+                        event["Timestamp"],
+                    )
+                    break
+                if event["EventId"] not in stack.event_ids:
+                    stack.event_ids.add(event["EventId"])
+                    # Events are in reverse chronological order
+                    # Pushing in front reverse the order to display older events first
+                    new_events.appendleft(event)
+            else:  # go to next loop (page of events) if not break from inside loop
+                LOG.debug("Still in describe_stack_events loop, got to next page")
+                continue
+            break  # reached here only if break from inner loop!
+
+        # Override timestamp marker with latest event (last in deque)
+        if new_events:
+            stack.time_stamp_marker = utc_to_timestamp(new_events[-1]["Timestamp"])
+        return list(new_events)
+
+    def _track_nested_stacks(self, parent_stack: _TailedStack, events: List[Dict]) -> None:
+        """
+        Starts tailing the nested stacks of parent_stack which appear in its events, and tails the finished ones
+        again when parent_stack reports them in progress again (ex. when they are rolled back)
+        """
+        for event in events:
+            stack_id = event.get("PhysicalResourceId", "")
+            if (
+                event.get("ResourceType") != AWS_CLOUDFORMATION_STACK
+                or not stack_id.startswith("arn:")
+                or stack_id == event.get("StackId")
+            ):
+                continue
+            in_progress = event.get("ResourceStatus", "").endswith("_IN_PROGRESS")
+            nested_stack = self._nested_stacks.get(stack_id)
+            if not nested_stack:
+                nested_stack = self._finished_nested_stacks.pop(stack_id, None)
+                if nested_stack and not in_progress:
+                    self._finished_nested_stacks[stack_id] = nested_stack
+                    continue
+                if not nested_stack:
+                    path = f"{parent_stack.path}/{event['LogicalResourceId']}".lstrip("/")
+                    # the nested stack is created or updated by the current operation, all its recent events are
+                    # relevant
+                    nested_stack = _TailedStack(
+                        stack_name=stack_id, path=path, time_stamp_marker=self._time_stamp_marker
+                    )
+                LOG.debug("Streaming the events of nested stack %s", nested_stack.path)
+                self._nested_stacks[stack_id] = nested_stack
+            if in_progress:
+                nested_stack.started_at = max(nested_stack.started_at, utc_to_timestamp(event["Timestamp"]))
+
+    def _untrack_finished_nested_stack(self, stack_id: str, nested_stack: _TailedStack, events: List[Dict]) -> None:
+        """
+        Stops tailing the nested stack once its own latest event reports that its operation completed, unless its
+        parent stack started another operation on it since
+        """
+        own_events = [event for event in events if event.get("PhysicalResourceId") == event.get("StackId")]
+        if not own_events:
+            return
+        latest_event = own_events[-1]
+        if latest_event.get("ResourceStatus", "").endswith(("_COMPLETE", "_FAILED")) and (
+            utc_to_timestamp(latest_event["Timestamp"]) >= nested_stack.started_at
+        ):
+            LOG.debug(
+                "Nested stack %s is %s, stop streaming its events", nested_stack.path, latest_event["ResourceStatus"]
+            )
+            self._finished_nested_stacks[stack_id] = self._nested_stacks.pop(stack_id)
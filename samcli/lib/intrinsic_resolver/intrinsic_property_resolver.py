@@ -66,6 +66,10 @@ class IntrinsicResolver:
 
     CONDITIONAL_FUNCTIONS = [FN_AND, FN_OR, FN_IF, FN_EQUALS, FN_NOT]
 
+    CONDITION = "Condition"
+    # Sections of the template which resolve_template replaces with resolved copies
+    RESOLVED_SECTIONS = ["Resources", "Outputs"]
+
     def __init__(self, template, symbol_resolver):
         """
         Initializes the Intrinsic Property class with the default intrinsic_key_function_map and
@@ -80,6 +84,8 @@ class IntrinsicResolver:
         self._parameters = None
         self._conditions = None
         self._outputs = None
+        self._resolved_conditions = {}
+        self._condition_dependencies = None
         self.init_template(template)
 
         self._symbol_resolver = symbol_resolver
@@ -88,7 +94,18 @@ class IntrinsicResolver:
         self.conditional_key_function_map = self.default_conditional_key_map()
 
     def init_template(self, template):
-        self._template = copy.deepcopy(template or {})
+        template = template or {}
+        if isinstance(template, dict):
+            # Resolving never modifies the template, and builds new dictionaries and lists for the resolved sections,
+            # so only the other sections are copied to keep the processed template independent of the given one
+            self._template = copy.copy(template)
+            for key, value in template.items():
+                if key not in IntrinsicResolver.RESOLVED_SECTIONS or not value:
+                    self._template[key] = copy.deepcopy(value)
+        else:
+            self._template = copy.deepcopy(template)
+        self._resolved_conditions = {}
+        self._condition_dependencies = None
         self._resources = self._template.get("Resources", {})
         self._mapping = self._template.get("Mappings", {})
         self._parameters = self._template.get("Parameters", {})
@@ -195,7 +212,9 @@ class IntrinsicResolver:
             raise InvalidIntrinsicException("Missing Intrinsic property in {}".format(parent_function))
         if isinstance(intrinsic, list):
             return [self.intrinsic_property_resolver(item, ignore_errors) for item in intrinsic]
-        if not isinstance(intrinsic, dict) or intrinsic == {}:
+        if intrinsic == {}:
+            return {}
+        if not isinstance(intrinsic, dict):
             return intrinsic
 
         # `intrinsic` is a dict at this point.
@@ -230,7 +249,7 @@ class IntrinsicResolver:
             except Exception:
                 if ignore_errors:
                     LOG.debug("Unable to resolve property %s: %s. Leaving as is.", key, val)
-                    sanitized_dict[key] = val
+                    sanitized_dict[key] = copy.deepcopy(val)
                 else:
                     raise
 
@@ -279,13 +298,117 @@ class IntrinsicResolver:
                 resource_type = val.get("Type", "")
                 if ignore_errors:
                     LOG.error("Unable to process properties of %s.%s", key, resource_type)
-                    processed_dict[key] = val
+                    processed_dict[key] = copy.deepcopy(val)
                 else:
                     raise InvalidIntrinsicException(
                         "Exception with property of {}.{}".format(key, resource_type) + ": " + str(e.args)
                     ) from e
         return processed_dict
 
+    def resolve_condition(self, condition_name, ignore_errors, parent_function="Conditions"):
+        """
+        Evaluates the condition of the Conditions dictionary with the given name. Each condition is evaluated once and
+        its result is reused by all the Fn::If, Fn::And, Fn::Or and Fn::Not which refer to it.
+
+        The conditions the condition refers to are evaluated first, in dependency order, so that evaluating a
+        condition never evaluates another one recursively, however long the chain of conditions is.
+
+        Parameters
+        ----------
+        condition_name: str
+            The name of a condition of the Conditions dictionary
+        ignore_errors: bool
+            Whether to ignore errors
+        parent_function: str
+            The intrinsic function referring to the condition, used in the error messages
+
+        Return
+        -------
+        The evaluated condition
+
+        Raises
+        ------
+        InvalidIntrinsicException
+            If the condition depends on itself through the conditions it refers to
+        """
+        if condition_name in self._resolved_conditions:
+            return self._resolved_conditions[condition_name]
+
+        evaluation_order = self._get_condition_evaluation_order(condition_name)
+        for dependency_name in evaluation_order[:-1]:
+            try:
+                self._evaluate_condition(dependency_name, ignore_errors, parent_function)
+            except Exception:  # pylint: disable=broad-except
+                # The condition might not need this dependency, as in a Fn::And with a false condition before it.
+                # When it does, the dependency is evaluated again and the error raised then
+                LOG.debug("Unable to evaluate the condition %s, required by %s", dependency_name, condition_name)
+        return self._evaluate_condition(condition_name, ignore_errors, parent_function)
+
+    def _evaluate_condition(self, condition_name, ignore_errors, parent_function):
+        if condition_name not in self._resolved_conditions:
+            self._resolved_conditions[condition_name] = self.intrinsic_property_resolver(
+                self._conditions.get(condition_name), ignore_errors, parent_function=parent_function
+            )
+        return self._resolved_conditions[condition_name]
+
+    def _get_condition_evaluation_order(self, condition_name):
+        """
+        Returns the names of the conditions which have to be evaluated for the given condition, each after the
+        conditions it refers to, and ending with the given condition. Conditions already evaluated are left out.
+        """
+        dependencies = self._get_condition_dependencies()
+        evaluation_order = []
+        visited = set(self._resolved_conditions)
+        # depth first search without recursion, the path holds the conditions being visited with their dependencies
+        # left to visit
+        path = [(condition_name, iter(dependencies.get(condition_name, [])))]
+        path_names = {condition_name}
+        while path:
+            name, remaining_dependencies = path[-1]
+            dependency_name = next(remaining_dependencies, None)
+            if dependency_name is None:
+                path.pop()
+                path_names.discard(name)
+                visited.add(name)
+                evaluation_order.append(name)
+            elif dependency_name in path_names:
+                cycle = [path_name for path_name, _ in path]
+                cycle = cycle[cycle.index(dependency_name) :] + [dependency_name]
+                raise InvalidIntrinsicException(
+                    "Circular dependency between the conditions {}".format(" -> ".join(cycle))
+                )
+            elif dependency_name not in visited and dependency_name in dependencies:
+                path.append((dependency_name, iter(dependencies[dependency_name])))
+                path_names.add(dependency_name)
+        return evaluation_order
+
+    def _get_condition_dependencies(self):
+        """
+        Returns the names of the conditions each condition of the Conditions dictionary refers to, with
+        {"Condition": condition_name} or with Fn::If. The dependency graph is built once per template.
+        """
+        if self._condition_dependencies is None:
+            self._condition_dependencies = {
+                condition_name: list(dict.fromkeys(self._find_condition_references(condition)))
+                for condition_name, condition in (self._conditions or {}).items()
+            }
+        return self._condition_dependencies
+
+    @staticmethod
+    def _find_condition_references(intrinsic):
+        pending = [intrinsic]
+        while pending:
+            item = pending.pop()
+            if isinstance(item, list):
+                pending.extend(reversed(item))
+            elif isinstance(item, dict):
+                if isinstance(item.get(IntrinsicResolver.CONDITION), str):
+                    yield item[IntrinsicResolver.CONDITION]
+                if_arguments = item.get(IntrinsicResolver.FN_IF)
+                if isinstance(if_arguments, list) and if_arguments and isinstance(if_arguments[0], str):
+                    yield if_arguments[0]
+                pending.extend(reversed(list(item.values())))
+
     def handle_fn_join(self, intrinsic_value, ignore_errors):
         """
         { "Fn::Join" : [ "delimiter", [ comma-delimited list of values ] ] }
@@ -741,9 +864,7 @@ class IntrinsicResolver:
             message="The condition is missing in the Conditions dictionary for {}".format(IntrinsicResolver.FN_IF),
         )
 
-        condition_evaluated = self.intrinsic_property_resolver(
-            condition, ignore_errors, parent_function=IntrinsicResolver.FN_IF
-        )
+        condition_evaluated = self.resolve_condition(condition_name, ignore_errors, IntrinsicResolver.FN_IF)
         verify_intrinsic_type_bool(
             condition_evaluated,
             IntrinsicResolver.FN_IF,
@@ -804,16 +925,14 @@ class IntrinsicResolver:
         argument_sanitised = self.intrinsic_property_resolver(
             arguments[0], ignore_errors, parent_function=IntrinsicResolver.FN_NOT
         )
-        if isinstance(argument_sanitised, dict) and "Condition" in arguments[0]:
-            condition_name = argument_sanitised.get("Condition")
+        if isinstance(argument_sanitised, dict) and IntrinsicResolver.CONDITION in arguments[0]:
+            condition_name = argument_sanitised.get(IntrinsicResolver.CONDITION)
             verify_intrinsic_type_str(condition_name, IntrinsicResolver.FN_NOT)
 
             condition = self._conditions.get(condition_name)
             verify_non_null(condition, IntrinsicResolver.FN_NOT, position_in_list="first")
 
-            argument_sanitised = self.intrinsic_property_resolver(
-                condition, ignore_errors, parent_function=IntrinsicResolver.FN_NOT
-            )
+            argument_sanitised = self.resolve_condition(condition_name, ignore_errors, IntrinsicResolver.FN_NOT)
 
         verify_intrinsic_type_bool(
             argument_sanitised,
@@ -869,8 +988,8 @@ class IntrinsicResolver:
         verify_intrinsic_type_list(arguments, IntrinsicResolver.FN_AND)
 
         for i, argument in enumerate(arguments):
-            if isinstance(argument, dict) and "Condition" in argument:
-                condition_name = argument.get("Condition")
+            if isinstance(argument, dict) and IntrinsicResolver.CONDITION in argument:
+                condition_name = argument.get(IntrinsicResolver.CONDITION)
                 verify_intrinsic_type_str(condition_name, IntrinsicResolver.FN_AND)
 
                 condition = self._conditions.get(condition_name)
@@ -878,9 +997,7 @@ class IntrinsicResolver:
                     condition, IntrinsicResolver.FN_AND, position_in_list=self.get_prefix_position_in_list(i)
                 )
 
-                condition_evaluated = self.intrinsic_property_resolver(
-                    condition, ignore_errors, parent_function=IntrinsicResolver.FN_AND
-                )
+                condition_evaluated = self.resolve_condition(condition_name, ignore_errors, IntrinsicResolver.FN_AND)
                 verify_intrinsic_type_bool(condition_evaluated, IntrinsicResolver.FN_AND)
 
                 if not condition_evaluated:
@@ -925,8 +1042,8 @@ class IntrinsicResolver:
         )
         verify_intrinsic_type_list(arguments, IntrinsicResolver.FN_OR)
         for i, argument in enumerate(arguments):
-            if isinstance(argument, dict) and "Condition" in argument:
-                condition_name = argument.get("Condition")
+            if isinstance(argument, dict) and IntrinsicResolver.CONDITION in argument:
+                condition_name = argument.get(IntrinsicResolver.CONDITION)
                 verify_intrinsic_type_str(condition_name, IntrinsicResolver.FN_OR)
 
                 condition = self._conditions.get(condition_name)
@@ -934,9 +1051,7 @@ class IntrinsicResolver:
                     condition, IntrinsicResolver.FN_OR, position_in_list=self.get_prefix_position_in_list(i)
                 )
 
-                condition_evaluated = self.intrinsic_property_resolver(
-                    condition, ignore_errors, parent_function=IntrinsicResolver.FN_OR
-                )
+                condition_evaluated = self.resolve_condition(condition_name, ignore_errors, IntrinsicResolver.FN_OR)
                 verify_intrinsic_type_bool(condition_evaluated, IntrinsicResolver.FN_OR)
                 if condition_evaluated:
                     return True
@@ -5,8 +5,9 @@ The producer for the 'sam list endpoints' command
 import dataclasses
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from botocore.exceptions import BotoCoreError, ClientError
 
@@ -46,6 +47,8 @@ API_ID = "ApiId"
 DOMAIN_NAME = "DomainName"
 BODY = "Body"
 PATHS = "paths"
+# Maximum number of deployed resources whose endpoints are looked up at the same time
+CLOUD_ENDPOINTS_MAX_WORKERS = 8
 
 LOG = logging.getLogger(__name__)
 
@@ -233,73 +236,102 @@ class EndpointsProducer(ResourceMappingProducer, Producer):
         endpoint: Any
             The endpoint(s) of the current API resource
         """
-        endpoint: Any
+        if deployed_resource.get(LOGICAL_RESOURCE_ID, "") in custom_domain_substitute_dict:
+            # the stages aren't part of the custom domain endpoints, no need to look them up
+            return custom_domain_substitute_dict.get(deployed_resource.get(LOGICAL_RESOURCE_ID, ""), "-")
         stages = self.get_stage_list(
             deployed_resource.get(PHYSICAL_RESOURCE_ID, ""),
             get_api_type_enum(deployed_resource.get(RESOURCE_TYPE, "")),
         )
-        if deployed_resource.get(LOGICAL_RESOURCE_ID, "") in custom_domain_substitute_dict:
-            endpoint = custom_domain_substitute_dict.get(deployed_resource.get(LOGICAL_RESOURCE_ID, ""), "-")
-        else:
-            endpoint = self.build_api_gw_endpoints(deployed_resource.get(PHYSICAL_RESOURCE_ID, ""), stages)
-        return endpoint
+        return self.build_api_gw_endpoints(deployed_resource.get(PHYSICAL_RESOURCE_ID, ""), stages)
 
-    def get_cloud_endpoints(self, stacks: list) -> list:
+    def get_cloud_endpoint(
+        self, deployed_resource: Dict[Any, Any], local_stack: Stack, custom_domain_substitute_dict: Dict[Any, Any]
+    ) -> Dict[str, Any]:
         """
-        Gets a list of cloud endpoints resources
+        Gets the endpoint data of a deployed function or API
+
+        Parameters
+        ----------
+        deployed_resource: Dict[Any, Any]
+            Dictionary containing the resource info of the deployed function or API
+        local_stack: Stack
+            The local stack, which contains the paths and methods of the APIs
+        custom_domain_substitute_dict: Dict[Any, Any]
+            Dictionary containing the mappings of the custom domains for APIs
+
+        Returns
+        -------
+        Dict[str, Any]
+            The endpoint data of the resource, see EndpointsDef
+        """
+        endpoint_function_url: Any = "-"
+        paths_and_methods: Any = "-"
+
+        # Collect function URLs
+        if deployed_resource.get(RESOURCE_TYPE, "") == AWS_LAMBDA_FUNCTION:
+            endpoint_function_url = self.get_function_url(deployed_resource.get(PHYSICAL_RESOURCE_ID, ""))
+
+        # Collect APIGW endpoints and methods
+        elif deployed_resource.get(RESOURCE_TYPE, "") in (AWS_APIGATEWAY_RESTAPI, AWS_APIGATEWAY_V2_API):
+            endpoint_function_url = self.get_api_gateway_endpoint(deployed_resource, custom_domain_substitute_dict)
+            paths_and_methods = get_methods_and_paths(deployed_resource.get(LOGICAL_RESOURCE_ID, ""), local_stack)
+
+        endpoint_data = EndpointsDef(
+            LogicalResourceId=deployed_resource.get(LOGICAL_RESOURCE_ID, "-"),
+            PhysicalResourceId=deployed_resource.get(PHYSICAL_RESOURCE_ID, "-"),
+            CloudEndpoint=endpoint_function_url,
+            Methods=paths_and_methods,
+        )
+        return dataclasses.asdict(endpoint_data)
+
+    def get_cloud_endpoints(self, stacks: list, response: Optional[Dict[Any, Any]] = None) -> list:
+        """
+        Gets a list of cloud endpoints resources. The endpoints of the deployed resources are looked up concurrently,
+        on up to CLOUD_ENDPOINTS_MAX_WORKERS threads sharing the clients of the producer
 
         Parameters
         ----------
         stacks: list
             A list containing the local stack
+        response: Optional[Dict[Any, Any]]
+            The stack resources information returned by get_resources_info, described if not given
 
         Returns
         -------
         endpoints_list: List[Any]
             A list of cloud endpoints resources
         """
-        endpoints_list = []
         local_stack = stacks[0]
         local_stack_resources = local_stack.resources
-        seen_endpoints = set()
-        response = self.get_resources_info()
+        if response is None:
+            response = self.get_resources_info()
         response_domain_dict = get_response_domain_dict(response)
         custom_domain_substitute_dict = get_custom_domain_substitute_list(response, stacks, response_domain_dict)
 
-        # Iterate over the deployed resources, collect relevant endpoint data for functions and APIGW resources
-        for deployed_resource in response.get(STACK_RESOURCES, {}):
-            if deployed_resource.get(RESOURCE_TYPE, "") in ENDPOINT_RESOURCE_TYPES:
-                endpoint_function_url: Any
-                paths_and_methods: Any
-                endpoint_function_url = "-"
-                paths_and_methods = "-"
-
-                # Collect function URLs
-                if deployed_resource.get(RESOURCE_TYPE, "") == AWS_LAMBDA_FUNCTION:
-                    endpoint_function_url = self.get_function_url(deployed_resource.get(PHYSICAL_RESOURCE_ID, ""))
-
-                # Collect APIGW endpoints and methods
-                elif deployed_resource.get(RESOURCE_TYPE, "") in (AWS_APIGATEWAY_RESTAPI, AWS_APIGATEWAY_V2_API):
-                    endpoint_function_url = self.get_api_gateway_endpoint(
-                        deployed_resource, custom_domain_substitute_dict
+        # Collect endpoint data for the deployed functions and APIGW resources, in the order of the stack resources
+        deployed_resources = [
+            deployed_resource
+            for deployed_resource in response.get(STACK_RESOURCES, {})
+            if deployed_resource.get(RESOURCE_TYPE, "") in ENDPOINT_RESOURCE_TYPES
+        ]
+        endpoints_list: List[Any] = []
+        if deployed_resources:
+            with ThreadPoolExecutor(max_workers=min(len(deployed_resources), CLOUD_ENDPOINTS_MAX_WORKERS)) as executor:
+                endpoints_list.extend(
+                    executor.map(
+                        lambda deployed_resource: self.get_cloud_endpoint(
+                            deployed_resource, local_stack, custom_domain_substitute_dict
+                        ),
+                        deployed_resources,
                     )
-                    paths_and_methods = get_methods_and_paths(
-                        deployed_resource.get(LOGICAL_RESOURCE_ID, ""), local_stack
-                    )
-
-                endpoint_data = EndpointsDef(
-                    LogicalResourceId=deployed_resource.get(LOGICAL_RESOURCE_ID, "-"),
-                    PhysicalResourceId=deployed_resource.get(PHYSICAL_RESOURCE_ID, "-"),
-                    CloudEndpoint=endpoint_function_url,
-                    Methods=paths_and_methods,
                 )
-                endpoints_list.append(dataclasses.asdict(endpoint_data))
-                seen_endpoints.add(deployed_resource.get(LOGICAL_RESOURCE_ID, ""))
+        seen_endpoints = {deployed_resource.get(LOGICAL_RESOURCE_ID, "") for deployed_resource in deployed_resources}
 
         # Loop over resources all stack resources and collect data for resources not yet deployed
         for local_resource in local_stack_resources:
             local_resource_type = local_stack_resources.get(local_resource, {}).get("Type", "")
-            paths_and_methods = "-"
+            paths_and_methods: Any = "-"
             # Check if a resources has already been added to the endpoints list, if not, add it
             if local_resource_type in ENDPOINT_RESOURCE_TYPES and local_resource not in seen_endpoints:
                 # We don't support function URLs locally, so this can only be APIGW endpoint data
@@ -319,18 +351,20 @@ class EndpointsProducer(ResourceMappingProducer, Producer):
         """
         The producer function for the endpoints resources command
         """
-        sam_template = get_template_data(self.template_file)
-
-        translated_dict = self.get_translated_dict(template_file_dict=sam_template)
-        stacks, _ = SamLocalStackProvider.get_stacks(template_file="", template_dictionary=translated_dict)
-        validate_stack(stacks)
-
-        endpoints_list: list
-
-        if self.stack_name:
-            endpoints_list = self.get_cloud_endpoints(stacks)
-        else:
-            endpoints_list = get_local_endpoints(stacks)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # describe the resources of the deployed stack while the template is translated
+            resources_info = executor.submit(self.get_resources_info) if self.stack_name else None
+
+            sam_template = get_template_data(self.template_file)
+            translated_dict = self.get_translated_dict(template_file_dict=sam_template)
+            stacks, _ = SamLocalStackProvider.get_stacks(template_file="", template_dictionary=translated_dict)
+            validate_stack(stacks)
+
+            endpoints_list: list
+            if resources_info:
+                endpoints_list = self.get_cloud_endpoints(stacks, resources_info.result())
+            else:
+                endpoints_list = get_local_endpoints(stacks)
         mapped_output = self.mapper.map(endpoints_list)
         self.consumer.consume(mapped_output)
 
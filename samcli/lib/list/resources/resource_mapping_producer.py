@@ -4,6 +4,7 @@ The producer for the 'sam list resources' command
 
 import dataclasses
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict
 
 from botocore.exceptions import BotoCoreError, ClientError, NoCredentialsError
@@ -129,17 +130,20 @@ class ResourceMappingProducer(Producer):
         """
         Produces the resource data to be printed
         """
-        sam_template = get_template_data(self.template_file)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # describe the resources of the deployed stack while the template is translated
+            resources_info = executor.submit(self.get_resources_info) if self.stack_name else None
 
-        translated_dict = self.get_translated_dict(template_file_dict=sam_template)
+            sam_template = get_template_data(self.template_file)
+            translated_dict = self.get_translated_dict(template_file_dict=sam_template)
+            stacks, _ = SamLocalStackProvider.get_stacks(template_file="", template_dictionary=translated_dict)
+            if not stacks or not stacks[ROOT_STACK].resources:
+                raise SamListLocalResourcesNotFoundError(msg="No local resources found.")
+            response = resources_info.result() if resources_info else None
 
-        stacks, _ = SamLocalStackProvider.get_stacks(template_file="", template_dictionary=translated_dict)
-        if not stacks or not stacks[ROOT_STACK].resources:
-            raise SamListLocalResourcesNotFoundError(msg="No local resources found.")
         seen_resources = set()
         resources_list = []
-        if self.stack_name:
-            response = self.get_resources_info()
+        if response is not None:
             for deployed_resource in response["StackResources"]:
                 resource_data = ResourcesDef(
                     LogicalResourceId=deployed_resource.get("LogicalResourceId"),
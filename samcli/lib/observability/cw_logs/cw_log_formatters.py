@@ -5,7 +5,7 @@ Contains all mappers (formatters) for CloudWatch logs
 import json
 import logging
 from json import JSONDecodeError
-from typing import Any
+from typing import Any, Dict, List
 
 from samcli.lib.observability.cw_logs.cw_log_event import CWLogEvent
 from samcli.lib.observability.observability_info_puller import ObservabilityEventMapper
@@ -39,6 +39,14 @@ class CWKeywordHighlighterFormatter(ObservabilityEventMapper[CWLogEvent]):
 
         return event
 
+    def map_all(self, events: List[CWLogEvent]) -> List[CWLogEvent]:
+        if self._keyword:
+            highlight = self._colored.underline(self._keyword)
+            for event in events:
+                event.message = event.message.replace(self._keyword, highlight)
+
+        return events
+
 
 class CWColorizeErrorsFormatter(ObservabilityEventMapper[CWLogEvent]):
     """
@@ -95,6 +103,20 @@ class CWPrettyPrintFormatter(ObservabilityEventMapper[CWLogEvent]):
         event.message = f"{log_stream_name} {timestamp} {event.message}"
         return event
 
+    def map_all(self, events: List[CWLogEvent]) -> List[CWLogEvent]:
+        # the events of a batch share a few log streams and timestamps, format each of them once
+        log_stream_names: Dict[str, str] = {}
+        timestamps: Dict[int, str] = {}
+        for event in events:
+            log_stream_name = log_stream_names.get(event.log_stream_name)
+            if log_stream_name is None:
+                log_stream_name = log_stream_names[event.log_stream_name] = self._colored.cyan(event.log_stream_name)
+            timestamp = timestamps.get(event.timestamp)
+            if timestamp is None:
+                timestamp = timestamps[event.timestamp] = self._colored.yellow(timestamp_to_iso(int(event.timestamp)))
+            event.message = f"{log_stream_name} {timestamp} {event.message}"
+        return events
+
 
 class CWAddNewLineIfItDoesntExist(ObservabilityEventMapper):
     """
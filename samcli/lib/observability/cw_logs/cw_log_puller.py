@@ -5,16 +5,69 @@ CloudWatch log event puller implementation
 import logging
 import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Set, Union
 
 from botocore.exceptions import ClientError
 
 from samcli.lib.observability.cw_logs.cw_log_event import CWLogEvent
 from samcli.lib.observability.observability_info_puller import ObservabilityEventConsumer, ObservabilityPuller
+from samcli.lib.utils.retry import exponential_backoff
 from samcli.lib.utils.time import to_datetime, to_timestamp
 
 LOG = logging.getLogger(__name__)
 
+# Maximum time in seconds between two polls of a log group while CloudWatch Logs API throttles the requests
+MAX_THROTTLED_POLL_INTERVAL = 60
+
+
+class CWLogTailCursor:
+    """
+    Position of a tail in a log group: the timestamp of the latest event loaded, and the IDs of the events loaded with
+    that timestamp.
+
+    The next poll starts at the timestamp of the latest event rather than a millisecond after it, so that events of the
+    same millisecond which were not ingested yet at the previous poll are not missed. The IDs skip the events loaded
+    already, they are only kept for the latest timestamp since polls never return older events.
+    """
+
+    def __init__(self, latest_event_time: int = 0):
+        """
+        Parameters
+        ----------
+        latest_event_time : int
+            Timestamp to start tailing from, in milliseconds
+        """
+        self.latest_event_time = latest_event_time
+        self._latest_event_ids: Set[str] = set()
+
+    def add(self, event: Dict) -> bool:
+        """
+        Moves the cursor past the given event
+
+        Parameters
+        ----------
+        event : Dict
+            Event returned by FilterLogEvents
+
+        Returns
+        -------
+        bool
+            False if the event was loaded already
+        """
+        timestamp = event.get("timestamp", 0)
+        event_id = event.get("eventId")
+        if timestamp > self.latest_event_time:
+            self.latest_event_time = timestamp
+            self._latest_event_ids.clear()
+        elif timestamp < self.latest_event_time or event_id is None:
+            # not returned again by the next polls
+            return True
+        if event_id in self._latest_event_ids:
+            return False
+        if event_id is not None:
+            self._latest_event_ids.add(event_id)
+        return True
+
 
 class CWLogPuller(ObservabilityPuller):
     """
@@ -52,49 +105,92 @@ class CWLogPuller(ObservabilityPuller):
         self.resource_name = resource_name
         self._max_retries = max_retries
         self._poll_interval = poll_interval
-        self.latest_event_time = 0
+        self._cursor = CWLogTailCursor()
         self.had_data = False
         self._invalid_log_group = False
 
+    @property
+    def latest_event_time(self) -> int:
+        """
+        Timestamp of the latest event loaded, the next poll of tail starts from it
+        """
+        return self._cursor.latest_event_time
+
+    @latest_event_time.setter
+    def latest_event_time(self, latest_event_time: int) -> None:
+        self._cursor = CWLogTailCursor(latest_event_time)
+
+    @property
+    def max_retries(self) -> int:
+        """
+        Number of consecutive polls without new events after which tailing stops
+        """
+        return self._max_retries
+
+    @property
+    def poll_interval(self) -> float:
+        """
+        Time in seconds between two polls of the log group when tailing
+        """
+        return self._poll_interval
+
     def tail(self, start_time: Optional[datetime] = None, filter_pattern: Optional[str] = None):
         if start_time:
             self.latest_event_time = to_timestamp(start_time)
 
         counter = self._max_retries
+        throttled_polls = 0
         while counter > 0 and not self.cancelled:
-            LOG.debug("Tailing logs from %s starting at %s", self.cw_log_group, str(self.latest_event_time))
-
             counter -= 1
+            poll_interval: float = self._poll_interval
             try:
-                self.load_time_period(to_datetime(self.latest_event_time), filter_pattern=filter_pattern)
+                # This poll fetched logs. Reset the retry counter
+                if self.poll(filter_pattern):
+                    counter = self._max_retries
+                throttled_polls = 0
             except ClientError as err:
                 error_code = err.response.get("Error", {}).get("Code")
                 if error_code == "ThrottlingException":
-                    # if throttled, increase poll interval by 1 second each time
-                    if self._poll_interval == 1:
-                        self._poll_interval += 1
-                    else:
-                        self._poll_interval **= 2
+                    # if throttled, back off exponentially up to a ceiling
+                    throttled_polls += 1
+                    poll_interval = exponential_backoff(
+                        throttled_polls, 2 * self._poll_interval, MAX_THROTTLED_POLL_INTERVAL
+                    )
                     LOG.warning(
                         "Throttled by CloudWatch Logs API, consider pulling logs for certain resources. "
-                        "Increasing the poll interval time for resource %s to %s seconds",
+                        "Polling resource %s again in %.1f seconds",
                         self.cw_log_group,
-                        self._poll_interval,
+                        poll_interval,
                     )
                 else:
                     # if error is other than throttling, re-raise it
                     LOG.error("Failed while fetching new log events", exc_info=err)
                     raise err
 
-            # This poll fetched logs. Reset the retry counter and set the timestamp for next poll
-            if self.had_data:
-                counter = self._max_retries
-                self.latest_event_time += 1  # one extra millisecond to fetch next log event
-                self.had_data = False
-
             # We already fetched logs once. Sleep for some time before querying again.
             # This also helps us scoot under the TPS limit for CloudWatch API call.
-            time.sleep(self._poll_interval)
+            time.sleep(poll_interval)
+
+    def poll(self, filter_pattern: Optional[str] = None) -> bool:
+        """
+        Loads the events of the log group which happened since the latest event loaded, which is one poll when tailing
+
+        Parameters
+        ----------
+        filter_pattern : Optional[str]
+            Optional parameter to filter events with given string
+
+        Returns
+        -------
+        bool
+            True if new events were loaded
+        """
+        LOG.debug("Tailing logs from %s starting at %s", self.cw_log_group, str(self.latest_event_time))
+        self.had_data = False
+        self.load_time_period(to_datetime(self.latest_event_time), filter_pattern=filter_pattern)
+        had_data = self.had_data
+        self.had_data = False
+        return had_data
 
     def load_time_period(
         self,
@@ -128,15 +224,15 @@ class CWLogPuller(ObservabilityPuller):
                     self._invalid_log_group = True
                 break
 
-            # Several events will be returned. Consume one at a time
-            for event in result.get("events", []):
+            # Several events will be returned. Consume the new ones as a batch
+            cw_events = [
+                CWLogEvent(self.cw_log_group, dict(event), self.resource_name)
+                for event in result.get("events", [])
+                if self._cursor.add(event)
+            ]
+            if cw_events:
                 self.had_data = True
-                cw_event = CWLogEvent(self.cw_log_group, dict(event), self.resource_name)
-
-                if cw_event.timestamp > self.latest_event_time:
-                    self.latest_event_time = cw_event.timestamp
-
-                self.consumer.consume(cw_event)
+                self.consumer.consume_all(cw_events)
 
             # Keep iterating until there are no more logs left to query.
             next_token = result.get("nextToken", None)
@@ -0,0 +1,316 @@
+"""
+Tails many CloudWatch log groups together, within a shared budget of CloudWatch Logs API requests
+"""
+
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from botocore.exceptions import ClientError
+
+from samcli.lib.observability.cw_logs.cw_log_puller import MAX_THROTTLED_POLL_INTERVAL, CWLogPuller
+from samcli.lib.observability.observability_info_puller import ObservabilityPuller
+from samcli.lib.utils.boto_utils import get_client_error_code
+from samcli.lib.utils.retry import exponential_backoff
+from samcli.lib.utils.time import to_timestamp
+
+LOG = logging.getLogger(__name__)
+
+# Requests per second sent to CloudWatch Logs while tailing, for all the log groups together
+TAIL_MAX_REQUESTS_PER_SECOND = 5
+# Maximum number of requests to CloudWatch Logs in flight while tailing
+TAIL_MAX_CONCURRENT_REQUESTS = 4
+# Maximum time in seconds between two polls of a log group which had no new events recently
+TAIL_MAX_IDLE_POLL_INTERVAL = 5
+# idle polls above this one get the maximum poll interval, keeps 2 ** idle_polls within the range of a float
+_MAX_IDLE_POLL_EXPONENT = 16
+
+
+class CWLogTailTransport(ABC):
+    """
+    Fetches the new events of tailed log groups from CloudWatch Logs
+    """
+
+    # Number of log groups whose events can be fetched with a single request
+    max_batch_size: int = 1
+
+    @abstractmethod
+    def fetch(self, pullers: Sequence[CWLogPuller], filter_pattern: Optional[str] = None) -> List[bool]:
+        """
+        Fetches the new events of the log groups of the pullers, and passes them to the consumers of the pullers
+
+        Parameters
+        ----------
+        pullers : Sequence[CWLogPuller]
+            Pullers of the log groups, at most max_batch_size of them
+        filter_pattern : Optional[str]
+            Optional parameter to filter events with given string
+
+        Returns
+        -------
+        List[bool]
+            For each puller, True if new events were fetched
+
+        Raises
+        ------
+        botocore.exceptions.ClientError
+            If the request fails, a ThrottlingException pauses tailing for all the log groups
+        """
+
+
+class FilterLogEventsTransport(CWLogTailTransport):
+    """
+    Fetches the new events of a log group with FilterLogEvents, which only accepts a single log group per request
+    """
+
+    def fetch(self, pullers: Sequence[CWLogPuller], filter_pattern: Optional[str] = None) -> List[bool]:
+        return [puller.poll(filter_pattern) for puller in pullers]
+
+
+class _RequestBudget:
+    """
+    Token bucket which limits the rate of requests, allowing a burst of up to one second of requests
+    """
+
+    def __init__(self, requests_per_second: float):
+        self._requests_per_second = requests_per_second
+        self._tokens = requests_per_second
+        self._last_refill: Optional[float] = None
+
+    def _refill(self, now: float) -> None:
+        if self._last_refill is not None:
+            elapsed = max(now - self._last_refill, 0)
+            self._tokens = min(self._requests_per_second, self._tokens + elapsed * self._requests_per_second)
+        self._last_refill = now
+
+    def try_acquire(self, now: float) -> bool:
+        """
+        Takes the budget of a request if available
+        """
+        self._refill(now)
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    def time_until_available(self, now: float) -> float:
+        """
+        Returns the time in seconds until the budget of a request is available
+        """
+        self._refill(now)
+        return max(1 - self._tokens, 0) / self._requests_per_second
+
+
+@dataclass
+class _TailedLogGroup:
+    """
+    Tailing state of a log group
+
+    Attributes
+    ----------
+    puller: CWLogPuller
+        Puller of the log group
+    remaining_polls: int
+        Number of polls without new events left before tailing of the log group stops
+    next_poll_time: float
+        Monotonic time of the next poll of the log group
+    last_active_time: float
+        Monotonic time of the latest poll which fetched new events, log groups active recently are polled first
+    idle_polls: int
+        Number of consecutive polls without new events
+    in_flight: bool
+        Whether a request for the log group is in flight
+    """
+
+    puller: CWLogPuller
+    remaining_polls: int
+    next_poll_time: float = 0.0
+    last_active_time: float = float("-inf")
+    idle_polls: int = 0
+    in_flight: bool = False
+
+
+class CWLogTailScheduler(ObservabilityPuller):
+    """
+    Puller which tails the log groups of many CWLogPuller instances with a few threads, instead of one thread each.
+
+    All the log groups share a budget of requests per second and a maximum number of requests in flight. Log groups
+    which had new events recently are polled every poll interval and before the others, while the poll interval of
+    idle log groups grows up to TAIL_MAX_IDLE_POLL_INTERVAL. When CloudWatch Logs throttles a request, tailing of all
+    the log groups pauses with a jittered exponential backoff, since the quotas apply to the whole account.
+    """
+
+    def __init__(
+        self,
+        pullers: Sequence[CWLogPuller],
+        transport: Optional[CWLogTailTransport] = None,
+        max_requests_per_second: float = TAIL_MAX_REQUESTS_PER_SECOND,
+        max_concurrent_requests: int = TAIL_MAX_CONCURRENT_REQUESTS,
+        max_idle_poll_interval: float = TAIL_MAX_IDLE_POLL_INTERVAL,
+        max_throttled_poll_interval: float = MAX_THROTTLED_POLL_INTERVAL,
+    ):
+        """
+        Parameters
+        ----------
+        pullers : Sequence[CWLogPuller]
+            Pullers of the log groups to tail, their poll interval is the one of the log groups which are active
+        transport : Optional[CWLogTailTransport]
+            Transport which fetches the new events of the log groups, FilterLogEventsTransport by default
+        max_requests_per_second : float
+            Requests per second sent to CloudWatch Logs, for all the log groups together
+        max_concurrent_requests : int
+            Maximum number of requests in flight
+        max_idle_poll_interval : float
+            Maximum time in seconds between two polls of a log group without new events
+        max_throttled_poll_interval : float
+            Maximum time in seconds tailing pauses for when throttled
+        """
+        self._pullers = pullers
+        self._transport = transport or FilterLogEventsTransport()
+        self._max_requests_per_second = max_requests_per_second
+        self._max_concurrent_requests = max_concurrent_requests
+        self._max_idle_poll_interval = max_idle_poll_interval
+        self._max_throttled_poll_interval = max_throttled_poll_interval
+        self._throttled_requests = 0
+        self._throttled_until = 0.0
+        self._wake_up = threading.Event()
+
+    def tail(self, start_time: Optional[datetime] = None, filter_pattern: Optional[str] = None):
+        if start_time:
+            for puller in self._pullers:
+                puller.latest_event_time = to_timestamp(start_time)
+
+        budget = _RequestBudget(self._max_requests_per_second)
+        log_groups = [_TailedLogGroup(puller, puller.max_retries) for puller in self._pullers]
+        in_flight: Dict[Future, List[_TailedLogGroup]] = {}
+        self._throttled_requests = 0
+        self._throttled_until = 0.0
+
+        with ThreadPoolExecutor(max_workers=self._max_concurrent_requests) as executor:
+            try:
+                while not self.cancelled and (in_flight or any(group.remaining_polls > 0 for group in log_groups)):
+                    timeout = self._dispatch(log_groups, in_flight, budget, executor, filter_pattern)
+                    if in_flight:
+                        done, _ = wait(list(in_flight), timeout=timeout, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            self._complete(in_flight.pop(future), future)
+                    else:
+                        self._wake_up.wait(timeout)
+            finally:
+                for future in in_flight:
+                    future.cancel()
+
+    def _dispatch(
+        self,
+        log_groups: List[_TailedLogGroup],
+        in_flight: Dict[Future, List[_TailedLogGroup]],
+        budget: _RequestBudget,
+        executor: ThreadPoolExecutor,
+        filter_pattern: Optional[str],
+    ) -> float:
+        """
+        Sends the requests for the log groups due for a poll, within the budget, and returns the time in seconds
+        until more requests can be sent
+        """
+        now = time.monotonic()
+        if now < self._throttled_until:
+            return self._throttled_until - now
+
+        due_log_groups = sorted(
+            (
+                group
+                for group in log_groups
+                if not group.in_flight and group.remaining_polls > 0 and group.next_poll_time <= now
+            ),
+            key=lambda group: group.last_active_time,
+            reverse=True,
+        )
+        batch_size = self._transport.max_batch_size
+        for index in range(0, len(due_log_groups), batch_size):
+            if len(in_flight) >= self._max_concurrent_requests or not budget.try_acquire(now):
+                break
+            batch = due_log_groups[index : index + batch_size]
+            for group in batch:
+                group.in_flight = True
+                group.remaining_polls -= 1
+            future = executor.submit(self._transport.fetch, [group.puller for group in batch], filter_pattern)
+            in_flight[future] = batch
+
+        waiting_log_groups = [
+            group.next_poll_time for group in log_groups if not group.in_flight and group.remaining_polls > 0
+        ]
+        if not waiting_log_groups or len(in_flight) >= self._max_concurrent_requests:
+            # only a completed request can make more requests possible
+            return self._max_idle_poll_interval
+        return max(min(waiting_log_groups) - now, budget.time_until_available(now), 0)
+
+    def _complete(self, batch: List[_TailedLogGroup], future: Future) -> None:
+        """
+        Schedules the next poll of the log groups of a completed request
+        """
+        now = time.monotonic()
+        for group in batch:
+            group.in_flight = False
+
+        try:
+            had_data = future.result()
+        except ClientError as err:
+            if get_client_error_code(err) != "ThrottlingException":
+                LOG.error("Failed while fetching new log events", exc_info=err)
+                raise err
+            self._throttled_requests += 1
+            delay = exponential_backoff(
+                self._throttled_requests,
+                2 * max(group.puller.poll_interval for group in batch),
+                self._max_throttled_poll_interval,
+            )
+            self._throttled_until = max(self._throttled_until, now + delay)
+            LOG.warning(
+                "Throttled by CloudWatch Logs API, consider pulling logs for certain resources. "
+                "Polling log groups again in %.1f seconds",
+                delay,
+            )
+            for group in batch:
+                group.next_poll_time = self._throttled_until
+            return
+
+        self._throttled_requests = 0
+        for group, group_had_data in zip(batch, had_data):
+            poll_interval = group.puller.poll_interval
+            if group_had_data:
+                group.remaining_polls = group.puller.max_retries
+                group.last_active_time = now
+                group.idle_polls = 0
+            else:
+                group.idle_polls += 1
+                idle_poll_interval = poll_interval * 2 ** min(group.idle_polls, _MAX_IDLE_POLL_EXPONENT)
+                poll_interval = max(poll_interval, min(idle_poll_interval, self._max_idle_poll_interval))
+            group.next_poll_time = now + poll_interval
+
+    def load_time_period(
+        self,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        filter_pattern: Optional[str] = None,
+    ):
+        with ThreadPoolExecutor(max_workers=self._max_concurrent_requests) as executor:
+            futures = [
+                executor.submit(puller.load_time_period, start_time, end_time, filter_pattern)
+                for puller in self._pullers
+            ]
+            for future in futures:
+                future.result()
+
+    def load_events(self, event_ids: Union[List[Any], Dict]):
+        LOG.debug("Loading specific events are not supported via CloudWatch Log Group")
+
+    def stop_tailing(self):
+        self.cancelled = True
+        self._wake_up.set()
+        for puller in self._pullers:
+            puller.stop_tailing()
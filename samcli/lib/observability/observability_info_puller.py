@@ -115,6 +115,22 @@ class ObservabilityEventMapper(Generic[ObservabilityEventType]):
             Return converted type
         """
 
+    def map_all(self, events: List[ObservabilityEventType]) -> List[Any]:
+        """
+        Maps a batch of events, mappers which can share work between the events of a batch override it
+
+        Parameters
+        ----------
+        events : List[ObservabilityEventType]
+            Event objects that will be mapped/converted, in order
+
+        Returns
+        -------
+        List[Any]
+            Converted events, in the same order
+        """
+        return [self.map(event) for event in events]
+
 
 class ObservabilityEventConsumer(Generic[ObservabilityEventType]):
     """
@@ -131,6 +147,18 @@ class ObservabilityEventConsumer(Generic[ObservabilityEventType]):
             Event that will be consumed
         """
 
+    def consume_all(self, events: List[ObservabilityEventType]):
+        """
+        Consumes a batch of events, consumers which can handle a batch at once override it
+
+        Parameters
+        ----------
+        events : List[ObservabilityEvent]
+            Events that will be consumed, in order
+        """
+        for event in events:
+            self.consume(event)
+
 
 class ObservabilityEventConsumerDecorator(ObservabilityEventConsumer):
     """
@@ -162,6 +190,17 @@ class ObservabilityEventConsumerDecorator(ObservabilityEventConsumer):
         LOG.debug("Calling consumer (%s) for event (%s)", self._consumer, event)
         self._consumer.consume(event)
 
+    def consume_all(self, events: List[ObservabilityEvent]):
+        """
+        Passes the whole batch of events through each mapper, and then to the actual consumer
+        """
+        mapped_events: List[Any] = events
+        for mapper in self._mappers:
+            LOG.debug("Calling mapper (%s) for %d events", mapper, len(mapped_events))
+            mapped_events = mapper.map_all(mapped_events)
+        LOG.debug("Calling consumer (%s) for %d events", self._consumer, len(mapped_events))
+        self._consumer.consume_all(mapped_events)
+
 
 class ObservabilityCombinedPuller(ObservabilityPuller):
     """
@@ -14,10 +14,11 @@ Exporting resources defined in the cloudformation template to the cloud.
 # distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
+import logging
 import os
 from typing import Dict, List, Optional
 
-from botocore.utils import set_value_from_jmespath
+import jmespath
 
 from samcli.commands.package import exceptions
 from samcli.lib.package.code_signer import CodeSigner
@@ -31,6 +32,7 @@ from samcli.lib.package.packageable_resources import (
 )
 from samcli.lib.package.uploaders import Destination, Uploaders
 from samcli.lib.package.utils import (
+    is_ecr_url,
     is_local_file,
     is_local_folder,
     is_s3_url,
@@ -38,7 +40,8 @@ from samcli.lib.package.utils import (
 )
 from samcli.lib.providers.provider import get_full_path
 from samcli.lib.samlib.resource_metadata_normalizer import ResourceMetadataNormalizer
-from samcli.lib.utils.packagetype import ZIP
+from samcli.lib.utils.lazy_import import lazy_import
+from samcli.lib.utils.packagetype import IMAGE, ZIP
 from samcli.lib.utils.resources import (
     AWS_CLOUDFORMATION_STACK,
     AWS_CLOUDFORMATION_STACKSET,
@@ -49,6 +52,10 @@ from samcli.lib.utils.resources import (
 from samcli.lib.utils.s3 import parse_s3_url
 from samcli.yamlhelper import yaml_dump, yaml_parse
 
+botocore_utils = lazy_import("botocore.utils")
+
+LOG = logging.getLogger(__name__)
+
 # NOTE: sriram-mv, A cyclic dependency on `Template` needs to be broken.
 
 
@@ -101,7 +108,7 @@ class CloudFormationStackResource(ResourceZip):
             # TemplateUrl property requires S3 URL to be in path-style format
             parts = parse_s3_url(url, version_property="Version")
             s3_path_url = self.uploader.to_path_style_s3_url(parts["Key"], parts.get("Version", None))
-            set_value_from_jmespath(resource_dict, self.PROPERTY_NAME, s3_path_url)
+            botocore_utils.set_value_from_jmespath(resource_dict, self.PROPERTY_NAME, s3_path_url)
 
 
 class ServerlessApplicationResource(CloudFormationStackResource):
@@ -148,7 +155,7 @@ class CloudFormationStackSetResource(ResourceZip):
         # TemplateUrl property requires S3 URL to be in path-style format
         parts = parse_s3_url(url, version_property="Version")
         s3_path_url = self.uploader.to_path_style_s3_url(parts["Key"], parts.get("Version", None))
-        set_value_from_jmespath(resource_dict, self.PROPERTY_NAME, s3_path_url)
+        botocore_utils.set_value_from_jmespath(resource_dict, self.PROPERTY_NAME, s3_path_url)
 
 
 class Template:
@@ -259,6 +266,41 @@ class Template:
                     if code_uri_global is not None and resource_dict is not None:
                         resource_dict["CodeUri"] = code_uri_global
 
+    def _upload_images(self) -> None:
+        """
+        Uploads the local images of all the image based resources at once, so that the distinct images are pushed
+        concurrently and only once. The exporters of the resources then get the URIs of the uploaded images from the
+        ECR uploader. Images which failed to upload are uploaded again by the exporters of their resources, which
+        report the errors.
+        """
+        images: Dict[str, str] = {}
+        for resource_logical_id, resource in self.template_dict["Resources"].items():
+            resource_type = resource.get("Type", None)
+            resource_dict = resource.get("Properties", {})
+            resource_id = ResourceMetadataNormalizer.get_resource_id(resource, resource_logical_id)
+
+            for exporter_class in self.resources_to_export:
+                if exporter_class.RESOURCE_TYPE != resource_type or exporter_class.ARTIFACT_TYPE != IMAGE:
+                    continue
+                if resource_dict is None or resource_dict.get("PackageType", ZIP) != IMAGE:
+                    continue
+                image = jmespath.search(exporter_class.PROPERTY_NAME, resource_dict)
+                if image and isinstance(image, str) and not is_ecr_url(image):
+                    images[get_full_path(self.parent_stack_id, resource_id)] = image
+
+        if len(images) <= 1:
+            # a single image is uploaded by its exporter
+            return
+
+        try:
+            self.uploaders.ecr.upload_images(images)
+        except (
+            exceptions.DockerPushFailedError,
+            exceptions.DockerLoginFailedError,
+            exceptions.ECRAuthorizationError,
+        ) as ex:
+            LOG.debug("Unable to upload the images of %s", list(images), exc_info=ex)
+
     def export(self) -> Dict:
         """
         Exports the local artifacts referenced by the given template to an
@@ -274,6 +316,7 @@ class Template:
 
         self._apply_global_values()
         self.template_dict = self._export_global_artifacts(self.template_dict)
+        self._upload_images()
 
         for resource_logical_id, resource in self.template_dict["Resources"].items():
             resource_type = resource.get("Type", None)
@@ -0,0 +1,182 @@
+"""
+Incremental rebuild of deployment archives, reusing the compressed entries of the previous archive of the same folder
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import struct
+import uuid
+import zipfile
+import zlib
+from typing import IO, Dict, Optional
+
+LOG = logging.getLogger(__name__)
+
+# Suffix of the manifest kept next to the base archive, with the digests of the contents of its entries
+MANIFEST_SUFFIX = ".manifest.json"
+
+# Signature and size of the local file header preceding the data of each entry, its last fields are the lengths of the
+# file name and of the extra field which follow it
+_LOCAL_FILE_HEADER_SIGNATURE = b"PK\x03\x04"
+_LOCAL_FILE_HEADER_SIZE = 30
+
+
+class BaseArchive:
+    """
+    Archive of the previous build of a folder, and the manifest of its entries, used as the base of its next build.
+
+    Entries whose content and attributes didn't change are copied into the new archive as raw compressed bytes,
+    only the modified and added files are compressed again. Compressing the same content with the same zlib gives the
+    same bytes, so the new archive is byte identical to a clean build, and its hash can still be compared with the
+    hash of the deployed code.
+
+    Use it inside a "with" statement while writing the new archive, then call save to make the new archive the base
+    of the next build.
+    """
+
+    def __init__(self, path: str):
+        """
+        Parameters
+        ----------
+        path : str
+            Path of the base archive, the manifest is kept next to it. Neither of them needs to exist yet.
+        """
+        self._path = path
+        self._manifest_path = path + MANIFEST_SUFFIX
+        self._digests: Dict[str, str] = {}
+        self._entries: Dict[str, zipfile.ZipInfo] = {}
+        self._file: Optional[IO[bytes]] = None
+        self._written_digests: Dict[str, str] = {}
+        self.reused_entries = 0
+
+    def __enter__(self) -> "BaseArchive":
+        try:
+            with open(self._manifest_path, "r") as manifest_file:
+                manifest = json.load(manifest_file)
+            if manifest.get("zlib") != zlib.ZLIB_RUNTIME_VERSION:
+                # another zlib may compress the same content differently
+                LOG.debug("Base archive %s was built with another zlib version, ignoring it", self._path)
+                return self
+            self._file = open(self._path, "rb")
+            with zipfile.ZipFile(self._file) as archive:
+                self._entries = {info.filename: info for info in archive.infolist()}
+            self._digests = manifest["entries"]
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile) as ex:
+            LOG.debug("No usable base archive %s (%s), building the archive from scratch", self._path, ex)
+            self._close()
+            self._entries = {}
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._close()
+
+    def writestr(self, archive: zipfile.ZipFile, info: zipfile.ZipInfo, data: bytes, compress_type: int) -> None:
+        """
+        Writes the entry into the new archive, like ZipFile.writestr, copying its compressed data from the base archive
+        if it didn't change
+
+        Parameters
+        ----------
+        archive : zipfile.ZipFile
+            The new archive, written to a seekable file
+        info : zipfile.ZipInfo
+            Attributes of the entry
+        data : bytes
+            Content of the entry
+        compress_type : int
+            Compression method of the entry
+        """
+        info.compress_type = compress_type
+        digest = hashlib.sha256(data).hexdigest()
+        self._written_digests[info.filename] = digest
+
+        previous = self._entries.get(info.filename)
+        compressed_data = self._unchanged_compressed_data(previous, info, data, digest) if previous else None
+        if previous is None or compressed_data is None:
+            archive.writestr(info, data)
+            return
+
+        # mirrors ZipFile.writestr for a seekable file, with the compressed data of the base archive
+        fp = archive.fp
+        if fp is None:
+            raise ValueError("Attempt to write to ZIP archive that was already closed")
+        info.file_size = previous.file_size
+        info.compress_size = previous.compress_size
+        info.CRC = previous.CRC
+        info.flag_bits = 0
+        zip64 = info.file_size * 1.05 > zipfile.ZIP64_LIMIT
+        fp.seek(archive.start_dir)
+        info.header_offset = fp.tell()
+        fp.write(info.FileHeader(zip64))
+        fp.write(compressed_data)
+        archive.start_dir = fp.tell()
+        archive.filelist.append(info)
+        archive.NameToInfo[info.filename] = info
+        self.reused_entries += 1
+
+    def save(self, archive_path: str) -> None:
+        """
+        Keeps the new archive and the manifest of its entries as the base of the next build
+
+        Parameters
+        ----------
+        archive_path : str
+            Path of the new archive, written with writestr
+        """
+        self._close()
+        temp_path = "{}.{}.tmp".format(self._path, uuid.uuid4().hex)
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self._path)), exist_ok=True)
+            # the manifest of the previous archive must never describe the new one, even if the copy is interrupted
+            if os.path.exists(self._manifest_path):
+                os.remove(self._manifest_path)
+            shutil.copyfile(archive_path, temp_path)
+            os.replace(temp_path, self._path)
+            with open(temp_path, "w") as manifest_file:
+                json.dump({"zlib": zlib.ZLIB_RUNTIME_VERSION, "entries": self._written_digests}, manifest_file)
+            os.replace(temp_path, self._manifest_path)
+        except OSError as ex:
+            LOG.debug("Failed to keep %s as the base archive %s", archive_path, self._path, exc_info=ex)
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def _unchanged_compressed_data(
+        self, previous: zipfile.ZipInfo, info: zipfile.ZipInfo, data: bytes, digest: str
+    ) -> Optional[bytes]:
+        """
+        Returns the compressed data of the entry in the base archive, None if its content or attributes changed
+        """
+        if self._digests.get(info.filename) != digest:
+            return None
+        if (
+            previous.compress_type != info.compress_type
+            or previous.external_attr != info.external_attr
+            or previous.create_system != info.create_system
+            or previous.date_time != info.date_time
+            or previous.extra != info.extra
+            or previous.file_size != len(data)
+            or previous.CRC != zlib.crc32(data)
+        ):
+            return None
+
+        fp = self._file
+        if fp is None:
+            return None
+        fp.seek(previous.header_offset)
+        header = fp.read(_LOCAL_FILE_HEADER_SIZE)
+        if len(header) != _LOCAL_FILE_HEADER_SIZE or not header.startswith(_LOCAL_FILE_HEADER_SIGNATURE):
+            return None
+        filename_length, extra_length = struct.unpack("<HH", header[-4:])
+        fp.seek(filename_length + extra_length, os.SEEK_CUR)
+        compressed_data = fp.read(previous.compress_size)
+        if len(compressed_data) != previous.compress_size:
+            return None
+        return compressed_data
+
+    def _close(self) -> None:
+        if self._file:
+            self._file.close()
+            self._file = None
@@ -3,9 +3,13 @@ Client for uploading packaged artifacts to ecr
 """
 
 import base64
+import json
 import logging
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from io import StringIO
-from typing import Dict
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
 
 import botocore
 import click
@@ -23,11 +27,21 @@ from samcli.lib.docker.log_streamer import LogStreamer, LogStreamError
 from samcli.lib.package.image_utils import tag_translation
 from samcli.lib.utils.osutils import stderr
 from samcli.lib.utils.stream_writer import StreamWriter
+from samcli.lib.utils.timings import traced
 
 LOG = logging.getLogger(__name__)
 
 ECR_USERNAME = "AWS"
 
+# Maximum number of images pushed to ECR at the same time
+ECR_PUSH_MAX_WORKERS = 4
+
+# Manifest types returned by batch_get_image, their config digest is the ID of the local docker image
+_ECR_IMAGE_MANIFEST_MEDIA_TYPES = [
+    "application/vnd.docker.distribution.manifest.v2+json",
+    "application/vnd.oci.image.manifest.v1+json",
+]
+
 
 class ECRUploader:
     """
@@ -47,6 +61,12 @@ class ECRUploader:
         self.stream = StreamWriter(stream=stream, auto_flush=True)
         self.log_streamer = LogStreamer(stream=self.stream)
         self.login_session_active = False
+        # remote image URI of each (repository, docker image ID) uploaded
+        self._uploaded_images: Dict[Tuple[str, str], str] = {}
+        # pushes in progress, which concurrent uploads of the same image wait for instead of pushing it again
+        self._pending_uploads: Dict[Tuple[str, str], Future] = {}
+        # guards the two dicts above, never held while pushing
+        self._upload_lock = threading.Lock()
 
     def login(self):
         """
@@ -73,36 +93,220 @@ class ECRUploader:
         :param resource_name: logical ID of the resource to be uploaded to ECR.
         :return: remote ECR image path that has been uploaded.
         """
+        return self.upload_images({resource_name: image})[resource_name]
+
+    @traced("package.upload.ecr")
+    def upload_images(self, images: Dict[str, str]) -> Dict[str, str]:
+        """
+        Uploads the local images of several resources to ECR.
+
+        Resources sharing the same local image and repository share a single push, and so the same remote image URI.
+        Images which are already in their repository, with the tag they would be pushed with, are not pushed again.
+        The other images are pushed concurrently, and their progress is reported together. Only successful pushes are
+        remembered, an image which failed to push is pushed again by the next upload.
+
+        Parameters
+        ----------
+        images : Dict[str, str]
+            Locally tagged docker image to upload, keyed by the logical ID of the resource it belongs to
+
+        Returns
+        -------
+        Dict[str, str]
+            Remote ECR image URI, keyed by the logical ID of the resource
+
+        Raises
+        ------
+        DockerPushFailedError
+            If an image can't be found locally or can't be pushed
+        """
         if not self.login_session_active:
             self.login()
             self.login_session_active = True
+
+        resource_images: Dict[str, Tuple[str, str]] = {}
+        local_images: Dict[Tuple[str, str], Tuple[Any, str, str]] = {}
+        for resource_name, image in images.items():
+            try:
+                docker_img = self.docker_client.images.get(image)
+            except (BuildError, APIError) as ex:
+                raise DockerPushFailedError(msg=str(ex)) from ex
+
+            repository = self._get_repository(resource_name)
+            key = (repository, docker_img.id)
+            resource_images[resource_name] = key
+            local_images.setdefault(key, (docker_img, repository, image))
+
+        uploaded_images: Dict[Tuple[str, str], str] = {}
+        other_uploads: Dict[Tuple[str, str], Future] = {}
+        pending_images: Dict[Tuple[str, str], Tuple[Any, str, str]] = {}
+        with self._upload_lock:
+            for key, (docker_img, repository, image) in local_images.items():
+                if key in self._uploaded_images:
+                    uploaded_images[key] = self._uploaded_images[key]
+                elif key in self._pending_uploads:
+                    other_uploads[key] = self._pending_uploads[key]
+                else:
+                    self._pending_uploads[key] = Future()
+                    _tag = tag_translation(image, docker_image_id=docker_img.id, gen_tag=self.tag)
+                    pending_images[key] = (docker_img, repository, _tag)
+
+        push_results: Dict[Tuple[str, str], Union[str, Exception]] = {}
         try:
-            docker_img = self.docker_client.images.get(image)
+            if len(pending_images) == 1:
+                # push on the current thread when there is nothing to parallelize
+                ((key, (docker_img, repository, _tag)),) = pending_images.items()
+                try:
+                    push_results[key] = self._upload_image(docker_img, repository, _tag, self._stream_progress)
+                except DockerPushFailedError as ex:
+                    push_results[key] = ex
+            elif pending_images:
+                push_results = self._upload_images_concurrently(pending_images)
+        finally:
+            self._complete_uploads(pending_images, push_results)
 
-            _tag = tag_translation(image, docker_image_id=docker_img.id, gen_tag=self.tag)
-            repository = (
-                self.ecr_repo
-                if not self.ecr_repo_multi or not isinstance(self.ecr_repo_multi, dict)
-                else self.ecr_repo_multi.get(resource_name)
-            )
+        for key, push_result in push_results.items():
+            if isinstance(push_result, Exception):
+                raise push_result
+            uploaded_images[key] = push_result
+        for key, other_upload in other_uploads.items():
+            uploaded_images[key] = other_upload.result()
+        return {resource_name: uploaded_images[key] for resource_name, key in resource_images.items()}
 
+    def _complete_uploads(
+        self,
+        pending_images: Dict[Tuple[str, str], Tuple[Any, str, str]],
+        push_results: Dict[Tuple[str, str], Union[str, Exception]],
+    ) -> None:
+        """
+        Remembers the successful pushes, and hands the result of every push to the uploads waiting for it
+        """
+        with self._upload_lock:
+            for key in pending_images:
+                pending_upload = self._pending_uploads.pop(key)
+                push_result = push_results.get(key)
+                if isinstance(push_result, str):
+                    self._uploaded_images[key] = push_result
+                    pending_upload.set_result(push_result)
+                else:
+                    pending_upload.set_exception(
+                        push_result or DockerPushFailedError(msg=f"Push of {key[0]} was interrupted")
+                    )
+
+    def _get_repository(self, resource_name: str) -> str:
+        return str(
+            self.ecr_repo
+            if not self.ecr_repo_multi or not isinstance(self.ecr_repo_multi, dict)
+            else self.ecr_repo_multi.get(resource_name)
+        )
+
+    def _upload_images_concurrently(
+        self, pending_images: Dict[Tuple[str, str], Tuple[Any, str, str]]
+    ) -> Dict[Tuple[str, str], Union[str, Exception]]:
+        """
+        Pushes the images with a pool of threads, and streams their merged push logs from the current thread
+        """
+        push_logs: queue.Queue = queue.Queue()
+
+        def upload_image(docker_img: Any, repository: str, _tag: str) -> Union[str, Exception]:
+            def forward_logs(logs: Iterator[Dict]) -> None:
+                for log in logs:
+                    if log.get("error"):
+                        raise LogStreamError(msg=log["error"])
+                    # layer IDs are only unique within an image, prefix them to get a line per image and layer
+                    push_logs.put({**log, "id": f"{_tag} {log['id']}"} if log.get("id") else log)
+
+            try:
+                return self._upload_image(docker_img, repository, _tag, forward_logs)
+            except DockerPushFailedError as ex:
+                return ex
+            finally:
+                push_logs.put(None)
+
+        with ThreadPoolExecutor(max_workers=ECR_PUSH_MAX_WORKERS) as executor:
+            futures = {
+                key: executor.submit(upload_image, docker_img, repository, _tag)
+                for key, (docker_img, repository, _tag) in pending_images.items()
+            }
+
+            def merged_logs() -> Iterator[Dict]:
+                running = len(futures)
+                while running:
+                    log = push_logs.get()
+                    if log is None:
+                        running -= 1
+                    else:
+                        yield log
+
+            self._stream_progress(merged_logs())
+            return {key: future.result() for key, future in futures.items()}
+
+    def _stream_progress(self, push_logs: Iterator[Dict]) -> None:
+        if not self.no_progressbar:
+            self.log_streamer.stream_progress(push_logs)
+        else:
+            # we need to wait till the image got pushed to ecr, without this workaround sam sync for template
+            # contains image always fail, because the provided ecr uri is not exist.
+            _log_streamer = LogStreamer(stream=StreamWriter(stream=StringIO(), auto_flush=True))
+            _log_streamer.stream_progress(push_logs)
+
+    def _upload_image(self, docker_img: Any, repository: str, _tag: str, stream_progress) -> str:
+        """
+        Tags and pushes a local image, unless the repository already has it with the same tag
+        """
+        if self._is_image_in_repository(docker_img.id, repository, _tag):
+            LOG.info("Image %s:%s already exists in ECR, skipping the push", repository, _tag)
+            return f"{repository}:{_tag}"
+
+        try:
             docker_img.tag(repository=repository, tag=_tag)
             push_logs = self.docker_client.api.push(
                 repository=repository, tag=_tag, auth_config=self.auth_config, stream=True, decode=True
             )
-            if not self.no_progressbar:
-                self.log_streamer.stream_progress(push_logs)
-            else:
-                # we need to wait till the image got pushed to ecr, without this workaround sam sync for template
-                # contains image always fail, because the provided ecr uri is not exist.
-                _log_streamer = LogStreamer(stream=StreamWriter(stream=StringIO(), auto_flush=True))
-                _log_streamer.stream_progress(push_logs)
-
+            stream_progress(push_logs)
         except (BuildError, APIError, LogStreamError) as ex:
             raise DockerPushFailedError(msg=str(ex)) from ex
 
         return f"{repository}:{_tag}"
 
+    def _is_image_in_repository(self, image_id: str, repository: str, _tag: str) -> bool:
+        """
+        Checks whether the image tagged with _tag in the ECR repository is the local image with the given ID, which
+        is the digest of the image config, or of the image manifest with the containerd image store.
+        """
+        repository_name = self.parse_image_url(f"{repository}:{_tag}")["repository"]
+        request: Dict[str, Any] = {
+            "repositoryName": repository_name,
+            "imageIds": [{"imageTag": _tag}],
+            "acceptedMediaTypes": _ECR_IMAGE_MANIFEST_MEDIA_TYPES,
+        }
+        registry_id = self._get_registry_id(repository)
+        if registry_id:
+            request["registryId"] = registry_id
+        try:
+            response = self.ecr_client.batch_get_image(**request)
+        except botocore.exceptions.ClientError as ex:
+            LOG.debug("Unable to get image %s:%s from ECR", repository, _tag, exc_info=ex)
+            return False
+
+        for remote_image in response.get("images", []):
+            if remote_image.get("imageId", {}).get("imageDigest") == image_id:
+                return True
+            try:
+                manifest = json.loads(remote_image.get("imageManifest", ""))
+            except ValueError:
+                continue
+            if isinstance(manifest, dict) and manifest.get("config", {}).get("digest") == image_id:
+                return True
+        return False
+
+    @staticmethod
+    def _get_registry_id(repository: str) -> Optional[str]:
+        # ECR registries are named <account ID>.dkr.ecr.<region>.amazonaws.com
+        registry, separator, _ = repository.partition("/")
+        registry_id = registry.split(".")[0]
+        return registry_id if separator and registry_id.isdigit() else None
+
     def delete_artifact(self, image_uri: str, resource_id: str, property_name: str):
         """
         Delete the given ECR image by extracting the repository and image_tag from
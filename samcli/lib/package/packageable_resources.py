@@ -8,7 +8,6 @@ import shutil
 from typing import Dict, Optional, Union, cast
 
 import jmespath
-from botocore.utils import set_value_from_jmespath
 
 from samcli.commands.package import exceptions
 from samcli.lib.package.ecr_uploader import ECRUploader
@@ -26,6 +25,7 @@ from samcli.lib.package.utils import (
     upload_local_image_artifacts,
 )
 from samcli.lib.utils import graphql_api
+from samcli.lib.utils.lazy_import import lazy_import
 from samcli.lib.utils.packagetype import IMAGE, ZIP
 from samcli.lib.utils.resources import (
     AWS_APIGATEWAY_RESTAPI,
@@ -54,6 +54,8 @@ from samcli.lib.utils.resources import (
 )
 from samcli.lib.utils.s3 import parse_s3_url
 
+botocore_utils = lazy_import("botocore.utils")
+
 LOG = logging.getLogger(__name__)
 
 
@@ -123,7 +125,7 @@ class ResourceZip(Resource):
         temp_dir = None
         if is_local_file(property_value) and not is_zip_file(property_value) and self.FORCE_ZIP:
             temp_dir = copy_to_temp_dir(property_value)
-            set_value_from_jmespath(resource_dict, self.PROPERTY_NAME, temp_dir)
+            botocore_utils.set_value_from_jmespath(resource_dict, self.PROPERTY_NAME, temp_dir)
 
         try:
             self.do_export(resource_id, resource_dict, parent_dir)
@@ -172,7 +174,7 @@ class ResourceZip(Resource):
             uploaded_url = self.code_signer.sign_package(
                 resource_id, uploaded_url, uploader.get_version_of_artifact(uploaded_url)
             )
-        set_value_from_jmespath(resource_dict, property_path, uploaded_url)
+        botocore_utils.set_value_from_jmespath(resource_dict, property_path, uploaded_url)
 
     def delete(self, resource_id, resource_dict):
         """
@@ -242,7 +244,9 @@ class ResourceImageDict(Resource):
         uploaded_url = upload_local_image_artifacts(
             resource_id, resource_dict, self.PROPERTY_NAME, parent_dir, self.uploader
         )
-        set_value_from_jmespath(resource_dict, self.PROPERTY_NAME, {self.EXPORT_PROPERTY_CODE_KEY: uploaded_url})
+        botocore_utils.set_value_from_jmespath(
+            resource_dict, self.PROPERTY_NAME, {self.EXPORT_PROPERTY_CODE_KEY: uploaded_url}
+        )
 
     def delete(self, resource_id, resource_dict):
         """
@@ -300,7 +304,7 @@ class ResourceImage(Resource):
         uploaded_url = upload_local_image_artifacts(
             resource_id, resource_dict, self.PROPERTY_NAME, parent_dir, self.uploader
         )
-        set_value_from_jmespath(resource_dict, self.PROPERTY_NAME, uploaded_url)
+        botocore_utils.set_value_from_jmespath(resource_dict, self.PROPERTY_NAME, uploaded_url)
 
     def delete(self, resource_id, resource_dict):
         """
@@ -348,7 +352,7 @@ class ResourceWithS3UrlDict(ResourceZip):
             object_key_property=self.OBJECT_KEY_PROPERTY,
             version_property=self.VERSION_PROPERTY,
         )
-        set_value_from_jmespath(resource_dict, self.PROPERTY_NAME, parsed_url)
+        botocore_utils.set_value_from_jmespath(resource_dict, self.PROPERTY_NAME, parsed_url)
 
     def delete(self, resource_id, resource_dict):
         """
@@ -662,7 +666,7 @@ class GraphQLApiCodeResource(ResourceZip):
             temp_dir = None
             if is_local_file(property_value) and not is_zip_file(property_value) and self.FORCE_ZIP:
                 temp_dir = copy_to_temp_dir(property_value)
-                set_value_from_jmespath(resource_dict, property_path, temp_dir)
+                botocore_utils.set_value_from_jmespath(resource_dict, property_path, temp_dir)
 
             try:
                 self.do_export(
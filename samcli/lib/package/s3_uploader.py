@@ -24,12 +24,11 @@ from typing import Any, Optional, cast
 
 import botocore
 import botocore.exceptions
-from boto3.s3 import transfer
-from boto3.s3.transfer import ProgressCallbackInvoker
 
 from samcli.commands.package.exceptions import BucketNotSpecifiedError, NoSuchBucketError
 from samcli.lib.package.local_files_utils import get_uploaded_s3_object_name
 from samcli.lib.utils.s3 import parse_s3_url
+from samcli.lib.utils.timings import traced
 
 LOG = logging.getLogger(__name__)
 
@@ -68,10 +67,14 @@ class S3Uploader:
         self.kms_key_id = kms_key_id or None
         self.force_upload = force_upload
         self.no_progressbar = no_progressbar
+        # boto3.s3.transfer imports the whole boto3 session machinery, defer it until something is uploaded
+        from boto3.s3 import transfer
+
         self.transfer_manager = transfer.create_transfer_manager(self.s3, transfer.TransferConfig())
 
         self._artifact_metadata = None
 
+    @traced("package.upload.s3")
     def upload(self, file_name: str, remote_path: str) -> str:
         """
         Uploads given file to S3
@@ -104,6 +107,8 @@ class S3Uploader:
                 raise BucketNotSpecifiedError()
 
             if not self.no_progressbar:
+                from boto3.s3.transfer import ProgressCallbackInvoker
+
                 print_progress_callback = ProgressCallbackInvoker(
                     ProgressPercentage(file_name, remote_path).on_progress
                 )
@@ -16,6 +16,7 @@ from typing import Callable, Dict, List, Optional, cast
 import jmespath
 
 from samcli.commands.package.exceptions import ImageNotFoundError, InvalidLocalPathError
+from samcli.lib.package.delta_zip import BaseArchive
 from samcli.lib.package.ecr_utils import is_ecr_url
 from samcli.lib.package.permissions import (
     AdditiveDirPermissionPermissionMapper,
@@ -28,6 +29,7 @@ from samcli.lib.package.s3_uploader import S3Uploader
 from samcli.lib.utils.hash import dir_checksum
 from samcli.lib.utils.resources import LAMBDA_LOCAL_RESOURCES
 from samcli.lib.utils.s3 import parse_s3_url
+from samcli.lib.utils.timings import traced
 
 LOG = logging.getLogger(__name__)
 
@@ -238,7 +240,10 @@ def zip_folder(folder_path, zip_method):
             os.remove(zipfile_name)
 
 
-def make_zip_with_permissions(file_name, source_root, permission_mappers: List[PermissionMapper]):
+@traced("package.zip")
+def make_zip_with_permissions(
+    file_name, source_root, permission_mappers: List[PermissionMapper], base_zip: Optional[str] = None
+):
     """
     Create a zip file from the source directory
 
@@ -251,6 +256,10 @@ def make_zip_with_permissions(file_name, source_root, permission_mappers: List[P
     permission_mappers : list
         permission objects that need to match an interface such that they have an apply method
         which takes in the external attributes of a zipfile.Zipinfo object
+    base_zip : Optional[str]
+        Path where the archive of the previous call for the same source directory is kept. The unchanged entries of
+        that archive are copied instead of being compressed again, and the new archive is kept there for the next call.
+        Only used with permission_mappers.
     Returns
     -------
     str
@@ -260,8 +269,11 @@ def make_zip_with_permissions(file_name, source_root, permission_mappers: List[P
     zipfile_name = "{0}.zip".format(file_name)
     source_root = os.path.abspath(source_root)
     compression_type = zipfile.ZIP_DEFLATED
+    base_archive = BaseArchive(base_zip) if base_zip and permission_mappers else None
     with open(zipfile_name, "wb") as f:
-        with contextlib.closing(zipfile.ZipFile(f, "w", compression_type)) as zf:
+        with contextlib.closing(zipfile.ZipFile(f, "w", compression_type)) as zf, (
+            base_archive or contextlib.nullcontext()
+        ):
             for root, _, files in os.walk(source_root, followlinks=True):
                 for filename in files:
                     full_path = os.path.join(root, filename)
@@ -290,10 +302,16 @@ def make_zip_with_permissions(file_name, source_root, permission_mappers: List[P
                             # the same as the remote lambda ZIP hash. A timestamp will make the evaluation always false.
                             # However, without this field, contents of the zip file will have a last modified date 1980
                             # because python's zipfile.ZipInfo is set to: https://docs.python.org/3/library/zipfile.html.
-                            zf.writestr(info, file_bytes, compress_type=compression_type)
+                            if base_archive:
+                                base_archive.writestr(zf, info, file_bytes, compress_type=compression_type)
+                            else:
+                                zf.writestr(info, file_bytes, compress_type=compression_type)
                         else:
                             zf.write(full_path, relative_path)
 
+    if base_archive:
+        LOG.debug("Reused %d unchanged entries of %s", base_archive.reused_entries, base_zip)
+        base_archive.save(zipfile_name)
     return zipfile_name
 
 
@@ -114,6 +114,9 @@ class Function(NamedTuple):
     runtime_management_config: Optional[Dict] = None
     # LoggingConfig for Advanced logging
     logging_config: Optional[Dict] = None
+    # Configuration of the asynchronous invocations. Includes the fields `MaximumEventAgeInSeconds`,
+    # `MaximumRetryAttempts` and `DestinationConfig` (all optional).
+    event_invoke_config: Optional[Dict] = None
 
     @property
     def full_path(self) -> str:
@@ -579,6 +582,8 @@ class Stack:
     template_dict: Dict
     # metadata
     metadata: Optional[Dict] = None
+    # whether the intrinsic functions of each resource are only resolved on its first access
+    lazy_resolution: bool = False
 
     def __init__(
         self,
@@ -588,6 +593,8 @@ class Stack:
         parameters: Optional[Dict],
         template_dict: Dict,
         metadata: Optional[Dict[str, str]] = None,
+        lazy_resolution: bool = False,
+        resources: Optional[Dict] = None,
     ):
         self.parent_stack_path = parent_stack_path
         self.name = name
@@ -595,7 +602,9 @@ class Stack:
         self.parameters = parameters
         self.template_dict = template_dict
         self.metadata = metadata
-        self._resources: Optional[Dict] = None
+        self.lazy_resolution = lazy_resolution
+        # the processed resources, when they were already computed from the template dict and parameters
+        self._resources: Optional[Dict] = resources
         self._raw_resources: Optional[Dict] = None
 
     @property
@@ -625,11 +634,14 @@ class Stack:
     def resources(self) -> Dict:
         """
         Return the resources dictionary where SAM plugins have been run
-        and parameter values have been substituted.
+        and parameter values have been substituted. With lazy resolution, it is a
+        samcli.lib.providers.sam_base_provider.LazyResolvedResources mapping.
         """
         if self._resources is not None:
             return self._resources
-        processed_template_dict: Dict[str, Dict] = SamBaseProvider.get_template(self.template_dict, self.parameters)
+        processed_template_dict: Dict[str, Dict] = SamBaseProvider.get_template(
+            self.template_dict, self.parameters, lazy_resolution=self.lazy_resolution
+        )
         self._resources = processed_template_dict.get("Resources", {})
         return self._resources
 
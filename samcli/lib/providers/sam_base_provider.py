@@ -3,24 +3,63 @@ Base class for SAM Template providers
 """
 
 import logging
-from typing import Any, Dict, Iterable, Optional, Union, cast
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, Union, cast
 
 from samcli.lib.iac.plugins_interfaces import Stack
 from samcli.lib.intrinsic_resolver.intrinsic_property_resolver import IntrinsicResolver
 from samcli.lib.intrinsic_resolver.intrinsics_symbol_table import IntrinsicsSymbolTable
 from samcli.lib.package.ecr_utils import is_ecr_url
 from samcli.lib.samlib.resource_metadata_normalizer import ResourceMetadataNormalizer
-from samcli.lib.samlib.wrapper import SamTranslatorWrapper
 from samcli.lib.utils.resources import (
     AWS_LAMBDA_FUNCTION,
     AWS_LAMBDA_LAYERVERSION,
     AWS_SERVERLESS_FUNCTION,
     AWS_SERVERLESS_LAYERVERSION,
 )
+from samcli.lib.utils.timings import span
 
 LOG = logging.getLogger(__name__)
 
 
+class LazyResolvedResources(Mapping):
+    """
+    Resources of a template whose intrinsic functions are resolved on first access, one resource at a time, so that
+    commands needing a few resources of a large template don't pay for resolving all of them
+    """
+
+    def __init__(self, resources: Dict, resolver: IntrinsicResolver):
+        """
+        Parameters
+        ----------
+        resources: Dict
+            The unresolved resources, after SAM plugins have been run
+        resolver: IntrinsicResolver
+            The resolver of the template of the resources
+        """
+        self._resources = resources
+        self._resolver = resolver
+        self._resolved_resources: Dict[str, Any] = {}
+
+    def __getitem__(self, logical_id: str) -> Any:
+        if logical_id not in self._resolved_resources:
+            resource = self._resources[logical_id]
+            resolved = self._resolver.resolve_attribute({logical_id: resource}, ignore_errors=True)
+            self._resolved_resources[logical_id] = next(iter(resolved.values()))
+        return self._resolved_resources[logical_id]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._resources)
+
+    def __len__(self) -> int:
+        return len(self._resources)
+
+    def get_resource_type(self, logical_id: str) -> Optional[str]:
+        """
+        Returns the type of the resource without resolving it, the type of a resource can't be an intrinsic function
+        """
+        return cast(Optional[str], self._resources[logical_id].get("Type"))
+
+
 class SamBaseProvider:
     """
     Base class for SAM Template providers
@@ -163,9 +202,21 @@ class SamBaseProvider:
         """
         return resource_properties.get(code_property_key)
 
+    @staticmethod
+    def _get_resource_type(resources: Mapping, logical_id: str) -> Optional[str]:
+        """
+        Returns the type of a resource, without resolving it if the resources are resolved lazily
+        """
+        if isinstance(resources, LazyResolvedResources):
+            return resources.get_resource_type(logical_id)
+        return cast(Optional[str], resources[logical_id].get("Type"))
+
     @staticmethod
     def get_template(
-        template_dict: Dict, parameter_overrides: Optional[Dict[str, str]] = None, use_sam_transform: bool = True
+        template_dict: Dict,
+        parameter_overrides: Optional[Dict[str, str]] = None,
+        use_sam_transform: bool = True,
+        lazy_resolution: bool = False,
     ) -> Dict:
         """
         Given a SAM template dictionary, return a cleaned copy of the template where SAM plugins have been run
@@ -182,24 +233,48 @@ class SamBaseProvider:
         use_sam_transform: bool
             Whether to transform the given template with Serverless Application Model. Default is True
 
+        lazy_resolution: bool
+            Whether to resolve the intrinsic functions of each resource on its first access only, instead of resolving
+            the whole template. The Resources of the processed template are then a LazyResolvedResources mapping.
+            Default is False
+
         Returns
         -------
         dict
             Processed SAM template
         """
+        # the translator pulls in samtranslator, which is only worth importing once a template is actually processed
+        from samcli.lib.samlib.wrapper import SamTranslatorWrapper
+
         template_dict = template_dict or {}
         parameters_values = SamBaseProvider._get_parameter_values(template_dict, parameter_overrides)
         if template_dict and use_sam_transform:
-            template_dict = SamTranslatorWrapper(template_dict, parameter_values=parameters_values).run_plugins()
+            with span("template.translate"):
+                template_dict = SamTranslatorWrapper(template_dict, parameter_values=parameters_values).run_plugins()
         ResourceMetadataNormalizer.normalize(template_dict)
 
-        resolver = IntrinsicResolver(
-            template=template_dict,
-            symbol_resolver=IntrinsicsSymbolTable(logical_id_translator=parameters_values, template=template_dict),
-        )
-        template_dict = resolver.resolve_template(ignore_errors=True)
+        with span("template.resolve"):
+            resolver = IntrinsicResolver(
+                template=template_dict,
+                symbol_resolver=IntrinsicsSymbolTable(logical_id_translator=parameters_values, template=template_dict),
+            )
+            if lazy_resolution:
+                template_dict = SamBaseProvider._get_lazily_resolved_template(template_dict, resolver)
+            else:
+                template_dict = resolver.resolve_template(ignore_errors=True)
         return template_dict
 
+    @staticmethod
+    def _get_lazily_resolved_template(template_dict: Dict, resolver: IntrinsicResolver) -> Dict:
+        lazily_resolved_template = dict(template_dict)
+        if template_dict.get("Resources"):
+            lazily_resolved_template["Resources"] = LazyResolvedResources(template_dict["Resources"], resolver)
+        if template_dict.get("Outputs"):
+            lazily_resolved_template["Outputs"] = resolver.resolve_attribute(
+                template_dict["Outputs"], ignore_errors=True
+            )
+        return lazily_resolved_template
+
     @staticmethod
     def get_resolved_template_dict(
         template_dict: Stack,
@@ -226,18 +301,22 @@ class SamBaseProvider:
             :param parameter_overrides:
             :param normalize_resource_metadata:
         """
+        from samcli.lib.samlib.wrapper import SamTranslatorWrapper
+
         template_dict = template_dict or Stack()
         parameters_values = SamBaseProvider._get_parameter_values(template_dict, parameter_overrides)
         if template_dict:
-            template_dict = SamTranslatorWrapper(template_dict, parameter_values=parameters_values).run_plugins()
+            with span("template.translate"):
+                template_dict = SamTranslatorWrapper(template_dict, parameter_values=parameters_values).run_plugins()
         if normalize_resource_metadata:
             ResourceMetadataNormalizer.normalize(template_dict)
 
-        resolver = IntrinsicResolver(
-            template=template_dict,
-            symbol_resolver=IntrinsicsSymbolTable(logical_id_translator=parameters_values, template=template_dict),
-        )
-        template_dict = resolver.resolve_template(ignore_errors=True)
+        with span("template.resolve"):
+            resolver = IntrinsicResolver(
+                template=template_dict,
+                symbol_resolver=IntrinsicsSymbolTable(logical_id_translator=parameters_values, template=template_dict),
+            )
+            template_dict = resolver.resolve_template(ignore_errors=True)
         return template_dict
 
     @staticmethod
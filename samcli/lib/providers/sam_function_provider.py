@@ -3,7 +3,7 @@ Class that provides functions from a given SAM template
 """
 
 import logging
-from typing import Any, Dict, Iterator, List, Optional, cast
+from typing import Any, Dict, Iterator, List, Mapping, Optional, cast
 
 from samtranslator.policy_template_processor.exceptions import TemplateNotFoundException
 
@@ -62,17 +62,35 @@ class SamFunctionProvider(SamBaseProvider):
         """
 
         self._stacks = stacks
+        self._extraction_options = (use_raw_codeuri, ignore_code_extraction_warnings, locate_layer_nested)
 
         for stack in stacks:
             LOG.debug("%d resources found in the stack %s", len(stack.resources), stack.stack_path)
 
-        # Store a map of function full_path to function information for quick reference
-        self.functions = SamFunctionProvider._extract_functions(
-            self._stacks, use_raw_codeuri, ignore_code_extraction_warnings, locate_layer_nested
-        )
+        # Store a map of function full_path to function information for quick reference. When the stacks resolve
+        # their resources lazily, the functions are only extracted when all of them are needed
+        self._functions: Optional[Dict[str, Function]] = None
+        if not self._is_lazy():
+            self._functions = SamFunctionProvider._extract_functions(self._stacks, *self._extraction_options)
 
         self._colored = Colored()
 
+    @property
+    def functions(self) -> Dict[str, Function]:
+        """
+        Returns the map of function full_path to function information, extracted on first access with lazy resolution
+        """
+        if self._functions is None:
+            self._functions = SamFunctionProvider._extract_functions(self._stacks, *self._extraction_options)
+        return self._functions
+
+    @functions.setter
+    def functions(self, functions: Dict[str, Function]) -> None:
+        self._functions = functions
+
+    def _is_lazy(self) -> bool:
+        return bool(self._stacks) and all(getattr(stack, "lazy_resolution", False) is True for stack in self._stacks)
+
     @property
     def stacks(self) -> List[Stack]:
         """
@@ -98,9 +116,10 @@ class SamFunctionProvider(SamBaseProvider):
         :param bool locate_layer_nested: resolved nested layer reference to their actual location in the nested stack
         """
         self._stacks = stacks
-        self.functions = SamFunctionProvider._extract_functions(
-            self._stacks, use_raw_codeuri, ignore_code_extraction_warnings, locate_layer_nested
-        )
+        self._extraction_options = (use_raw_codeuri, ignore_code_extraction_warnings, locate_layer_nested)
+        self._functions = None
+        if not self._is_lazy():
+            self._functions = SamFunctionProvider._extract_functions(self._stacks, *self._extraction_options)
 
     def get(self, name: str) -> Optional[Function]:
         """
@@ -121,9 +140,12 @@ class SamFunctionProvider(SamBaseProvider):
 
         resolved_function = None
 
-        if name in self.functions:
+        if self._functions is None:
+            # with lazy resolution, only extract the function with the given full path if there is one
+            resolved_function = self._extract_function_by_full_path(name)
+        elif name in self._functions:
             # support lookup by full_path
-            resolved_function = self.functions.get(name)
+            resolved_function = self._functions.get(name)
 
         if not resolved_function:
             # If function is not found by full path, search through all functions
@@ -167,6 +189,27 @@ class SamFunctionProvider(SamBaseProvider):
             )
             LOG.warning(self._colored.color_log(msg=message, color=Colors.WARNING), extra=dict(markup=True))
 
+    def _extract_function_by_full_path(self, full_path: str) -> Optional[Function]:
+        """
+        Extracts the function with the given full path only, resolving the function resource and its layers
+        """
+        for stack in self._stacks:
+            if stack.stack_path:
+                if not full_path.startswith(stack.stack_path + "/"):
+                    continue
+                logical_id = full_path[len(stack.stack_path) + 1 :]
+            else:
+                logical_id = full_path
+            if logical_id not in stack.resources:
+                continue
+
+            function = SamFunctionProvider._extract_function(
+                stack, self._stacks, logical_id, stack.resources, *self._extraction_options
+            )
+            if function and function.full_path == full_path:
+                return function
+        return None
+
     def get_all(self) -> Iterator[Function]:
         """
         Yields all the Lambda functions available in the SAM Template.
@@ -198,77 +241,91 @@ class SamFunctionProvider(SamBaseProvider):
 
         result: Dict[str, Function] = {}  # a dict with full_path as key and extracted function as value
         for stack in stacks:
-            for name, resource in stack.resources.items():
-                resource_type = resource.get("Type")
-                resource_properties = resource.get("Properties", {})
-                resource_metadata = resource.get("Metadata", None)
-                # Add extra metadata information to properties under a separate field.
-                if resource_metadata:
-                    resource_properties["Metadata"] = resource_metadata
-
-                if resource_type in [AWS_SERVERLESS_FUNCTION, AWS_LAMBDA_FUNCTION]:
-                    resource_package_type = resource_properties.get("PackageType", ZIP)
-
-                    code_property_key = SamBaseProvider.CODE_PROPERTY_KEYS[resource_type]
-                    image_property_key = SamBaseProvider.IMAGE_PROPERTY_KEYS[resource_type]
-
-                    if resource_package_type == ZIP and SamBaseProvider._is_s3_location(
-                        resource_properties.get(code_property_key)
-                    ):
-                        # CodeUri can be a dictionary of S3 Bucket/Key or a S3 URI, neither of which are supported
-                        if not ignore_code_extraction_warnings:
-                            SamFunctionProvider._warn_code_extraction(resource_type, name, code_property_key)
-                        continue
-
-                    if (
-                        resource_package_type == IMAGE
-                        and SamBaseProvider._is_ecr_uri(resource_properties.get(image_property_key))
-                        and not SamFunctionProvider._metadata_has_necessary_entries_for_image_function_to_be_built(
-                            resource_metadata
-                        )
-                    ):
-                        # ImageUri can be an ECR uri, which is not supported
-                        if not ignore_code_extraction_warnings:
-                            SamFunctionProvider._warn_imageuri_extraction(resource_type, name, image_property_key)
-                        continue
-
-                if resource_type == AWS_SERVERLESS_FUNCTION:
-                    layers = SamFunctionProvider._parse_layer_info(
-                        stack,
-                        resource_properties.get("Layers", []),
-                        use_raw_codeuri,
-                        ignore_code_extraction_warnings=ignore_code_extraction_warnings,
-                        locate_layer_nested=locate_layer_nested,
-                        stacks=stacks if locate_layer_nested else None,
-                        function_id=resource_metadata.get("SamResourceId", "") if locate_layer_nested else None,
-                    )
-                    function = SamFunctionProvider._convert_sam_function_resource(
-                        stack,
-                        name,
-                        resource_properties,
-                        layers,
-                        use_raw_codeuri,
-                    )
+            resources = stack.resources
+            for name in resources:
+                function = SamFunctionProvider._extract_function(
+                    stack,
+                    stacks,
+                    name,
+                    resources,
+                    use_raw_codeuri,
+                    ignore_code_extraction_warnings,
+                    locate_layer_nested,
+                )
+                if function:
                     result[function.full_path] = function
 
-                elif resource_type == AWS_LAMBDA_FUNCTION:
-                    layers = SamFunctionProvider._parse_layer_info(
-                        stack,
-                        resource_properties.get("Layers", []),
-                        use_raw_codeuri,
-                        ignore_code_extraction_warnings=ignore_code_extraction_warnings,
-                        locate_layer_nested=locate_layer_nested,
-                        stacks=stacks if locate_layer_nested else None,
-                        function_id=resource_metadata.get("SamResourceId", "") if locate_layer_nested else None,
-                    )
-                    function = SamFunctionProvider._convert_lambda_function_resource(
-                        stack, name, resource_properties, layers, use_raw_codeuri
-                    )
-                    result[function.full_path] = function
+        return result
 
-                # We don't care about other resource types. Just ignore them
+    @staticmethod
+    def _extract_function(
+        stack: Stack,
+        stacks: List[Stack],
+        name: str,
+        resources: Mapping,
+        use_raw_codeuri: bool = False,
+        ignore_code_extraction_warnings: bool = False,
+        locate_layer_nested: bool = False,
+    ) -> Optional[Function]:
+        """
+        Extracts the function information of a resource of a stack, without resolving the resource if it is not a
+        function. Returns None if the resource is not a function, or if its code can't be used locally
+        """
+        resource_type = SamBaseProvider._get_resource_type(resources, name)
+        # We don't care about other resource types. Just ignore them
+        if resource_type not in [AWS_SERVERLESS_FUNCTION, AWS_LAMBDA_FUNCTION]:
+            return None
 
-        return result
+        resource = resources[name]
+        resource_properties = resource.get("Properties", {})
+        resource_metadata = resource.get("Metadata", None)
+        # Add extra metadata information to properties under a separate field.
+        if resource_metadata:
+            resource_properties["Metadata"] = resource_metadata
+
+        resource_package_type = resource_properties.get("PackageType", ZIP)
+
+        code_property_key = SamBaseProvider.CODE_PROPERTY_KEYS[resource_type]
+        image_property_key = SamBaseProvider.IMAGE_PROPERTY_KEYS[resource_type]
+
+        if resource_package_type == ZIP and SamBaseProvider._is_s3_location(resource_properties.get(code_property_key)):
+            # CodeUri can be a dictionary of S3 Bucket/Key or a S3 URI, neither of which are supported
+            if not ignore_code_extraction_warnings:
+                SamFunctionProvider._warn_code_extraction(resource_type, name, code_property_key)
+            return None
+
+        if (
+            resource_package_type == IMAGE
+            and SamBaseProvider._is_ecr_uri(resource_properties.get(image_property_key))
+            and not SamFunctionProvider._metadata_has_necessary_entries_for_image_function_to_be_built(
+                resource_metadata
+            )
+        ):
+            # ImageUri can be an ECR uri, which is not supported
+            if not ignore_code_extraction_warnings:
+                SamFunctionProvider._warn_imageuri_extraction(resource_type, name, image_property_key)
+            return None
+
+        layers = SamFunctionProvider._parse_layer_info(
+            stack,
+            resource_properties.get("Layers", []),
+            use_raw_codeuri,
+            ignore_code_extraction_warnings=ignore_code_extraction_warnings,
+            locate_layer_nested=locate_layer_nested,
+            stacks=stacks if locate_layer_nested else None,
+            function_id=resource_metadata.get("SamResourceId", "") if locate_layer_nested else None,
+        )
+        if resource_type == AWS_SERVERLESS_FUNCTION:
+            return SamFunctionProvider._convert_sam_function_resource(
+                stack,
+                name,
+                resource_properties,
+                layers,
+                use_raw_codeuri,
+            )
+        return SamFunctionProvider._convert_lambda_function_resource(
+            stack, name, resource_properties, layers, use_raw_codeuri
+        )
 
     @staticmethod
     def _convert_sam_function_resource(
@@ -479,6 +536,7 @@ class SamFunctionProvider(SamBaseProvider):
             runtime_management_config=resource_properties.get("RuntimeManagementConfig"),
             function_build_info=function_build_info,
             logging_config=resource_properties.get("LoggingConfig"),
+            event_invoke_config=resource_properties.get("EventInvokeConfig"),
         )
 
     @staticmethod
@@ -4,7 +4,7 @@ Class that provides all nested stacks from a given SAM template
 
 import logging
 import os
-from typing import Dict, Iterator, List, Optional, Tuple, Union, cast
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple, Union, cast
 from urllib.parse import unquote, urlparse
 
 from samcli.commands._utils.template import TemplateNotFoundException, get_template_data
@@ -31,6 +31,7 @@ class SamLocalStackProvider(SamBaseProvider):
         parameter_overrides: Optional[Dict] = None,
         global_parameter_overrides: Optional[Dict] = None,
         use_sam_transform: bool = True,
+        lazy_resolution: bool = False,
     ):
         """
         Initialize the class with SAM template data. The SAM template passed to this provider is assumed
@@ -55,6 +56,9 @@ class SamLocalStackProvider(SamBaseProvider):
             the template and all its child templates
         use_sam_transform: bool
             Whether to transform the given template with Serverless Application Model. Default is True
+        lazy_resolution: bool
+            Whether to only resolve the intrinsic functions of the resources which are accessed, the nested stacks
+            resources here. Default is False
         """
 
         self._template_file = template_file
@@ -63,8 +67,9 @@ class SamLocalStackProvider(SamBaseProvider):
             template_dict,
             SamLocalStackProvider.merge_parameter_overrides(parameter_overrides, global_parameter_overrides),
             use_sam_transform=use_sam_transform,
+            lazy_resolution=lazy_resolution,
         )
-        self._resources = self._template_dict.get("Resources", {})
+        self._resources: Mapping = self._template_dict.get("Resources", {})
         self._global_parameter_overrides = global_parameter_overrides
 
         # Store a map of stack name to stack information for quick reference -> self._stacks
@@ -75,6 +80,13 @@ class SamLocalStackProvider(SamBaseProvider):
 
         LOG.debug("%d stacks found in the template", len(self._stacks))
 
+    @property
+    def resources(self) -> Mapping:
+        """
+        The resources of the template where SAM plugins have been run and parameter values have been substituted
+        """
+        return self._resources
+
     def get(self, name: str) -> Optional[Stack]:
         """
         Returns the application given name or LogicalId of the application.
@@ -109,13 +121,18 @@ class SamLocalStackProvider(SamBaseProvider):
         If child stacks with remote URL are detected, their full paths are recorded in self._remote_stack_full_paths.
         """
 
-        for name, resource in self._resources.items():
-            resource_type = resource.get("Type")
+        for name in self._resources:
+            resource_type = self._get_resource_type(self._resources, name)
+            # We don't care about other resource types, and don't resolve them
+            if resource_type not in (AWS_SERVERLESS_APPLICATION, AWS_CLOUDFORMATION_STACK):
+                continue
+
+            resource = self._resources[name]
             resource_properties = resource.get("Properties", {})
             resource_metadata = resource.get("Metadata", None)
             # Add extra metadata information to properties under a separate field.
             if resource_metadata:
-                resource_properties["Metadata"] = resource_metadata
+                resource_properties = {**resource_properties, "Metadata": resource_metadata}
 
             stack: Optional[Stack] = None
             try:
@@ -133,8 +150,6 @@ class SamLocalStackProvider(SamBaseProvider):
             if stack:
                 self._stacks[name] = stack
 
-            # We don't care about other resource types. Just ignore them
-
     @staticmethod
     def _convert_sam_application_resource(
         template_file: str,
@@ -211,6 +226,7 @@ class SamLocalStackProvider(SamBaseProvider):
         metadata: Optional[Dict] = None,
         template_dictionary: Optional[Dict] = None,
         use_sam_transform: bool = True,
+        lazy_resolution: bool = False,
     ) -> Tuple[List[Stack], List[str]]:
         """
         Recursively extract stacks from a template file.
@@ -236,6 +252,9 @@ class SamLocalStackProvider(SamBaseProvider):
             dictionary representing the sam template. Only one of either template_dict or template_file is required
         use_sam_transform: bool
             Whether to transform the given template with Serverless Application Model. Default is True
+        lazy_resolution: bool
+            Whether the intrinsic functions of each resource of the stacks are only resolved on its first access,
+            for commands which only need a few resources. Default is False
 
         Returns
         -------
@@ -255,6 +274,16 @@ class SamLocalStackProvider(SamBaseProvider):
                 message="A template file or a template dict is required but both are missing."
             )
 
+        current = SamLocalStackProvider(
+            template_file,
+            stack_path,
+            template_dict,
+            parameter_overrides,
+            global_parameter_overrides,
+            use_sam_transform=use_sam_transform,
+            lazy_resolution=lazy_resolution,
+        )
+
         stacks = [
             Stack(
                 stack_path,
@@ -263,18 +292,12 @@ class SamLocalStackProvider(SamBaseProvider):
                 SamLocalStackProvider.merge_parameter_overrides(parameter_overrides, global_parameter_overrides),
                 template_dict,
                 metadata,
+                lazy_resolution=lazy_resolution,
+                # the stack resources are processed the same way, reuse them instead of translating the template again
+                resources=cast(Dict, current.resources) if lazy_resolution and use_sam_transform else None,
             )
         ]
         remote_stack_full_paths: List[str] = []
-
-        current = SamLocalStackProvider(
-            template_file,
-            stack_path,
-            template_dict,
-            parameter_overrides,
-            global_parameter_overrides,
-            use_sam_transform=use_sam_transform,
-        )
         remote_stack_full_paths.extend(current.remote_stack_full_paths)
 
         for child_stack in current.get_all():
@@ -286,6 +309,7 @@ class SamLocalStackProvider(SamBaseProvider):
                 global_parameter_overrides,
                 child_stack.metadata,
                 use_sam_transform=use_sam_transform,
+                lazy_resolution=lazy_resolution,
             )
             stacks.extend(stacks_in_child)
             remote_stack_full_paths.extend(remote_stack_full_paths_in_child)
@@ -5,7 +5,7 @@ Remote invoke executor implementation for Kinesis streams
 import logging
 import uuid
 from dataclasses import asdict, dataclass
-from typing import cast
+from typing import List, Optional, cast
 
 from botocore.exceptions import ClientError, ParamValidationError
 from mypy_boto3_kinesis import KinesisClient
@@ -15,7 +15,7 @@ from samcli.lib.remote_invoke.exceptions import (
     InvalidResourceBotoParameterException,
 )
 from samcli.lib.remote_invoke.remote_invoke_executors import (
-    BotoActionExecutor,
+    BatchBotoActionExecutor,
     RemoteInvokeIterableResponseType,
     RemoteInvokeOutputFormat,
     RemoteInvokeResponse,
@@ -25,6 +25,8 @@ LOG = logging.getLogger(__name__)
 STREAM_NAME = "StreamName"
 DATA = "Data"
 PARTITION_KEY = "PartitionKey"
+EXPLICIT_HASH_KEY = "ExplicitHashKey"
+SEQUENCE_NUMBER_FOR_ORDERING = "SequenceNumberForOrdering"
 
 
 @dataclass
@@ -50,7 +52,7 @@ class KinesisStreamPutRecordTextOutput:
         return asdict(self, dict_factory=lambda x: {k: v for (k, v) in x if v is not None})
 
 
-class KinesisPutDataExecutor(BotoActionExecutor):
+class KinesisPutDataExecutor(BatchBotoActionExecutor):
     """
     Calls "put_record" method of "Kinesis stream" service with given input.
     If a file location provided, the file handle will be passed as input object.
@@ -61,11 +63,16 @@ class KinesisPutDataExecutor(BotoActionExecutor):
     _remote_output_format: RemoteInvokeOutputFormat
     request_parameters: dict
 
+    # put_records accepts up to 500 records, and up to 5 MiB of data and partition keys
+    max_batch_size = 500
+    max_batch_payload_size = 5 * 1024 * 1024
+
     def __init__(self, kinesis_client: KinesisClient, physical_id: str, remote_output_format: RemoteInvokeOutputFormat):
         self._kinesis_client = kinesis_client
         self._remote_output_format = remote_output_format
         self._stream_name = physical_id
         self.request_parameters = {}
+        self._generated_partition_key = False
 
     def validate_action_parameters(self, parameters: dict) -> None:
         """
@@ -86,6 +93,7 @@ class KinesisPutDataExecutor(BotoActionExecutor):
 
         if PARTITION_KEY not in self.request_parameters:
             self.request_parameters[PARTITION_KEY] = str(uuid.uuid4())
+            self._generated_partition_key = True
 
     def _execute_action(self, payload: str) -> RemoteInvokeIterableResponseType:
         """
@@ -131,3 +139,37 @@ class KinesisPutDataExecutor(BotoActionExecutor):
             )
         except ClientError as client_ex:
             raise ErrorBotoApiCallException(client_ex) from client_ex
+
+    def get_payload_size(self, payload: str) -> int:
+        # generated partition keys are all as long as the one of the request parameters
+        return len((payload or "{}").encode("utf-8")) + len(str(self.request_parameters.get(PARTITION_KEY, "")))
+
+    def send_batch(self, payloads: List[str]) -> List[Optional[str]]:
+        """
+        Writes the events with "put_records". Unless a PartitionKey is given as input, each record gets a random
+        partition key so that the records spread across the shards of the stream
+        """
+        stream_parameters = {
+            key: value
+            for key, value in self.request_parameters.items()
+            if key not in {PARTITION_KEY, EXPLICIT_HASH_KEY, SEQUENCE_NUMBER_FOR_ORDERING}
+        }
+        record_parameters = {
+            key: value for key, value in self.request_parameters.items() if key in {PARTITION_KEY, EXPLICIT_HASH_KEY}
+        }
+        records = [
+            {
+                **record_parameters,
+                **({PARTITION_KEY: str(uuid.uuid4())} if self._generated_partition_key else {}),
+                DATA: payload or "{}",
+            }
+            for payload in payloads
+        ]
+        LOG.debug("Calling kinesis_client.put_records with StreamName:%s, %d records", self._stream_name, len(records))
+        put_records_response = cast(
+            dict,
+            self._kinesis_client.put_records(
+                **{**stream_parameters, STREAM_NAME: self._stream_name, "Records": records}
+            ),
+        )
+        return [record.get("ErrorCode") for record in put_records_response["Records"]]
@@ -7,7 +7,7 @@ import json
 import logging
 from abc import ABC, abstractmethod
 from json import JSONDecodeError
-from typing import cast
+from typing import List, Optional, cast
 
 from botocore.eventstream import EventStream
 from botocore.exceptions import ClientError, ParamValidationError
@@ -20,7 +20,7 @@ from samcli.lib.remote_invoke.exceptions import (
     InvalidResourceBotoParameterException,
 )
 from samcli.lib.remote_invoke.remote_invoke_executors import (
-    BotoActionExecutor,
+    BatchBotoActionExecutor,
     RemoteInvokeExecutionInfo,
     RemoteInvokeIterableResponseType,
     RemoteInvokeLogOutput,
@@ -37,12 +37,13 @@ EVENT_STREAM = "EventStream"
 PAYLOAD_CHUNK = "PayloadChunk"
 INVOKE_COMPLETE = "InvokeComplete"
 LOG_RESULT = "LogResult"
+FUNCTION_ERROR = "FunctionError"
 
 INVOKE_MODE = "InvokeMode"
 RESPONSE_STREAM = "RESPONSE_STREAM"
 
 
-class AbstractLambdaInvokeExecutor(BotoActionExecutor, ABC):
+class AbstractLambdaInvokeExecutor(BatchBotoActionExecutor, ABC):
     """
     Abstract class for different lambda invocation executors, see implementation for details.
     For Payload parameter, if a file location provided, the file handle will be passed as Payload object
@@ -52,6 +53,9 @@ class AbstractLambdaInvokeExecutor(BotoActionExecutor, ABC):
     _function_name: str
     _remote_output_format: RemoteInvokeOutputFormat
 
+    # invoke accepts a single event
+    max_batch_size = 1
+
     def __init__(self, lambda_client: LambdaClient, function_name: str, remote_output_format: RemoteInvokeOutputFormat):
         self._lambda_client = lambda_client
         self._function_name = function_name
@@ -98,6 +102,23 @@ class AbstractLambdaInvokeExecutor(BotoActionExecutor, ABC):
                 raise InvalidResourceBotoParameterException(client_ex) from client_ex
             raise ErrorBotoApiCallException(client_ex) from client_ex
 
+    def send_batch(self, payloads: List[str]) -> List[Optional[str]]:
+        """
+        Invokes the function with each event using "invoke", the response of functions using response streaming is
+        buffered. Errors of the function are reported as FunctionError with its type (ex. "FunctionError: Unhandled")
+        """
+        errors: List[Optional[str]] = []
+        for payload in payloads:
+            invoke_parameters: dict = {**self.request_parameters, FUNCTION_NAME: self._function_name, PAYLOAD: payload}
+            lambda_response = cast(dict, self._lambda_client.invoke(**invoke_parameters))
+            response_payload = lambda_response.get(PAYLOAD)
+            if response_payload:
+                # the latency of the request includes reading the whole response
+                cast(StreamingBody, response_payload).read()
+            function_error = lambda_response.get(FUNCTION_ERROR)
+            errors.append(f"{FUNCTION_ERROR}: {function_error}" if function_error else None)
+        return errors
+
     @abstractmethod
     def _execute_lambda_invoke(self, payload: str) -> RemoteInvokeIterableResponseType:
         raise NotImplementedError()
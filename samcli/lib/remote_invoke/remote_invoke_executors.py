@@ -11,8 +11,12 @@ from io import TextIOWrapper
 from pathlib import Path
 from typing import Any, Callable, Generic, Iterable, List, Optional, TypeVar, Union, cast
 
+from botocore.exceptions import ParamValidationError
 from typing_extensions import TypeAlias
 
+from samcli.lib.remote_invoke.exceptions import InvalidResourceBotoParameterException
+from samcli.lib.remote_invoke.remote_invoke_load_generator import RemoteInvokeLoadGenerator, RemoteInvokeLoadReport
+
 LOG = logging.getLogger(__name__)
 
 
@@ -84,6 +88,7 @@ class RemoteInvokeExecutionInfo:
 
     payload: payload string given by the customer
     payload_file: if file is given, this points to its location
+    asynchronous: if True, the execution is started without waiting for its result
 
     response: response object returned from boto3 action
     exception: if an exception is thrown, it will be stored here
@@ -94,6 +99,7 @@ class RemoteInvokeExecutionInfo:
     payload_file: Optional[TextIOWrapper]
     parameters: dict
     output_format: RemoteInvokeOutputFormat
+    asynchronous: bool
 
     # Response related properties
     response: Optional[Union[dict, str]]
@@ -106,11 +112,13 @@ class RemoteInvokeExecutionInfo:
         payload_file: Optional[TextIOWrapper],
         parameters: dict,
         output_format: RemoteInvokeOutputFormat,
+        asynchronous: bool = False,
     ):
         self.payload = payload
         self.payload_file = payload_file
         self.parameters = parameters
         self.output_format = output_format
+        self.asynchronous = asynchronous
         self.response = None
         self.log_output = None
         self.exception = None
@@ -242,6 +250,47 @@ class BotoActionExecutor(ABC):
         return action_executor(payload)
 
 
+class BatchBotoActionExecutor(BotoActionExecutor):
+    """
+    BotoActionExecutor which can also send events in batches, which is required to generate load
+    """
+
+    # Maximum number of events sent with a single request by send_batch
+    max_batch_size: int = 1
+    # Maximum total size in bytes of the events sent with a single request by send_batch, None if not limited
+    max_batch_payload_size: Optional[int] = None
+
+    def get_payload_size(self, payload: str) -> int:
+        """
+        Returns the size of the event counted against max_batch_payload_size
+        """
+        return len(payload.encode("utf-8"))
+
+    @abstractmethod
+    def send_batch(self, payloads: List[str]) -> List[Optional[str]]:
+        """
+        Sends a batch of events with a single request, used to generate load. Unlike execute, it may be called from
+        several threads at the same time, so it must not change the state of the executor.
+
+        Parameters
+        ----------
+        payloads : List[str]
+            Events to send, at most max_batch_size of them, and at most max_batch_payload_size bytes unless the
+            batch is made of a single event
+
+        Returns
+        -------
+        List[Optional[str]]
+            For each event, None if it was sent successfully or the code of its error otherwise
+
+        Raises
+        ------
+        botocore.exceptions.ClientError
+            If the request fails, all the events of the batch failed
+        """
+        raise NotImplementedError()
+
+
 class RemoteInvokeExecutor:
     """
     Generic RemoteInvokeExecutor, which contains request mappers, response mappers and boto action executor.
@@ -286,6 +335,62 @@ class RemoteInvokeExecutor:
             if isinstance(remote_invoke_result, RemoteInvokeLogOutput):
                 self._log_consumer.consume(remote_invoke_result)
 
+    @property
+    def supports_load(self) -> bool:
+        """
+        Whether the events can be sent in load mode, which requires sending them in batches
+        """
+        return isinstance(self._boto_action_executor, BatchBotoActionExecutor)
+
+    def execute_load(
+        self,
+        remote_invoke_inputs: List[RemoteInvokeExecutionInfo],
+        repeat: int,
+        concurrency: int,
+        rate: Optional[float] = None,
+    ) -> RemoteInvokeLoadReport:
+        """
+        Sends each of the inputs repeat times in batches, with concurrent requests, and returns the latencies and the
+        errors of the requests. The inputs are mapped once, and they all share the parameters of the first one.
+
+        Parameters
+        ----------
+        remote_invoke_inputs : List[RemoteInvokeExecutionInfo]
+            Inputs to send, in order
+        repeat : int
+            Number of times all the inputs are sent
+        concurrency : int
+            Maximum number of requests in flight
+        rate : Optional[float]
+            Events sent per second, as fast as the concurrency allows if not set
+
+        Returns
+        -------
+        RemoteInvokeLoadReport
+            Latencies and errors of the requests
+        """
+        remote_invoke_inputs = [self._map_input(remote_invoke_input) for remote_invoke_input in remote_invoke_inputs]
+        if remote_invoke_inputs:
+            self._boto_action_executor.validate_action_parameters(remote_invoke_inputs[0].parameters)
+        payloads = [
+            (
+                cast(TextIOWrapper, remote_invoke_input.payload_file).read()
+                if remote_invoke_input.is_file_provided()
+                else cast(str, remote_invoke_input.payload)
+            )
+            for remote_invoke_input in remote_invoke_inputs
+        ]
+
+        load_generator = RemoteInvokeLoadGenerator(
+            cast(BatchBotoActionExecutor, self._boto_action_executor), concurrency, rate
+        )
+        try:
+            return load_generator.run(payload for _ in range(repeat) for payload in payloads)
+        except ParamValidationError as param_val_ex:
+            raise InvalidResourceBotoParameterException(
+                f"Invalid parameter key provided. {param_val_ex}"
+            ) from param_val_ex
+
     def _map_input(self, remote_invoke_input: RemoteInvokeExecutionInfo) -> RemoteInvokeExecutionInfo:
         """
         Maps the given input through the request mapper list.
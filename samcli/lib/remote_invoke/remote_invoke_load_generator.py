@@ -0,0 +1,264 @@
+"""
+Sends many events to a resource concurrently, and reports the latencies and the errors of the requests
+"""
+
+import logging
+import math
+import threading
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from botocore.exceptions import BotoCoreError, ClientError, ParamValidationError
+
+from samcli.lib.utils.boto_utils import get_client_error_code
+
+if TYPE_CHECKING:  # pragma: no cover
+    from samcli.lib.remote_invoke.remote_invoke_executors import BatchBotoActionExecutor
+
+LOG = logging.getLogger(__name__)
+
+# Number of requests in flight at the same time by default
+DEFAULT_LOAD_CONCURRENCY = 10
+# Upper bounds of the buckets of the latency histogram, in milliseconds
+LATENCY_HISTOGRAM_BUCKETS_MS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000]
+# Width of the bar of the most populated bucket of the latency histogram
+_HISTOGRAM_BAR_WIDTH = 40
+
+
+@dataclass
+class RemoteInvokeLoadReport:
+    """
+    Results of sending events in load mode
+
+    Attributes
+    ----------
+    events: int
+        Number of events sent
+    failed_events: int
+        Number of events which failed
+    errors: Counter[str]
+        Number of failed events by error code
+    latencies: List[float]
+        Latency of each request in seconds, a request sends a batch of events
+    duration: float
+        Time in seconds spent sending all the events
+    """
+
+    events: int = 0
+    failed_events: int = 0
+    errors: Counter = field(default_factory=Counter)
+    latencies: List[float] = field(default_factory=list)
+    duration: float = 0.0
+
+    def add_request(self, latency: float, errors: List[Optional[str]]) -> None:
+        """
+        Records the results of a request which sent a batch of events, with the error of each event or None
+        """
+        self.latencies.append(latency)
+        self.events += len(errors)
+        for error in errors:
+            if error is not None:
+                self.failed_events += 1
+                self.errors[error] += 1
+
+    @property
+    def error_rate(self) -> float:
+        return self.failed_events / self.events if self.events else 0.0
+
+    def latency_percentile(self, percentile: float) -> float:
+        """
+        Returns the latency in seconds of the given percentile (0 to 100) of the requests, with the nearest-rank method
+        """
+        if not self.latencies:
+            return 0.0
+        latencies = sorted(self.latencies)
+        rank = max(math.ceil(percentile / 100 * len(latencies)), 1)
+        return latencies[min(rank, len(latencies)) - 1]
+
+    def latency_histogram(self) -> List[Tuple[Optional[int], int]]:
+        """
+        Returns the number of requests in each bucket of LATENCY_HISTOGRAM_BUCKETS_MS, as (upper bound in
+        milliseconds, count) tuples. The last bucket has no upper bound, and holds the requests slower than all others
+        """
+        buckets: List[Optional[int]] = [*LATENCY_HISTOGRAM_BUCKETS_MS, None]
+        counts = [0] * len(buckets)
+        for latency in self.latencies:
+            latency_ms = latency * 1000
+            index = next(
+                (index for index, bound in enumerate(LATENCY_HISTOGRAM_BUCKETS_MS) if latency_ms <= bound),
+                len(LATENCY_HISTOGRAM_BUCKETS_MS),
+            )
+            counts[index] += 1
+        return list(zip(buckets, counts))
+
+    def to_dict(self) -> Dict:
+        """
+        Returns the report as a dictionary, used for the JSON output
+        """
+        return {
+            "Events": self.events,
+            "FailedEvents": self.failed_events,
+            "ErrorRate": self.error_rate,
+            "Errors": dict(self.errors),
+            "Requests": len(self.latencies),
+            "DurationSeconds": self.duration,
+            "LatencyMilliseconds": {
+                name: self.latency_percentile(percentile) * 1000 for name, percentile in self._percentiles()
+            },
+            "LatencyHistogram": [
+                {"UpperBoundMilliseconds": bound, "Count": count} for bound, count in self.latency_histogram()
+            ],
+        }
+
+    def format(self) -> str:
+        """
+        Returns the report as a human readable summary, used for the text output
+        """
+        events_per_second = self.events / self.duration if self.duration else 0.0
+        lines = [
+            f"Events: {self.events} sent, {self.events - self.failed_events} succeeded, {self.failed_events} failed "
+            f"({self.error_rate:.2%} error rate)",
+            f"Requests: {len(self.latencies)} in {self.duration:.2f} seconds ({events_per_second:.1f} events/second)",
+        ]
+        if not self.latencies:
+            return "\n".join(lines)
+
+        percentiles = ", ".join(
+            f"{name.lower()} {self.latency_percentile(percentile) * 1000:.1f}"
+            for name, percentile in self._percentiles()
+        )
+        lines.append(f"Latency (ms): {percentiles}")
+        if self.errors:
+            lines.append("Errors:")
+            lines.extend(f"  {error}: {count}" for error, count in self.errors.most_common())
+
+        histogram = self.latency_histogram()
+        populated = [index for index, (_, count) in enumerate(histogram) if count]
+        max_count = max(count for _, count in histogram)
+        lines.append("Latency histogram (ms):")
+        for bound, count in histogram[populated[0] : populated[-1] + 1]:
+            label = f"<= {bound}" if bound is not None else f"> {LATENCY_HISTOGRAM_BUCKETS_MS[-1]}"
+            bar = "#" * math.ceil(count / max_count * _HISTOGRAM_BAR_WIDTH)
+            lines.append(f"  {label:>8} | {bar:<{_HISTOGRAM_BAR_WIDTH}} {count}")
+        return "\n".join(lines)
+
+    @staticmethod
+    def _percentiles() -> List[Tuple[str, float]]:
+        return [("Min", 0), ("P50", 50), ("P90", 90), ("P99", 99), ("Max", 100)]
+
+
+class RemoteInvokeLoadGenerator:
+    """
+    Sends events with the batch API of a BatchBotoActionExecutor, with a bounded number of requests in flight and
+    optionally at a fixed rate, and records the latency and the errors of each request
+    """
+
+    def __init__(
+        self,
+        boto_action_executor: "BatchBotoActionExecutor",
+        concurrency: int = DEFAULT_LOAD_CONCURRENCY,
+        rate: Optional[float] = None,
+    ):
+        """
+        Parameters
+        ----------
+        boto_action_executor : BatchBotoActionExecutor
+            Executor which sends the batches of events
+        concurrency : int
+            Maximum number of requests in flight
+        rate : Optional[float]
+            Events sent per second, as fast as the concurrency allows if not set
+        """
+        self._boto_action_executor = boto_action_executor
+        self._concurrency = concurrency
+        self._rate = rate
+        self._lock = threading.Lock()
+
+    def run(self, payloads: Iterable[str]) -> RemoteInvokeLoadReport:
+        """
+        Sends all the payloads, in batches of up to max_batch_size events and max_batch_payload_size bytes of the
+        executor
+
+        Parameters
+        ----------
+        payloads : Iterable[str]
+            Events to send
+
+        Returns
+        -------
+        RemoteInvokeLoadReport
+            Latencies and errors of the requests
+
+        Raises
+        ------
+        botocore.exceptions.ParamValidationError
+            If the parameters of the requests are invalid, since all the following requests would fail the same way
+        """
+        report = RemoteInvokeLoadReport()
+        started = time.monotonic()
+        scheduled_events = 0
+        in_flight: Set[Future] = set()
+
+        with ThreadPoolExecutor(max_workers=self._concurrency) as executor:
+            try:
+                for batch in self._batches(payloads):
+                    if len(in_flight) >= self._concurrency:
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            future.result()
+                    if self._rate:
+                        # keep the number of events sent in line with the rate since the start
+                        delay = started + scheduled_events / self._rate - time.monotonic()
+                        if delay > 0:
+                            time.sleep(delay)
+                    in_flight.add(executor.submit(self._send_batch, batch, report))
+                    scheduled_events += len(batch)
+
+                for future in wait(in_flight).done:
+                    future.result()
+            finally:
+                for future in in_flight:
+                    future.cancel()
+
+        report.duration = time.monotonic() - started
+        return report
+
+    def _batches(self, payloads: Iterable[str]) -> Iterator[List[str]]:
+        max_batch_size = self._boto_action_executor.max_batch_size
+        max_batch_payload_size = self._boto_action_executor.max_batch_payload_size
+        batch: List[str] = []
+        batch_payload_size = 0
+        for payload in payloads:
+            payload_size = self._boto_action_executor.get_payload_size(payload) if max_batch_payload_size else 0
+            if batch and (
+                len(batch) >= max_batch_size
+                or (max_batch_payload_size and batch_payload_size + payload_size > max_batch_payload_size)
+            ):
+                yield batch
+                batch = []
+                batch_payload_size = 0
+            batch.append(payload)
+            batch_payload_size += payload_size
+        if batch:
+            yield batch
+
+    def _send_batch(self, batch: List[str], report: RemoteInvokeLoadReport) -> None:
+        request_started = time.perf_counter()
+        errors: List[Optional[str]]
+        try:
+            errors = self._boto_action_executor.send_batch(batch)
+        except ParamValidationError:
+            raise
+        except ClientError as ex:
+            LOG.debug("Failed to send a batch of %d events", len(batch), exc_info=ex)
+            errors = [get_client_error_code(ex) or type(ex).__name__] * len(batch)
+        except BotoCoreError as ex:
+            LOG.debug("Failed to send a batch of %d events", len(batch), exc_info=ex)
+            errors = [type(ex).__name__] * len(batch)
+        latency = time.perf_counter() - request_started
+
+        with self._lock:
+            report.add_request(latency, errors)
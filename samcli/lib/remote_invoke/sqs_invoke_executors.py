@@ -6,7 +6,7 @@ import json
 import logging
 from dataclasses import asdict, dataclass
 from json.decoder import JSONDecodeError
-from typing import Optional, cast
+from typing import Any, Dict, List, Optional, cast
 
 from botocore.exceptions import ClientError, ParamValidationError
 from mypy_boto3_sqs import SQSClient
@@ -16,7 +16,7 @@ from samcli.lib.remote_invoke.exceptions import (
     InvalidResourceBotoParameterException,
 )
 from samcli.lib.remote_invoke.remote_invoke_executors import (
-    BotoActionExecutor,
+    BatchBotoActionExecutor,
     RemoteInvokeIterableResponseType,
     RemoteInvokeOutputFormat,
     RemoteInvokeResponse,
@@ -28,6 +28,7 @@ MESSAGE_BODY = "MessageBody"
 DELAY_SECONDS = "DelaySeconds"
 MESSAGE_ATTRIBUTES = "MessageAttributes"
 MESSAGE_SYSTEM_ATTRIBUTES = "MessageSystemAttributes"
+ENTRY_ID = "Id"
 
 
 @dataclass
@@ -54,7 +55,7 @@ class SqsSendMessageTextOutput:
         return asdict(self, dict_factory=lambda x: {k: v for (k, v) in x if v is not None})
 
 
-class SqsSendMessageExecutor(BotoActionExecutor):
+class SqsSendMessageExecutor(BatchBotoActionExecutor):
     """
     Calls "send_message" method of "SQS" service with given input.
     If a file location provided, the file handle will be passed as input object.
@@ -65,6 +66,10 @@ class SqsSendMessageExecutor(BotoActionExecutor):
     _remote_output_format: RemoteInvokeOutputFormat
     request_parameters: dict
 
+    # send_message_batch accepts up to 10 messages, and up to 256 KiB of message bodies and attributes
+    max_batch_size = 10
+    max_batch_payload_size = 256 * 1024
+
     def __init__(self, sqs_client: SQSClient, physical_id: str, remote_output_format: RemoteInvokeOutputFormat):
         self._sqs_client = sqs_client
         self._remote_output_format = remote_output_format
@@ -146,6 +151,41 @@ class SqsSendMessageExecutor(BotoActionExecutor):
         except ClientError as client_ex:
             raise ErrorBotoApiCallException(client_ex) from client_ex
 
+    def get_payload_size(self, payload: str) -> int:
+        return len((payload or "{}").encode("utf-8")) + _get_message_attributes_size(
+            self.request_parameters.get(MESSAGE_ATTRIBUTES, {})
+        )
+
+    def send_batch(self, payloads: List[str]) -> List[Optional[str]]:
+        """
+        Sends the events with "send_message_batch", each message gets the parameters given as input
+        """
+        entries: List[Any] = [
+            {**self.request_parameters, ENTRY_ID: str(index), MESSAGE_BODY: payload or "{}"}
+            for index, payload in enumerate(payloads)
+        ]
+        LOG.debug("Calling sqs_client.send_message_batch with QueueUrl:%s, %d entries", self._queue_url, len(entries))
+        send_message_batch_response = cast(
+            dict, self._sqs_client.send_message_batch(QueueUrl=self._queue_url, Entries=entries)
+        )
+
+        errors: List[Optional[str]] = [None] * len(payloads)
+        for failed_entry in send_message_batch_response.get("Failed", []):
+            errors[int(failed_entry[ENTRY_ID])] = failed_entry["Code"]
+        return errors
+
+
+def _get_message_attributes_size(message_attributes: Dict[str, Dict]) -> int:
+    """
+    Returns the size of message attributes as counted by SQS: the names, data types and values of the attributes
+    """
+    size = 0
+    for name, attribute in message_attributes.items():
+        value = attribute.get("StringValue") or attribute.get("BinaryValue") or ""
+        size += len(name.encode("utf-8")) + len(attribute.get("DataType", "").encode("utf-8"))
+        size += len(value) if isinstance(value, bytes) else len(str(value).encode("utf-8"))
+    return size
+
 
 def get_queue_url_from_arn(sqs_client: SQSClient, queue_name: str) -> str:
     """
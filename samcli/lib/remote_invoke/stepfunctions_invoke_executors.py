@@ -5,7 +5,7 @@ Remote invoke executor implementation for Step Functions
 import logging
 import time
 from datetime import datetime
-from typing import cast
+from typing import Dict, Iterator, List, Optional, cast
 
 from botocore.exceptions import ClientError, ParamValidationError
 from mypy_boto3_stepfunctions import SFNClient
@@ -17,6 +17,7 @@ from samcli.lib.remote_invoke.exceptions import (
 )
 from samcli.lib.remote_invoke.remote_invoke_executors import (
     BotoActionExecutor,
+    RemoteInvokeExecutionInfo,
     RemoteInvokeIterableResponseType,
     RemoteInvokeLogOutput,
     RemoteInvokeOutputFormat,
@@ -28,20 +29,27 @@ LOG = logging.getLogger(__name__)
 STATE_MACHINE_ARN = "stateMachineArn"
 INPUT = "input"
 RUNNING = "RUNNING"
+# Time in seconds between the first two polls of a running execution, doubles with every poll afterwards
+SFN_EXECUTION_MIN_WAIT_TIME = 0.25
+# Maximum time in seconds between two polls of a running execution
 SFN_EXECUTION_WAIT_TIME = 2
+# History event types which end an execution
+SFN_EXECUTION_END_EVENT_TYPES = {"ExecutionSucceeded", "ExecutionFailed", "ExecutionTimedOut", "ExecutionAborted"}
 
 
 class StepFunctionsStartExecutionExecutor(BotoActionExecutor):
     """
     Calls "start_execution" method of "Step Functions" service with given input.
     If a file location provided, the file handle will be passed as input object.
-    Calls "describe_execution" method after the executions starts to get more
-    execution details.
+    Streams the events of the execution history while the execution runs, and calls "describe_execution" method
+    once it completes to get more execution details. Asynchronous invocations return the execution ARN once the
+    execution starts.
     """
 
     _stepfunctions_client: SFNClient
     _state_machine_arn: str
     _remote_output_format: RemoteInvokeOutputFormat
+    _asynchronous: bool
     request_parameters: dict
 
     def __init__(
@@ -50,8 +58,13 @@ class StepFunctionsStartExecutionExecutor(BotoActionExecutor):
         self._stepfunctions_client = stepfunctions_client
         self._remote_output_format = remote_output_format
         self._state_machine_arn = physical_id
+        self._asynchronous = False
         self.request_parameters = {}
 
+    def execute(self, remote_invoke_input: RemoteInvokeExecutionInfo) -> RemoteInvokeIterableResponseType:
+        self._asynchronous = remote_invoke_input.asynchronous
+        return super().execute(remote_invoke_input)
+
     def validate_action_parameters(self, parameters: dict) -> None:
         """
         Validates the input boto parameters and prepares the parameters for calling the API.
@@ -75,8 +88,8 @@ class StepFunctionsStartExecutionExecutor(BotoActionExecutor):
 
     def _execute_action(self, payload: str) -> RemoteInvokeIterableResponseType:
         """
-        Calls "start_execution" method to start the execution and waits
-        for the execution to complete using the "describe_execution" method
+        Calls "start_execution" method to start the execution and waits for the execution to complete, streaming the
+        events of its history, unless the invocation is asynchronous
 
         Parameters
         ----------
@@ -100,15 +113,24 @@ class StepFunctionsStartExecutionExecutor(BotoActionExecutor):
             start_execution_response = self._stepfunctions_client.start_execution(**self.request_parameters)
             execution_arn = start_execution_response["executionArn"]
 
-            execution_status = RUNNING
-            while execution_status == RUNNING:
-                describe_execution_response = cast(
-                    dict, self._stepfunctions_client.describe_execution(executionArn=execution_arn)
-                )
-                execution_status = describe_execution_response["status"]
-                LOG.debug("ExecutionArn: %s, status: %s", execution_arn, execution_status)
-                # Sleep to avoid throttling the API for longer executions
-                time.sleep(SFN_EXECUTION_WAIT_TIME)
+            if self._asynchronous:
+                LOG.debug("Started execution %s asynchronously", execution_arn)
+                if self._remote_output_format == RemoteInvokeOutputFormat.JSON:
+                    yield RemoteInvokeResponse(
+                        {key: value for key, value in start_execution_response.items() if key != "ResponseMetadata"}
+                    )
+                else:
+                    yield RemoteInvokeResponse(execution_arn)
+                return
+
+            for history_event in self._wait_for_execution(execution_arn):
+                if self._remote_output_format == RemoteInvokeOutputFormat.TEXT:
+                    yield RemoteInvokeLogOutput(_format_history_event(history_event))
+
+            describe_execution_response = cast(
+                dict, self._stepfunctions_client.describe_execution(executionArn=execution_arn)
+            )
+            LOG.debug("ExecutionArn: %s, status: %s", execution_arn, describe_execution_response["status"])
 
             if self._remote_output_format == RemoteInvokeOutputFormat.JSON:
                 yield RemoteInvokeResponse(describe_execution_response)
@@ -132,6 +154,65 @@ class StepFunctionsStartExecutionExecutor(BotoActionExecutor):
         except ClientError as client_ex:
             raise ErrorBotoApiCallException(client_ex) from client_ex
 
+    def _wait_for_execution(self, execution_arn: str) -> Iterator[Dict]:
+        """
+        Yields the events of the execution history as they happen, until the execution ends.
+
+        Polls tightly right after the execution starts, so that short executions complete quickly, and backs off up to
+        SFN_EXECUTION_WAIT_TIME to avoid throttling the API for longer executions.
+        """
+        last_event_id = 0
+        wait_time = SFN_EXECUTION_MIN_WAIT_TIME
+        while True:
+            history_events = self._get_new_history_events(execution_arn, last_event_id)
+            for history_event in history_events:
+                last_event_id = history_event["id"]
+                yield history_event
+                if history_event["type"] in SFN_EXECUTION_END_EVENT_TYPES:
+                    return
+
+            time.sleep(wait_time)
+            wait_time = min(wait_time * 2, SFN_EXECUTION_WAIT_TIME)
+
+    def _get_new_history_events(self, execution_arn: str, last_event_id: int) -> List[Dict]:
+        """
+        Returns the events of the execution history after the event with ID last_event_id, in chronological order.
+
+        The history is read newest first, so that a poll reads only the pages with new events instead of the whole
+        history. Event IDs increase with time, the IDs of the events read so far act as the pagination cursor.
+        """
+        new_events: List[Dict] = []
+        next_token: Optional[str] = None
+        while True:
+            if next_token:
+                response = self._stepfunctions_client.get_execution_history(
+                    executionArn=execution_arn, reverseOrder=True, nextToken=next_token
+                )
+            else:
+                response = self._stepfunctions_client.get_execution_history(
+                    executionArn=execution_arn, reverseOrder=True
+                )
+            for history_event in response.get("events", []):
+                if history_event["id"] <= last_event_id:
+                    return list(reversed(new_events))
+                new_events.append(cast(Dict, history_event))
+            next_token = response.get("nextToken")
+            if not next_token:
+                return list(reversed(new_events))
+
+
+def _format_history_event(history_event: Dict) -> str:
+    """
+    Formats an event of the execution history as a log line, with the name of the state it's about if any
+    (ex. "2023-07-10 07:26:25.123000+00:00 TaskStateEntered: MyState")
+    """
+    details: Dict = next((value for key, value in history_event.items() if key.endswith("EventDetails")), {})
+    state_name = details.get("name")
+    message = f"{history_event['timestamp']} {history_event['type']}"
+    if state_name:
+        message += f": {state_name}"
+    return message + "\n"
+
 
 class SfnDescribeExecutionResponseConverter(RemoteInvokeRequestResponseMapper[RemoteInvokeResponse]):
     """
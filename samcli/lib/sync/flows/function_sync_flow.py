@@ -6,8 +6,6 @@ from abc import ABC
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, cast
 
-from botocore.client import BaseClient
-
 from samcli.lib.build.app_builder import ApplicationBuildResult
 from samcli.lib.providers.provider import Function, Stack
 from samcli.lib.providers.sam_function_provider import SamFunctionProvider
@@ -16,6 +14,8 @@ from samcli.lib.sync.sync_flow import SyncFlow
 from samcli.local.lambdafn.exceptions import FunctionNotFound
 
 if TYPE_CHECKING:  # pragma: no cover
+    from botocore.client import BaseClient
+
     from samcli.commands.build.build_context import BuildContext
     from samcli.commands.deploy.deploy_context import DeployContext
     from samcli.commands.sync.sync_context import SyncContext
@@ -137,7 +137,7 @@ class FunctionUpdateStatus(Enum):
     IN_PROGRESS = "InProgress"
 
 
-def wait_for_function_update_complete(lambda_client: BaseClient, physical_id: str) -> None:
+def wait_for_function_update_complete(lambda_client: "BaseClient", physical_id: str) -> None:
     """
     Checks on cloud side to wait for the function update status to be complete
 
@@ -28,6 +28,7 @@ if TYPE_CHECKING:  # pragma: no cover
 
 LOG = logging.getLogger(__name__)
 MAXIMUM_FUNCTION_ZIP_SIZE = 50 * 1024 * 1024  # 50MB limit for Lambda direct ZIP upload
+SYNC_ZIP_SUFFIX = ".sync.zip"
 
 
 class ZipFunctionSyncFlow(FunctionSyncFlow):
@@ -95,10 +96,21 @@ class ZipFunctionSyncFlow(FunctionSyncFlow):
             self._build_resources_from_scratch()
 
         zip_file_path = os.path.join(tempfile.gettempdir(), "data-" + uuid.uuid4().hex)
-        self._zip_file = make_zip_with_lambda_permissions(zip_file_path, self._artifact_folder)
+        self._zip_file = make_zip_with_lambda_permissions(
+            zip_file_path, self._artifact_folder, base_zip=self._get_base_zip_path()
+        )
         LOG.debug("%sCreated artifact ZIP file: %s", self.log_prefix, self._zip_file)
         self._local_sha = file_checksum(cast(str, self._zip_file), hashlib.sha256())
 
+    def _get_base_zip_path(self) -> str:
+        """
+        Returns the path where the ZIP file of the last sync of the function is kept, so that the next sync only
+        compresses the files which changed since then
+        """
+        return os.path.join(
+            self._build_context.cache_dir, "{}{}".format(self._function_identifier.replace("/", "-"), SYNC_ZIP_SUFFIX)
+        )
+
     def _use_prebuilt_resources(self, application_build_result: ApplicationBuildResult) -> None:
         """Uses pre-built artifacts and assigns build_graph and artifacts_folder"""
         self._build_graph = application_build_result.build_graph
@@ -250,6 +262,8 @@ class ZipFunctionSyncFlowSkipBuildDirectory(ZipFunctionSyncFlow):
 
     def gather_resources(self) -> None:
         zip_file_path = os.path.join(tempfile.gettempdir(), f"data-{uuid.uuid4().hex}")
-        self._zip_file = make_zip_with_lambda_permissions(zip_file_path, self._function.codeuri)
+        self._zip_file = make_zip_with_lambda_permissions(
+            zip_file_path, self._function.codeuri, base_zip=self._get_base_zip_path()
+        )
         LOG.debug("%sCreated artifact ZIP file: %s", self.log_prefix, self._zip_file)
         self._local_sha = file_checksum(cast(str, self._zip_file), hashlib.sha256())
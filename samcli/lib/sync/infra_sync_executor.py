@@ -10,7 +10,6 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Dict, List, Optional, Set, cast
 from uuid import uuid4
 
-from boto3 import Session
 from botocore.exceptions import ClientError
 
 from samcli.commands._utils.template import get_template_data
@@ -21,6 +20,7 @@ from samcli.lib.providers.provider import ResourceIdentifier
 from samcli.lib.providers.sam_stack_provider import is_local_path
 from samcli.lib.telemetry.event import EventTracker
 from samcli.lib.utils.boto_utils import get_boto_client_provider_from_session_with_config
+from samcli.lib.utils.lazy_import import lazy_import
 from samcli.lib.utils.resources import (
     AWS_APIGATEWAY_RESTAPI,
     AWS_APIGATEWAY_V2_API,
@@ -40,8 +40,12 @@ from samcli.lib.utils.resources import (
 from samcli.yamlhelper import yaml_parse
 
 if TYPE_CHECKING:  # pragma: no cover
+    from boto3 import Session
+
     from samcli.commands.sync.sync_context import SyncContext
 
+boto3 = lazy_import("boto3")
+
 LOG = logging.getLogger(__name__)
 
 GENERAL_REMOVAL_MAP = {
@@ -130,11 +134,11 @@ class InfraSyncExecutor:
 
         self._code_sync_resources = set()
 
-        session = Session(profile_name=self._deploy_context.profile, region_name=self._deploy_context.region)
+        session = boto3.Session(profile_name=self._deploy_context.profile, region_name=self._deploy_context.region)
         self._cfn_client = self._boto_client("cloudformation", session)
         self._s3_client = self._boto_client("s3", session)
 
-    def _boto_client(self, client_name: str, session: Session):
+    def _boto_client(self, client_name: str, session: "Session"):
         """
         Creates boto client
 
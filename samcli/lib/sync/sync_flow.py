@@ -8,20 +8,24 @@ from pathlib import Path
 from threading import Lock
 from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, cast
 
-from boto3.session import Session
-
 from samcli.lib.build.app_builder import ApplicationBuildResult
 from samcli.lib.providers.provider import ResourceIdentifier, Stack, get_resource_by_id
 from samcli.lib.sync.exceptions import MissingLockException, MissingPhysicalResourceError
 from samcli.lib.utils.boto_utils import get_boto_client_provider_from_session_with_config
+from samcli.lib.utils.lazy_import import lazy_import
 from samcli.lib.utils.lock_distributor import LockChain, LockDistributor
 from samcli.lib.utils.resources import RESOURCES_WITH_LOCAL_PATHS
+from samcli.lib.utils.timings import span
 
 if TYPE_CHECKING:  # pragma: no cover
+    from boto3.session import Session
+
     from samcli.commands.build.build_context import BuildContext
     from samcli.commands.deploy.deploy_context import DeployContext
     from samcli.commands.sync.sync_context import SyncContext
 
+boto3 = lazy_import("boto3")
+
 # Logging with multiple processes is not safe. Use a log queue in the future.
 # https://docs.python.org/3/howto/logging-cookbook.html#:~:text=Although%20logging%20is%20thread%2Dsafe,across%20multiple%20processes%20in%20Python.
 LOG = logging.getLogger(__name__)
@@ -59,7 +63,7 @@ class SyncFlow(ABC):
     _deploy_context: "DeployContext"
     _sync_context: "SyncContext"
     _stacks: Optional[List[Stack]]
-    _session: Optional[Session]
+    _session: Optional["Session"]
     _physical_id_mapping: Dict[str, str]
     _locks: Optional[Dict[str, Lock]]
     # Local hash represents the state of a particular sync flow
@@ -110,9 +114,12 @@ class SyncFlow(ABC):
         """Clients and other expensives setups should be handled here instead of constructor"""
         pass
 
-    def _get_session(self) -> Session:
+    def _get_session(self) -> "Session":
         if not self._session:
-            self._session = Session(profile_name=self._deploy_context.profile, region_name=self._deploy_context.region)
+            self._session = cast(
+                "Session",
+                boto3.Session(profile_name=self._deploy_context.profile, region_name=self._deploy_context.region),
+            )
         return self._session
 
     def _boto_client(self, client_name: str):
@@ -378,20 +385,27 @@ class SyncFlow(ABC):
             A list of dependent sync flows
         """
         dependencies: List["SyncFlow"] = list()
-        LOG.debug("%sSetting Up", self.log_prefix)
-        self.set_up()
-        LOG.debug("%sGathering Resources", self.log_prefix)
-        self.gather_resources()
-        LOG.debug("%sComparing with Remote", self.log_prefix)
-        if (not self.compare_local()) and (not self.compare_remote()):
-            LOG.debug("%sSyncing", self.log_prefix)
-            self.sync()
-            LOG.debug("%sUpdating local hash of the sync flow", self.log_prefix)
-            self._update_local_hash()
-            LOG.debug("%sGathering Dependencies", self.log_prefix)
-            dependencies = self.gather_dependencies()
-        else:
-            LOG.info("%sSkipping resource update as the content didn't change", self.log_prefix)
+        with span("sync.flow", flow=self.log_name):
+            LOG.debug("%sSetting Up", self.log_prefix)
+            with span("sync.set_up"):
+                self.set_up()
+            LOG.debug("%sGathering Resources", self.log_prefix)
+            with span("sync.gather_resources"):
+                self.gather_resources()
+            LOG.debug("%sComparing with Remote", self.log_prefix)
+            with span("sync.compare"):
+                is_unchanged = self.compare_local() or self.compare_remote()
+            if not is_unchanged:
+                LOG.debug("%sSyncing", self.log_prefix)
+                with span("sync.sync"):
+                    self.sync()
+                LOG.debug("%sUpdating local hash of the sync flow", self.log_prefix)
+                self._update_local_hash()
+                LOG.debug("%sGathering Dependencies", self.log_prefix)
+                with span("sync.gather_dependencies"):
+                    dependencies = self.gather_dependencies()
+            else:
+                LOG.info("%sSkipping resource update as the content didn't change", self.log_prefix)
         LOG.debug("%sFinished", self.log_prefix)
         return dependencies
 
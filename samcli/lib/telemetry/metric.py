@@ -3,6 +3,7 @@ Provides methods to generate and send metrics
 """
 
 import logging
+import os
 import platform
 import uuid
 from dataclasses import dataclass
@@ -29,6 +30,7 @@ from samcli.lib.telemetry.event import EventTracker
 from samcli.lib.telemetry.project_metadata import get_git_remote_origin_url, get_initial_commit_hash, get_project_name
 from samcli.lib.telemetry.telemetry import Telemetry
 from samcli.lib.telemetry.user_agent import get_user_agent_string
+from samcli.lib.utils.timings import TIMINGS_TRACE_FILE_ENV_VAR, get_tracer
 from samcli.lib.warnings.sam_cli_warning import TemplateWarningsChecker
 
 LOG = logging.getLogger(__name__)
@@ -147,7 +149,8 @@ def track_command(func):
 
             # Execute the function and capture return value. This is returned by the wrapper
             # First argument of all commands should be the Context
-            return_value = func(*args, **kwargs)
+            with get_tracer().span(ctx.command_path if ctx else func.__name__):
+                return_value = func(*args, **kwargs)
         except (
             UserException,
             click.Abort,
@@ -181,6 +184,8 @@ def track_command(func):
             except RuntimeError:
                 LOG.debug("Unable to find Click context when sending metrics to telemetry")
 
+        _report_timings()
+
         if exception:
             raise exception  # pylint: disable=raising-bad-type
 
@@ -189,6 +194,26 @@ def track_command(func):
     return wrapped
 
 
+def _report_timings() -> None:
+    """
+    Prints the breakdown of the spans recorded while running the command, and exports them as Chrome trace events
+    if requested. Does nothing unless --timings was provided.
+    """
+    tracer = get_tracer()
+    if not tracer.enabled or not tracer.root_spans:
+        return
+
+    click.echo(tracer.format_report(), err=True)
+
+    trace_file = os.environ.get(TIMINGS_TRACE_FILE_ENV_VAR)
+    if trace_file:
+        try:
+            tracer.export_chrome_trace(trace_file)
+            click.echo(f"Timings trace written to {trace_file}", err=True)
+        except OSError as ex:
+            LOG.debug("Unable to write timings trace file", exc_info=ex)
+
+
 def _send_command_run_metrics(ctx: Context, duration: int, exit_reason: str, exit_code: int, **kwargs) -> None:
     """
     Emits metrics based on the results of a command run
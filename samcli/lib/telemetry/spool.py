@@ -0,0 +1,249 @@
+"""
+Local spool of telemetry metrics
+
+Metrics are appended to a file in the SAM CLI config directory and delivered to the backend in batches by a background
+sender, so that the exit latency of a command does not depend on whether the telemetry endpoint is reachable.
+Metrics which can't be delivered stay in the spool and are retried by the next invocation.
+"""
+
+import argparse
+import json
+import logging
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+LOG = logging.getLogger(__name__)
+
+SPOOL_FILE_NAME = "telemetry-spool.jsonl"
+IN_FLIGHT_FILE_SUFFIX = ".sending"
+
+# Upper bound of the spool file, oldest metrics are dropped once it is reached
+MAX_SPOOL_SIZE_BYTES = 512 * 1024
+# Maximum number of metrics sent to the backend in a single request
+MAX_BATCH_SIZE = 50
+# In-flight files older than this were left behind by a sender which didn't finish, and can be claimed again
+STALE_IN_FLIGHT_SECONDS = 300
+# Hidden first argument of the "sam" executable which runs the sender instead of the CLI, used by frozen builds which
+# can't run this module in a separate interpreter
+SENDER_COMMAND = "__send-telemetry"
+
+
+class TelemetrySpool:
+    """
+    Append-only spool of telemetry metrics, stored as one JSON document per line.
+
+    Several SAM CLI processes may share the same spool. Appends rely on the atomicity of small writes in append mode,
+    and a sender claims the current spool by atomically renaming it to a unique in-flight file before delivering it,
+    so that a metric is never picked up by two senders at the same time.
+    """
+
+    def __init__(
+        self,
+        spool_dir: Path,
+        max_size_bytes: int = MAX_SPOOL_SIZE_BYTES,
+        max_batch_size: int = MAX_BATCH_SIZE,
+        stale_in_flight_seconds: int = STALE_IN_FLIGHT_SECONDS,
+    ):
+        """
+        Parameters
+        ----------
+        spool_dir : Path
+            Directory where the spool file is stored
+        max_size_bytes : int
+            Maximum size of the spool file. Oldest metrics are dropped to stay under this size
+        max_batch_size : int
+            Maximum number of metrics delivered with a single call to the send function
+        stale_in_flight_seconds : int
+            Age after which an in-flight file of another sender is considered abandoned and is claimed again
+        """
+        self._spool_dir = Path(spool_dir)
+        self._max_size_bytes = max_size_bytes
+        self._max_batch_size = max_batch_size
+        self._stale_in_flight_seconds = stale_in_flight_seconds
+
+    @property
+    def spool_dir(self) -> Path:
+        return self._spool_dir
+
+    @property
+    def spool_file(self) -> Path:
+        return self._spool_dir.joinpath(SPOOL_FILE_NAME)
+
+    def append(self, metric: Dict) -> bool:
+        """
+        Appends a metric to the spool
+
+        Parameters
+        ----------
+        metric : Dict
+            Metric data, keyed by the metric name
+
+        Returns
+        -------
+        bool
+            True if the metric was spooled, False if the spool couldn't be written
+        """
+        try:
+            self._append_lines([json.dumps(metric, default=str)])
+        except (OSError, TypeError, ValueError) as ex:
+            LOG.debug("Unable to spool telemetry metric", exc_info=ex)
+            return False
+        return True
+
+    def has_pending(self) -> bool:
+        """
+        Returns True if there are metrics waiting to be delivered
+        """
+        try:
+            return self.spool_file.stat().st_size > 0
+        except OSError:
+            return False
+
+    def flush(self, send: Callable[[List[Dict]], bool]) -> int:
+        """
+        Delivers the spooled metrics in batches
+
+        Parameters
+        ----------
+        send : Callable[[List[Dict]], bool]
+            Function which delivers a batch of metrics and returns True on success
+
+        Returns
+        -------
+        int
+            Number of metrics delivered. Delivery stops on the first failed batch, and all the metrics which weren't
+            delivered are put back into the spool.
+        """
+        delivered = 0
+        claimed_files = self._claim()
+        for index, in_flight_file in enumerate(claimed_files):
+            remaining = self._read_lines(in_flight_file)
+            while remaining:
+                batch = remaining[: self._max_batch_size]
+                if not send([json.loads(line) for line in batch]):
+                    break
+                delivered += len(batch)
+                remaining = remaining[len(batch) :]
+                if remaining:
+                    # persist the progress, so an interrupted sender doesn't deliver the same batch twice
+                    self._write_lines(in_flight_file, remaining)
+
+            if remaining:
+                self._release(claimed_files[index:])
+                break
+            self._remove(in_flight_file)
+
+        return delivered
+
+    def _claim(self) -> List[Path]:
+        claimed_files = []
+
+        now = time.time()
+        for in_flight_file in self._spool_dir.glob(f"{SPOOL_FILE_NAME}.*{IN_FLIGHT_FILE_SUFFIX}"):
+            try:
+                if now - in_flight_file.stat().st_mtime < self._stale_in_flight_seconds:
+                    continue
+                claimed_file = self._new_in_flight_file()
+                os.replace(in_flight_file, claimed_file)
+                claimed_files.append(claimed_file)
+            except OSError:
+                # claimed by another sender in the meantime
+                continue
+
+        if self.has_pending():
+            claimed_file = self._new_in_flight_file()
+            try:
+                os.replace(self.spool_file, claimed_file)
+                claimed_files.append(claimed_file)
+            except OSError:
+                LOG.debug("Telemetry spool was claimed by another sender")
+
+        return claimed_files
+
+    def _release(self, in_flight_files: List[Path]) -> None:
+        lines = []
+        for in_flight_file in in_flight_files:
+            lines.extend(self._read_lines(in_flight_file))
+        try:
+            self._append_lines(lines)
+        except OSError as ex:
+            LOG.debug("Unable to put undelivered telemetry metrics back into the spool", exc_info=ex)
+            return
+        for in_flight_file in in_flight_files:
+            self._remove(in_flight_file)
+
+    def _new_in_flight_file(self) -> Path:
+        return self._spool_dir.joinpath(f"{SPOOL_FILE_NAME}.{uuid.uuid4().hex}{IN_FLIGHT_FILE_SUFFIX}")
+
+    def _append_lines(self, lines: List[str]) -> None:
+        if not lines:
+            return
+        self._spool_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        data = "".join(line + "\n" for line in lines)
+        try:
+            current_size = self.spool_file.stat().st_size
+        except OSError:
+            current_size = 0
+        if current_size + len(data) > self._max_size_bytes:
+            self._trim(len(data))
+        with open(self.spool_file, "a", encoding="utf-8") as spool:
+            spool.write(data)
+
+    def _trim(self, incoming_size: int) -> None:
+        """
+        Drops the oldest metrics so that ``incoming_size`` more bytes fit into the spool
+        """
+        budget = max(self._max_size_bytes - incoming_size, 0)
+        kept: List[str] = []
+        kept_size = 0
+        for line in reversed(self._read_lines(self.spool_file)):
+            if kept_size + len(line) + 1 > budget:
+                break
+            kept.append(line)
+            kept_size += len(line) + 1
+        kept.reverse()
+        self._write_lines(self.spool_file, kept)
+
+    @staticmethod
+    def _read_lines(path: Path) -> List[str]:
+        try:
+            with open(path, "r", encoding="utf-8") as spool:
+                return [line.rstrip("\n") for line in spool if line.strip()]
+        except OSError:
+            return []
+
+    @staticmethod
+    def _write_lines(path: Path, lines: List[str]) -> None:
+        temp_file = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        with open(temp_file, "w", encoding="utf-8") as spool:
+            spool.write("".join(line + "\n" for line in lines))
+        os.replace(temp_file, path)
+
+    @staticmethod
+    def _remove(path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    """
+    Entry point of the detached sender process, which delivers the spool and exits
+    """
+    # pylint: disable=cyclic-import
+    from samcli.lib.telemetry.telemetry import Telemetry
+
+    parser = argparse.ArgumentParser(description="Delivers spooled SAM CLI telemetry metrics")
+    parser.add_argument("--url", required=True)
+    parser.add_argument("--spool-dir", required=True)
+    parsed_args = parser.parse_args(args)
+
+    Telemetry(url=parsed_args.url, spool=TelemetrySpool(Path(parsed_args.spool_dir))).flush()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -2,19 +2,34 @@
 Class to publish metrics
 """
 
+import atexit
 import logging
-
-import requests
+import os
+import subprocess
+import sys
+import threading
+from typing import Dict, List, Optional
 
 # Get the preconfigured endpoint URL
 from samcli.cli.global_config import GlobalConfig
+from samcli.lib.telemetry.spool import SENDER_COMMAND, TelemetrySpool
+from samcli.lib.utils.lazy_import import lazy_import
 from samcli.settings import telemetry_endpoint_url as DEFAULT_ENDPOINT_URL
 
+# Metrics are spooled by the command and delivered later, most invocations never need requests
+requests = lazy_import("requests")
+
 LOG = logging.getLogger(__name__)
 
+# Responses with a status code from this value onward are server side errors, for which the metrics are kept
+SERVER_ERROR_STATUS_CODE = 500
+
+_background_sender_lock = threading.Lock()
+_background_sender_scheduled = threading.Event()
+
 
 class Telemetry:
-    def __init__(self, url=None):
+    def __init__(self, url=None, spool: Optional[TelemetrySpool] = None):
         """
         Initialize the Telemetry object.
 
@@ -22,15 +37,25 @@ class Telemetry:
         ----------
         url : str
             Optional, URL where the metrics should be published to
+        spool : TelemetrySpool
+            Optional, spool where metrics are stored until they are delivered. Defaults to a spool in the SAM CLI
+            config directory
         """
         self._url = url or DEFAULT_ENDPOINT_URL
+        self._spool = spool
         LOG.debug("Telemetry endpoint configured to be %s", self._url)
 
+    @property
+    def spool(self) -> TelemetrySpool:
+        if not self._spool:
+            self._spool = TelemetrySpool(GlobalConfig().config_dir)
+        return self._spool
+
     def emit(self, metric, force_emit=False):
         """
-        Emits the metric with given name and the attributes and send it immediately to the HTTP backend. This method
-        will return immediately without waiting for response from the backend. Before sending, this method will
-        also update ``attrs`` with some common attributes used by all metrics.
+        Emits the metric with given name and the attributes. The metric is appended to the local spool and delivered
+        to the HTTP backend by a background sender, so this method never waits on the network. Before sending, this
+        method will also update ``attrs`` with some common attributes used by all metrics.
 
         Parameters
         ----------
@@ -41,7 +66,37 @@ class Telemetry:
             Defaults to False. Set to True to emit even when telemetry is turned off.
         """
         if bool(GlobalConfig().telemetry_enabled) or force_emit:
-            self._send({metric.get_metric_name(): metric.get_data()})
+            self._enqueue({metric.get_metric_name(): metric.get_data()})
+
+    def flush(self) -> int:
+        """
+        Delivers all the spooled metrics to the backend in batches, waiting for the backend to respond.
+
+        Returns
+        -------
+        int
+            Number of metrics delivered
+        """
+        if not self._url:
+            LOG.debug("Not sending telemetry. Endpoint URL not configured")
+            return 0
+        return self.spool.flush(lambda metrics: self._send_batch(metrics, wait_for_response=True))
+
+    def _enqueue(self, metric: Dict) -> None:
+        """
+        Appends the metric to the spool and makes sure a background sender will deliver it. Falls back to sending
+        the metric directly if the spool can't be written.
+        """
+        if not self._url:
+            # Endpoint not configured. So simply return
+            LOG.debug("Not sending telemetry. Endpoint URL not configured")
+            return
+
+        if not self.spool.append(metric):
+            self._send(metric)
+            return
+
+        _schedule_background_sender(self)
 
     def _send(self, metric, wait_for_response=False):
         """
@@ -57,13 +112,34 @@ class Telemetry:
             If set to True, this method will wait until the HTTP server returns a response. If not, it will return
             immediately after the request is sent.
         """
+        self._send_batch([metric], wait_for_response)
+
+    def _send_batch(self, metrics: List[Dict], wait_for_response=False) -> bool:
+        """
+        Serializes a batch of metrics to JSON and sends it to the backend in a single request.
+
+        Parameters
+        ----------
+
+        metrics : List[dict]
+            List of metric data to send to backend.
+
+        wait_for_response : bool
+            If set to True, this method will wait until the HTTP server returns a response. If not, it will return
+            immediately after the request is sent.
+
+        Returns
+        -------
+        bool
+            False if the backend couldn't be reached or failed to process the batch, True otherwise.
+        """
 
         if not self._url:
             # Endpoint not configured. So simply return
             LOG.debug("Not sending telemetry. Endpoint URL not configured")
-            return
+            return True
 
-        payload = {"metrics": [metric]}
+        payload = {"metrics": metrics}
         LOG.debug("Sending Telemetry: %s", payload)
 
         timeout_ms = 2000 if wait_for_response else 100  # 2 seconds to wait for response or 100ms
@@ -79,3 +155,54 @@ class Telemetry:
             # Expected if request times out OR cannot connect to the backend (offline).
             # Just print debug log and ignore the exception.
             LOG.debug(str(ex))
+            return False
+        # Client errors won't succeed on retry, only keep the batch for server side errors
+        return bool(r.ok) or r.status_code < SERVER_ERROR_STATUS_CODE
+
+
+def _schedule_background_sender(telemetry: Telemetry) -> None:
+    """
+    Arranges for the spool to be delivered once per process.
+
+    A detached sender process is started at exit, so it can deliver every metric emitted by the command without the
+    command waiting for it. Anything not delivered by the sender stays in the spool for the next invocation.
+    """
+    with _background_sender_lock:
+        if _background_sender_scheduled.is_set():
+            return
+        _background_sender_scheduled.set()
+
+    atexit.register(_start_sender_process, telemetry._url, str(telemetry.spool.spool_dir))
+
+
+def _start_sender_process(url: str, spool_dir: str) -> None:
+    """
+    Starts a sender process which is detached from the current process and its console
+
+    Frozen (pyinstaller) builds have no interpreter to run the spool module with, the "sam" executable itself is
+    started with the hidden sender command instead.
+    """
+    sender_args = ["--url", url, "--spool-dir", spool_dir]
+    if getattr(sys, "frozen", False):
+        command = [sys.executable, SENDER_COMMAND, *sender_args]
+    else:
+        command = [sys.executable, "-m", "samcli.lib.telemetry.spool", *sender_args]
+
+    kwargs: Dict = {
+        "stdin": subprocess.DEVNULL,
+        "stdout": subprocess.DEVNULL,
+        "stderr": subprocess.DEVNULL,
+        "close_fds": True,
+        "cwd": spool_dir,
+    }
+    if os.name == "nt":
+        kwargs["creationflags"] = getattr(subprocess, "DETACHED_PROCESS", 0) | getattr(
+            subprocess, "CREATE_NEW_PROCESS_GROUP", 0
+        )
+    else:
+        kwargs["start_new_session"] = True
+
+    try:
+        subprocess.Popen(command, **kwargs)  # pylint: disable=consider-using-with
+    except OSError as ex:
+        LOG.debug("Unable to start telemetry sender", exc_info=ex)
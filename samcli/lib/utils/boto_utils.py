@@ -2,18 +2,24 @@
 This module contains utility functions for boto3 library
 """
 
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional, cast
 
-from boto3 import Session
-from botocore.config import Config
 from botocore.exceptions import ClientError
 from typing_extensions import Protocol
 
 from samcli import __version__
 from samcli.cli.global_config import GlobalConfig
+from samcli.lib.utils.lazy_import import lazy_import
 
+if TYPE_CHECKING:  # pragma: no cover
+    from boto3 import Session
+    from botocore.config import Config
 
-def get_boto_config_with_user_agent(**kwargs) -> Config:
+boto3 = lazy_import("boto3")
+botocore_config = lazy_import("botocore.config")
+
+
+def get_boto_config_with_user_agent(**kwargs) -> "Config":
     """
     Automatically add user agent string to boto configs.
 
@@ -28,11 +34,16 @@ def get_boto_config_with_user_agent(**kwargs) -> Config:
         Returns config instance which contains given parameters in it
     """
     gc = GlobalConfig()
-    return Config(
-        user_agent_extra=(
-            f"aws-sam-cli/{__version__}/{gc.installation_id}" if gc.telemetry_enabled else f"aws-sam-cli/{__version__}"
+    return cast(
+        "Config",
+        botocore_config.Config(
+            user_agent_extra=(
+                f"aws-sam-cli/{__version__}/{gc.installation_id}"
+                if gc.telemetry_enabled
+                else f"aws-sam-cli/{__version__}"
+            ),
+            **kwargs,
         ),
-        **kwargs,
     )
 
 
@@ -41,7 +52,7 @@ class BotoProviderType(Protocol):
     def __call__(self, service_name: str) -> Any: ...  # pragma: no cover
 
 
-def get_boto_client_provider_from_session_with_config(session: Session, **kwargs) -> BotoProviderType:
+def get_boto_client_provider_from_session_with_config(session: "Session", **kwargs) -> BotoProviderType:
     """
     Returns a wrapper function for boto client with given configuration. It can be used like;
 
@@ -85,11 +96,11 @@ def get_boto_client_provider_with_config(
         A callable function which will return a boto client
     """
     return get_boto_client_provider_from_session_with_config(
-        Session(region_name=region, profile_name=profile), **kwargs
+        boto3.Session(region_name=region, profile_name=profile), **kwargs
     )
 
 
-def get_boto_resource_provider_from_session_with_config(session: Session, **kwargs) -> BotoProviderType:
+def get_boto_resource_provider_from_session_with_config(session: "Session", **kwargs) -> BotoProviderType:
     """
     Returns a wrapper function for boto resource with given configuration. It can be used like;
 
@@ -133,7 +144,7 @@ def get_boto_resource_provider_with_config(
         A callable function which will return a boto resource
     """
     return get_boto_resource_provider_from_session_with_config(
-        Session(region_name=region, profile_name=profile), **kwargs
+        boto3.Session(region_name=region, profile_name=profile), **kwargs
     )
 
 
@@ -2,8 +2,8 @@
 Contains helpers for providing default values
 """
 
-from botocore.session import get_session
-
 
 def get_default_aws_region() -> str:
+    from botocore.session import get_session
+
     return get_session().get_config_variable("region") or "us-east-1"
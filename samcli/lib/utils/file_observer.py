@@ -3,18 +3,16 @@ Wraps watchdog to observe file system for any change.
 """
 
 import logging
+import os
 import platform
 import threading
+import time
 import uuid
 from abc import ABC, abstractmethod
 from pathlib import Path
 from threading import Lock, Thread
-from typing import Callable, Dict, List, Optional
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
 
-import docker
-from docker import DockerClient
-from docker.errors import ImageNotFound
-from docker.types import CancellableStream
 from watchdog.events import (
     EVENT_TYPE_DELETED,
     EVENT_TYPE_OPENED,
@@ -27,13 +25,24 @@ from watchdog.observers.api import BaseObserver, ObservedWatch
 
 from samcli.cli.global_config import Singleton
 from samcli.lib.constants import DOCKER_MIN_API_VERSION
-from samcli.lib.utils.hash import dir_checksum, file_checksum
+from samcli.lib.utils.hash import DirectoryDigest, dir_checksum, file_checksum
+from samcli.lib.utils.lazy_import import lazy_import
 from samcli.lib.utils.packagetype import IMAGE, ZIP
 from samcli.local.lambdafn.config import FunctionConfig
 
+if TYPE_CHECKING:  # pragma: no cover
+    from docker import DockerClient
+    from docker.types import CancellableStream
+
+docker = lazy_import("docker")
+
 LOG = logging.getLogger(__name__)
 # Windows API error returned when attempting to perform I/O on closed pipe
 BROKEN_PIPE_ERROR = 109
+# File system events are processed once no new event was received for this many seconds (ex. during `npm install`)
+FILE_EVENTS_DEBOUNCE_INTERVAL = 0.5
+# Maximum delay between receiving a file system event and processing it, even if events keep coming in
+FILE_EVENTS_MAX_DELAY = 5
 
 
 class ResourceObserver(ABC):
@@ -306,8 +315,8 @@ class ImageObserver(ResourceObserver):
         """
         self._observed_images: Dict[str, str] = {}
         self._input_on_change: Callable = on_change
-        self.docker_client: DockerClient = docker.from_env(version=DOCKER_MIN_API_VERSION)
-        self.events: CancellableStream = self.docker_client.events(filters={"type": "image"}, decode=True)
+        self.docker_client: "DockerClient" = docker.from_env(version=DOCKER_MIN_API_VERSION)
+        self.events: "CancellableStream" = self.docker_client.events(filters={"type": "image"}, decode=True)
         self._images_observer_thread: Optional[Thread] = None
         self._lock: Lock = threading.Lock()
 
@@ -340,7 +349,7 @@ class ImageObserver(ResourceObserver):
         try:
             image = self.docker_client.images.get(resource)
             self._observed_images[resource] = image.id
-        except ImageNotFound as exc:
+        except docker.errors.ImageNotFound as exc:
             raise ImageObserverException("Can not observe non exist image") from exc
 
     def unwatch(self, resource: str) -> None:
@@ -437,56 +446,144 @@ class SingletonFileObserver(metaclass=Singleton):
         self._watch_lock = threading.Lock()
         self._lock: Lock = threading.Lock()
 
+        # incrementally updated checksums of the observed directories
+        self._directory_digests: Dict[str, DirectoryDigest] = {}
+        # file system events waiting to be processed, the last event type of each changed path
+        self._pending_events: Dict[str, str] = {}
+        self._first_pending_event_time = 0.0
+        self._last_pending_event_time = 0.0
+        self._events_condition = threading.Condition()
+        self._events_thread: Optional[Thread] = None
+        self._stopped = False
+
     def on_change(self, event: FileSystemEvent) -> None:
         """
         It got executed once there is a change in one of the paths that watchdog is observing.
-        This method will check if any of the input paths is really changed, and based on that it will
-        invoke the input on_change function with the changed paths
+        The event is only queued here, so that the watchdog thread is never blocked by hashing. Queued events are
+        coalesced, and processed once the file system is quiet for FILE_EVENTS_DEBOUNCE_INTERVAL seconds.
 
         Parameters
         ----------
         event: watchdog.events.FileSystemEvent
             Determines that there is a change happened to some file/dir in the observed paths
         """
-        with self._watch_lock:
-            if event.event_type == EVENT_TYPE_OPENED:
-                LOG.debug("Ignoring file system OPENED event")
-                return
+        if event.event_type == EVENT_TYPE_OPENED:
+            LOG.debug("Ignoring file system OPENED event")
+            return
+
+        LOG.debug("a %s change got detected in path %s", event.event_type, event.src_path)
+        with self._events_condition:
+            now = time.monotonic()
+            if not self._pending_events:
+                self._first_pending_event_time = now
+            self._last_pending_event_time = now
+            self._pending_events[event.src_path] = event.event_type
+            self._events_condition.notify()
+
+    def _process_events_loop(self) -> None:
+        """
+        Waits for file system events, and processes them in batches once they stop coming in, or once the oldest
+        one waited for FILE_EVENTS_MAX_DELAY seconds
+        """
+        while True:
+            with self._events_condition:
+                while not self._pending_events and not self._stopped:
+                    self._events_condition.wait()
+                while not self._stopped:
+                    now = time.monotonic()
+                    timeout = min(
+                        self._last_pending_event_time + FILE_EVENTS_DEBOUNCE_INTERVAL - now,
+                        self._first_pending_event_time + FILE_EVENTS_MAX_DELAY - now,
+                    )
+                    if timeout <= 0:
+                        break
+                    self._events_condition.wait(timeout)
+                if self._stopped:
+                    return
+            try:
+                self._flush_events()
+            except Exception:
+                LOG.debug("Failed to process file system events", exc_info=True)
+
+    def _flush_events(self) -> None:
+        """
+        Processes the queued file system events. This method will check if any of the observed paths is really
+        changed, and based on that it will invoke the on_change function of each group with its changed paths
+        """
+        with self._events_condition:
+            events, self._pending_events = self._pending_events, {}
+
+        if not events:
+            return
 
-            LOG.debug("a %s change got detected in path %s", event.event_type, event.src_path)
+        with self._watch_lock:
+            # checksums calculated while processing these events, as the same path can be observed by several groups
+            new_checksums: Dict[str, Optional[str]] = {}
             for group, _observed_paths in self._observed_paths_per_group.items():
-                if event.event_type == EVENT_TYPE_DELETED:
-                    observed_paths = [
-                        path
-                        for path in _observed_paths
-                        if path == event.src_path
-                        or path in self._watch_dog_observed_paths.get(f"{event.src_path}_False", [])
+                changed_paths = []
+                for path in list(_observed_paths):
+                    changed_sub_paths = [
+                        src_path
+                        for src_path, event_type in events.items()
+                        if self._is_affected_by_event(path, src_path, event_type)
                     ]
-                else:
-                    observed_paths = [path for path in _observed_paths if event.src_path.startswith(path)]
-
-                if not observed_paths:
-                    continue
+                    if not changed_sub_paths:
+                        continue
 
-                LOG.debug("affected paths of this change %s", observed_paths)
-                changed_paths = []
-                for path in observed_paths:
+                    LOG.debug("path %s is affected by changes in %s", path, changed_sub_paths)
                     path_obj = Path(path)
                     # The path got deleted
                     if not path_obj.exists():
                         _observed_paths.pop(path, None)
+                        self._directory_digests.pop(path, None)
+                        changed_paths += [path]
+                        continue
+
+                    if path not in new_checksums:
+                        new_checksums[path] = self._update_checksum(path, changed_sub_paths)
+                    new_checksum = new_checksums[path]
+                    if new_checksum and new_checksum != _observed_paths.get(path, None):
                         changed_paths += [path]
+                        _observed_paths[path] = new_checksum
                     else:
-                        new_checksum = calculate_checksum(path)
-                        if new_checksum and new_checksum != _observed_paths.get(path, None):
-                            changed_paths += [path]
-                            _observed_paths[path] = new_checksum
-                        else:
-                            LOG.debug("the path %s content does not change", path)
+                        LOG.debug("the path %s content does not change", path)
 
                 if changed_paths:
                     self._observed_groups_handlers[group](changed_paths)
 
+    def _is_affected_by_event(self, path: str, src_path: str, event_type: str) -> bool:
+        if event_type == EVENT_TYPE_DELETED:
+            return path == src_path or path in self._watch_dog_observed_paths.get(f"{src_path}_False", [])
+        return src_path.startswith(path)
+
+    def _calculate_checksum(self, path: str) -> Optional[str]:
+        """
+        Calculates the checksum of a newly observed path. The checksums of the files of a directory are kept, so that
+        later changes only re-hash the changed files.
+        """
+        if not os.path.isdir(path):
+            return calculate_checksum(path)
+        try:
+            directory_digest = self._directory_digests.get(path) or DirectoryDigest(path)
+        except Exception:
+            return None
+        self._directory_digests[path] = directory_digest
+        return directory_digest.digest
+
+    def _update_checksum(self, path: str, changed_sub_paths: List[str]) -> Optional[str]:
+        """
+        Returns the checksum of an observed path after some of its files changed
+        """
+        directory_digest = self._directory_digests.get(path)
+        if not directory_digest:
+            return calculate_checksum(path)
+        try:
+            changed_files = directory_digest.update(changed_sub_paths)
+        except Exception:
+            return None
+        LOG.debug("files changed in path %s: %s", path, changed_files)
+        return directory_digest.digest
+
     def add_group(self, group: str, on_change: Callable) -> None:
         """
         Add new group to file observer. This enable FileObserver to watch the same path for
@@ -531,7 +628,7 @@ class SingletonFileObserver(metaclass=Singleton):
                 raise FileObserverException("Can not observe non exist path")
 
             _observed_paths = self._observed_paths_per_group[group]
-            _check_sum = calculate_checksum(resource)
+            _check_sum = self._calculate_checksum(resource)
             if not _check_sum:
                 raise Exception(f"Failed to calculate the hash of resource {resource}")
             _observed_paths[resource] = _check_sum
@@ -629,6 +726,8 @@ class SingletonFileObserver(metaclass=Singleton):
         if original_path in child_paths:
             child_paths.remove(original_path)
             _observed_paths.pop(original_path, None)
+            if not any(original_path in paths for paths in self._observed_paths_per_group.values()):
+                self._directory_digests.pop(original_path, None)
         if not child_paths:
             self._watch_dog_observed_paths.pop(watch_dog_path, None)
             if self._observed_watches.get(watch_dog_path, None):
@@ -643,6 +742,10 @@ class SingletonFileObserver(metaclass=Singleton):
         with self._lock:
             if not self._observer.is_alive():
                 self._observer.start()
+            if not self._events_thread or not self._events_thread.is_alive():
+                self._stopped = False
+                self._events_thread = threading.Thread(target=self._process_events_loop, daemon=True)
+                self._events_thread.start()
 
     def stop(self):
         """
@@ -651,6 +754,9 @@ class SingletonFileObserver(metaclass=Singleton):
         with self._lock:
             if self._observer.is_alive():
                 self._observer.stop()
+            with self._events_condition:
+                self._stopped = True
+                self._events_condition.notify()
 
 
 def calculate_checksum(path: str) -> Optional[str]:
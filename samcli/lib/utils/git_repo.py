@@ -10,7 +10,7 @@ from pathlib import Path
 # import check_output alone so that it can be patched without affecting
 # other parts of subprocess.
 from subprocess import check_output
-from typing import Optional
+from typing import List, Optional
 
 from samcli.commands.exceptions import UserException
 from samcli.lib.utils import osutils
@@ -60,8 +60,10 @@ class GitRepo:
 
     Methods
     -------
-    clone(self, clone_dir: Path, clone_name, replace_existing=False) -> Path:
+    clone(self, clone_dir: Path, clone_name, replace_existing=False, commit="", shallow=False) -> Path:
         creates a local clone of this Git repository. (more details in the method documentation).
+    checkout_paths(self, paths=None) -> None:
+        checks out more paths of a shallow clone, fetching their content on demand.
     """
 
     def __init__(self, url: str) -> None:
@@ -97,7 +99,14 @@ class GitRepo:
             f"was looking with following names: {executables}"
         )
 
-    def clone(self, clone_dir: Path, clone_name: str, replace_existing: bool = False, commit: str = "") -> Path:
+    def clone(
+        self,
+        clone_dir: Path,
+        clone_name: str,
+        replace_existing: bool = False,
+        commit: str = "",
+        shallow: bool = False,
+    ) -> Path:
         """
         creates a local clone of this Git repository.
         This method is different from the standard Git clone in the following:
@@ -116,6 +125,10 @@ class GitRepo:
             Whether to replace the current local clone directory if already exists or not
         commit: str
             if a commit is provided, it will checkout out the commit in the clone repo
+        shallow: bool
+            Whether to only fetch the given commit, without history, and to only check out the files at the root of
+            the repository. The content of the other directories is fetched when they are checked out with
+            checkout_paths. Falls back to a full clone if the remote or the local git doesn't support it
         Returns
         -------
             The path of the created local clone
@@ -137,25 +150,14 @@ class GitRepo:
         with osutils.mkdir_temp(ignore_errors=True) as tempdir:
             try:
                 temp_path = os.path.normpath(os.path.join(tempdir, clone_name))
-                git_executable: str = GitRepo.git_executable()
                 LOG.info("\nCloning from %s (process may take a moment)", self.url)
-                command = [git_executable, "clone", self.url, clone_name]
-                if platform.system().lower() == "windows":
-                    LOG.debug(
-                        "Configure core.longpaths=true in git clone. "
-                        "You might also need to enable long paths in Windows registry."
-                    )
-                    command += ["--config", "core.longpaths=true"]
-                check_output(
-                    command,
-                    cwd=tempdir,
-                    stderr=subprocess.STDOUT,
-                )
+                if not (shallow and commit and self._fetch_commit(temp_path, commit)):
+                    self._clone_repo(tempdir, clone_name)
 
-                # bind a certain sam cli release to a specific commit of the aws-sam-cli-app-templates's repo, avoiding
-                # regression
-                if commit:
-                    self._checkout_commit(temp_path, commit)
+                    # bind a certain sam cli release to a specific commit of the aws-sam-cli-app-templates's repo,
+                    # avoiding regression
+                    if commit:
+                        self._checkout_commit(temp_path, commit)
 
                 self.local_path = self._persist_local_repo(temp_path, clone_dir, clone_name, replace_existing)
                 return self.local_path
@@ -170,6 +172,85 @@ class GitRepo:
             finally:
                 self.clone_attempted = True
 
+    def _clone_repo(self, clone_parent_dir: str, clone_name: str) -> None:
+        git_executable: str = GitRepo.git_executable()
+        command = [git_executable, "clone", self.url, clone_name]
+        if platform.system().lower() == "windows":
+            LOG.debug(
+                "Configure core.longpaths=true in git clone. "
+                "You might also need to enable long paths in Windows registry."
+            )
+            command += ["--config", "core.longpaths=true"]
+        check_output(
+            command,
+            cwd=clone_parent_dir,
+            stderr=subprocess.STDOUT,
+        )
+
+    def _fetch_commit(self, repo_dir: str, commit: str) -> bool:
+        """
+        Creates a repository in repo_dir with only the given commit, fetched with a depth of 1 and without the content
+        of its files (partial clone), and checks out the files at the root of the repository (sparse checkout in
+        cone mode). Git fetches the content of the checked out files only.
+
+        Returns
+        -------
+        bool
+            True if the commit was checked out, False if the remote or the git executable doesn't support shallow
+            partial clones, in which case repo_dir is removed
+        """
+        git_executable: str = GitRepo.git_executable()
+        commands = [["init", "--quiet"]]
+        if platform.system().lower() == "windows":
+            commands.append(["config", "core.longpaths", "true"])
+        commands += [
+            ["remote", "add", "origin", self.url],
+            ["sparse-checkout", "set", "--cone"],
+            ["fetch", "--quiet", "--depth", "1", "--filter=blob:none", "origin", commit],
+            ["checkout", "--quiet", "FETCH_HEAD"],
+        ]
+        try:
+            os.makedirs(repo_dir)
+            for command in commands:
+                check_output([git_executable] + command, cwd=repo_dir, stderr=subprocess.STDOUT)
+            return True
+        except subprocess.CalledProcessError as fetch_error:
+            LOG.debug(
+                "Unable to fetch commit %s of %s, cloning the whole repository instead\n%s",
+                commit,
+                self.url,
+                fetch_error.output.decode("utf-8"),
+            )
+            shutil.rmtree(repo_dir, onerror=rmtree_callback)
+            return False
+
+    def checkout_paths(self, paths: Optional[List[str]] = None) -> None:
+        """
+        Adds paths to the working tree of a shallow clone of this Git repository, the content of their files is
+        fetched from the remote repository if it isn't available locally yet.
+
+        Parameters
+        ----------
+        paths: Optional[List[str]]
+            Directories to check out, relative to the root of the repository. The whole repository is checked out if
+            not provided
+
+        Raises
+        ------
+        CloneRepoException:
+            if there is no local clone, or if the paths couldn't be checked out
+        """
+        if not self.local_path:
+            raise CloneRepoException(f"Can not check out paths of {self.url}, the repository is not cloned")
+
+        git_executable: str = GitRepo.git_executable()
+        command = [git_executable, "sparse-checkout"] + (["add"] + paths if paths else ["disable"])
+        LOG.debug("Checking out %s in %s", paths or "all files", self.local_path)
+        try:
+            check_output(command, cwd=self.local_path, stderr=subprocess.STDOUT)
+        except subprocess.CalledProcessError as checkout_error:
+            raise CloneRepoException(checkout_error.output.decode("utf-8")) from checkout_error
+
     @staticmethod
     def _persist_local_repo(temp_path: str, dest_dir: Path, dest_name: str, replace_existing: bool) -> Path:
         dest_path = os.path.normpath(dest_dir.joinpath(dest_name))
@@ -3,9 +3,14 @@ Hash calculation utilities for files and directories.
 """
 
 import hashlib
+import json
+import logging
 import os
 import sys
-from typing import Any, List, Optional, cast
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, cast
+
+from samcli.lib.utils.timings import traced
 
 BLOCK_SIZE = 4096
 # earliest python version to support usedforsecurity option for hashlib.md5 is 3.9
@@ -13,6 +18,14 @@ BLOCK_SIZE = 4096
 _MAJOR_PYTHON_VERSION = 3
 _MINOR_PYTHON_VERSION = 9
 
+LOG = logging.getLogger(__name__)
+
+# Version of the persisted DirectoryDigest format, digests persisted with another version are ignored
+DIRECTORY_DIGEST_VERSION = 1
+# Files modified this recently may still change without their modification time changing (on file systems with a
+# coarse timestamp granularity), so their modification time isn't trusted to skip hashing them later
+_RACY_MODIFICATION_WINDOW_NS = 2 * 10**9
+
 
 def _get_md5():
     if sys.version_info.major >= _MAJOR_PYTHON_VERSION and sys.version_info.minor >= _MINOR_PYTHON_VERSION:
@@ -21,6 +34,12 @@ def _get_md5():
         return hashlib.md5()
 
 
+def _get_hash_generator(algorithm: str) -> Any:
+    if algorithm == "md5":
+        return _get_md5()
+    return hashlib.new(algorithm)
+
+
 def file_checksum(file_name: str, hash_generator: Any = None) -> str:
     """
 
@@ -55,6 +74,7 @@ def file_checksum(file_name: str, hash_generator: Any = None) -> str:
         return cast(str, hash_generator.hexdigest())
 
 
+@traced("hash.dir_checksum")
 def dir_checksum(
     directory: str, followlinks: bool = True, ignore_list: Optional[List[str]] = None, hash_generator: Any = None
 ) -> str:
@@ -120,3 +140,270 @@ def str_checksum(content: str, hash_generator: Any = None) -> str:
         hash_generator = _get_md5()
     hash_generator.update(content.encode("utf-8"))
     return cast(str, hash_generator.hexdigest())
+
+
+class DirectoryDigest:
+    """
+    Checksums of every file of a directory, organized as a tree of directory digests, which are kept up to date file
+    by file when only some files changed, instead of reading the whole directory again.
+
+    * The digest of a directory, or of any of its sub directories, is computed from the stored file checksums, and
+      equals what ``dir_checksum`` returns for the same directory content. Directory digests are memoized, a changed
+      file only invalidates the digests of the directories containing it.
+    * Files whose size and modification time didn't change are not read again when the directory is re-scanned.
+    * The digest can be persisted with ``save`` and ``load``, and compared with a previous digest of the same
+      directory with ``changed_files``.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        followlinks: bool = True,
+        ignore_list: Optional[List[str]] = None,
+        algorithm: str = "md5",
+        files: Optional[Dict[str, Tuple[int, int, str]]] = None,
+    ):
+        """
+        Parameters
+        ----------
+        directory : str
+            A directory with an absolute path
+        followlinks : bool
+            Follow symbolic links through the given directory
+        ignore_list : list(str)
+            The list of file/directory names to ignore in checksum
+        algorithm : str
+            Name of the hashlib algorithm which combines the file checksums into directory digests, files are always
+            hashed with md5 like ``dir_checksum`` does. Defaults to md5.
+        files : dict
+            Optional, previously known state of the files, which is used as is instead of scanning the directory. See
+            ``update`` to refresh it.
+        """
+        self.directory = directory
+        self.followlinks = followlinks
+        self.ignore_list = sorted(set(ignore_list or []))
+        self.algorithm = algorithm
+        # relative path of each file, mapped to its size, modification time and checksum
+        self._files: Dict[str, Tuple[int, int, str]] = {}
+        # memoized digests of the sub directories, by relative path ("" being the directory itself)
+        self._subtree_digests: Dict[str, str] = {}
+        if files is None:
+            self.update([directory])
+        else:
+            self._files = dict(files)
+
+    @property
+    def digest(self) -> str:
+        return self.subtree_digest("")
+
+    @property
+    def files(self) -> Dict[str, str]:
+        """Checksum of every file, by path relative to the directory"""
+        return {relative_path: state[2] for relative_path, state in self._files.items()}
+
+    def subtree_digest(self, relative_path: str) -> str:
+        """
+        Returns the digest of a sub directory, which is what ``dir_checksum`` returns for it
+
+        Parameters
+        ----------
+        relative_path : str
+            Path of the sub directory, relative to the directory. Empty for the directory itself
+        """
+        relative_path = os.path.normpath(relative_path) if relative_path else ""
+        subtree_digest = self._subtree_digests.get(relative_path)
+        if subtree_digest is None:
+            prefix = relative_path + os.sep if relative_path else ""
+            hash_generator = _get_hash_generator(self.algorithm)
+            for file_path in sorted(path for path in self._files if path.startswith(prefix)):
+                hash_generator.update(file_path[len(prefix) :].encode("utf-8"))
+                hash_generator.update(self._files[file_path][2].encode("utf-8"))
+            subtree_digest = self._subtree_digests[relative_path] = cast(str, hash_generator.hexdigest())
+        return subtree_digest
+
+    def changed_files(self, previous: "DirectoryDigest") -> List[str]:
+        """
+        Returns the relative paths of the files which were added, modified or removed since the previous digest
+        """
+        return sorted(
+            relative_path
+            for relative_path in set(self._files) | set(previous._files)
+            if relative_path not in self._files
+            or relative_path not in previous._files
+            or self._files[relative_path][2] != previous._files[relative_path][2]
+        )
+
+    def update(self, paths: Iterable[str]) -> List[str]:
+        """
+        Re-hashes the given files, and the files of the given sub directories whose size or modification time changed.
+        Files which don't exist anymore are removed from the digest.
+
+        Parameters
+        ----------
+        paths : Iterable[str]
+            Changed files or directories, paths outside of the directory or ignored are skipped
+
+        Returns
+        -------
+        List[str]
+            Relative paths of the files whose checksum changed, were added or were removed
+        """
+        changed: Set[str] = set()
+        for path in paths:
+            relative_path = os.path.relpath(path, self.directory)
+            if relative_path == os.pardir or relative_path.startswith(os.pardir + os.sep):
+                continue
+            if relative_path == os.curdir:
+                relative_path = ""
+            if self._is_ignored(relative_path):
+                continue
+
+            if os.path.isfile(path):
+                if self._update_file(relative_path, force=True):
+                    changed.add(relative_path)
+            else:
+                changed.update(self._update_directory(relative_path))
+
+        for relative_path in changed:
+            self._invalidate_subtree_digests(relative_path)
+        return sorted(changed)
+
+    def save(self, path: str) -> None:
+        """
+        Persists the digest as JSON in the given file
+        """
+        os.makedirs(os.path.dirname(path) or os.curdir, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as digest_file:
+            json.dump(
+                {
+                    "version": DIRECTORY_DIGEST_VERSION,
+                    "directory": self.directory,
+                    "followlinks": self.followlinks,
+                    "ignore_list": self.ignore_list,
+                    "algorithm": self.algorithm,
+                    "files": self._files,
+                },
+                digest_file,
+            )
+
+    @classmethod
+    def load(cls, path: str) -> Optional["DirectoryDigest"]:
+        """
+        Returns the digest persisted in the given file as it was saved, without reading the directory again, or None
+        if the file doesn't exist or can't be read
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as digest_file:
+                content = json.load(digest_file)
+            if content.get("version") != DIRECTORY_DIGEST_VERSION:
+                return None
+            return cls(
+                content["directory"],
+                followlinks=content["followlinks"],
+                ignore_list=content["ignore_list"],
+                algorithm=content["algorithm"],
+                files={relative_path: tuple(state) for relative_path, state in content["files"].items()},
+            )
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            LOG.debug("Ignoring unreadable directory digest %s", path, exc_info=True)
+            return None
+
+    def _is_ignored(self, relative_path: str) -> bool:
+        return bool(self.ignore_list) and any(part in self.ignore_list for part in relative_path.split(os.sep))
+
+    def _invalidate_subtree_digests(self, relative_path: str) -> None:
+        parent = os.path.dirname(relative_path)
+        while parent:
+            self._subtree_digests.pop(parent, None)
+            parent = os.path.dirname(parent)
+        self._subtree_digests.pop("", None)
+
+    def _update_directory(self, relative_path: str) -> Set[str]:
+        changed = set()
+        found = set()
+        ignore_set = set(self.ignore_list)
+        for dirpath, dirnames, filenames in os.walk(
+            os.path.join(self.directory, relative_path), followlinks=self.followlinks
+        ):
+            dirnames[:] = [dirname for dirname in dirnames if dirname not in ignore_set]
+            for filename in filenames:
+                if filename in ignore_set:
+                    continue
+                file_relative_path = os.path.relpath(os.path.join(dirpath, filename), self.directory)
+                found.add(file_relative_path)
+                if self._update_file(file_relative_path, force=False):
+                    changed.add(file_relative_path)
+
+        # a deleted path can either be a file or a directory
+        prefix = relative_path + os.sep if relative_path else ""
+        removed_paths = [
+            path for path in self._files if path not in found and (path == relative_path or path.startswith(prefix))
+        ]
+        for removed in removed_paths:
+            del self._files[removed]
+            changed.add(removed)
+        return changed
+
+    def _update_file(self, relative_path: str, force: bool) -> bool:
+        previous = self._files.get(relative_path)
+        try:
+            stat = os.stat(os.path.join(self.directory, relative_path))
+            if not force and previous and previous[:2] == (stat.st_size, stat.st_mtime_ns):
+                return False
+            checksum = file_checksum(os.path.join(self.directory, relative_path))
+        except OSError:
+            # the file got deleted, or can't be read anymore
+            return self._files.pop(relative_path, None) is not None
+
+        modification_time = stat.st_mtime_ns
+        if time.time_ns() - modification_time < _RACY_MODIFICATION_WINDOW_NS:
+            # make sure the file is hashed again next time
+            modification_time = -1
+        self._files[relative_path] = (stat.st_size, modification_time, checksum)
+        return not previous or previous[2] != checksum
+
+
+def load_directory_digest(
+    digest_path: str, directory: str, ignore_list: Optional[List[str]] = None, algorithm: str = "md5"
+) -> Tuple[DirectoryDigest, Optional[DirectoryDigest]]:
+    """
+    Returns the up to date digest of a directory, re-using the digest persisted in ``digest_path`` so that only files
+    changed since it was saved are read again, and saves the updated digest back
+
+    Parameters
+    ----------
+    digest_path : str
+        File where the digest of the directory is persisted
+    directory : str
+        A directory with an absolute path
+    ignore_list : list(str)
+        The list of file/directory names to ignore in checksum
+    algorithm : str
+        Name of the hashlib algorithm which combines the file checksums into directory digests
+
+    Returns
+    -------
+    Tuple[DirectoryDigest, Optional[DirectoryDigest]]
+        The up to date digest, and the previously persisted one if it was computed with the same settings
+    """
+    previous = DirectoryDigest.load(digest_path)
+    if (
+        previous
+        and previous.directory == directory
+        and previous.algorithm == algorithm
+        and previous.ignore_list == sorted(set(ignore_list or []))
+        and previous.followlinks
+    ):
+        digest = DirectoryDigest(
+            directory, ignore_list=ignore_list, algorithm=algorithm, files=previous._files  # pylint: disable=W0212
+        )
+        digest.update([directory])
+    else:
+        previous = None
+        digest = DirectoryDigest(directory, ignore_list=ignore_list, algorithm=algorithm)
+
+    try:
+        digest.save(digest_path)
+    except OSError:
+        LOG.debug("Failed to persist the digest of %s", directory, exc_info=True)
+    return digest, previous
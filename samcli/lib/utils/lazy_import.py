@@ -0,0 +1,84 @@
+"""
+Deferred imports of heavy third party modules, to keep the startup time of the CLI low
+"""
+
+import importlib.util
+import sys
+import threading
+from types import ModuleType
+from typing import Any, Set
+
+# Guards the creation and the execution of the lazy modules. Reentrant, since executing a module can use another one
+_lazy_import_lock = threading.RLock()
+# Names of the lazy modules being executed by the thread holding the lock
+_executing_modules: Set[str] = set()
+
+
+class _LazyModule(ModuleType):
+    """
+    Module which is executed the first time one of its attributes is accessed, then becomes a regular module.
+
+    Unlike the modules of importlib.util.LazyLoader, which become regular modules before being executed, threads
+    accessing the module while it is executed wait for the execution to finish instead of seeing a partially
+    initialized module.
+    """
+
+    def __getattribute__(self, attr: str) -> Any:
+        with _lazy_import_lock:
+            if ModuleType.__getattribute__(self, "__class__") is _LazyModule:
+                spec = ModuleType.__getattribute__(self, "__spec__")
+                if spec.name in _executing_modules:
+                    # accessed by the import system, its own code or one of its submodules while being executed
+                    return ModuleType.__getattribute__(self, attr)
+                _executing_modules.add(spec.name)
+                try:
+                    spec.loader.exec_module(self)
+                finally:
+                    _executing_modules.discard(spec.name)
+                self.__class__ = ModuleType  # type: ignore[assignment]
+        return getattr(self, attr)
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Returns the module called ``name`` without executing it. The module is executed the first time one of its
+    attributes is accessed, so a module level ``requests = lazy_import("requests")`` costs nothing to a command which
+    never sends a request, while keeping ``requests`` patchable as a module attribute in tests.
+
+    Parent packages of ``name`` are imported right away, so this only helps for top level modules or submodules of
+    packages which are cheap to import.
+
+    Parameters
+    ----------
+    name : str
+        Fully qualified name of the module (ex. "docker" or "botocore.utils")
+
+    Returns
+    -------
+    ModuleType
+        The module, which is the actual module if it was already imported
+
+    Raises
+    ------
+    ModuleNotFoundError
+        If the module doesn't exist. Errors raised while executing the module are only raised on first use, which
+        executes the module again
+    """
+    with _lazy_import_lock:
+        module = sys.modules.get(name)
+        if module is not None:
+            return module
+
+        spec = importlib.util.find_spec(name)
+        if spec is None or spec.loader is None:
+            raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+
+        module = importlib.util.module_from_spec(spec)
+        module.__class__ = _LazyModule
+        sys.modules[name] = module
+
+        parent_name, _, child_name = name.rpartition(".")
+        if parent_name:
+            # bind the submodule to its package, as a regular import does
+            setattr(sys.modules[parent_name], child_name, module)
+        return module
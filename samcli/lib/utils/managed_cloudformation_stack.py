@@ -6,12 +6,14 @@ import logging
 from collections.abc import Collection
 from typing import Dict, List, Optional, Union, cast
 
-import boto3
 import click
-from botocore.config import Config
 from botocore.exceptions import BotoCoreError, ClientError, NoCredentialsError, NoRegionError, ProfileNotFound
 
 from samcli.commands.exceptions import AWSServiceClientError, RegionError, UserException
+from samcli.lib.utils.lazy_import import lazy_import
+
+boto3 = lazy_import("boto3")
+botocore_config = lazy_import("botocore.config")
 
 LOG = logging.getLogger(__name__)
 
@@ -68,7 +70,7 @@ def update_stack(
             cloudformation_client = session.client("cloudformation")
         else:
             cloudformation_client = boto3.client(
-                "cloudformation", config=Config(region_name=region if region else None)
+                "cloudformation", config=botocore_config.Config(region_name=region if region else None)
             )
     except ProfileNotFound as ex:
         raise AWSServiceClientError(
@@ -124,7 +126,7 @@ def manage_stack(
             cloudformation_client = session.client("cloudformation")
         else:
             cloudformation_client = boto3.client(
-                "cloudformation", config=Config(region_name=region if region else None)
+                "cloudformation", config=botocore_config.Config(region_name=region if region else None)
             )
     except ProfileNotFound as ex:
         raise AWSServiceClientError(
@@ -4,8 +4,8 @@ Module for aws profile related helpers
 
 from typing import List
 
-from botocore.session import Session
-
 
 def list_available_profiles() -> List[str]:
+    from botocore.session import Session
+
     return Session().available_profiles
@@ -3,9 +3,13 @@ Retry decorator to retry decorated function based on Exception with exponential
 """
 
 import math
+import random
 import time
 from functools import wraps
 
+# attempts above this one get the maximum delay, keeps 2 ** attempt within the range of a float
+_MAX_BACKOFF_EXPONENT = 32
+
 
 def retry(exc, attempts=3, delay=0.05, exc_raise=Exception, exc_raise_msg=""):
     """
@@ -38,3 +42,26 @@ def retry(exc, attempts=3, delay=0.05, exc_raise=Exception, exc_raise_msg=""):
         return wrapper
 
     return retry_wrapper
+
+
+def exponential_backoff(attempt: int, base_delay: float, max_delay: float) -> float:
+    """
+    Returns the delay before a retry, which doubles with every attempt up to max_delay. The second half of the delay is
+    random, so that clients throttled at the same time don't all retry at the same time.
+
+    Parameters
+    ----------
+    attempt: int
+        Number of the retry attempt, starting from 1
+    base_delay: float
+        Delay in seconds before the first retry, without jitter
+    max_delay: float
+        Maximum delay in seconds
+
+    Returns
+    -------
+    float
+        Delay in seconds, between half of and the full exponential delay
+    """
+    delay = min(max_delay, base_delay * 2.0 ** min(max(attempt - 1, 0), _MAX_BACKOFF_EXPONENT))
+    return delay / 2 + random.uniform(0, delay / 2)
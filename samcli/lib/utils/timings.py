@@ -0,0 +1,208 @@
+"""
+Lightweight span tracing used to report where time goes while running a command
+
+Spans are only recorded once tracing is enabled (with the ``--timings`` option), otherwise opening a span is a no-op.
+
+    >>> with span("build", function="HelloWorldFunction"):
+    ...     build_function()
+
+    >>> @traced("deploy.changeset.create")
+    ... def create_changeset(...):
+    ...     ...
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar, cast
+
+# Environment variable holding the file path where the Chrome trace-event JSON is exported to
+TIMINGS_TRACE_FILE_ENV_VAR = "SAM_CLI_TIMINGS_TRACE_FILE"
+
+FuncType = TypeVar("FuncType", bound=Callable[..., Any])
+
+
+class Span:
+    """
+    A named, timed section of the execution
+    """
+
+    def __init__(self, name: str, parent: Optional["Span"] = None, attributes: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.parent = parent
+        self.attributes = attributes or {}
+        self.children: List["Span"] = []
+        self.thread_id = threading.get_ident()
+        self.start = time.perf_counter()
+        self.end: Optional[float] = None
+
+    @property
+    def duration(self) -> float:
+        """Duration of the span in seconds, up to now if the span is still open"""
+        return (self.end if self.end is not None else time.perf_counter()) - self.start
+
+    @property
+    def label(self) -> str:
+        if not self.attributes:
+            return self.name
+        attributes = ", ".join(f"{key}={value}" for key, value in self.attributes.items())
+        return f"{self.name} ({attributes})"
+
+
+class SpanTracer:
+    """
+    Records spans in a tree. Each thread keeps its own stack of open spans, spans opened from a thread without any
+    open span (ex. worker threads of parallel builds) are attached to the root span of the command.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._root_spans: List[Span] = []
+        self._command_span: Optional[Span] = None
+        self._origin = time.perf_counter()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._root_spans = []
+            self._command_span = None
+            self._local = threading.local()
+            self._origin = time.perf_counter()
+
+    @property
+    def root_spans(self) -> List[Span]:
+        return list(self._root_spans)
+
+    def _stack(self) -> List[Span]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+        """
+        Records the execution of the wrapped block as a span named ``name``
+
+        Parameters
+        ----------
+        name : str
+            Name of the span, dot separated names are used to group similar spans (ex. "build.function")
+        attributes
+            Extra attributes of the span, displayed in the report (ex. the logical id of the function being built)
+        """
+        if not self.enabled:
+            yield None
+            return
+
+        stack = self._stack()
+        parent = stack[-1] if stack else self._command_span
+        current = Span(name, parent, attributes)
+        with self._lock:
+            if parent:
+                parent.children.append(current)
+            else:
+                self._root_spans.append(current)
+                self._command_span = self._command_span or current
+        stack.append(current)
+        try:
+            yield current
+        finally:
+            current.end = time.perf_counter()
+            stack.pop()
+            if self._command_span is current:
+                self._command_span = None
+
+    def traced(self, name: str) -> Callable[[FuncType], FuncType]:
+        """
+        Decorator recording every call of the decorated function as a span named ``name``
+        """
+
+        def decorator(func: FuncType) -> FuncType:
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with self.span(name):
+                    return func(*args, **kwargs)
+
+            return cast(FuncType, wrapper)
+
+        return decorator
+
+    def format_report(self) -> str:
+        """
+        Returns the hierarchical breakdown of the recorded spans. Sibling spans with the same name and attributes are
+        displayed once, with their total duration and call count.
+        """
+        lines = ["Timings:"]
+        self._format_spans(self.root_spans, 1, None, lines)
+        return "\n".join(lines)
+
+    def _format_spans(self, spans: List[Span], depth: int, parent_duration: Optional[float], lines: List[str]) -> None:
+        groups: Dict[str, List[Span]] = {}
+        for current in spans:
+            groups.setdefault(current.label, []).append(current)
+
+        for label, group in groups.items():
+            duration = sum(current.duration for current in group)
+            share = f" {duration / parent_duration:6.1%}" if parent_duration else ""
+            count = f" x{len(group)}" if len(group) > 1 else ""
+            lines.append(f"{'  ' * depth}{duration * 1000:10.1f} ms{share}  {label}{count}")
+            children = [child for current in group for child in current.children]
+            self._format_spans(children, depth + 1, duration, lines)
+
+    def to_chrome_trace(self) -> Dict:
+        """
+        Returns the recorded spans in the Chrome trace-event format, which can be opened with chrome://tracing or
+        https://ui.perfetto.dev
+        """
+        events: List[Dict[str, Any]] = []
+        pid = os.getpid()
+        pending = self.root_spans
+        while pending:
+            current = pending.pop()
+            events.append(
+                {
+                    "name": current.name,
+                    "cat": current.name.split(".")[0],
+                    "ph": "X",
+                    "ts": round((current.start - self._origin) * 1e6),
+                    "dur": round(current.duration * 1e6),
+                    "pid": pid,
+                    "tid": current.thread_id,
+                    "args": {key: str(value) for key, value in current.attributes.items()},
+                }
+            )
+            pending.extend(current.children)
+        events.sort(key=lambda event: event["ts"])
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as trace_file:
+            json.dump(self.to_chrome_trace(), trace_file)
+
+
+_TRACER = SpanTracer()
+
+
+def get_tracer() -> SpanTracer:
+    return _TRACER
+
+
+def enable_timings(enabled: bool = True) -> None:
+    _TRACER.enabled = enabled
+
+
+def span(name: str, **attributes: Any):
+    """Records the wrapped block as a span of the global tracer, see SpanTracer.span"""
+    return _TRACER.span(name, **attributes)
+
+
+def traced(name: str) -> Callable[[FuncType], FuncType]:
+    """Records every call of the decorated function as a span of the global tracer, see SpanTracer.traced"""
+    return _TRACER.traced(name)
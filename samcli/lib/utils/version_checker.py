@@ -7,10 +7,12 @@ from datetime import datetime, timedelta
 from functools import wraps
 
 import click
-from requests import get
 
 from samcli import __version__ as installed_version
 from samcli.cli.global_config import GlobalConfig
+from samcli.lib.utils.lazy_import import lazy_import
+
+requests = lazy_import("requests")
 
 LOG = logging.getLogger(__name__)
 
@@ -85,7 +87,7 @@ def fetch_and_compare_versions() -> None:
     """
     Compare current up to date version with the installed one, and inform if a newer version available
     """
-    response = get(AWS_SAM_CLI_PYPI_ENDPOINT, timeout=PYPI_CALL_TIMEOUT_IN_SECONDS)
+    response = requests.get(AWS_SAM_CLI_PYPI_ENDPOINT, timeout=PYPI_CALL_TIMEOUT_IN_SECONDS)
     result = response.json()
     latest_version = result.get("info", {}).get("version", None)
     LOG.debug("Installed version %s, current version %s", installed_version, latest_version)
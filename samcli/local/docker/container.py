@@ -23,6 +23,7 @@ from samcli.lib.constants import DOCKER_MIN_API_VERSION
 from samcli.lib.utils.retry import retry
 from samcli.lib.utils.stream_writer import StreamWriter
 from samcli.lib.utils.tar import extract_tarfile
+from samcli.lib.utils.timings import traced
 from samcli.local.docker.effective_user import ROOT_USER_ID, EffectiveUser
 from samcli.local.docker.exceptions import ContainerNotStartableException, PortAlreadyInUse
 from samcli.local.docker.utils import NoFreePortsError, find_free_port, to_posix_path
@@ -148,6 +149,7 @@ class Container:
         except NoFreePortsError as ex:
             raise ContainerNotStartableException(str(ex)) from ex
 
+    @traced("container.create")
     def create(self):
         """
         Calls Docker API to creates the Docker container instance. Creating the container does *not* run the container.
@@ -283,6 +285,7 @@ class Container:
 
         return additional_volumes
 
+    @traced("container.stop")
     def stop(self, timeout=3):
         """
         Stop a container, with a given number of seconds between sending SIGTERM and SIGKILL.
@@ -312,6 +315,7 @@ class Container:
                 raise ex
             LOG.debug("Container removal is in progress, skipping exception: %s", msg)
 
+    @traced("container.delete")
     def delete(self):
         """
         Removes a container that was created earlier.
@@ -344,6 +348,7 @@ class Container:
 
         self.id = None
 
+    @traced("container.start")
     def start(self, input_data=None):
         """
         Calls Docker API to start the container. The container must be created at the first place to run.
@@ -379,7 +384,7 @@ class Container:
             raise ex
 
     @retry(exc=requests.exceptions.RequestException, exc_raise=ContainerResponseException)
-    def wait_for_http_response(self, name, event, stdout) -> Tuple[Union[str, bytes], bool]:
+    def wait_for_http_response(self, name, event: Union[str, bytes], stdout) -> Tuple[Union[str, bytes], bool]:
         # TODO(sriram-mv): `aws-lambda-rie` is in a mode where the function_name is always "function"
         # NOTE(sriram-mv): There is a connection timeout set on the http call to `aws-lambda-rie`, however there is not
         # a read time out for the response received from the server.
@@ -396,7 +401,8 @@ class Container:
         with lock:
             resp = requests.post(
                 self.URL.format(host=self._container_host, port=self.rapid_port_host, function_name="function"),
-                data=event.encode("utf-8"),
+                # large events received as bytes are sent as is, without copies
+                data=event if isinstance(event, bytes) else event.encode("utf-8"),
                 timeout=(self.RAPID_CONNECTION_TIMEOUT, None),
             )
 
@@ -409,6 +415,7 @@ class Container:
             LOG.debug("Failed to deserialize response from RIE, returning the raw response as is")
             return resp.content, False
 
+    @traced("container.invoke")
     def wait_for_result(self, full_path, event, stdout, stderr, start_timer=None):
         # NOTE(sriram-mv): Let logging happen in its own thread, so that a http request can be sent.
         # NOTE(sriram-mv): All logging is re-directed to stderr, so that only the lambda function return
@@ -0,0 +1,126 @@
+"""
+Tears down the containers of finished invokes in background threads, off the path of the invoke responses
+"""
+
+import logging
+import queue
+import threading
+from typing import TYPE_CHECKING, List, Optional
+
+if TYPE_CHECKING:  # pragma: no cover
+    from samcli.local.docker.container import Container
+    from samcli.local.docker.manager import ContainerManager
+
+LOG = logging.getLogger(__name__)
+
+# Maximum number of containers waiting for their teardown, reaping more containers blocks until one of them is removed
+DEFAULT_MAX_PENDING_TEARDOWNS = 16
+# Maximum number of containers torn down at the same time
+DEFAULT_TEARDOWN_WORKERS = 4
+# Seconds an idle worker waits for a container to tear down before exiting
+_WORKER_IDLE_TIMEOUT = 1
+
+
+class ContainerReaper:
+    """
+    Stops and removes containers with a ContainerManager in background threads, taking them off a queue.
+
+    The workers are started on demand and exit once idle. They aren't daemon threads, so the interpreter waits for the
+    pending teardowns before exiting even if drain is interrupted by Ctrl+C, and no container is left behind.
+    """
+
+    def __init__(
+        self,
+        container_manager: "ContainerManager",
+        max_pending_teardowns: int = DEFAULT_MAX_PENDING_TEARDOWNS,
+        max_workers: int = DEFAULT_TEARDOWN_WORKERS,
+    ):
+        """
+        Parameters
+        ----------
+        container_manager: ContainerManager
+            Manager which stops and removes the containers
+        max_pending_teardowns: int
+            Maximum number of containers waiting for their teardown
+        max_workers: int
+            Maximum number of containers torn down at the same time
+        """
+        self._container_manager = container_manager
+        self._max_workers = max_workers
+        self._queue: "queue.Queue[Optional[Container]]" = queue.Queue()
+        self._pending_teardowns = threading.BoundedSemaphore(max_pending_teardowns)
+        self._workers: List[threading.Thread] = []
+        self._draining = False
+        self._lock = threading.Lock()
+
+    def reap(self, container: "Container") -> None:
+        """
+        Queues the container for its teardown and returns immediately, unless max_pending_teardowns containers are
+        already waiting for their teardown. After drain was called, tears the container down before returning.
+
+        Parameters
+        ----------
+        container: Container
+            The container of a finished invoke
+        """
+        self._pending_teardowns.acquire()
+        with self._lock:
+            if not self._draining:
+                self._queue.put(container)
+                if len(self._workers) < self._max_workers:
+                    self._start_worker()
+                return
+        self._pending_teardowns.release()
+        self._teardown(container)
+
+    def drain(self) -> None:
+        """
+        Waits for the teardown of all the reaped containers. The containers reaped afterwards are torn down
+        synchronously.
+        """
+        with self._lock:
+            self._draining = True
+            workers = list(self._workers)
+            # the workers exit on these markers, once all the containers queued before them are torn down
+            for _ in workers:
+                self._queue.put(None)
+
+        if workers:
+            LOG.debug("Waiting for the teardown of the containers of the finished invokes")
+        for worker in workers:
+            worker.join()
+
+    def _start_worker(self) -> None:
+        worker = threading.Thread(target=self._work, name="container-reaper", daemon=False)
+        self._workers.append(worker)
+        worker.start()
+
+    def _work(self) -> None:
+        while True:
+            try:
+                container = self._queue.get(timeout=_WORKER_IDLE_TIMEOUT)
+            except queue.Empty:
+                with self._lock:
+                    # a container may have been queued since the timeout, relying on this worker
+                    if self._queue.empty():
+                        self._workers.remove(threading.current_thread())
+                        return
+                continue
+
+            if container is None:
+                with self._lock:
+                    self._workers.remove(threading.current_thread())
+                return
+
+            try:
+                self._teardown(container)
+            finally:
+                self._pending_teardowns.release()
+
+    def _teardown(self, container: "Container") -> None:
+        container_id = container.id
+        try:
+            self._container_manager.stop(container)
+        except Exception as ex:
+            LOG.warning("Failed to remove the container %s: %s", container_id, ex)
+            LOG.debug("Container teardown failure", exc_info=ex)
@@ -13,8 +13,6 @@ from enum import Enum
 from pathlib import Path
 from typing import Optional
 
-import docker
-
 from samcli.commands.local.cli_common.user_exceptions import (
     DockerDistributionAPIError,
     ImageBuildException,
@@ -22,11 +20,15 @@ from samcli.commands.local.cli_common.user_exceptions import (
 from samcli.commands.local.lib.exceptions import InvalidIntermediateImageError
 from samcli.lib.constants import DOCKER_MIN_API_VERSION
 from samcli.lib.utils.architecture import has_runtime_multi_arch_image
+from samcli.lib.utils.lazy_import import lazy_import
 from samcli.lib.utils.packagetype import IMAGE, ZIP
 from samcli.lib.utils.stream_writer import StreamWriter
 from samcli.lib.utils.tar import create_tarball
 from samcli.local.docker.utils import get_docker_platform, get_rapid_name
 
+# Runtime names are needed by most commands to render their options, the docker client only to build images
+docker = lazy_import("docker")
+
 LOG = logging.getLogger(__name__)
 
 RAPID_IMAGE_TAG_PREFIX = "rapid"
@@ -0,0 +1,295 @@
+"""
+Local stand-in of the asynchronous (Event) invocations of the Lambda service
+"""
+
+import io
+import json
+import logging
+import os
+import queue
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+
+from samcli.lib.utils.stream_writer import StreamWriter
+from samcli.local.services.base_local_service import LambdaOutputParser
+
+if TYPE_CHECKING:  # pragma: no cover
+    from samcli.commands.local.lib.local_lambda import LocalLambdaRunner
+    from samcli.lib.providers.provider import Function
+
+LOG = logging.getLogger(__name__)
+
+# Number of Event invocations running at the same time
+DEFAULT_EVENT_INVOKE_WORKERS = 4
+# Number of Event invocations waiting for a worker, more are rejected as throttled
+DEFAULT_MAX_QUEUED_EVENTS = 100
+# Defaults of the Lambda service, overridden by the EventInvokeConfig of the function
+DEFAULT_MAXIMUM_RETRY_ATTEMPTS = 2
+DEFAULT_MAXIMUM_EVENT_AGE_SECONDS = 21600
+# Seconds before the first retry, doubled for each next retry. The Lambda service waits one minute then two, retries
+# are faster locally so that the tests of the asynchronous flows don't wait for minutes
+RETRY_BASE_DELAY_SECONDS = 1
+
+RETRIES_EXHAUSTED = "RetriesExhausted"
+EVENT_AGE_EXCEEDED = "EventAgeExceeded"
+
+
+@dataclass
+class QueuedEvent:
+    """
+    Event of an Event invocation, waiting for or being processed by a worker
+    """
+
+    function: "Function"
+    payload: Union[str, bytes]
+    request_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    received_at: float = field(default_factory=time.monotonic)
+    invoke_count: int = 0
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.received_at
+
+
+class EventInvoker:
+    """
+    Queues the events of Event invocations, and invokes the functions with them in a bounded pool of workers.
+
+    Like the Lambda service, failed invocations are retried and events older than their maximum age are discarded,
+    following the EventInvokeConfig of the function. The events which can't be processed are written as on-failure
+    destination records in the failure destination directory, standing in for the destinations of the function.
+    """
+
+    def __init__(
+        self,
+        lambda_runner: "LocalLambdaRunner",
+        failure_destination: Optional[str] = None,
+        stderr: Optional[StreamWriter] = None,
+        max_workers: int = DEFAULT_EVENT_INVOKE_WORKERS,
+        max_queued_events: int = DEFAULT_MAX_QUEUED_EVENTS,
+    ):
+        """
+        Parameters
+        ----------
+        lambda_runner: LocalLambdaRunner
+            The Lambda runner which invokes the functions
+        failure_destination: Optional[str]
+            Directory where the on-failure destination records are written, they are only logged if not set
+        stderr: Optional[StreamWriter]
+            Stream where the stderr of the containers is written
+        max_workers: int
+            Number of Event invocations running at the same time. With 0, the events are processed before submit
+            returns, for the functions being debugged which can only run in the main thread
+        max_queued_events: int
+            Number of Event invocations waiting for a worker
+        """
+        self._lambda_runner = lambda_runner
+        self._failure_destination = failure_destination
+        self._stderr = stderr
+        self._max_workers = max_workers
+        self._queue: "queue.Queue[Optional[QueuedEvent]]" = queue.Queue(maxsize=max_queued_events)
+        self._workers: List[threading.Thread] = []
+        self._stopping = threading.Event()
+        self._lock = threading.Lock()
+
+    def submit(self, function: "Function", payload: Union[str, bytes]) -> Optional[str]:
+        """
+        Queues an event for the invocation of the function
+
+        Parameters
+        ----------
+        function: Function
+            The function to invoke
+        payload: Union[str, bytes]
+            The event, as a JSON document or its UTF-8 encoded bytes
+
+        Returns
+        -------
+        Optional[str]
+            The request id of the invocation, None if too many events are already queued
+        """
+        event = QueuedEvent(function, payload)
+        if not self._max_workers:
+            self._process(event)
+            return event.request_id
+
+        with self._lock:
+            if self._stopping.is_set():
+                return None
+            try:
+                self._queue.put_nowait(event)
+            except queue.Full:
+                LOG.warning("Too many queued events, the Event invocation of %s is rejected", function.full_path)
+                return None
+            if len(self._workers) < self._max_workers:
+                self._start_worker()
+        LOG.debug("Queued the event %s for the invocation of %s", event.request_id, function.full_path)
+        return event.request_id
+
+    def shutdown(self) -> None:
+        """
+        Stops processing the events. The invocations in progress complete without retries, and the queued events
+        are discarded
+        """
+        with self._lock:
+            self._stopping.set()
+            workers = list(self._workers)
+            discarded = 0
+            while True:
+                try:
+                    if self._queue.get_nowait() is not None:
+                        discarded += 1
+                except queue.Empty:
+                    break
+
+        # the workers exit on these markers, once the invocations in progress complete
+        for _ in workers:
+            self._queue.put(None)
+        if discarded:
+            LOG.warning("Discarded %d queued events of Event invocations", discarded)
+        for worker in workers:
+            worker.join()
+
+    def _start_worker(self) -> None:
+        worker = threading.Thread(target=self._work, name="event-invoker", daemon=True)
+        self._workers.append(worker)
+        worker.start()
+
+    def _work(self) -> None:
+        while True:
+            event = self._queue.get()
+            if event is None:
+                return
+            try:
+                self._process(event)
+            except Exception as ex:
+                LOG.error("Failed to process the event %s", event.request_id, exc_info=ex)
+
+    def _process(self, event: QueuedEvent) -> None:
+        """
+        Invokes the function with the event until it succeeds, or its retries are exhausted, or the event is too old
+        """
+        config = event.function.event_invoke_config or {}
+        maximum_retry_attempts = int(config.get("MaximumRetryAttempts", DEFAULT_MAXIMUM_RETRY_ATTEMPTS))
+        maximum_event_age = int(config.get("MaximumEventAgeInSeconds", DEFAULT_MAXIMUM_EVENT_AGE_SECONDS))
+
+        response: Union[str, bytes, None] = None
+        function_error: Optional[str] = None
+        while not self._stopping.is_set():
+            if event.age > maximum_event_age:
+                LOG.warning(
+                    "The event %s of %s exceeded its maximum age of %d seconds",
+                    event.request_id,
+                    event.function.full_path,
+                    maximum_event_age,
+                )
+                self._write_failure_record(event, EVENT_AGE_EXCEEDED, response, function_error)
+                return
+
+            event.invoke_count += 1
+            response, function_error = self._invoke(event)
+            if not function_error:
+                LOG.debug("The event %s of %s was processed", event.request_id, event.function.full_path)
+                return
+
+            if event.invoke_count > maximum_retry_attempts:
+                LOG.warning(
+                    "The invocation of %s with the event %s failed %d times",
+                    event.function.full_path,
+                    event.request_id,
+                    event.invoke_count,
+                )
+                self._write_failure_record(event, RETRIES_EXHAUSTED, response, function_error)
+                return
+
+            delay = RETRY_BASE_DELAY_SECONDS * 2 ** (event.invoke_count - 1)
+            LOG.info(
+                "The invocation of %s with the event %s failed, retrying in %d seconds",
+                event.function.full_path,
+                event.request_id,
+                delay,
+            )
+            self._stopping.wait(delay)
+
+    def _invoke(self, event: QueuedEvent) -> Tuple[Union[str, bytes], Optional[str]]:
+        """
+        Invokes the function with the event, and returns its response and its error type if it failed
+        """
+        stdout_stream_string = io.StringIO()
+        stdout_stream_bytes = io.BytesIO()
+        stdout_stream_writer = StreamWriter(stdout_stream_string, stdout_stream_bytes, auto_flush=True)
+        try:
+            self._lambda_runner.invoke(
+                event.function.full_path, event.payload, stdout=stdout_stream_writer, stderr=self._stderr
+            )
+        except Exception as ex:
+            LOG.debug("Failed to invoke %s", event.function.full_path, exc_info=ex)
+            return json.dumps({"errorMessage": str(ex), "errorType": type(ex).__name__}), "Unhandled"
+
+        response, is_function_error = LambdaOutputParser.get_lambda_output(stdout_stream_string, stdout_stream_bytes)
+        return response, "Unhandled" if is_function_error else None
+
+    def _write_failure_record(
+        self,
+        event: QueuedEvent,
+        condition: str,
+        response: Union[str, bytes, None],
+        function_error: Optional[str],
+    ) -> None:
+        """
+        Writes the on-failure destination record of the event, in the format of the Lambda service
+        """
+        if not self._failure_destination:
+            return
+
+        record: Dict[str, Any] = {
+            "version": "1.0",
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "requestContext": {
+                "requestId": event.request_id,
+                "functionArn": "arn:aws:lambda:us-west-2:012345678901:function:{}:$LATEST".format(
+                    event.function.full_path
+                ),
+                "condition": condition,
+                "approximateInvokeCount": event.invoke_count,
+            },
+            "requestPayload": _load_json(event.payload),
+        }
+        if event.invoke_count:
+            record["responseContext"] = {
+                "statusCode": 200,
+                "executedVersion": "$LATEST",
+                "functionError": function_error,
+            }
+            record["responsePayload"] = _load_json(response)
+
+        record_path = os.path.join(self._failure_destination, "{}.json".format(event.request_id))
+        try:
+            os.makedirs(self._failure_destination, exist_ok=True)
+            with open(record_path, "w") as record_file:
+                json.dump(record, record_file, indent=2)
+        except OSError as ex:
+            LOG.error("Failed to write the on-failure destination record %s", record_path, exc_info=ex)
+            return
+        LOG.info("Wrote the on-failure destination record of the event %s to %s", event.request_id, record_path)
+
+
+def _load_json(document: Union[str, bytes, None]) -> Any:
+    """
+    Returns the JSON document as a dictionary or list if it can be parsed, as is otherwise
+    """
+    if isinstance(document, bytes):
+        try:
+            document = document.decode("utf-8")
+        except UnicodeDecodeError:
+            return None
+    if not document:
+        return None
+    try:
+        return json.loads(document)
+    except ValueError:
+        return document
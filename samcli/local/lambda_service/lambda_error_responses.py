@@ -21,6 +21,12 @@ class LambdaErrorResponses:
 
     NotImplementedException = ("NotImplemented", 501)
 
+    # The request payload exceeded the Invoke request body JSON input quota.
+    RequestTooLargeException = ("RequestTooLarge", 413)
+
+    # The request throughput limit was exceeded.
+    TooManyRequestsException = ("TooManyRequests", 429)
+
     PathNotFoundException = ("PathNotFoundLocally", 404)
 
     MethodNotAllowedException = ("MethodNotAllowedLocally", 405)
@@ -131,6 +137,55 @@ class LambdaErrorResponses:
             exception_tuple[1],
         )
 
+    @staticmethod
+    def too_many_requests(message):
+        """
+        Creates a Lambda Service TooManyRequests Response
+
+        Parameters
+        ----------
+        message str
+            Message to be added to the body of the response
+
+        Returns
+        -------
+        Flask.Response
+            A response object representing the TooManyRequests Error
+        """
+        exception_tuple = LambdaErrorResponses.TooManyRequestsException
+
+        return BaseLocalService.service_response(
+            LambdaErrorResponses._construct_error_response_body(LambdaErrorResponses.USER_ERROR, message),
+            LambdaErrorResponses._construct_headers(exception_tuple[0]),
+            exception_tuple[1],
+        )
+
+    @staticmethod
+    def request_too_large(max_payload_size):
+        """
+        Creates a Lambda Service RequestTooLarge Response
+
+        Parameters
+        ----------
+        max_payload_size int
+            Maximum size in bytes of the request payload
+
+        Returns
+        -------
+        Flask.Response
+            A response object representing the RequestTooLarge Error
+        """
+        exception_tuple = LambdaErrorResponses.RequestTooLargeException
+
+        return BaseLocalService.service_response(
+            LambdaErrorResponses._construct_error_response_body(
+                LambdaErrorResponses.USER_ERROR,
+                "Request must be smaller than {} bytes for the InvokeFunction operation".format(max_payload_size),
+            ),
+            LambdaErrorResponses._construct_headers(exception_tuple[0]),
+            exception_tuple[1],
+        )
+
     @staticmethod
     def not_implemented_locally(message):
         """
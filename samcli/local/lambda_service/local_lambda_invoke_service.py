@@ -30,7 +30,12 @@ class FunctionNamePathConverter(BaseConverter):
 
 
 class LocalLambdaInvokeService(BaseLocalService):
-    def __init__(self, lambda_runner, port, host, stderr=None, ssl_context=None):
+    SUPPORTED_INVOCATION_TYPES = ("RequestResponse", "Event")
+
+    # Maximum size in bytes of the request payload of synchronous invocations in the Lambda service
+    MAX_REQUEST_PAYLOAD_SIZE = 6 * 1024 * 1024
+
+    def __init__(self, lambda_runner, port, host, stderr=None, ssl_context=None, event_invoker=None):
         """
         Creates a Local Lambda Service that will only response to invoking a function
 
@@ -47,16 +52,22 @@ class LocalLambdaInvokeService(BaseLocalService):
             Defaults to None
         stderr io.BaseIO
             Optional stream where the stderr from Docker container should be written to
+        event_invoker samcli.local.lambda_service.event_invoker.EventInvoker
+            Optional. Invokes the functions of the Event invocations in the background, Event invocations are not
+            supported without it
         """
         super().__init__(lambda_runner.is_debugging(), port=port, host=host, ssl_context=ssl_context)
         self.lambda_runner = lambda_runner
         self.stderr = stderr
+        self.event_invoker = event_invoker
 
     def create(self):
         """
         Creates a Flask Application that can be started.
         """
         self._app = Flask(__name__)
+        # larger requests are rejected from their Content-Length before their body is read
+        self._app.config["MAX_CONTENT_LENGTH"] = self.MAX_REQUEST_PAYLOAD_SIZE
 
         # add converter to support nested stack function path
         self._app.url_map.converters["function_path"] = FunctionNamePathConverter
@@ -85,7 +96,9 @@ class LocalLambdaInvokeService(BaseLocalService):
             2. Query Parameters are sent to the endpoint
             3. The Request Content-Type is not application/json
             4. 'X-Amz-Log-Type' header is not 'None'
-            5. 'X-Amz-Invocation-Type' header is not 'RequestResponse'
+            5. 'X-Amz-Invocation-Type' header is not 'RequestResponse' or 'Event'
+
+        Requests larger than MAX_REQUEST_PAYLOAD_SIZE are rejected by Flask when reading their data
 
         Returns
         -------
@@ -96,15 +109,11 @@ class LocalLambdaInvokeService(BaseLocalService):
             If the request passes all validation
         """
         flask_request = request
-        request_data = flask_request.get_data()
-
-        if not request_data:
-            request_data = b"{}"
-
-        request_data = request_data.decode("utf-8")
+        request_data = LocalLambdaInvokeService._get_request_data()
 
         try:
-            json.loads(request_data)
+            # the document is only parsed here to validate it, the invocations receive the request data as is
+            json.loads(request_data.decode("utf-8"))
         except ValueError as json_error:
             LOG.debug("Request body was not json. Exception: %s", str(json_error))
             return LambdaErrorResponses.invalid_request_content(
@@ -125,10 +134,14 @@ class LocalLambdaInvokeService(BaseLocalService):
             )
 
         invocation_type = request_headers.get("X-Amz-Invocation-Type", "RequestResponse")
-        if invocation_type != "RequestResponse":
-            LOG.warning("invocation-type: %s is not supported. RequestResponse is only supported.", invocation_type)
+        if invocation_type not in LocalLambdaInvokeService.SUPPORTED_INVOCATION_TYPES:
+            LOG.warning(
+                "invocation-type: %s is not supported. RequestResponse and Event are only supported.", invocation_type
+            )
             return LambdaErrorResponses.not_implemented_locally(
-                "invocation-type: {} is not supported. RequestResponse is only supported.".format(invocation_type)
+                "invocation-type: {} is not supported. RequestResponse and Event are only supported.".format(
+                    invocation_type
+                )
             )
 
         return None
@@ -141,6 +154,35 @@ class LocalLambdaInvokeService(BaseLocalService):
         self._app.register_error_handler(500, LambdaErrorResponses.generic_service_exception)
         self._app.register_error_handler(404, LambdaErrorResponses.generic_path_not_found)
         self._app.register_error_handler(405, LambdaErrorResponses.generic_method_not_allowed)
+        self._app.register_error_handler(413, self._request_too_large)
+
+    def _request_too_large(self, *args):
+        """
+        Error handler of the requests larger than MAX_REQUEST_PAYLOAD_SIZE
+
+        Parameters
+        ----------
+        args list
+            List of arguments Flask passes to the method
+
+        Returns
+        -------
+        Flask.Response
+            A response object representing the RequestTooLarge Error
+        """
+        return LambdaErrorResponses.request_too_large(self.MAX_REQUEST_PAYLOAD_SIZE)
+
+    @staticmethod
+    def _get_request_data():
+        """
+        Returns the body of the request, read once by Flask and kept for the next calls
+
+        Returns
+        -------
+        bytes
+            The request body, or an empty JSON document if the request has no body
+        """
+        return request.get_data() or b"{}"
 
     def _invoke_request_handler(self, function_name):
         """
@@ -158,12 +200,11 @@ class LocalLambdaInvokeService(BaseLocalService):
         """
         flask_request = request
 
-        request_data = flask_request.get_data()
+        # the request data was validated in validate_request, it is passed as bytes to the containers, without copies
+        request_data = self._get_request_data()
 
-        if not request_data:
-            request_data = b"{}"
-
-        request_data = request_data.decode("utf-8")
+        if flask_request.headers.get("X-Amz-Invocation-Type") == "Event":
+            return self._invoke_event_request_handler(function_name, request_data)
 
         stdout_stream_string = io.StringIO()
         stdout_stream_bytes = io.BytesIO()
@@ -189,3 +230,39 @@ class LocalLambdaInvokeService(BaseLocalService):
             )
 
         return self.service_response(lambda_response, {"Content-Type": "application/json"}, 200)
+
+    def _invoke_event_request_handler(self, function_name, request_data):
+        """
+        Queues an Event invocation of the function, which runs once a worker of the event invoker is available
+
+        Parameters
+        ----------
+        function_name str
+            Name of the function to invoke
+        request_data bytes
+            The event to invoke the function with
+
+        Returns
+        -------
+        A Flask Response with the status code 202 as if it was returned from Lambda, or an error Response if the
+        invocation can't be queued
+        """
+        if not self.event_invoker:
+            return LambdaErrorResponses.not_implemented_locally(
+                "invocation-type: Event is not supported. RequestResponse is only supported."
+            )
+
+        function = self.lambda_runner.provider.get(function_name)
+        if not function:
+            LOG.debug("%s was not found to invoke.", function_name)
+            return LambdaErrorResponses.resource_not_found(function_name)
+        if function.inlinecode:
+            return LambdaErrorResponses.not_implemented_locally(
+                "Inline code is not supported for sam local commands. Please write your code in a separate file."
+            )
+
+        request_id = self.event_invoker.submit(function, request_data)
+        if not request_id:
+            return LambdaErrorResponses.too_many_requests("Too many Event invocations are waiting to be processed")
+
+        return self.service_response("", {"X-Amzn-RequestId": request_id}, 202)
@@ -9,13 +9,14 @@ import shutil
 import signal
 import tempfile
 import threading
-from typing import Dict, Optional, Union
+from typing import Dict, List, Optional, Union
 
 from samcli.lib.telemetry.metric import capture_parameter
 from samcli.lib.utils.file_observer import LambdaFunctionObserver
 from samcli.lib.utils.packagetype import ZIP
 from samcli.local.docker.container import Container
 from samcli.local.docker.container_analyzer import ContainerAnalyzer
+from samcli.local.docker.container_reaper import ContainerReaper
 from samcli.local.docker.exceptions import ContainerFailureError
 from samcli.local.docker.lambda_container import LambdaContainer
 
@@ -35,7 +36,7 @@ class LambdaRuntime:
 
     SUPPORTED_ARCHIVE_EXTENSIONS = (".zip", ".jar", ".ZIP", ".JAR")
 
-    def __init__(self, container_manager, image_builder):
+    def __init__(self, container_manager, image_builder, container_reaper: Optional[ContainerReaper] = None):
         """
         Initialize the Local Lambda runtime
 
@@ -45,10 +46,14 @@ class LambdaRuntime:
             Instance of the ContainerManager class that can run a local Docker container
         image_builder samcli.local.docker.lambda_image.LambdaImage
             Instance of the LambdaImage class that can create am image
+        container_reaper samcli.local.docker.container_reaper.ContainerReaper
+            Optional. Tears down the containers of the finished invokes in the background, instead of before
+            returning the invoke results. Its owner must drain it before exiting
         """
         self._container_manager = container_manager
         self._image_builder = image_builder
-        self._temp_uncompressed_paths_to_be_cleaned = []
+        self._container_reaper = container_reaper
+        self._temp_uncompressed_paths_to_be_cleaned: List[str] = []
         self._lock = threading.Lock()
 
     def create(
@@ -180,7 +185,7 @@ class LambdaRuntime:
         because the underlying implementation essentially blocks on a socket, which is synchronous.
 
         :param FunctionConfig function_config: Configuration of the function to invoke
-        :param event: String input event passed to Lambda function
+        :param event: Input event passed to Lambda function, a JSON document as a string or UTF-8 encoded bytes
         :param DebugContext debug_context: Debugging context for the function (includes port, args, and path)
         :param samcli.lib.utils.stream_writer.StreamWriter stdout: Optional.
             StreamWriter that receives stdout text from container.
@@ -224,9 +229,9 @@ class LambdaRuntime:
         finally:
             # We will be done with execution, if either the execution completed or an interrupt was fired
             # Any case, cleanup the container.
-            self._on_invoke_done(container)
+            self._on_invoke_done(container, debug_context)
 
-    def _on_invoke_done(self, container):
+    def _on_invoke_done(self, container, debug_context=None):
         """
         Cleanup the created resources, just before the invoke function ends
 
@@ -234,10 +239,19 @@ class LambdaRuntime:
         ----------
         container: Container
            The current running container
+        debug_context: DebugContext
+           Optional, debugging context the container was created with
         """
         if container:
-            self._check_exit_state(container)
-            self._container_manager.stop(container)
+            try:
+                self._check_exit_state(container)
+            finally:
+                # a container started for debugging binds the debug ports on the host, the next invoke can only bind
+                # them once the container is removed
+                if self._container_reaper and not debug_context:
+                    self._container_reaper.reap(container)
+                else:
+                    self._container_manager.stop(container)
         self._clean_decompressed_paths()
 
     def _check_exit_state(self, container: Container):
@@ -450,7 +464,7 @@ class WarmLambdaRuntime(LambdaRuntime):
 
         return container
 
-    def _on_invoke_done(self, container):
+    def _on_invoke_done(self, container, debug_context=None):
         """
         Cleanup the created resources, just before the invoke function ends.
         In warm containers, the running containers will be closed just before the end of te command execution,
@@ -460,6 +474,8 @@ class WarmLambdaRuntime(LambdaRuntime):
         ----------
         container: Container
            The current running container
+        debug_context: DebugContext
+           Optional, debugging context the container was created with
         """
 
     def _configure_interrupt(self, function_full_path, timeout, container, is_debugging):
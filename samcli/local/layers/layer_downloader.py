@@ -6,14 +6,16 @@ import logging
 from pathlib import Path
 from typing import List
 
-import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
 
 from samcli.commands.local.cli_common.user_exceptions import CredentialsRequired, ResourceNotFound
 from samcli.lib.providers.provider import LayerVersion, Stack
 from samcli.lib.utils.codeuri import resolve_code_path
+from samcli.lib.utils.lazy_import import lazy_import
 from samcli.local.lambdafn.remote_files import unzip_from_uri
 
+boto3 = lazy_import("boto3")
+
 LOG = logging.getLogger(__name__)
 
 
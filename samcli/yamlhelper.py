@@ -18,11 +18,10 @@ https://github.com/aws/aws-cli/blob/develop/awscli/customizations/cloudformation
 # pylint: disable=too-many-ancestors
 
 import json
+from collections import OrderedDict
 from typing import Dict, Optional, cast
 
 import yaml
-from botocore.compat import OrderedDict
-from samtranslator.utils.py27hash_fix import Py27Dict, Py27UniStr
 from yaml.nodes import ScalarNode, SequenceNode
 
 TAG_STR = "tag:yaml.org,2002:str"
@@ -98,6 +97,9 @@ def yaml_dump(dict_to_dump):
     :param dict_to_dump:
     :return:
     """
+    # samtranslator is slow to import and only needed to dump templates which went through the translator
+    from samtranslator.utils.py27hash_fix import Py27Dict, Py27UniStr
+
     CfnDumper.add_representer(OrderedDict, _dict_representer)
     CfnDumper.add_representer(str, string_representer)
     CfnDumper.add_representer(Py27Dict, _dict_representer)
@@ -111,6 +113,25 @@ def _dict_constructor(loader, node):
     return OrderedDict(loader.construct_pairs(node))
 
 
+# Use the libyaml backed loader when PyYAML was built with it, it is an order of magnitude faster
+# than the pure Python implementation on large templates
+_BaseSafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+class CfnLoader(_BaseSafeLoader):  # type: ignore
+    """
+    Safe YAML loader which understands CloudFormation intrinsic short forms and keeps mapping order.
+
+    Constructors are registered on this class only (once, at import time) so that the global
+    ``yaml.SafeLoader`` used by other libraries is left untouched.
+    """
+
+
+CfnLoader.add_constructor(TIMESTAMP_TAG, CfnLoader.yaml_constructors[TAG_STR])
+CfnLoader.add_constructor(yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _dict_constructor)
+CfnLoader.add_multi_constructor("!", intrinsics_multi_constructor)
+
+
 def yaml_parse(yamlstr) -> Dict:
     """Parse a yaml string"""
     try:
@@ -119,12 +140,7 @@ def yaml_parse(yamlstr) -> Dict:
         # json parser.
         return cast(Dict, json.loads(yamlstr, object_pairs_hook=OrderedDict))
     except ValueError:
-        yaml.constructor.SafeConstructor.yaml_constructors[TIMESTAMP_TAG] = (
-            yaml.constructor.SafeConstructor.yaml_constructors[TAG_STR]
-        )
-        yaml.SafeLoader.add_constructor(yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _dict_constructor)
-        yaml.SafeLoader.add_multi_constructor("!", intrinsics_multi_constructor)
-        return cast(Dict, yaml.safe_load(yamlstr))
+        return cast(Dict, yaml.load(yamlstr, Loader=CfnLoader))  # nosec B506 - CfnLoader is a SafeLoader
 
 
 def parse_yaml_file(file_path, extra_context: Optional[Dict] = None) -> Dict:
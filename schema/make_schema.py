@@ -139,6 +139,10 @@ def format_param(param: click.core.Option) -> SamCliParameterSchema:
             formatted_param_types.append("string")
         elif param_name == "list":
             formatted_param_types.append("array")
+        elif param_name == "integer range":
+            formatted_param_types.append("integer")
+        elif param_name in ["float", "float range"]:
+            formatted_param_types.append("number")
         else:
             formatted_param_types.append(param_name or "string")
     formatted_param_types = sorted(list(set(formatted_param_types)))  # deduplicate
@@ -189,7 +193,12 @@ def retrieve_command_structure(package_name: str) -> List[SamCliCommandSchema]:
     command = []
 
     if isinstance(module.cli, click.core.Group):  # command has subcommands (e.g. local invoke)
-        for subcommand in module.cli.commands.values():
+        # subcommands of lazy groups are only loaded by get_command, so they can't be read from `commands`
+        ctx = click.Context(module.cli)
+        for subcommand_name in module.cli.list_commands(ctx):
+            subcommand = module.cli.get_command(ctx, subcommand_name)
+            if subcommand is None:
+                continue
             cmd_name = SamConfig.to_key([module.__name__.split(".")[-1], str(subcommand.name)])
             command.append(
                 SamCliCommandSchema(
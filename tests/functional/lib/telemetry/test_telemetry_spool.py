@@ -0,0 +1,110 @@
+import json
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from samcli.lib.telemetry.spool import TelemetrySpool
+from samcli.lib.telemetry.telemetry import Telemetry
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.received_payloads.append(json.loads(body))
+        self.send_response(self.server.status_code)
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestTelemetrySpoolDelivery(TestCase):
+    def setUp(self):
+        self.server = HTTPServer(("127.0.0.1", 0), _MetricsHandler)
+        self.server.received_payloads = []
+        self.server.status_code = 200
+        self.server_thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.server_thread.start()
+        self.url = "http://127.0.0.1:{}/metrics".format(self.server.server_port)
+
+        self.spool_dir = Path(tempfile.mkdtemp())
+        self.gc_patcher = patch("samcli.lib.telemetry.telemetry.GlobalConfig")
+        gc_mock = self.gc_patcher.start()
+        gc_mock.return_value.telemetry_enabled = True
+        self.schedule_patcher = patch("samcli.lib.telemetry.telemetry._schedule_background_sender")
+        self.schedule_patcher.start()
+
+    def tearDown(self):
+        self.schedule_patcher.stop()
+        self.gc_patcher.stop()
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.spool_dir)
+
+    def _emit(self, telemetry, count):
+        for index in range(count):
+            metric = Mock()
+            metric.get_metric_name.return_value = "commandRun"
+            metric.get_data.return_value = {"index": index}
+            telemetry.emit(metric)
+
+    def _received_metrics(self):
+        return [metric for payload in self.server.received_payloads for metric in payload["metrics"]]
+
+    def test_spooled_metrics_are_delivered_in_batches(self):
+        telemetry = Telemetry(url=self.url, spool=TelemetrySpool(self.spool_dir, max_batch_size=4))
+        self._emit(telemetry, 10)
+
+        self.assertEqual(self.server.received_payloads, [])
+
+        delivered = telemetry.flush()
+
+        self.assertEqual(delivered, 10)
+        self.assertEqual(len(self.server.received_payloads), 3)
+        self.assertEqual([m["commandRun"]["index"] for m in self._received_metrics()], list(range(10)))
+
+    def test_detached_sender_process_delivers_spool(self):
+        telemetry = Telemetry(url=self.url, spool=TelemetrySpool(self.spool_dir))
+        self._emit(telemetry, 3)
+
+        subprocess.run(
+            [sys.executable, "-m", "samcli.lib.telemetry.spool", "--url", self.url, "--spool-dir", str(self.spool_dir)],
+            check=True,
+            timeout=60,
+        )
+
+        self.assertEqual(len(self._received_metrics()), 3)
+        self.assertFalse(telemetry.spool.has_pending())
+
+    def test_metrics_are_kept_when_endpoint_is_down(self):
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            unreachable_url = "http://127.0.0.1:{}/metrics".format(sock.getsockname()[1])
+
+        telemetry = Telemetry(url=unreachable_url, spool=TelemetrySpool(self.spool_dir))
+        start = time.perf_counter()
+        self._emit(telemetry, 5)
+        emit_duration = time.perf_counter() - start
+
+        self.assertLess(emit_duration, 1)
+        self.assertEqual(telemetry.flush(), 0)
+        self.assertTrue(telemetry.spool.has_pending())
+
+        # next invocation with a reachable endpoint delivers what was left behind
+        self.assertEqual(Telemetry(url=self.url, spool=TelemetrySpool(self.spool_dir)).flush(), 5)
+
+    def test_metrics_are_kept_on_server_errors(self):
+        self.server.status_code = 500
+        telemetry = Telemetry(url=self.url, spool=TelemetrySpool(self.spool_dir))
+        self._emit(telemetry, 2)
+
+        self.assertEqual(telemetry.flush(), 0)
+        self.assertTrue(telemetry.spool.has_pending())
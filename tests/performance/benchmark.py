@@ -0,0 +1,105 @@
+"""
+Base class of the performance tests, which compares measured timings against the JSON baselines
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+from unittest import TestCase
+
+BASELINES_FILE = Path(__file__).parent.joinpath("baselines.json")
+
+# Set to re-record the baselines of the benchmarks which are run, instead of checking them
+UPDATE_BASELINES_ENV_VAR = "SAM_CLI_PERF_UPDATE_BASELINES"
+# Multiplier applied to every threshold, ex. to run the suite on a host slower than the one baselines were recorded on
+TOLERANCE_ENV_VAR = "SAM_CLI_PERF_TOLERANCE"
+
+# Maximum accepted slowdown compared to the baseline, unless a benchmark sets its own threshold
+DEFAULT_THRESHOLD = 2.0
+
+_baselines_lock = threading.Lock()
+
+
+def load_baselines() -> Dict[str, Dict[str, float]]:
+    if not BASELINES_FILE.exists():
+        return {}
+    baselines: Dict[str, Dict[str, float]] = json.loads(BASELINES_FILE.read_text(encoding="utf-8"))
+    return baselines
+
+
+def update_baseline(name: str, seconds: float, threshold: float) -> None:
+    with _baselines_lock:
+        baselines = load_baselines()
+        baselines[name] = {"seconds": round(seconds, 6), "threshold": threshold}
+        BASELINES_FILE.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def measure(func: Callable[[], Any], repeat: int = 5, setup: Optional[Callable[[], Any]] = None) -> float:
+    """
+    Runs ``func`` ``repeat`` times and returns the fastest run in seconds, which filters out noise from the host.
+    ``setup`` is called before each run and is not measured.
+    """
+    timings = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+class PerformanceTestCase(TestCase):
+    """
+    Test case providing ``benchmark``, which times a callable and fails if it regressed past its baseline
+    """
+
+    def benchmark(
+        self,
+        name: str,
+        func: Callable[[], Any],
+        repeat: int = 5,
+        setup: Optional[Callable[[], Any]] = None,
+        threshold: float = DEFAULT_THRESHOLD,
+    ) -> float:
+        """
+        Runs ``func`` ``repeat`` times and compares the fastest run against the baseline named ``name``
+
+        Parameters
+        ----------
+        name : str
+            Name of the baseline in baselines.json
+        func : Callable
+            Code being measured
+        repeat : int
+            Number of measured runs, the fastest one is kept
+        setup : Callable
+            Optional, called before each run and not measured
+        threshold : float
+            Maximum accepted ratio between the measured time and the baseline
+
+        Returns
+        -------
+        float
+            Fastest measured run, in seconds
+        """
+        best = measure(func, repeat, setup)
+
+        if os.environ.get(UPDATE_BASELINES_ENV_VAR):
+            update_baseline(name, best, threshold)
+            return best
+
+        baseline = load_baselines().get(name)
+        if not baseline:
+            self.fail(f"No baseline recorded for {name}, run with {UPDATE_BASELINES_ENV_VAR}=1 to record it")
+
+        tolerance = float(os.environ.get(TOLERANCE_ENV_VAR, "1"))
+        limit = baseline["seconds"] * baseline.get("threshold", threshold) * tolerance
+        print(f"{name}: {best:.4f}s (baseline {baseline['seconds']:.4f}s, limit {limit:.4f}s)")
+        self.assertLessEqual(
+            best, limit, f"{name} regressed: {best:.4f}s against a baseline of {baseline['seconds']:.4f}s"
+        )
+        return best
@@ -0,0 +1,124 @@
+"""
+Generators of large, synthetic inputs for the performance tests. Everything is generated locally, so the suite runs
+without Docker and without AWS credentials.
+"""
+
+import os
+from typing import Dict, Optional
+
+from samcli.yamlhelper import yaml_dump
+
+
+def generate_function_resources(function_count: int, prefix: str = "Function") -> Dict:
+    """
+    Returns serverless function resources, each with its own code directory, environment variables referencing
+    other resources and an API event
+    """
+    resources = {}
+    for index in range(function_count):
+        resources[f"{prefix}{index}"] = {
+            "Type": "AWS::Serverless::Function",
+            "Properties": {
+                "CodeUri": f"functions/function{index}",
+                "Handler": "app.handler",
+                "Runtime": "python3.12",
+                "MemorySize": {"Fn::If": ["IsProduction", 1024, 256]},
+                "Environment": {
+                    "Variables": {
+                        "TABLE": {"Ref": "Table"},
+                        "QUEUE": {"Fn::GetAtt": ["Queue", "Arn"]},
+                        "STAGE": {"Fn::Sub": "${Stage}-" + str(index)},
+                    }
+                },
+                "Events": {
+                    "Api": {
+                        "Type": "Api",
+                        "Properties": {"Path": f"/{prefix.lower()}{index}/{{id}}", "Method": "get"},
+                    }
+                },
+            },
+        }
+    return resources
+
+
+def generate_template(function_count: int, extra_resources: Optional[Dict] = None) -> Dict:
+    """
+    Returns a SAM template with ``function_count`` functions sharing a table and a queue
+    """
+    resources = generate_function_resources(function_count)
+    resources["Table"] = {"Type": "AWS::Serverless::SimpleTable"}
+    resources["Queue"] = {"Type": "AWS::SQS::Queue"}
+    resources.update(extra_resources or {})
+    return {
+        "AWSTemplateFormatVersion": "2010-09-09",
+        "Transform": "AWS::Serverless-2016-10-31",
+        "Parameters": {"Stage": {"Type": "String", "Default": "dev"}},
+        "Conditions": {"IsProduction": {"Fn::Equals": [{"Ref": "Stage"}, "prod"]}},
+        "Resources": resources,
+    }
+
+
+def generate_swagger(path_count: int, function_name: str = "Function0") -> Dict:
+    """
+    Returns an OpenAPI 2.0 body with ``path_count`` paths, each integrated with the given function
+    """
+    uri = {
+        "Fn::Sub": "arn:aws:apigateway:${AWS::Region}:lambda:path/2015-03-31/functions/"
+        f"${{{function_name}.Arn}}/invocations"
+    }
+    paths = {}
+    for index in range(path_count):
+        paths[f"/resource{index}/{{id}}"] = {
+            method: {
+                "parameters": [{"name": "id", "in": "path", "required": True, "type": "string"}],
+                "responses": {"200": {"description": "OK"}},
+                "x-amazon-apigateway-integration": {"type": "aws_proxy", "httpMethod": "POST", "uri": uri},
+            }
+            for method in ("get", "post", "delete")
+        }
+    return {"swagger": "2.0", "info": {"title": "Generated", "version": "1.0"}, "paths": paths}
+
+
+def write_template(path: str, template: Dict) -> str:
+    with open(path, "w", encoding="utf-8") as fp:
+        fp.write(yaml_dump(template))
+    # like a template which wasn't just edited, which get_template_data memoizes
+    modification_time = os.stat(path).st_mtime - 60
+    os.utime(path, (modification_time, modification_time))
+    return path
+
+
+def write_nested_stacks(root_dir: str, depth: int, functions_per_stack: int) -> str:
+    """
+    Writes a chain of ``depth`` nested stacks, each with ``functions_per_stack`` functions and the next stack as an
+    AWS::Serverless::Application resource. Returns the path of the root template.
+    """
+    child_location: Optional[str] = None
+    for level in reversed(range(depth)):
+        extra_resources: Dict = {}
+        if child_location:
+            extra_resources["ChildStack"] = {
+                "Type": "AWS::Serverless::Application",
+                "Properties": {"Location": child_location, "Parameters": {"Stage": {"Ref": "Stage"}}},
+            }
+        stack_dir = os.path.join(root_dir, f"level{level}")
+        os.makedirs(stack_dir, exist_ok=True)
+        template_path = write_template(
+            os.path.join(stack_dir, "template.yaml"), generate_template(functions_per_stack, extra_resources)
+        )
+        child_location = os.path.relpath(template_path, os.path.join(root_dir, f"level{level - 1}"))
+    return os.path.join(root_dir, "level0", "template.yaml")
+
+
+def write_code_tree(root_dir: str, directory_count: int, files_per_directory: int, file_size: int) -> str:
+    """
+    Writes a synthetic code tree, similar to a function with vendored dependencies
+    """
+    content = (b"def handler(event, context):\n    return event\n" * (file_size // 46 + 1))[:file_size]
+    for directory_index in range(directory_count):
+        directory = os.path.join(root_dir, f"package{directory_index}", "module")
+        os.makedirs(directory, exist_ok=True)
+        for file_index in range(files_per_directory):
+            with open(os.path.join(directory, f"file{file_index}.py"), "wb") as fp:
+                fp.write(content)
+    return root_dir
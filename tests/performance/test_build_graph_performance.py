@@ -0,0 +1,47 @@
+import os
+import shutil
+import tempfile
+
+from samcli.lib.build.build_graph import BuildGraph, FunctionBuildDefinition
+from samcli.lib.providers.sam_function_provider import SamFunctionProvider
+from samcli.lib.providers.sam_stack_provider import SamLocalStackProvider
+from samcli.lib.utils.architecture import X86_64
+from samcli.lib.utils.packagetype import ZIP
+from tests.performance.benchmark import PerformanceTestCase
+from tests.performance.fixtures import generate_template
+
+FUNCTION_COUNT = 300
+
+
+class TestBuildGraphPerformance(PerformanceTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.build_dir = os.path.join(cls.temp_dir, ".aws-sam", "build")
+        os.makedirs(cls.build_dir)
+        stacks, _ = SamLocalStackProvider.get_stacks(template_dictionary=generate_template(FUNCTION_COUNT))
+        cls.functions = list(SamFunctionProvider(stacks).get_all())
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.temp_dir)
+
+    def _write_build_graph(self):
+        build_graph = BuildGraph(self.build_dir)
+        for function in self.functions:
+            build_definition = FunctionBuildDefinition(
+                function.runtime, function.codeuri, ZIP, X86_64, function.metadata, function.handler, "source_hash"
+            )
+            build_graph.put_function_build_definition(build_definition, function)
+        build_graph.clean_redundant_definitions_and_update(persist=True)
+        return build_graph
+
+    def test_write(self):
+        self.assertEqual(len(self._write_build_graph().get_function_build_definitions()), FUNCTION_COUNT)
+
+        self.benchmark("BuildGraph.write", self._write_build_graph, repeat=3)
+
+    def test_read(self):
+        self._write_build_graph()
+
+        self.benchmark("BuildGraph.read", lambda: BuildGraph(self.build_dir), repeat=3)
@@ -0,0 +1,49 @@
+import json
+from unittest.mock import Mock
+
+from samcli.lib.providers.provider import Api
+from samcli.local.apigw.local_apigw_service import LocalApigwService
+from samcli.local.apigw.route import Route
+from tests.performance.benchmark import PerformanceTestCase
+
+ROUTE_COUNT = 500
+REQUEST_COUNT = 200
+
+
+class StubLambdaRunner:
+    """
+    Stands in for LocalLambdaRunner, answering every invoke with a proxy integration response without any container
+    """
+
+    RESPONSE = json.dumps({"statusCode": 200, "headers": {"Content-Type": "application/json"}, "body": '{"ok": true}'})
+
+    def is_debugging(self):
+        return False
+
+    def invoke(self, function_identifier, event, stdout=None, stderr=None, **kwargs):
+        stdout.write_str(self.RESPONSE)
+
+
+class TestLocalApigwServicePerformance(PerformanceTestCase):
+    def setUp(self):
+        routes = [
+            Route(function_name=f"Function{index}", path=f"/resource{index}/{{id}}", methods=["GET", "POST"])
+            for index in range(ROUTE_COUNT)
+        ]
+        self.service = LocalApigwService(Api(routes=routes), StubLambdaRunner(), port=3000, stderr=Mock())
+        self.service.create()
+        self.client = self.service._app.test_client()
+
+    def test_dispatch(self):
+        response = self.client.get(f"/resource{ROUTE_COUNT - 1}/1")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json(), {"ok": True})
+
+        def dispatch():
+            for index in range(REQUEST_COUNT):
+                self.client.get(f"/resource{index % ROUTE_COUNT}/{index}")
+
+        self.benchmark("LocalApigwService.dispatch", dispatch, repeat=3)
+
+    def test_create(self):
+        self.benchmark("LocalApigwService.create", self.service.create, repeat=3)
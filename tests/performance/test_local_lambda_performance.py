@@ -0,0 +1,39 @@
+import json
+
+from samcli.local.lambda_service.local_lambda_invoke_service import LocalLambdaInvokeService
+from tests.performance.benchmark import PerformanceTestCase
+
+INVOKE_PATH = "/2015-03-31/functions/HelloWorld/invocations"
+PAYLOAD_SIZE = 5 * 1024 * 1024
+REQUEST_COUNT = 5
+
+
+class StubLambdaRunner:
+    """
+    Stands in for LocalLambdaRunner, answering every invoke with the size of its event without any container
+    """
+
+    def is_debugging(self):
+        return False
+
+    def invoke(self, function_identifier, event, stdout=None, stderr=None, **kwargs):
+        stdout.write_str(json.dumps({"size": len(event)}))
+
+
+class TestLocalLambdaServicePerformance(PerformanceTestCase):
+    def setUp(self):
+        service = LocalLambdaInvokeService(StubLambdaRunner(), port=3001, host="127.0.0.1")
+        service.create()
+        self.client = service._app.test_client()
+
+    def test_invoke_with_large_payload(self):
+        payload = json.dumps({"data": "x" * (PAYLOAD_SIZE - len('{"data": ""}'))}).encode("utf-8")
+        response = self.client.post(INVOKE_PATH, data=payload)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json(), {"size": PAYLOAD_SIZE})
+
+        def invoke():
+            for _ in range(REQUEST_COUNT):
+                self.client.post(INVOKE_PATH, data=payload)
+
+        self.benchmark("LocalLambdaInvokeService.invoke.large_payload", invoke, repeat=3)
@@ -0,0 +1,71 @@
+import os
+import shutil
+import tempfile
+import time
+
+from samcli.lib.package.permissions import AdditiveDirPermissionPermissionMapper, AdditiveFilePermissionPermissionMapper
+from samcli.lib.package.utils import make_zip_with_permissions
+from samcli.lib.utils.hash import DirectoryDigest, dir_checksum, load_directory_digest
+from tests.performance.benchmark import PerformanceTestCase
+from tests.performance.fixtures import write_code_tree
+
+DIRECTORY_COUNT = 100
+FILES_PER_DIRECTORY = 20
+FILE_SIZE = 4096
+
+
+class TestPackagePerformance(PerformanceTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.code_dir = write_code_tree(
+            os.path.join(cls.temp_dir, "code"), DIRECTORY_COUNT, FILES_PER_DIRECTORY, FILE_SIZE
+        )
+        cls.output_dir = os.path.join(cls.temp_dir, "output")
+        os.makedirs(cls.output_dir)
+        # age the files, recently modified files are always re-hashed by DirectoryDigest
+        modification_time = time.time() - 60
+        for dirpath, _, filenames in os.walk(cls.code_dir):
+            for filename in filenames:
+                os.utime(os.path.join(dirpath, filename), (modification_time, modification_time))
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.temp_dir)
+
+    def test_dir_checksum(self):
+        self.benchmark("dir_checksum.code_tree", lambda: dir_checksum(self.code_dir))
+
+    def test_directory_digest_single_file_update(self):
+        digest = DirectoryDigest(self.code_dir)
+        changed_file = os.path.join(self.code_dir, "package0", "module", "file0.py")
+        revisions = iter(range(1000))
+
+        def change_file():
+            with open(changed_file, "w") as fp:
+                fp.write(f"REVISION = {next(revisions)}\n")
+
+        self.benchmark(
+            "DirectoryDigest.update.single_file",
+            lambda: (digest.update([changed_file]), digest.digest),
+            setup=change_file,
+        )
+
+    def test_load_directory_digest_unchanged_code_tree(self):
+        digest_path = os.path.join(self.output_dir, "digest.json")
+        load_directory_digest(digest_path, self.code_dir)
+
+        self.benchmark("load_directory_digest.code_tree", lambda: load_directory_digest(digest_path, self.code_dir))
+
+    def test_make_zip_with_permissions(self):
+        permission_mappers = [
+            AdditiveFilePermissionPermissionMapper(permissions=0o444),
+            AdditiveDirPermissionPermissionMapper(permissions=0o111),
+        ]
+        zip_file_base = os.path.join(self.output_dir, "code")
+
+        self.benchmark(
+            "make_zip_with_permissions.code_tree",
+            lambda: make_zip_with_permissions(zip_file_base, self.code_dir, permission_mappers),
+            repeat=3,
+        )
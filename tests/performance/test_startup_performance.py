@@ -0,0 +1,22 @@
+import subprocess
+import sys
+
+from tests.performance.benchmark import PerformanceTestCase
+
+
+def run_sam(*args: str) -> None:
+    subprocess.run([sys.executable, "-m", "samcli", *args], capture_output=True, check=True)
+
+
+class TestStartupPerformance(PerformanceTestCase):
+    def test_version(self):
+        self.benchmark("startup.version", lambda: run_sam("--version"))
+
+    def test_root_help(self):
+        self.benchmark("startup.help", lambda: run_sam("--help"))
+
+    def test_group_help(self):
+        self.benchmark("startup.local_help", lambda: run_sam("local", "--help"))
+
+    def test_command_help(self):
+        self.benchmark("startup.build_help", lambda: run_sam("build", "--help"))
@@ -0,0 +1,56 @@
+from typing import Any, List
+from unittest.mock import Mock
+
+from samcli.lib.sync.sync_flow import ApiCallTypes, ResourceAPICall, SyncFlow
+from samcli.lib.sync.sync_flow_executor import SyncFlowExecutor
+from tests.performance.benchmark import PerformanceTestCase
+
+FLOW_COUNT = 200
+SHARED_LAYER_COUNT = 10
+
+
+class NoOpSyncFlow(SyncFlow):
+    """
+    SyncFlow which only locks on a shared layer, so that the benchmark measures the executor's scheduling overhead
+    """
+
+    def __init__(self, index: int, dependencies: List[SyncFlow]):
+        sync_context = Mock()
+        sync_context.get_resource_latest_sync_hash.return_value = None
+        super().__init__(Mock(), Mock(), sync_context, {}, f"NoOpSyncFlow{index}")
+        self._index = index
+        self._dependencies = dependencies
+
+    @property
+    def sync_state_identifier(self) -> str:
+        return self.log_name
+
+    def gather_resources(self) -> None:
+        pass
+
+    def compare_remote(self) -> bool:
+        return False
+
+    def sync(self) -> None:
+        pass
+
+    def gather_dependencies(self) -> List[SyncFlow]:
+        return self._dependencies
+
+    def _get_resource_api_calls(self) -> List[ResourceAPICall]:
+        return [ResourceAPICall(f"Layer{self._index % SHARED_LAYER_COUNT}", [ApiCallTypes.BUILD])]
+
+    def _equality_keys(self) -> Any:
+        return self._index
+
+
+class TestSyncFlowExecutorPerformance(PerformanceTestCase):
+    def _execute(self):
+        executor = SyncFlowExecutor()
+        for index in range(FLOW_COUNT):
+            # every flow has a dependent flow, so the executor goes through several scheduling rounds
+            executor.add_sync_flow(NoOpSyncFlow(index, [NoOpSyncFlow(FLOW_COUNT + index, [])]))
+        executor.execute()
+
+    def test_scheduling(self):
+        self.benchmark("SyncFlowExecutor.execute", self._execute, repeat=3)
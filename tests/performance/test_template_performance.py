@@ -0,0 +1,113 @@
+import os
+import shutil
+import tempfile
+from copy import deepcopy
+
+import yaml
+
+from samcli.commands._utils.template import (
+    clear_template_cache,
+    get_template_data,
+    get_template_function_resource_ids,
+)
+from samcli.lib.intrinsic_resolver.intrinsic_property_resolver import IntrinsicResolver
+from samcli.lib.intrinsic_resolver.intrinsics_symbol_table import IntrinsicsSymbolTable
+from samcli.lib.providers.sam_base_provider import SamBaseProvider
+from samcli.lib.providers.sam_stack_provider import SamLocalStackProvider
+from samcli.lib.samlib.wrapper import SamTranslatorWrapper
+from samcli.lib.utils.packagetype import ZIP
+from samcli.yamlhelper import CfnLoader, yaml_dump, yaml_parse
+from tests.performance.benchmark import PerformanceTestCase, measure
+from tests.performance.fixtures import generate_swagger, generate_template, write_nested_stacks, write_template
+
+FUNCTION_COUNT = 300
+NESTED_STACK_DEPTH = 6
+NESTED_STACK_FUNCTION_COUNT = 40
+SWAGGER_PATH_COUNT = 500
+
+
+class TestTemplatePerformance(PerformanceTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.template = generate_template(
+            FUNCTION_COUNT,
+            {
+                "RestApi": {
+                    "Type": "AWS::Serverless::Api",
+                    "Properties": {"StageName": "prod", "DefinitionBody": generate_swagger(SWAGGER_PATH_COUNT)},
+                }
+            },
+        )
+        cls.template_str = yaml_dump(cls.template)
+        cls.template_file = write_template(os.path.join(cls.temp_dir, "template.yaml"), cls.template)
+        cls.nested_template_file = write_nested_stacks(
+            os.path.join(cls.temp_dir, "nested"), NESTED_STACK_DEPTH, NESTED_STACK_FUNCTION_COUNT
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        clear_template_cache()
+        shutil.rmtree(cls.temp_dir)
+
+    def test_yaml_parse(self):
+        self.benchmark("yaml_parse.large_template", lambda: yaml_parse(self.template_str))
+
+    def test_yaml_parse_libyaml_is_faster_than_pure_python(self):
+        if not yaml.__with_libyaml__:
+            self.skipTest("PyYAML is not built with libyaml")
+
+        class PurePythonCfnLoader(yaml.SafeLoader):
+            yaml_constructors = CfnLoader.yaml_constructors
+            yaml_multi_constructors = CfnLoader.yaml_multi_constructors
+
+        expected = yaml.load(self.template_str, Loader=PurePythonCfnLoader)  # nosec B506
+        self.assertEqual(yaml_parse(self.template_str), expected)
+
+        libyaml_time = measure(lambda: yaml_parse(self.template_str), repeat=3)
+        pure_python_time = measure(
+            lambda: yaml.load(self.template_str, Loader=PurePythonCfnLoader), repeat=3  # nosec B506
+        )
+        self.assertLess(libyaml_time, pure_python_time)
+
+    def test_get_template_data_cached(self):
+        get_template_data(self.template_file)
+        self.benchmark("get_template_data.cached_large_template", lambda: get_template_data(self.template_file))
+
+    def test_get_template_function_resource_ids_cached(self):
+        get_template_data(self.template_file)
+        # reads the memoized template without copying it
+        self.benchmark(
+            "get_template_function_resource_ids.cached_large_template",
+            lambda: get_template_function_resource_ids(self.template_file, ZIP),
+        )
+
+    def test_get_stacks(self):
+        self.benchmark(
+            "SamLocalStackProvider.get_stacks.large_template",
+            lambda: SamLocalStackProvider.get_stacks(self.template_file),
+            repeat=3,
+        )
+
+    def test_get_stacks_nested(self):
+        stacks, _ = SamLocalStackProvider.get_stacks(self.nested_template_file)
+        self.assertEqual(len(stacks), NESTED_STACK_DEPTH)
+
+        self.benchmark(
+            "SamLocalStackProvider.get_stacks.nested_stacks",
+            lambda: SamLocalStackProvider.get_stacks(self.nested_template_file),
+            repeat=3,
+        )
+
+    def test_resolve_template(self):
+        parameters = SamBaseProvider._get_parameter_values(self.template, None)
+        translated = SamTranslatorWrapper(deepcopy(self.template), parameter_values=parameters).run_plugins()
+
+        def resolve():
+            resolver = IntrinsicResolver(
+                template=translated,
+                symbol_resolver=IntrinsicsSymbolTable(logical_id_translator=parameters, template=translated),
+            )
+            resolver.resolve_template(ignore_errors=True)
+
+        self.benchmark("IntrinsicResolver.resolve_template.large_template", resolve, repeat=3)
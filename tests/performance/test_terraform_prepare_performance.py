@@ -0,0 +1,20 @@
+from samcli.hook_packages.terraform.hooks.prepare.translate import translate_to_cfn
+from tests.performance.benchmark import PerformanceTestCase
+from tests.unit.hook_packages.terraform.hooks.prepare.plan_generator import generate_terraform_plan
+
+# Lambda functions, layers and API Gateway resources, methods and integrations of the plan, 5 resources per unit
+PLAN_SIZE = 2000
+
+
+class TestTerraformPreparePerformance(PerformanceTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tf_json = generate_terraform_plan(PLAN_SIZE)
+
+    def test_translate_large_plan(self):
+        # resources are linked with lookup tables, a quadratic linking is ~16 times slower than the baseline
+        self.benchmark(
+            "translate_to_cfn.large_terraform_plan",
+            lambda: translate_to_cfn(self.tf_json, "/output/dir", "/app/root", "/project/root"),
+            repeat=3,
+        )
@@ -1,10 +1,14 @@
+import importlib
 from contextlib import contextmanager
 
 import click
 
 from unittest import TestCase
 from unittest.mock import Mock, patch, call
-from samcli.cli.command import BaseCommand
+
+from parameterized import parameterized
+
+from samcli.cli.command import BaseCommand, LazyGroup
 from samcli.cli.formatters import RootCommandHelpTextFormatter
 from samcli.cli.root.command_list import SAM_CLI_COMMANDS
 
@@ -209,3 +213,68 @@ class TestBaseCommand(TestCase):
         ):
             cmd.format_commands(ctx, formatter)
             self.assertEqual(formatter.data, expected_output)
+
+
+class TestLazyGroup(TestCase):
+    def setUp(self):
+        self.subcommand = click.Command("sub", callback=lambda: None, short_help="Loaded short help.")
+        self.group = LazyGroup(
+            "group",
+            lazy_subcommands={"sub": ("a.b.sub", "Registered short help."), "other": ("a.b.other", "Other command.")},
+        )
+        self.ctx = click.Context(self.group)
+
+    def test_list_commands_includes_lazy_and_loaded_commands(self):
+        self.group.add_command(click.Command("loaded"))
+
+        self.assertEqual(self.group.list_commands(self.ctx), ["loaded", "other", "sub"])
+
+    @patch("samcli.cli.command.importlib")
+    def test_get_command_imports_package_once(self, importlib_mock):
+        importlib_mock.import_module.return_value = Mock(cli=self.subcommand)
+
+        self.assertIs(self.group.get_command(self.ctx, "sub"), self.subcommand)
+        self.assertIs(self.group.get_command(self.ctx, "sub"), self.subcommand)
+
+        importlib_mock.import_module.assert_called_once_with("a.b.sub")
+
+    @patch("samcli.cli.command.importlib")
+    def test_get_command_unknown_command(self, importlib_mock):
+        self.assertIsNone(self.group.get_command(self.ctx, "unknown"))
+
+        importlib_mock.import_module.assert_not_called()
+
+    @patch("samcli.cli.command.importlib")
+    def test_help_doesnt_import_subcommands(self, importlib_mock):
+        help_text = self.group.get_help(self.ctx)
+
+        self.assertIn("Registered short help.", help_text)
+        self.assertIn("Other command.", help_text)
+        importlib_mock.import_module.assert_not_called()
+
+    @patch("samcli.cli.command.importlib")
+    def test_help_uses_loaded_command(self, importlib_mock):
+        importlib_mock.import_module.return_value = Mock(cli=self.subcommand)
+        self.group.get_command(self.ctx, "sub")
+
+        help_text = self.group.get_help(self.ctx)
+
+        self.assertIn("Loaded short help.", help_text)
+        self.assertNotIn("Registered short help.", help_text)
+
+    @parameterized.expand(
+        [
+            ("samcli.commands.local.local",),
+            ("samcli.commands.list.list",),
+            ("samcli.commands.pipeline.pipeline",),
+            ("samcli.commands.remote.remote",),
+            ("samcli.commands.remote.test_event.test_event",),
+        ]
+    )
+    def test_registry_matches_subcommands(self, group_module):
+        group = importlib.import_module(group_module).cli
+
+        for name, (package, short_help) in group.lazy_subcommands.items():
+            command = importlib.import_module(package).cli
+            self.assertEqual(command.name, name)
+            self.assertEqual(short_help, command.get_short_help_str(limit=1000), f"{name} short help is outdated")
@@ -0,0 +1,63 @@
+"""
+Guards the startup time of the CLI: the root command and the command packages it loads must not import the heavy
+modules, which are only needed once a command runs.
+"""
+
+import subprocess
+import sys
+from typing import Dict
+from unittest import TestCase
+
+from parameterized import parameterized
+
+from samcli.cli.command import _SAM_CLI_COMMAND_PACKAGES
+
+# Modules which take tens to hundreds of milliseconds to import, and must be imported when they are first used
+HEAVY_MODULES = [
+    "boto3",
+    "botocore.session",
+    "dateparser",
+    "docker",
+    "flask",
+    "jsonschema",
+    "requests",
+    "ruamel.yaml",
+    "samtranslator.model",
+    "tomlkit",
+]
+
+
+def import_times(module: str) -> Dict[str, int]:
+    """
+    Imports ``module`` in a new interpreter with ``-X importtime``, and returns the cumulative import time in
+    microseconds of every module it imported
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        _, separator, columns = line.partition("import time:")
+        fields = columns.split("|")
+        if not separator or len(fields) != 3 or not fields[1].strip().isdigit():
+            continue
+        times[fields[2].strip()] = int(fields[1])
+    return times
+
+
+class TestImportTime(TestCase):
+    @parameterized.expand([(package,) for package in ["samcli.cli.main"] + _SAM_CLI_COMMAND_PACKAGES])
+    def test_command_doesnt_import_heavy_modules(self, package):
+        imported_modules = import_times(package)
+
+        self.assertIn(package, imported_modules)
+        for heavy_module in HEAVY_MODULES:
+            self.assertNotIn(
+                heavy_module,
+                imported_modules,
+                f"{package} imports {heavy_module} at startup, import it where it is used or with lazy_import",
+            )
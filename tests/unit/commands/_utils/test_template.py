@@ -28,6 +28,8 @@ from samcli.commands._utils.template import (
     TemplateFailedParsingException,
     get_template_artifacts_format,
     get_template_function_resource_ids,
+    clear_template_cache,
+    _load_template_data,
 )
 from samcli.lib.utils.packagetype import IMAGE, ZIP
 
@@ -187,6 +189,72 @@ class Test_get_template_data(TestCase):
         yaml_parse_mock.assert_called_with(file_data)
 
 
+class Test_get_template_data_cache(TestCase):
+    def setUp(self):
+        clear_template_cache()
+        self.temp_dir = tempfile.mkdtemp()
+        self.template_file = os.path.join(self.temp_dir, "template.yaml")
+        with open(self.template_file, "w", encoding="utf-8") as fp:
+            fp.write("Resources:\n  Function:\n    Type: AWS::Serverless::Function\n")
+        self._set_modified_a_minute_ago(self.template_file)
+
+    def tearDown(self):
+        clear_template_cache()
+        shutil.rmtree(self.temp_dir)
+
+    @staticmethod
+    def _set_modified_a_minute_ago(path):
+        modification_time = os.stat(path).st_mtime - 60
+        os.utime(path, (modification_time, modification_time))
+
+    @patch("samcli.commands._utils.template.yaml_parse")
+    def test_must_parse_unchanged_file_once(self, yaml_parse_mock):
+        yaml_parse_mock.return_value = {"Resources": {}}
+
+        get_template_data(self.template_file)
+        get_template_data(self.template_file)
+
+        yaml_parse_mock.assert_called_once()
+
+    @patch("samcli.commands._utils.template.yaml_parse")
+    def test_must_parse_recently_modified_file_again(self, yaml_parse_mock):
+        yaml_parse_mock.return_value = {"Resources": {}}
+        os.utime(self.template_file)
+
+        get_template_data(self.template_file)
+        get_template_data(self.template_file)
+
+        self.assertEqual(yaml_parse_mock.call_count, 2)
+
+    def test_must_share_memoized_template_with_internal_readers(self):
+        first, memoized = _load_template_data(self.template_file)
+        second, _ = _load_template_data(self.template_file)
+
+        self.assertTrue(memoized)
+        self.assertIs(first, second)
+        self.assertIsNot(get_template_data(self.template_file), first)
+
+    def test_must_return_independent_copies(self):
+        first = get_template_data(self.template_file)
+        first["Resources"]["Function"]["Type"] = "Changed"
+
+        second = get_template_data(self.template_file)
+
+        self.assertEqual(second["Resources"]["Function"]["Type"], "AWS::Serverless::Function")
+
+    def test_must_reparse_when_file_changes(self):
+        first = get_template_data(self.template_file)
+
+        with open(self.template_file, "w", encoding="utf-8") as fp:
+            fp.write("Resources:\n  OtherFunction:\n    Type: AWS::Serverless::Function\n")
+        self._set_modified_a_minute_ago(self.template_file)
+
+        second = get_template_data(self.template_file)
+
+        self.assertIn("Function", first["Resources"])
+        self.assertIn("OtherFunction", second["Resources"])
+
+
 class Test_update_relative_paths(TestCase):
     def setUp(self):
         self.s3path = "s3://foo/bar"
@@ -564,74 +632,90 @@ class Test_move_template(TestCase):
 
 
 class Test_get_template_artifacts_format(TestCase):
-    @patch("samcli.commands._utils.template.get_template_data")
-    def test_template_get_artifacts_format(self, mock_get_template_data):
-        mock_get_template_data.return_value = {
-            "Resources": {
-                "HelloWorldFunction1": {
-                    "Type": AWS_SERVERLESS_FUNCTION,
-                    "Properties": {"ImageUri": "myimage", "PackageType": IMAGE},
-                },
-                "HelloWorldFunction2": {
-                    "Type": AWS_SERVERLESS_FUNCTION,
-                    "Properties": {"CodeUri": "mycode", "PackageType": ZIP},
-                },
-            }
-        }
+    @patch("samcli.commands._utils.template._load_template_data")
+    def test_template_get_artifacts_format(self, mock_load_template_data):
+        mock_load_template_data.return_value = (
+            {
+                "Resources": {
+                    "HelloWorldFunction1": {
+                        "Type": AWS_SERVERLESS_FUNCTION,
+                        "Properties": {"ImageUri": "myimage", "PackageType": IMAGE},
+                    },
+                    "HelloWorldFunction2": {
+                        "Type": AWS_SERVERLESS_FUNCTION,
+                        "Properties": {"CodeUri": "mycode", "PackageType": ZIP},
+                    },
+                }
+            },
+            True,
+        )
         self.assertEqual(get_template_artifacts_format(MagicMock()), [IMAGE, ZIP])
 
-    @patch("samcli.commands._utils.template.get_template_data")
-    def test_template_get_artifacts_format_non_packageable(self, mock_get_template_data):
-        mock_get_template_data.return_value = {
-            "Resources": {
-                "HelloWorldFunction1": {
-                    "Type": "SomeType",
-                    "Properties": {"ImageUri": "myimage", "PackageType": IMAGE},
-                },
-            }
-        }
+    @patch("samcli.commands._utils.template._load_template_data")
+    def test_template_get_artifacts_format_non_packageable(self, mock_load_template_data):
+        mock_load_template_data.return_value = (
+            {
+                "Resources": {
+                    "HelloWorldFunction1": {
+                        "Type": "SomeType",
+                        "Properties": {"ImageUri": "myimage", "PackageType": IMAGE},
+                    },
+                }
+            },
+            True,
+        )
         self.assertEqual(get_template_artifacts_format(MagicMock()), [])
 
-    @patch("samcli.commands._utils.template.get_template_data")
-    def test_template_get_artifacts_format_only_image(self, mock_get_template_data):
-        mock_get_template_data.return_value = {
-            "Resources": {
-                "HelloWorldFunction1": {
-                    "Type": AWS_SERVERLESS_FUNCTION,
-                    "Properties": {"ImageUri": "myimage", "PackageType": IMAGE},
-                },
-            }
-        }
+    @patch("samcli.commands._utils.template._load_template_data")
+    def test_template_get_artifacts_format_only_image(self, mock_load_template_data):
+        mock_load_template_data.return_value = (
+            {
+                "Resources": {
+                    "HelloWorldFunction1": {
+                        "Type": AWS_SERVERLESS_FUNCTION,
+                        "Properties": {"ImageUri": "myimage", "PackageType": IMAGE},
+                    },
+                }
+            },
+            True,
+        )
         self.assertEqual(get_template_artifacts_format(MagicMock()), [IMAGE])
 
-    @patch("samcli.commands._utils.template.get_template_data")
-    def test_template_get_artifacts_format_only_image_other_resources_present(self, mock_get_template_data):
-        mock_get_template_data.return_value = {
-            "Resources": {
-                "HelloWorldFunction1": {
-                    "Type": AWS_SERVERLESS_FUNCTION,
-                    "Properties": {"ImageUri": "myimage", "PackageType": IMAGE},
-                },
-                "HelloWorldFunction2": {"Type": AWS_SERVERLESS_API, "Properties": {"StageName": "Prod"}},
-            }
-        }
+    @patch("samcli.commands._utils.template._load_template_data")
+    def test_template_get_artifacts_format_only_image_other_resources_present(self, mock_load_template_data):
+        mock_load_template_data.return_value = (
+            {
+                "Resources": {
+                    "HelloWorldFunction1": {
+                        "Type": AWS_SERVERLESS_FUNCTION,
+                        "Properties": {"ImageUri": "myimage", "PackageType": IMAGE},
+                    },
+                    "HelloWorldFunction2": {"Type": AWS_SERVERLESS_API, "Properties": {"StageName": "Prod"}},
+                }
+            },
+            True,
+        )
         self.assertEqual(get_template_artifacts_format(MagicMock()), [IMAGE])
 
-    @patch("samcli.commands._utils.template.get_template_data")
-    def test_template_get_artifacts_format_none_other_resources_present(self, mock_get_template_data):
-        mock_get_template_data.return_value = {
-            "Resources": {"HelloWorldFunction2": {"Type": AWS_SERVERLESS_API, "Properties": {"StageName": "Prod"}}}
-        }
+    @patch("samcli.commands._utils.template._load_template_data")
+    def test_template_get_artifacts_format_none_other_resources_present(self, mock_load_template_data):
+        mock_load_template_data.return_value = (
+            {"Resources": {"HelloWorldFunction2": {"Type": AWS_SERVERLESS_API, "Properties": {"StageName": "Prod"}}}},
+            True,
+        )
         self.assertEqual(get_template_artifacts_format(MagicMock()), [])
 
 
 class Test_get_template_function_resouce_ids(TestCase):
-    @patch("samcli.commands._utils.template.get_template_data")
-    def test_get_template_function_resouce_ids(self, mock_get_template_data):
-        mock_get_template_data.return_value = {
-            "Resources": {
-                "HelloWorldFunction1": {"Type": "AWS::Lambda::Function", "Properties": {"PackageType": IMAGE}},
-                "HelloWorldFunction2": {"Type": "AWS::Serverless::Function", "Properties": {"PackageType": ZIP}},
-            }
-        }
+    @patch("samcli.commands._utils.template._load_template_data")
+    def test_get_template_function_resouce_ids(self, mock_load_template_data):
+        mock_load_template_data.return_value = (
+            {
+                "Resources": {
+                    "HelloWorldFunction1": {"Type": "AWS::Lambda::Function", "Properties": {"PackageType": IMAGE}},
+                    "HelloWorldFunction2": {"Type": "AWS::Serverless::Function", "Properties": {"PackageType": ZIP}},
+                }
+            },
+            True,
+        )
         self.assertEqual(get_template_function_resource_ids(MagicMock(), IMAGE), ["HelloWorldFunction1"])
@@ -15,6 +15,7 @@ from samcli.lib.build.app_builder import (
     ApplicationBuildResult,
 )
 from samcli.lib.build.build_graph import DEFAULT_DEPENDENCIES_DIR
+from samcli.lib.build.constants import HOOK_BUILD_ALL_RESOURCES_ENV_VAR
 from samcli.lib.build.bundler import EsbuildBundlerManager
 from samcli.lib.build.workflow_config import UnsupportedRuntimeException
 from samcli.lib.providers.provider import Function, get_function_build_info
@@ -1338,6 +1339,37 @@ class TestBuildContext_exclude_warning(TestCase):
             log_mock.warning.assert_not_called()
 
 
+class TestBuildContext_hook_build_all_resources_env(TestCase):
+    @parameterized.expand(
+        [
+            ("terraform", None, None, True),
+            ("terraform", "Function", None, False),
+            ("terraform", None, ("Function",), False),
+            (None, None, None, False),
+        ]
+    )
+    def test_hook_build_all_resources_env(self, hook_name, resource_id, exclude, expect_env_var):
+        build_context = BuildContext(
+            resource_identifier=resource_id,
+            template_file="template_file",
+            base_dir="base_dir",
+            build_dir="build_dir",
+            cache_dir="cache_dir",
+            cached=False,
+            clean=False,
+            parallel=False,
+            mode="mode",
+            excluded_resources=exclude,
+            hook_name=hook_name,
+        )
+
+        with patch.dict(os.environ, {}):
+            os.environ.pop(HOOK_BUILD_ALL_RESOURCES_ENV_VAR, None)
+            with build_context._hook_build_all_resources_env():
+                self.assertEqual(HOOK_BUILD_ALL_RESOURCES_ENV_VAR in os.environ, expect_env_var)
+            self.assertNotIn(HOOK_BUILD_ALL_RESOURCES_ENV_VAR, os.environ)
+
+
 class TestBuildContext_gen_success_msg(TestCase):
     def setUp(self):
         self.build_dir = "build_dir"
@@ -68,6 +68,7 @@ class TestCli(TestCase):
     # only one clone will happen.
     clone_cache: Dict[str, Path]
     patcher: Any
+    checkout_patcher: Any
 
     @classmethod
     def setUpClass(cls) -> None:
@@ -75,10 +76,14 @@ class TestCli(TestCase):
         cls.clone_cache = {}
         cls.patcher = patch("samcli.lib.utils.git_repo.check_output", side_effect=cls.check_output_mock)
         cls.patcher.start()
+        # the templates of the test manifest don't exist, there is nothing to check out
+        cls.checkout_patcher = patch("samcli.lib.utils.git_repo.GitRepo.checkout_paths")
+        cls.checkout_patcher.start()
 
     @classmethod
     def tearDownClass(cls) -> None:
         cls.patcher.stop()
+        cls.checkout_patcher.stop()
         for _, directory in cls.clone_cache.items():
             shutil.rmtree(directory.parent)
 
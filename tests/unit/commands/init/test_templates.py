@@ -7,7 +7,8 @@ from re import search
 from unittest import TestCase
 from unittest.mock import mock_open, patch, PropertyMock, Mock
 
-from samcli.commands.init.init_templates import InitTemplates
+from samcli.commands.init.init_templates import InitTemplates, InvalidInitTemplateError
+from samcli.lib.utils.git_repo import CloneRepoException
 from samcli.lib.utils.packagetype import IMAGE, ZIP
 
 
@@ -83,3 +84,37 @@ class TestTemplates(TestCase):
             ["git", "rev-parse", "--verify", "HEAD"], cwd=Path("shared_dir/cloned_folder_dir"), stderr=STDOUT
         )
         self.assertEqual(return_value, expected_value)
+
+    @patch("samcli.commands.init.init_templates.os.path.exists")
+    def test_get_app_template_location_checks_out_missing_template(self, exists_mock):
+        it = InitTemplates()
+        it._git_repo = Mock(local_path=Path("/tmp/test-sam/aws-sam-cli-app-templates"))
+        exists_mock.return_value = False
+
+        location = it.get_app_template_location("python3.9/hello")
+
+        self.assertEqual(location, str(Path("/tmp/test-sam/aws-sam-cli-app-templates/python3.9/hello")))
+        it._git_repo.checkout_paths.assert_called_once_with(["python3.9/hello"])
+
+    @patch("samcli.commands.init.init_templates.os.path.exists")
+    def test_get_app_template_location_raises_when_checkout_fails(self, exists_mock):
+        it = InitTemplates()
+        it._git_repo = Mock(local_path=Path("/tmp/test-sam/aws-sam-cli-app-templates"))
+        it._git_repo.checkout_paths.side_effect = CloneRepoException("fatal: unable to fetch blobs")
+        exists_mock.return_value = False
+
+        with self.assertRaises(InvalidInitTemplateError) as ctx:
+            it.get_app_template_location("python3.9/hello")
+
+        self.assertIn("python3.9/hello", str(ctx.exception))
+        self.assertIn("fatal: unable to fetch blobs", str(ctx.exception))
+
+    @patch("samcli.commands.init.init_templates.os.path.exists")
+    def test_get_app_template_location_of_checked_out_template(self, exists_mock):
+        it = InitTemplates()
+        it._git_repo = Mock(local_path=Path("/tmp/test-sam/aws-sam-cli-app-templates"))
+        exists_mock.return_value = True
+
+        it.get_app_template_location("python3.9/hello")
+
+        it._git_repo.checkout_paths.assert_not_called()
@@ -1,3 +1,4 @@
+import threading
 from unittest import TestCase
 from unittest.mock import patch, call, Mock
 from botocore.exceptions import ClientError, EndpointConnectionError, NoCredentialsError, BotoCoreError
@@ -868,6 +869,103 @@ class TestBuildAPIGWEndpoints(TestCase):
         self.assertEqual(repsonse2, ["https://testID.execute-api.us-east-1.amazonaws.com/Prod"])
 
 
+class TestGetCloudEndpoints(TestCase):
+    def setUp(self):
+        self.endpoint_producer = EndpointsProducer(
+            stack_name="stack",
+            region="us-east-1",
+            profile=None,
+            template_file=None,
+            cloudformation_client=None,
+            iam_client=None,
+            cloudcontrol_client=None,
+            apigateway_client=None,
+            apigatewayv2_client=None,
+            mapper=None,
+            consumer=None,
+        )
+        self.local_stack = Mock(
+            resources={
+                "Function1": {"Type": "AWS::Lambda::Function"},
+                "Function2": {"Type": "AWS::Lambda::Function"},
+                "Api": {"Type": "AWS::ApiGateway::RestApi", "Properties": {}},
+                "Domain": {"Type": "AWS::ApiGateway::DomainName"},
+                "Mapping": {
+                    "Type": "AWS::ApiGateway::BasePathMapping",
+                    "Properties": {"RestApiId": "Api", "DomainName": "Domain"},
+                },
+            }
+        )
+        self.response = {
+            "StackResources": [
+                {
+                    "LogicalResourceId": "Function1",
+                    "PhysicalResourceId": "fn1",
+                    "ResourceType": "AWS::Lambda::Function",
+                },
+                {
+                    "LogicalResourceId": "Function2",
+                    "PhysicalResourceId": "fn2",
+                    "ResourceType": "AWS::Lambda::Function",
+                },
+                {"LogicalResourceId": "Api", "PhysicalResourceId": "api", "ResourceType": "AWS::ApiGateway::RestApi"},
+                {
+                    "LogicalResourceId": "Domain",
+                    "PhysicalResourceId": "example.com",
+                    "ResourceType": "AWS::ApiGateway::DomainName",
+                },
+                {
+                    "LogicalResourceId": "Mapping",
+                    "PhysicalResourceId": "mapping",
+                    "ResourceType": "AWS::ApiGateway::BasePathMapping",
+                },
+            ]
+        }
+
+    @patch("samcli.lib.list.endpoints.endpoints_producer.EndpointsProducer.get_stage_list")
+    @patch("samcli.lib.list.endpoints.endpoints_producer.EndpointsProducer.get_function_url")
+    def test_looks_up_endpoints_concurrently_in_stack_order(self, mock_get_function_url, mock_get_stage_list):
+        # both function URLs are looked up at the same time, or the barrier times out
+        barrier = threading.Barrier(2, timeout=5)
+
+        def get_function_url(physical_id):
+            barrier.wait()
+            return f"https://{physical_id}.lambda-url.aws"
+
+        mock_get_function_url.side_effect = get_function_url
+
+        endpoints = self.endpoint_producer.get_cloud_endpoints([self.local_stack], self.response)
+
+        self.assertEqual(
+            [(endpoint["LogicalResourceId"], endpoint["CloudEndpoint"]) for endpoint in endpoints],
+            [
+                ("Function1", "https://fn1.lambda-url.aws"),
+                ("Function2", "https://fn2.lambda-url.aws"),
+                ("Api", ["https://example.com"]),
+            ],
+        )
+        # the custom domain replaces the default endpoints of the stages
+        mock_get_stage_list.assert_not_called()
+
+    @patch("samcli.lib.list.endpoints.endpoints_producer.EndpointsProducer.get_function_url")
+    def test_raises_lookup_errors(self, mock_get_function_url):
+        mock_get_function_url.side_effect = SamListUnknownClientError(msg="error")
+
+        with self.assertRaises(SamListUnknownClientError):
+            self.endpoint_producer.get_cloud_endpoints([self.local_stack], self.response)
+
+    @patch("samcli.lib.list.endpoints.endpoints_producer.EndpointsProducer.get_function_url")
+    @patch("samcli.lib.list.endpoints.endpoints_producer.EndpointsProducer.get_resources_info")
+    def test_describes_resources_if_not_given(self, mock_get_resources_info, mock_get_function_url):
+        mock_get_resources_info.return_value = {"StackResources": []}
+
+        endpoints = self.endpoint_producer.get_cloud_endpoints([self.local_stack])
+
+        mock_get_resources_info.assert_called_once_with()
+        self.assertEqual([endpoint["LogicalResourceId"] for endpoint in endpoints], ["Function1", "Function2", "Api"])
+        mock_get_function_url.assert_not_called()
+
+
 class TestEndpointsProducerProduce(TestCase):
     @patch("samcli.commands.list.json_consumer.click.echo")
     @patch("samcli.commands.list.json_consumer.click.get_current_context")
@@ -1,3 +1,4 @@
+import threading
 from unittest import TestCase
 
 from samtranslator.model.exceptions import ExceptionWithMessage
@@ -294,6 +295,51 @@ class TestResourceMappingProducerProduce(TestCase):
         ]
         self.assertEqual(expected_output, patched_click_echo.call_args_list)
 
+    @patch("samcli.commands.list.json_consumer.click.echo")
+    @patch("samcli.commands.list.json_consumer.click.get_current_context")
+    @patch("samcli.lib.list.resources.resource_mapping_producer.get_template_data")
+    @patch("samcli.lib.list.resources.resource_mapping_producer.ResourceMappingProducer.get_translated_dict")
+    @patch("samcli.lib.list.resources.resource_mapping_producer.ResourceMappingProducer.get_resources_info")
+    def test_resources_are_described_while_template_is_translated(
+        self,
+        mock_get_resources_info,
+        mock_get_translated_dict,
+        mock_sam_file_reader,
+        patched_click_get_current_context,
+        patched_click_echo,
+    ):
+        resources_described = threading.Event()
+
+        def get_resources_info():
+            resources_described.set()
+            return {"StackResources": [{"LogicalResourceId": "HelloWorldFunction", "PhysicalResourceId": "physical"}]}
+
+        def get_translated_dict(template_file_dict):
+            self.assertTrue(resources_described.wait(timeout=5))
+            return TRANSLATED_DICT_RETURN
+
+        mock_get_resources_info.side_effect = get_resources_info
+        mock_get_translated_dict.side_effect = get_translated_dict
+        mock_sam_file_reader.return_value = SAM_FILE_READER_RETURN
+        resource_producer = ResourceMappingProducer(
+            stack_name="test-stack",
+            region="us-east-1",
+            profile=None,
+            template_file=None,
+            cloudformation_client=None,
+            iam_client=None,
+            mapper=Mock(),
+            consumer=Mock(),
+        )
+
+        resource_producer.produce()
+
+        resources_list = resource_producer.mapper.map.call_args[0][0]
+        self.assertEqual(
+            resources_list[0], {"LogicalResourceId": "HelloWorldFunction", "PhysicalResourceId": "physical"}
+        )
+        self.assertEqual(len(resources_list), 6)
+
 
 class TestGetTranslatedDict(TestCase):
     @patch("samcli.commands.list.json_consumer.click.echo")
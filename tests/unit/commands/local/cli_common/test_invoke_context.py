@@ -496,6 +496,14 @@ class TestInvokeContext__exit__(TestCase):
         context.__exit__()
         self.assertIsNone(context._log_file_handle)
 
+    def test_must_drain_container_reaper(self):
+        context = InvokeContext(template_file="template")
+        context._container_reaper = container_reaper_mock = Mock()
+
+        context.__exit__()
+
+        container_reaper_mock.drain.assert_called_once_with()
+
 
 class TestInvokeContextAsContextManager(TestCase):
     """
@@ -619,7 +627,7 @@ class TestInvokeContext_local_lambda_runner(TestCase):
             result = self.context.local_lambda_runner
             self.assertEqual(result, runner_mock)
 
-            LambdaRuntimeMock.assert_called_with(container_manager_mock, image_mock)
+            LambdaRuntimeMock.assert_called_with(container_manager_mock, image_mock, self.context._container_reaper)
             lambda_image_patch.assert_called_once_with(download_mock, True, True, invoke_images=None)
             LocalLambdaMock.assert_called_with(
                 local_runtime=runtime_mock,
@@ -783,7 +791,7 @@ class TestInvokeContext_local_lambda_runner(TestCase):
             result = self.context.local_lambda_runner
             self.assertEqual(result, runner_mock)
 
-            LambdaRuntimeMock.assert_called_with(container_manager_mock, image_mock)
+            LambdaRuntimeMock.assert_called_with(container_manager_mock, image_mock, self.context._container_reaper)
             lambda_image_patch.assert_called_once_with(download_mock, True, True, invoke_images=None)
             LocalLambdaMock.assert_called_with(
                 local_runtime=runtime_mock,
@@ -868,7 +876,7 @@ class TestInvokeContext_local_lambda_runner(TestCase):
             result = self.context.local_lambda_runner
             self.assertEqual(result, runner_mock)
 
-            LambdaRuntimeMock.assert_called_with(container_manager_mock, image_mock)
+            LambdaRuntimeMock.assert_called_with(container_manager_mock, image_mock, self.context._container_reaper)
             lambda_image_patch.assert_called_once_with(download_mock, True, True, invoke_images=None)
             LocalLambdaMock.assert_called_with(
                 local_runtime=runtime_mock,
@@ -955,7 +963,7 @@ class TestInvokeContext_local_lambda_runner(TestCase):
             result = self.context.local_lambda_runner
             self.assertEqual(result, runner_mock)
 
-            LambdaRuntimeMock.assert_called_with(container_manager_mock, image_mock)
+            LambdaRuntimeMock.assert_called_with(container_manager_mock, image_mock, self.context._container_reaper)
             lambda_image_patch.assert_called_once_with(download_mock, True, True, invoke_images={None: "image"})
             LocalLambdaMock.assert_called_with(
                 local_runtime=runtime_mock,
@@ -1353,5 +1361,20 @@ class TestInvokeContext_get_stacks(TestCase):
         invoke_context = InvokeContext("template_file", aws_region="my-custom-region")
         invoke_context._get_stacks()
         get_stacks_mock.assert_called_with(
-            "template_file", parameter_overrides=None, global_parameter_overrides={"AWS::Region": "my-custom-region"}
+            "template_file",
+            parameter_overrides=None,
+            global_parameter_overrides={"AWS::Region": "my-custom-region"},
+            lazy_resolution=False,
+        )
+
+    @patch("samcli.commands.local.cli_common.invoke_context.SamLocalStackProvider.get_stacks")
+    def test_must_pass_lazy_resolution(self, get_stacks_mock):
+        get_stacks_mock.return_value = [Mock(), []]
+        invoke_context = InvokeContext("template_file", lazy_resolution=True)
+        invoke_context._get_stacks()
+        get_stacks_mock.assert_called_with(
+            "template_file",
+            parameter_overrides=None,
+            global_parameter_overrides=None,
+            lazy_resolution=True,
         )
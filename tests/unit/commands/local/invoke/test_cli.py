@@ -112,6 +112,7 @@ class TestCli(TestCase):
             container_host_interface=self.container_host_interface,
             add_host=self.add_host,
             invoke_images={None: "amazon/aws-sam-cli-emulation-image-python3.9"},
+            lazy_resolution=True,
         )
 
         context_mock.local_lambda_runner.invoke.assert_called_with(
@@ -152,6 +153,7 @@ class TestCli(TestCase):
             container_host_interface=self.container_host_interface,
             add_host=self.add_host,
             invoke_images={None: "amazon/aws-sam-cli-emulation-image-python3.9"},
+            lazy_resolution=True,
         )
 
         get_event_mock.assert_not_called()
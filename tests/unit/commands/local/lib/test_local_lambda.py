@@ -395,6 +395,7 @@ class TestLocalLambda_get_invoke_config(TestCase):
             env_vars_values=self.env_vars_values,
             debug_context=self.debug_context,
         )
+        self.local_lambda.get_aws_creds = Mock(return_value={"key": "key", "secret": "secret"})
 
     @patch("samcli.commands.local.lib.local_lambda.resolve_code_path")
     @patch("samcli.commands.local.lib.local_lambda.LocalLambdaRunner.is_debugging")
@@ -532,6 +533,100 @@ class TestLocalLambda_get_invoke_config(TestCase):
         self.local_lambda._make_env_vars.assert_called_with(function)
 
 
+class TestLocalLambda_get_invoke_config_cache(TestCase):
+    def setUp(self):
+        self.local_lambda = LocalLambdaRunner(Mock(), Mock(), "/my/current/working/directory")
+        self.aws_creds = {"key": "key", "secret": "secret"}
+        self.local_lambda.get_aws_creds = Mock(side_effect=lambda: dict(self.aws_creds))
+        self.function = Function(
+            stack_path="",
+            function_id="function_name",
+            name="function_name",
+            functionname="function_name",
+            runtime="python3.12",
+            memory=1234,
+            timeout=12,
+            handler="app.handler",
+            codeuri="codeuri",
+            environment={"Variables": {"KEY": "value"}},
+            rolearn=None,
+            layers=[],
+            events=None,
+            metadata=None,
+            inlinecode=None,
+            imageuri=None,
+            imageconfig=None,
+            packagetype=ZIP,
+            architectures=[X86_64],
+            codesign_config_arn=None,
+            function_url_config=None,
+            runtime_management_config=None,
+            function_build_info=FunctionBuildInfo.BuildableZip,
+        )
+
+    @patch("samcli.commands.local.lib.local_lambda.resolve_code_path")
+    def test_must_reuse_config_of_unchanged_function(self, resolve_code_path_patch):
+        config = self.local_lambda.get_invoke_config(self.function)
+
+        # the provider returns an equal function after reloading an unchanged template
+        self.assertIs(self.local_lambda.get_invoke_config(self.function._replace(layers=[])), config)
+        resolve_code_path_patch.assert_called_once()
+
+    @parameterized.expand(
+        [
+            ("code path", {"codeuri": "othercodeuri"}),
+            ("environment", {"environment": {"Variables": {"KEY": "othervalue"}}}),
+            ("timeout", {"timeout": 30}),
+        ]
+    )
+    @patch("samcli.commands.local.lib.local_lambda.resolve_code_path")
+    def test_must_rebuild_config_of_changed_function(self, _, changes, resolve_code_path_patch):
+        resolve_code_path_patch.side_effect = lambda cwd, codeuri: os.path.join(cwd, codeuri)
+        config = self.local_lambda.get_invoke_config(self.function)
+
+        new_config = self.local_lambda.get_invoke_config(self.function._replace(**changes))
+
+        self.assertIsNot(new_config, config)
+        self.assertEqual(resolve_code_path_patch.call_count, 2)
+        self.assertIs(self.local_lambda.get_invoke_config(self.function._replace(**changes)), new_config)
+
+    @patch("samcli.commands.local.lib.local_lambda.resolve_code_path")
+    def test_must_rebuild_config_when_credentials_change(self, resolve_code_path_patch):
+        config = self.local_lambda.get_invoke_config(self.function)
+
+        self.aws_creds["sessiontoken"] = "refreshedtoken"
+        new_config = self.local_lambda.get_invoke_config(self.function)
+
+        self.assertIsNot(new_config, config)
+        self.assertEqual(new_config.env_vars.aws_creds["sessiontoken"], "refreshedtoken")
+
+    @patch("samcli.commands.local.lib.local_lambda.resolve_code_path")
+    def test_must_rebuild_config_when_env_vars_values_change(self, resolve_code_path_patch):
+        config = self.local_lambda.get_invoke_config(self.function)
+
+        self.local_lambda.env_vars_values = {"function_name": {"KEY": "overridden"}}
+        new_config = self.local_lambda.get_invoke_config(self.function)
+
+        self.assertIsNot(new_config, config)
+        self.assertEqual(new_config.env_vars.resolve()["KEY"], "overridden")
+
+    @patch("samcli.commands.local.lib.local_lambda.resolve_code_path")
+    def test_must_cache_config_of_each_function(self, resolve_code_path_patch):
+        other_function = self.function._replace(function_id="other", name="other", functionname="other")
+
+        config = self.local_lambda.get_invoke_config(self.function)
+        other_config = self.local_lambda.get_invoke_config(other_function)
+
+        with patch("samcli.commands.local.lib.local_lambda.LOG") as log_mock:
+            self.assertIs(self.local_lambda.get_invoke_config(self.function), config)
+            self.assertIs(self.local_lambda.get_invoke_config(other_function), other_config)
+
+        self.assertEqual(resolve_code_path_patch.call_count, 2)
+        log_mock.debug.assert_called_with(
+            "%s the invoke configuration of %s (cache hits: %d, misses: %d)", "Reusing", "other", 2, 2
+        )
+
+
 class TestLocalLambda_invoke(TestCase):
     def setUp(self):
         self.runtime_mock = Mock()
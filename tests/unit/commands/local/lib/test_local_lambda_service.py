@@ -22,9 +22,11 @@ class TestLocalLambdaService(TestCase):
         self.assertEqual(service.lambda_runner, lambda_runner_mock)
         self.assertEqual(service.stderr_stream, stderr_mock)
 
+    @patch("samcli.commands.local.lib.local_lambda_service.EventInvoker")
     @patch("samcli.commands.local.lib.local_lambda_service.LocalLambdaInvokeService")
-    def test_start(self, local_lambda_invoke_service_mock):
+    def test_start(self, local_lambda_invoke_service_mock, event_invoker_mock):
         lambda_runner_mock = Mock()
+        lambda_runner_mock.is_debugging.return_value = False
         stderr_mock = Mock()
         lambda_invoke_context_mock = Mock()
 
@@ -35,13 +37,41 @@ class TestLocalLambdaService(TestCase):
         lambda_invoke_context_mock.stderr = stderr_mock
 
         service = LocalLambdaService(
-            lambda_invoke_context=lambda_invoke_context_mock, port=3000, host="localhost", ssl_context=None
+            lambda_invoke_context=lambda_invoke_context_mock,
+            port=3000,
+            host="localhost",
+            ssl_context=None,
+            event_failure_destination="failures",
         )
 
         service.start()
 
+        event_invoker_mock.assert_called_once_with(
+            lambda_runner_mock, failure_destination="failures", stderr=stderr_mock, max_workers=4
+        )
         local_lambda_invoke_service_mock.assert_called_once_with(
-            lambda_runner=lambda_runner_mock, port=3000, host="localhost", stderr=stderr_mock, ssl_context=None
+            lambda_runner=lambda_runner_mock,
+            port=3000,
+            host="localhost",
+            stderr=stderr_mock,
+            ssl_context=None,
+            event_invoker=event_invoker_mock.return_value,
         )
         lambda_context_mock.create.assert_called_once()
         lambda_context_mock.run.assert_called_once()
+        event_invoker_mock.return_value.shutdown.assert_called_once_with()
+
+    @patch("samcli.commands.local.lib.local_lambda_service.EventInvoker")
+    @patch("samcli.commands.local.lib.local_lambda_service.LocalLambdaInvokeService")
+    def test_start_must_shutdown_event_invoker_on_interrupt(self, local_lambda_invoke_service_mock, event_invoker_mock):
+        lambda_invoke_context_mock = Mock()
+        lambda_invoke_context_mock.local_lambda_runner.is_debugging.return_value = True
+        local_lambda_invoke_service_mock.return_value.run.side_effect = KeyboardInterrupt
+
+        service = LocalLambdaService(lambda_invoke_context=lambda_invoke_context_mock, port=3000, host="localhost")
+
+        with self.assertRaises(KeyboardInterrupt):
+            service.start()
+
+        self.assertEqual(event_invoker_mock.call_args[1]["max_workers"], 0)
+        event_invoker_mock.return_value.shutdown.assert_called_once_with()
@@ -1,13 +1,13 @@
 from unittest import TestCase
 from unittest.mock import Mock, patch
-from samcli.lib.providers.sam_base_provider import SamBaseProvider
+from samcli.lib.providers.sam_base_provider import LazyResolvedResources, SamBaseProvider
 from samcli.lib.intrinsic_resolver.intrinsic_property_resolver import IntrinsicResolver
 from samcli.lib.intrinsic_resolver.intrinsics_symbol_table import IntrinsicsSymbolTable
 
 
 class TestSamBaseProvider_get_template(TestCase):
     @patch("samcli.lib.providers.sam_base_provider.ResourceMetadataNormalizer")
-    @patch("samcli.lib.providers.sam_base_provider.SamTranslatorWrapper")
+    @patch("samcli.lib.samlib.wrapper.SamTranslatorWrapper")
     @patch.object(IntrinsicResolver, "resolve_template")
     def test_must_run_translator_plugins(
         self, resolve_template_mock, SamTranslatorWrapperMock, resource_metadata_normalizer_patch
@@ -24,3 +24,47 @@ class TestSamBaseProvider_get_template(TestCase):
         called_parameter_values.update(overrides)
         SamTranslatorWrapperMock.assert_called_once_with(template, parameter_values=called_parameter_values)
         translator_instance.run_plugins.assert_called_once()
+
+
+class TestSamBaseProvider_get_template_lazy_resolution(TestCase):
+    def setUp(self):
+        self.template = {
+            "Parameters": {"Runtime": {"Type": "String", "Default": "python3.12"}},
+            "Resources": {
+                "Function": {
+                    "Type": "AWS::Lambda::Function",
+                    "Properties": {"Runtime": {"Ref": "Runtime"}, "Handler": "app.handler", "Code": "."},
+                },
+                "Table": {"Type": "AWS::DynamoDB::Table", "Properties": {"TableName": {"Fn::Sub": "${Runtime}"}}},
+            },
+            "Outputs": {"FunctionRuntime": {"Value": {"Ref": "Runtime"}}},
+        }
+
+    def test_must_resolve_resources_on_access(self):
+        with patch.object(IntrinsicResolver, "resolve_attribute", autospec=True) as resolve_attribute_mock:
+            resolve_attribute_mock.side_effect = lambda resolver, attribute, ignore_errors: {
+                key: {**value, "Resolved": True} for key, value in attribute.items()
+            }
+            template = SamBaseProvider.get_template(self.template, lazy_resolution=True)
+            resources = template["Resources"]
+
+            self.assertIsInstance(resources, LazyResolvedResources)
+            self.assertEqual(list(resources), ["Function", "Table"])
+            self.assertEqual(len(resources), 2)
+            self.assertEqual(resources.get_resource_type("Table"), "AWS::DynamoDB::Table")
+            # only the outputs are resolved up front
+            self.assertEqual(resolve_attribute_mock.call_count, 1)
+
+            self.assertTrue(resources["Function"]["Resolved"])
+            resources["Function"]
+            self.assertEqual(resolve_attribute_mock.call_count, 2)
+
+    def test_must_resolve_like_whole_template(self):
+        template = SamBaseProvider.get_template(self.template, lazy_resolution=True)
+
+        self.assertEqual(
+            {logical_id: resource for logical_id, resource in template["Resources"].items()},
+            SamBaseProvider.get_template(self.template)["Resources"],
+        )
+        self.assertEqual(template["Outputs"], {"FunctionRuntime": {"Value": "python3.12"}})
+        self.assertEqual(template["Parameters"], self.template["Parameters"])
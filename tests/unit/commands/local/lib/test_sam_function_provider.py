@@ -12,6 +12,8 @@ from samcli.commands.local.cli_common.user_exceptions import InvalidLayerVersion
 from samcli.lib.providers.provider import Function, LayerVersion, Stack, FunctionBuildInfo
 from samcli.lib.providers.sam_function_provider import SamFunctionProvider, RefreshableSamFunctionProvider
 from samcli.lib.providers.exceptions import InvalidLayerReference
+from samcli.lib.providers.sam_stack_provider import SamLocalStackProvider
+from samcli.lib.intrinsic_resolver.intrinsic_property_resolver import IntrinsicResolver
 from samcli.lib.utils.packagetype import IMAGE, ZIP
 
 
@@ -1112,7 +1114,7 @@ class TestSamFunctionProvider_init(TestCase):
         provider = SamFunctionProvider([stack])
 
         extract_mock.assert_called_with([stack], False, False, False)
-        get_template_mock.assert_called_with(template, self.parameter_overrides)
+        get_template_mock.assert_called_with(template, self.parameter_overrides, lazy_resolution=False)
         self.assertEqual(provider.functions, extract_result)
 
     @patch.object(SamFunctionProvider, "_extract_functions")
@@ -1141,7 +1143,7 @@ class TestSamFunctionProvider_init(TestCase):
         provider = SamFunctionProvider([stack], locate_layer_nested=True)
 
         extract_mock.assert_called_with([stack], False, False, True)
-        get_template_mock.assert_called_with(template, self.parameter_overrides)
+        get_template_mock.assert_called_with(template, self.parameter_overrides, lazy_resolution=False)
         self.assertEqual(provider.functions, extract_result)
 
 
@@ -1486,6 +1488,19 @@ class TestSamFunctionProvider_convert_sam_function_resource(TestCase):
 
         self.assertEqual(expected, result)
 
+    def test_must_convert_event_invoke_config(self):
+        event_invoke_config = {"MaximumEventAgeInSeconds": 60, "MaximumRetryAttempts": 0}
+        properties = {
+            "CodeUri": "/usr/local",
+            "Runtime": "myruntime",
+            "Handler": "myhandler",
+            "EventInvokeConfig": event_invoke_config,
+        }
+
+        result = SamFunctionProvider._convert_sam_function_resource(STACK, "myname", properties, [])
+
+        self.assertEqual(result.event_invoke_config, event_invoke_config)
+
     def test_must_convert_image(self):
         name = "myname"
         properties = {
@@ -2060,6 +2075,58 @@ class TestSamFunctionProvider_get(TestCase):
         self.assertIsNone(provider.get("somefunc"), "Must return None when Function is not found")
 
 
+class TestSamFunctionProvider_lazy_resolution(TestCase):
+    def setUp(self):
+        self.template = {
+            "Parameters": {"Runtime": {"Type": "String", "Default": "python3.12"}},
+            "Resources": {
+                "Layer": {
+                    "Type": "AWS::Serverless::LayerVersion",
+                    "Properties": {"ContentUri": "layer", "CompatibleRuntimes": [{"Ref": "Runtime"}]},
+                },
+                "Table": {"Type": "AWS::DynamoDB::Table", "Properties": {"TableName": "table"}},
+            },
+        }
+        for index in range(3):
+            self.template["Resources"][f"Function{index}"] = {
+                "Type": "AWS::Serverless::Function",
+                "Properties": {
+                    "CodeUri": f"function{index}",
+                    "Handler": "app.handler",
+                    "Runtime": {"Ref": "Runtime"},
+                    "Layers": [{"Ref": "Layer"}],
+                },
+            }
+
+    def _get_provider(self, lazy_resolution):
+        stacks, _ = SamLocalStackProvider.get_stacks(
+            "", template_dictionary=self.template, lazy_resolution=lazy_resolution
+        )
+        return SamFunctionProvider(stacks)
+
+    def test_get_must_only_resolve_function_and_its_layers(self):
+        with patch.object(
+            IntrinsicResolver, "resolve_attribute", autospec=True, side_effect=IntrinsicResolver.resolve_attribute
+        ) as resolve_attribute_mock:
+            provider = self._get_provider(lazy_resolution=True)
+            function = provider.get("Function1")
+
+        resolved_logical_ids = [
+            logical_id for resolver_call in resolve_attribute_mock.call_args_list for logical_id in resolver_call[0][1]
+        ]
+        self.assertEqual(sorted(resolved_logical_ids), ["Function1", "Layer"])
+        self.assertEqual(function.runtime, "python3.12")
+        self.assertEqual([layer.name for layer in function.layers], ["Layer"])
+
+    def test_get_must_return_same_function_as_eager_resolution(self):
+        lazy_provider = self._get_provider(lazy_resolution=True)
+        eager_provider = self._get_provider(lazy_resolution=False)
+
+        self.assertEqual(lazy_provider.get("Function2"), eager_provider.get("Function2"))
+        self.assertIsNone(lazy_provider.get("Table"))
+        self.assertEqual(list(lazy_provider.get_all()), list(eager_provider.get_all()))
+
+
 class TestSamFunctionProvider_get_all(TestCase):
     def test_must_work_with_no_functions(self):
         provider = SamFunctionProvider([])
@@ -2099,7 +2166,7 @@ class TestRefreshableSamFunctionProvider(TestCase):
         )
 
         extract_mock.assert_called_with([stack, stack2], False, False, False)
-        get_template_mock.assert_called_with(template, self.parameter_overrides)
+        get_template_mock.assert_called_with(template, self.parameter_overrides, lazy_resolution=False)
         self.assertEqual(provider.functions, extract_result)
 
         FileObserverMock.assert_called_with(provider._set_templates_changed)
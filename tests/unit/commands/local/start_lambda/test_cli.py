@@ -45,6 +45,7 @@ class TestCli(TestCase):
         self.add_host = {}
         self.invoke_image = ()
         self.hook_name = None
+        self.event_failure_destination = "failures"
 
     @patch("samcli.commands.local.cli_common.invoke_context.InvokeContext")
     @patch("samcli.commands.local.lib.local_lambda_service.LocalLambdaService")
@@ -86,7 +87,12 @@ class TestCli(TestCase):
             invoke_images={},
         )
 
-        local_lambda_service_mock.assert_called_with(lambda_invoke_context=context_mock, port=self.port, host=self.host)
+        local_lambda_service_mock.assert_called_with(
+            lambda_invoke_context=context_mock,
+            port=self.port,
+            host=self.host,
+            event_failure_destination=self.event_failure_destination,
+        )
 
         service_mock.start.assert_called_with()
 
@@ -185,4 +191,5 @@ class TestCli(TestCase):
             add_host=self.add_host,
             invoke_image=self.invoke_image,
             hook_name=self.hook_name,
+            event_failure_destination=self.event_failure_destination,
         )
@@ -29,3 +29,22 @@ class TestCWConsoleEventConsumer(TestCase):
         consumer.consume(event)
 
         patched_click.echo.assert_called_with(event.message, nl=False)
+
+    @parameterized.expand(
+        [
+            (True, "message 1\nmessage 2"),
+            (False, "message 1message 2"),
+        ]
+    )
+    @patch("samcli.commands.logs.console_consumers.click")
+    def test_consumer_with_batch_of_events(self, add_newline, expected_output, patched_click):
+        consumer = CWConsoleEventConsumer(add_newline)
+        consumer.consume_all([Mock(message="message 1"), Mock(message="message 2")])
+
+        patched_click.echo.assert_called_once_with(expected_output, nl=add_newline)
+
+    @patch("samcli.commands.logs.console_consumers.click")
+    def test_consumer_with_empty_batch(self, patched_click):
+        CWConsoleEventConsumer().consume_all([])
+
+        patched_click.echo.assert_not_called()
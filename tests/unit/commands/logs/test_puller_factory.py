@@ -27,6 +27,7 @@ class TestPullerFactory(TestCase):
     @patch("samcli.commands.logs.puller_factory.generate_json_consumer")
     @patch("samcli.commands.logs.puller_factory.CWLogPuller")
     @patch("samcli.commands.logs.puller_factory.generate_trace_puller")
+    @patch("samcli.commands.logs.puller_factory.CWLogTailScheduler")
     @patch("samcli.commands.logs.puller_factory.ObservabilityCombinedPuller")
     def test_generate_puller(
         self,
@@ -34,6 +35,7 @@ class TestPullerFactory(TestCase):
         param_cw_log_groups,
         param_output,
         patched_combined_puller,
+        patched_tail_scheduler,
         patched_xray_puller,
         patched_cw_log_puller,
         patched_json_consumer,
@@ -63,9 +65,11 @@ class TestPullerFactory(TestCase):
         mocked_xray_puller = Mock()
         patched_xray_puller.return_value = mocked_xray_puller
         mocked_pullers = [Mock() for _ in mocked_consumers]
-        mocked_pullers.append(mocked_xray_puller)  # add a mock puller for xray puller
         patched_cw_log_puller.side_effect = mocked_pullers
 
+        mocked_tail_scheduler = Mock()
+        patched_tail_scheduler.return_value = mocked_tail_scheduler
+
         mocked_combined_puller = Mock()
 
         patched_combined_puller.return_value = mocked_combined_puller
@@ -91,7 +95,8 @@ class TestPullerFactory(TestCase):
             [call(mock_logs_client, consumer, ANY) for consumer in mocked_cw_specific_consumers]
         )
 
-        patched_combined_puller.assert_called_with(mocked_pullers)
+        patched_tail_scheduler.assert_called_once_with(mocked_pullers)
+        patched_combined_puller.assert_called_with([mocked_tail_scheduler, mocked_xray_puller])
 
         # depending on the output_dir param assert calls for file consumer or console consumer
         if param_output == "json":
@@ -109,9 +114,10 @@ class TestPullerFactory(TestCase):
 
     @patch("samcli.commands.logs.puller_factory.generate_text_consumer")
     @patch("samcli.commands.logs.puller_factory.CWLogPuller")
+    @patch("samcli.commands.logs.puller_factory.CWLogTailScheduler")
     @patch("samcli.commands.logs.puller_factory.ObservabilityCombinedPuller")
     def test_generate_puller_with_console_with_additional_cw_logs_groups(
-        self, patched_combined_puller, patched_cw_log_puller, patched_text_consumer
+        self, patched_combined_puller, patched_tail_scheduler, patched_cw_log_puller, patched_text_consumer
     ):
         mock_logs_client = Mock()
         mock_logs_client_generator = lambda client: mock_logs_client
@@ -132,7 +138,8 @@ class TestPullerFactory(TestCase):
 
         patched_cw_log_puller.assert_has_calls([call(mock_logs_client, consumer, ANY) for consumer in mocked_consumers])
 
-        patched_combined_puller.assert_called_with(mocked_pullers)
+        patched_tail_scheduler.assert_called_once_with(mocked_pullers)
+        patched_combined_puller.assert_called_with([patched_tail_scheduler.return_value])
 
         patched_text_consumer.assert_has_calls([call(None) for _ in mock_cw_log_groups])
 
@@ -27,6 +27,7 @@ class TestRemoteInvokeCommand(unittest.TestCase):
             MockParams(rv=("--stack-name", ""), name="stack_name"),
             MockParams(rv=("--parameter", ""), name="parameter"),
             MockParams(rv=("--event", ""), name="event"),
+            MockParams(rv=("--repeat", ""), name="repeat"),
             MockParams(rv=("--config-file", ""), name="config_file"),
             MockParams(rv=("--beta-features", ""), name="beta_features"),
             MockParams(rv=("--debug", ""), name="debug"),
@@ -143,6 +144,7 @@ class TestRemoteInvokeCommand(unittest.TestCase):
             "Infrastructure Options": [("", ""), ("--stack-name", ""), ("", "")],
             "Input Event Options": [("", ""), ("--event", ""), ("", "")],
             "Additional Options": [("", ""), ("--parameter", ""), ("", "")],
+            "Load Options": [("", ""), ("--repeat", ""), ("", "")],
             "AWS Credential Options": [("", ""), ("--region", ""), ("", "")],
             "Configuration Options": [("", ""), ("--config-file", ""), ("", "")],
             "Beta Options": [("", ""), ("--beta-features", ""), ("", "")],
@@ -1,5 +1,6 @@
+from io import StringIO
 from unittest import TestCase
-from unittest.mock import patch, Mock
+from unittest.mock import patch, Mock, call
 
 from parameterized import parameterized
 
@@ -94,6 +95,11 @@ class TestRemoteInvokeCliCommand(TestCase):
             event_file=event_file,
             parameter=parameter,
             output=output,
+            asynchronous=False,
+            events_file=None,
+            repeat=1,
+            concurrency=10,
+            rate=None,
             test_event_name=None,
             region=self.region,
             profile=self.profile,
@@ -112,7 +118,7 @@ class TestRemoteInvokeCliCommand(TestCase):
         )
 
         patched_remote_invoke_execution_info.assert_called_with(
-            payload=event, payload_file=event_file, parameters=parameter, output_format=output
+            payload=event, payload_file=event_file, parameters=parameter, output_format=output, asynchronous=False
         )
 
         context_mock.run.assert_called_with(remote_invoke_input=given_remote_invoke_execution_info)
@@ -173,6 +179,11 @@ class TestRemoteInvokeCliCommand(TestCase):
             event_file=None,
             parameter={},
             output=RemoteInvokeOutputFormat.TEXT,
+            asynchronous=True,
+            events_file=None,
+            repeat=1,
+            concurrency=10,
+            rate=None,
             test_event_name="event1",
             region=self.region,
             profile=self.profile,
@@ -186,6 +197,8 @@ class TestRemoteInvokeCliCommand(TestCase):
             payload_file=None,
             parameters={},
             output_format=RemoteInvokeOutputFormat.TEXT,
+            # --async is only supported for state machines
+            asynchronous=False,
         )
         context_mock.run.assert_called_with(remote_invoke_input=given_remote_invoke_execution_info)
         # Assert metric was emitted
@@ -238,6 +251,11 @@ class TestRemoteInvokeCliCommand(TestCase):
             event_file=None,
             parameter={},
             output=RemoteInvokeOutputFormat.TEXT,
+            asynchronous=True,
+            events_file=None,
+            repeat=1,
+            concurrency=10,
+            rate=None,
             test_event_name="event1",
             region=self.region,
             profile=self.profile,
@@ -250,11 +268,115 @@ class TestRemoteInvokeCliCommand(TestCase):
             payload_file=None,
             parameters={},
             output_format=RemoteInvokeOutputFormat.TEXT,
+            asynchronous=True,
         )
         context_mock.run.assert_called_with(remote_invoke_input=given_remote_invoke_execution_info)
         # Assert metric was emitted
         self.assertIn(["RemoteInvokeEventType", "text"], tracked_events)
 
+    @parameterized.expand(
+        [
+            ("event", None, 5),
+            (None, "event_file", 2),
+        ]
+    )
+    @patch("samcli.lib.remote_invoke.remote_invoke_executors.RemoteInvokeExecutionInfo")
+    @patch("samcli.lib.utils.boto_utils.get_boto_client_provider_with_config")
+    @patch("samcli.lib.utils.boto_utils.get_boto_resource_provider_with_config")
+    @patch("samcli.commands.remote.remote_invoke_context.RemoteInvokeContext")
+    @patch("samcli.lib.telemetry.event.EventTracker.track_event")
+    def test_remote_invoke_repeat_runs_load(
+        self,
+        event,
+        event_file,
+        repeat,
+        mock_track_event,
+        mock_remote_invoke_context,
+        patched_get_boto_resource_provider_with_config,
+        patched_get_boto_client_provider_with_config,
+        patched_remote_invoke_execution_info,
+    ):
+        context_mock = Mock()
+        mock_remote_invoke_context.return_value.__enter__.return_value = context_mock
+
+        do_cli(
+            stack_name=self.stack_name,
+            resource_id=self.resource_id,
+            event=event,
+            event_file=event_file,
+            events_file=None,
+            output=RemoteInvokeOutputFormat.TEXT,
+            asynchronous=False,
+            repeat=repeat,
+            concurrency=4,
+            rate=20.0,
+            parameter={"Param1": "ParamValue1"},
+            test_event_name=None,
+            region=self.region,
+            profile=self.profile,
+            config_file=self.config_file,
+            config_env=self.config_env,
+        )
+
+        patched_remote_invoke_execution_info.assert_called_once_with(
+            payload=event,
+            payload_file=event_file,
+            parameters={"Param1": "ParamValue1"},
+            output_format=RemoteInvokeOutputFormat.TEXT,
+        )
+        context_mock.run_load.assert_called_once_with(
+            [patched_remote_invoke_execution_info.return_value], RemoteInvokeOutputFormat.TEXT, repeat, 4, 20.0
+        )
+        context_mock.run.assert_not_called()
+
+    @patch("samcli.lib.remote_invoke.remote_invoke_executors.RemoteInvokeExecutionInfo")
+    @patch("samcli.lib.utils.boto_utils.get_boto_client_provider_with_config")
+    @patch("samcli.lib.utils.boto_utils.get_boto_resource_provider_with_config")
+    @patch("samcli.commands.remote.remote_invoke_context.RemoteInvokeContext")
+    @patch("samcli.lib.telemetry.event.EventTracker.track_event")
+    def test_remote_invoke_events_file_runs_load(
+        self,
+        mock_track_event,
+        mock_remote_invoke_context,
+        patched_get_boto_resource_provider_with_config,
+        patched_get_boto_client_provider_with_config,
+        patched_remote_invoke_execution_info,
+    ):
+        context_mock = Mock()
+        mock_remote_invoke_context.return_value.__enter__.return_value = context_mock
+
+        do_cli(
+            stack_name=self.stack_name,
+            resource_id=self.resource_id,
+            event=None,
+            event_file=None,
+            events_file=StringIO('{"id": 1}\n\n  {"id": 2}  \n'),
+            output=RemoteInvokeOutputFormat.JSON,
+            asynchronous=True,
+            repeat=1,
+            concurrency=10,
+            rate=None,
+            parameter={},
+            test_event_name=None,
+            region=self.region,
+            profile=self.profile,
+            config_file=self.config_file,
+            config_env=self.config_env,
+        )
+
+        patched_remote_invoke_execution_info.assert_has_calls(
+            [
+                call(
+                    payload='{"id": 1}', payload_file=None, parameters={}, output_format=RemoteInvokeOutputFormat.JSON
+                ),
+                call(
+                    payload='{"id": 2}', payload_file=None, parameters={}, output_format=RemoteInvokeOutputFormat.JSON
+                ),
+            ]
+        )
+        self.assertEqual(len(context_mock.run_load.call_args[0][0]), 2)
+        context_mock.run.assert_not_called()
+
     @parameterized.expand(
         [
             (InvalideBotoResponseException,),
@@ -279,6 +401,11 @@ class TestRemoteInvokeCliCommand(TestCase):
                 event_file=None,
                 parameter={},
                 output=RemoteInvokeOutputFormat.TEXT,
+                asynchronous=False,
+                events_file=None,
+                repeat=1,
+                concurrency=10,
+                rate=None,
                 test_event_name=None,
                 region=self.region,
                 profile=self.profile,
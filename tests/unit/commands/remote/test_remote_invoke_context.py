@@ -16,6 +16,7 @@ from samcli.commands.remote.remote_invoke_context import (
     SUPPORTED_SERVICES,
     RESOURCES_PRIORITY_ORDER,
 )
+from samcli.lib.remote_invoke.remote_invoke_executors import RemoteInvokeOutputFormat
 from samcli.lib.utils.cloudformation import CloudFormationResourceSummary
 
 
@@ -259,3 +260,49 @@ class TestRemoteInvokeContext(TestCase):
 
             mocked_remote_invoke_executor_factory.create_remote_invoke_executor.assert_called_once()
             mocked_remote_invoke_executor.execute.assert_called_with(given_input)
+
+    @parameterized.expand(
+        [
+            (RemoteInvokeOutputFormat.TEXT, "formatted report\n"),
+            (RemoteInvokeOutputFormat.JSON, '{\n  "Events": 10\n}\n'),
+        ]
+    )
+    @patch("samcli.commands.remote.remote_invoke_context.StreamWriter")
+    @patch("samcli.commands.remote.remote_invoke_context.RemoteInvokeExecutorFactory")
+    @patch("samcli.commands.remote.remote_invoke_context.get_resource_summary")
+    def test_run_load_should_write_report(
+        self,
+        output_format,
+        expected_output,
+        patched_get_resource_summary,
+        patched_remote_invoke_executor_factory,
+        patched_stream_writer,
+    ):
+        patched_get_resource_summary.return_value = Mock(resource_type=SUPPORTED_SERVICES["sqs"])
+        mocked_remote_invoke_executor = Mock(supports_load=True)
+        mocked_remote_invoke_executor.execute_load.return_value.format.return_value = "formatted report"
+        mocked_remote_invoke_executor.execute_load.return_value.to_dict.return_value = {"Events": 10}
+        patched_remote_invoke_executor_factory.return_value.create_remote_invoke_executor.return_value = (
+            mocked_remote_invoke_executor
+        )
+
+        given_inputs = [Mock()]
+        with self._get_remote_invoke_context() as remote_invoke_context:
+            remote_invoke_context.run_load(given_inputs, output_format, 5, 2, 10.0)
+
+            mocked_remote_invoke_executor.execute_load.assert_called_with(given_inputs, 5, 2, 10.0)
+            patched_stream_writer.return_value.write_str.assert_called_once_with(expected_output)
+
+    @patch("samcli.commands.remote.remote_invoke_context.RemoteInvokeExecutorFactory")
+    @patch("samcli.commands.remote.remote_invoke_context.get_resource_summary")
+    def test_run_load_with_resource_without_batches_should_raise_exception(
+        self, patched_get_resource_summary, patched_remote_invoke_executor_factory
+    ):
+        patched_get_resource_summary.return_value = Mock(resource_type=SUPPORTED_SERVICES["states"])
+        patched_remote_invoke_executor_factory.return_value.create_remote_invoke_executor.return_value = Mock(
+            supports_load=False
+        )
+
+        with self._get_remote_invoke_context() as remote_invoke_context:
+            with self.assertRaises(ResourceNotSupportedForRemoteInvoke):
+                remote_invoke_context.run_load([Mock()], RemoteInvokeOutputFormat.TEXT, 5, 2)
@@ -528,6 +528,7 @@ class TestSamConfigForAllCommands(TestCase):
                 {},
                 ("image",),
                 None,
+                None,
             )
 
     @patch("samcli.lib.cli_validation.image_repository_validation._is_all_image_funcs_provided")
@@ -1143,6 +1144,7 @@ class TestSamConfigWithOverrides(TestCase):
                 {},
                 ("image",),
                 None,
+                None,
             )
 
     @patch("samcli.commands.local.start_lambda.cli.do_cli")
@@ -1240,6 +1242,7 @@ class TestSamConfigWithOverrides(TestCase):
                 {},
                 ("image",),
                 None,
+                None,
             )
 
     @patch("samcli.commands.validate.validate.do_cli")
@@ -0,0 +1,76 @@
+"""
+Generator of large, synthetic Terraform plans, shared by the unit and the performance tests of the prepare hook
+"""
+
+from typing import Dict
+
+from samcli.hook_packages.terraform.hooks.prepare.translate import AWS_PROVIDER_NAME
+
+
+def _planned_terraform_resource(resource_type: str, name: str, values: Dict) -> Dict:
+    return {
+        "address": f"{resource_type}.{name}",
+        "mode": "managed",
+        "type": resource_type,
+        "name": name,
+        "provider_name": AWS_PROVIDER_NAME,
+        "values": values,
+    }
+
+
+def generate_terraform_plan(size: int) -> Dict:
+    """
+    Returns an applied Terraform plan with `size` Lambda functions each using its own layer, and a REST API with
+    `size` resources each having a GET method integrated with a function, 5 * size + 1 resources in total
+    """
+    planned_resources = [_planned_terraform_resource("aws_api_gateway_rest_api", "api", {"id": "api", "name": "api"})]
+    for index in range(size):
+        layer_arn = f"arn:aws:lambda:us-east-1:123456789012:layer:layer{index}:1"
+        planned_resources += [
+            _planned_terraform_resource(
+                "aws_lambda_layer_version",
+                f"layer{index}",
+                {"arn": layer_arn, "layer_name": f"layer{index}", "filename": "layer.zip"},
+            ),
+            _planned_terraform_resource(
+                "aws_lambda_function",
+                f"function{index}",
+                {
+                    "function_name": f"function{index}",
+                    "handler": "app.handler",
+                    "runtime": "python3.12",
+                    "filename": "app.zip",
+                    "package_type": "Zip",
+                    "layers": [layer_arn],
+                },
+            ),
+            _planned_terraform_resource(
+                "aws_api_gateway_resource",
+                f"resource{index}",
+                {"id": f"resource{index}", "rest_api_id": "api", "parent_id": "root", "path_part": f"path{index}"},
+            ),
+            _planned_terraform_resource(
+                "aws_api_gateway_method",
+                f"method{index}",
+                {"rest_api_id": "api", "resource_id": f"resource{index}", "http_method": "GET"},
+            ),
+            _planned_terraform_resource(
+                "aws_api_gateway_integration",
+                f"integration{index}",
+                {
+                    "rest_api_id": "api",
+                    "resource_id": f"resource{index}",
+                    "http_method": "GET",
+                    "type": "AWS_PROXY",
+                    "uri": f"function{index}_invoke_arn",
+                },
+            ),
+        ]
+    configuration_resources = [
+        {"address": resource["address"], "mode": "managed", "type": resource["type"], "name": resource["name"]}
+        for resource in planned_resources
+    ]
+    return {
+        "planned_values": {"root_module": {"resources": planned_resources}},
+        "configuration": {"root_module": {"resources": configuration_resources}},
+    }
@@ -11,6 +11,7 @@ from samcli.hook_packages.terraform.hooks.prepare.resources.apigw import (
     _get_reference_from_string_or_intrinsic,
     _gateway_method_integration_identifier,
     _find_gateway_integration,
+    _index_gateway_integrations,
     add_integrations_to_methods,
     add_integration_responses_to_methods,
     _create_gateway_method_integration_response,
@@ -197,7 +198,7 @@ class TestMethodToIntegrationLinking(TestCase):
         ]
     )
     def test_find_gateway_integration(self, search_key, gateway_integrations_cfn, expected_response):
-        response = _find_gateway_integration(search_key, gateway_integrations_cfn)
+        response = _find_gateway_integration(search_key, _index_gateway_integrations(gateway_integrations_cfn))
         self.assertEqual(response, expected_response)
 
     @parameterized.expand(
@@ -152,7 +152,9 @@ class TestPrepareHookMakefile(PrepareHookUnitBase):
             ]
         )
 
-        mock_generate_makefile.assert_called_once_with(makefile_rules, "/output/dir")
+        mock_generate_makefile.assert_called_once_with(
+            makefile_rules, "/output/dir", [resource.resource["address"] for resource in sam_metadata_resources]
+        )
 
     @patch("samcli.hook_packages.terraform.hooks.prepare.enrich._get_python_command_name")
     @patch("samcli.hook_packages.terraform.hooks.prepare.enrich.generate_makefile")
@@ -241,7 +243,9 @@ class TestPrepareHookMakefile(PrepareHookUnitBase):
             ]
         )
 
-        mock_generate_makefile.assert_called_once_with(makefile_rules, "/output/dir")
+        mock_generate_makefile.assert_called_once_with(
+            makefile_rules, "/output/dir", [resource.resource["address"] for resource in sam_metadata_resources]
+        )
 
     @patch("samcli.hook_packages.terraform.hooks.prepare.enrich._get_python_command_name")
     @patch("samcli.hook_packages.terraform.hooks.prepare.enrich.generate_makefile")
@@ -350,7 +354,9 @@ class TestPrepareHookMakefile(PrepareHookUnitBase):
             ]
         )
 
-        mock_generate_makefile.assert_called_once_with(makefile_rules, "/output/dir")
+        mock_generate_makefile.assert_called_once_with(
+            makefile_rules, "/output/dir", [resource.resource["address"] for resource in sam_metadata_resources]
+        )
 
     @patch("samcli.hook_packages.terraform.hooks.prepare.enrich._get_relevant_cfn_resource")
     @patch(
@@ -547,7 +553,9 @@ class TestPrepareHookMakefile(PrepareHookUnitBase):
             ]
         )
 
-        mock_generate_makefile.assert_called_once_with(makefile_rules, "/output/dir")
+        mock_generate_makefile.assert_called_once_with(
+            makefile_rules, "/output/dir", [resource.resource["address"] for resource in sam_metadata_resources]
+        )
 
     @patch("samcli.hook_packages.terraform.hooks.prepare.enrich._get_relevant_cfn_resource")
     @patch(
@@ -699,7 +707,9 @@ class TestPrepareHookMakefile(PrepareHookUnitBase):
             ]
         )
 
-        mock_generate_makefile.assert_called_once_with(makefile_rules, "/output/dir")
+        mock_generate_makefile.assert_called_once_with(
+            makefile_rules, "/output/dir", [resource.resource["address"] for resource in sam_metadata_resources]
+        )
 
     @parameterized.expand(
         [
@@ -25,6 +25,12 @@ from samcli.lib.utils.subprocess_utils import LoadingPatternError
 class TestPrepareHook(PrepareHookUnitBase):
     def setUp(self):
         super().setUp()
+        # the plan cache is tested in test_plan_cache
+        plan_cache_patch = patch(
+            "samcli.hook_packages.terraform.hooks.prepare.hook.is_plan_cache_enabled", return_value=False
+        )
+        plan_cache_patch.start()
+        self.addCleanup(plan_cache_patch.stop)
 
     @parameterized.expand(
         [
@@ -1,5 +1,9 @@
 """Test Terraform prepare Makefile"""
 
+import os
+import shutil
+import tempfile
+from pathlib import Path
 from unittest.mock import patch, Mock, call
 from parameterized import parameterized
 
@@ -15,6 +19,7 @@ from samcli.hook_packages.terraform.hooks.prepare.makefile_generator import (
     _build_jpath_string,
     _format_makefile_recipe,
     _build_makerule_python_command,
+    remove_batch_apply_state,
 )
 from samcli.hook_packages.terraform.hooks.prepare.types import TFResource
 
@@ -149,6 +154,7 @@ class TestPrepareMakefile(PrepareHookUnitBase):
 
     @parameterized.expand([(True,), (False,)])
     @patch("builtins.open")
+    @patch("samcli.hook_packages.terraform.hooks.prepare.makefile_generator.json")
     @patch("samcli.hook_packages.terraform.hooks.prepare.makefile_generator.shutil")
     @patch("samcli.hook_packages.terraform.hooks.prepare.makefile_generator.os")
     def test_generate_makefile(
@@ -156,6 +162,7 @@ class TestPrepareMakefile(PrepareHookUnitBase):
         output_dir_exists,
         mock_os,
         mock_shutil,
+        mock_json,
         mock_open,
     ):
         mock_os.path.exists.return_value = output_dir_exists
@@ -164,12 +171,14 @@ class TestPrepareMakefile(PrepareHookUnitBase):
         mock_copy_terraform_built_artifacts_script_path = Mock()
         mock_zip_module_path = Mock()
         mock_makefile_path = Mock()
+        mock_targets_path = Mock()
         mock_os.path.dirname.return_value = ""
         mock_os.path.join.side_effect = [
             mock_copy_tf_backend_override_file_path,
             mock_copy_terraform_built_artifacts_script_path,
             mock_zip_module_path,
             mock_makefile_path,
+            mock_targets_path,
         ]
 
         mock_makefile = Mock()
@@ -178,7 +187,7 @@ class TestPrepareMakefile(PrepareHookUnitBase):
         mock_makefile_rules = Mock()
         mock_output_directory_path = Mock()
 
-        generate_makefile(mock_makefile_rules, mock_output_directory_path)
+        generate_makefile(mock_makefile_rules, mock_output_directory_path, ["null_resource.sam_metadata_func"])
 
         if output_dir_exists:
             mock_os.makedirs.assert_not_called()
@@ -192,3 +201,34 @@ class TestPrepareMakefile(PrepareHookUnitBase):
             ]
         )
         mock_makefile.writelines.assert_called_once_with(mock_makefile_rules)
+        mock_open.assert_any_call(mock_targets_path, "w+")
+        mock_json.dump.assert_called_once_with(["null_resource.sam_metadata_func"], mock_makefile)
+
+    @parameterized.expand([({}, True), ({"SAM_CLI_TERRAFORM_BATCH_APPLY": "0"}, False)])
+    def test_generate_makefile_rule_batch_apply(self, environment, batch_apply):
+        sam_metadata_resource = SamMetadataResource(
+            current_module_address=None,
+            resource={"address": "null_resource.sam_metadata_aws_lambda_function"},
+            config_resource=TFResource("", "", None, {}),
+        )
+
+        with patch.dict(os.environ, environment):
+            makefile_rule = generate_makefile_rule_for_lambda_resource(
+                python_command_name="python",
+                output_dir="/some/dir/path/.aws-sam/output",
+                sam_metadata_resource=sam_metadata_resource,
+                terraform_application_dir="/some/dir/path",
+                logical_id="function_logical_id",
+            )
+
+        self.assertEqual(makefile_rule.endswith(" --batch\n"), batch_apply)
+
+    def test_remove_batch_apply_state(self):
+        output_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, output_dir)
+        for filename in ["Makefile", "terraform_batch_output.1a2b.json", "terraform_batch_output.3c4d.lock"]:
+            Path(output_dir, filename).touch()
+
+        remove_batch_apply_state(output_dir)
+
+        self.assertEqual(os.listdir(output_dir), ["Makefile"])
@@ -0,0 +1,223 @@
+"""Test Terraform plan cache"""
+
+import json
+import os
+import shutil
+import stat
+import tempfile
+import time
+from pathlib import Path
+from unittest import TestCase, skipIf
+from unittest.mock import patch
+
+from samcli.hook_packages.terraform.hooks.prepare.hook import prepare
+from samcli.hook_packages.terraform.hooks.prepare.plan_cache import (
+    TERRAFORM_PLAN_CACHE_FILE,
+    TERRAFORM_PLAN_CACHE_VERSION,
+    TerraformPlanCache,
+    is_plan_cache_enabled,
+)
+from tests.testing_utils import IS_WINDOWS
+
+# terraform stand-in which records its arguments, writes the lock file of the providers of main.tf and the modules
+# manifest on init, and prints a plan with the content of main.tf as output
+STUB_TERRAFORM = """#!/bin/sh
+echo "$1" >> "{calls_file}"
+if [ "$1" = "init" ]; then
+    echo "provider $(cat main.tf)" > .terraform.lock.hcl
+    mkdir -p .terraform/modules
+    echo '{"Modules": [{"Key": "", "Dir": "."}]}' > .terraform/modules/modules.json
+fi
+if [ "$1" = "show" ]; then
+    printf '{"planned_values": {"root_module": {}}, "main_tf": "%s"}' "$(cat main.tf)"
+fi
+"""
+
+
+class TestTerraformPlanCache(TestCase):
+    def setUp(self):
+        self.app_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.app_dir, ".aws-sam-iacs", "iacs_metadata")
+        self.addCleanup(shutil.rmtree, self.app_dir)
+        self._write("main.tf", 'resource "null_resource" "sam_metadata" {}')
+        self._write("terraform.tfvars", 'name = "value"')
+        self._write(".terraform.lock.hcl", 'provider "registry.terraform.io/hashicorp/aws" {}')
+
+        environ_patch = patch.dict(os.environ, {}, clear=True)
+        environ_patch.start()
+        self.addCleanup(environ_patch.stop)
+
+    def _write(self, relative_path, content, base_dir=None):
+        path = Path(base_dir or self.app_dir, relative_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+    def _key(self):
+        return TerraformPlanCache(self.app_dir, self.cache_dir).key
+
+    def test_stores_and_loads_plan(self):
+        plan = {"planned_values": {"root_module": {}}}
+
+        TerraformPlanCache(self.app_dir, self.cache_dir).store(plan)
+
+        self.assertEqual(TerraformPlanCache(self.app_dir, self.cache_dir).load(), plan)
+        self.assertEqual(os.listdir(self.cache_dir), [TERRAFORM_PLAN_CACHE_FILE])
+
+    def test_load_without_cache_file(self):
+        self.assertIsNone(TerraformPlanCache(self.app_dir, self.cache_dir).load())
+
+    def test_load_ignores_unreadable_cache_file(self):
+        self._write(TERRAFORM_PLAN_CACHE_FILE, "{not json", base_dir=self.cache_dir)
+
+        self.assertIsNone(TerraformPlanCache(self.app_dir, self.cache_dir).load())
+
+    def test_load_ignores_cache_file_of_another_version(self):
+        cache = {"Version": TERRAFORM_PLAN_CACHE_VERSION + 1, "Key": self._key(), "Plan": {}}
+        self._write(TERRAFORM_PLAN_CACHE_FILE, json.dumps(cache), base_dir=self.cache_dir)
+
+        self.assertIsNone(TerraformPlanCache(self.app_dir, self.cache_dir).load())
+
+    def test_load_misses_after_configuration_change(self):
+        TerraformPlanCache(self.app_dir, self.cache_dir).store({"planned_values": {}})
+        self._write("main.tf", 'resource "null_resource" "other" {}')
+
+        self.assertIsNone(TerraformPlanCache(self.app_dir, self.cache_dir).load())
+
+    def test_key_changes_with_inputs(self):
+        key = self._key()
+
+        for change in [
+            lambda: self._write("modules/function/main.tf", "variable name {}"),
+            lambda: self._write("terraform.tfvars", 'name = "other"'),
+            lambda: self._write("prod.tfvars.json", "{}"),
+            lambda: self._write(".terraform.lock.hcl", 'provider "registry.terraform.io/hashicorp/null" {}'),
+            lambda: self._write(".terraform/environment", "staging"),
+            lambda: self._write(".terraform/modules/modules.json", '{"Modules": []}'),
+            lambda: os.environ.update({"TF_VAR_name": "value"}),
+            lambda: os.environ.update({"TF_WORKSPACE": "staging"}),
+            lambda: os.environ.update({"AWS_REGION": "us-west-2"}),
+        ]:
+            change()
+            new_key = self._key()
+            self.assertNotEqual(new_key, key)
+            key = new_key
+
+    def test_key_ignores_other_inputs(self):
+        key = self._key()
+
+        self._write("README.md", "readme")
+        self._write("src/app.py", "def handler(event, context): pass")
+        self._write(".terraform/providers/provider.tf", "installed provider")
+        self._write(".terraform/modules/remote/main.tf", "installed module")
+        self._write(".aws-sam/build/main.tf", "build output")
+        self._write(TERRAFORM_PLAN_CACHE_FILE, "{}", base_dir=self.cache_dir)
+        os.environ.update({"TF_LOG": "DEBUG", "SAM_CLI_TELEMETRY": "0"})
+
+        self.assertEqual(self._key(), key)
+
+    def test_key_includes_local_modules_outside_of_application(self):
+        module_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, module_dir)
+        self._write("main.tf", "variable name {}", base_dir=module_dir)
+        manifest = {"Modules": [{"Key": "", "Dir": "."}, {"Key": "function", "Dir": module_dir}]}
+        self._write(".terraform/modules/modules.json", json.dumps(manifest))
+        key = self._key()
+
+        self._write("main.tf", "variable other_name {}", base_dir=module_dir)
+
+        self.assertNotEqual(self._key(), key)
+
+    def test_key_uses_custom_data_dir(self):
+        os.environ["TF_DATA_DIR"] = "tf-data"
+        key = self._key()
+
+        self._write(".terraform/environment", "staging")
+        self.assertEqual(self._key(), key)
+        self._write("tf-data/environment", "staging")
+        self.assertNotEqual(self._key(), key)
+
+    def test_is_plan_cache_enabled(self):
+        self.assertTrue(is_plan_cache_enabled())
+        for value, expected in [("1", True), ("true", True), ("0", False), ("False", False)]:
+            os.environ["SAM_CLI_TERRAFORM_PLAN_CACHE"] = value
+            self.assertEqual(is_plan_cache_enabled(), expected)
+
+
+@skipIf(IS_WINDOWS, "The stub terraform executable is a shell script")
+class TestPrepareWithPlanCache(TestCase):
+    def setUp(self):
+        self.app_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.app_dir)
+        self.output_dir = os.path.join(self.app_dir, ".aws-sam-iacs", "iacs_metadata")
+        Path(self.app_dir, "main.tf").write_text("v1")
+
+        bin_dir = os.path.join(self.app_dir, "bin")
+        os.mkdir(bin_dir)
+        self.calls_file = os.path.join(self.app_dir, "terraform-calls.log")
+        terraform = Path(bin_dir, "terraform")
+        terraform.write_text(STUB_TERRAFORM.replace("{calls_file}", self.calls_file))
+        terraform.chmod(terraform.stat().st_mode | stat.S_IEXEC)
+
+        environ_patch = patch.dict(os.environ, {"PATH": f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}"})
+        environ_patch.start()
+        self.addCleanup(environ_patch.stop)
+        # shorten the wait between the dots printed while terraform runs
+        sleep_patch = patch("samcli.lib.utils.subprocess_utils.sleep", side_effect=lambda _: time.sleep(0.01))
+        sleep_patch.start()
+        self.addCleanup(sleep_patch.stop)
+
+    def _prepare(self):
+        prepare({"IACProjectPath": self.app_dir, "OutputDirPath": self.output_dir})
+        with open(os.path.join(self.output_dir, TERRAFORM_PLAN_CACHE_FILE)) as cache_file:
+            return json.load(cache_file)["Plan"]
+
+    def _terraform_calls(self):
+        if not os.path.exists(self.calls_file):
+            return []
+        return Path(self.calls_file).read_text().split()
+
+    def test_unchanged_configuration_skips_terraform(self):
+        self._prepare()
+        self.assertEqual(self._terraform_calls(), ["init", "plan", "show"])
+
+        plan = self._prepare()
+
+        self.assertEqual(self._terraform_calls(), ["init", "plan", "show"])
+        self.assertEqual(plan["main_tf"], "v1")
+        self.assertTrue(os.path.exists(os.path.join(self.output_dir, "template.json")))
+
+    def test_changed_configuration_runs_terraform(self):
+        self._prepare()
+        Path(self.app_dir, "main.tf").write_text("v2")
+
+        plan = self._prepare()
+
+        self.assertEqual(self._terraform_calls(), ["init", "plan", "show"] * 2)
+        self.assertEqual(plan["main_tf"], "v2")
+
+    def test_plan_is_cached_with_the_files_written_by_init(self):
+        self._prepare()
+        # init updates the lock file on the next prepare
+        Path(self.app_dir, "main.tf").write_text("v2")
+        self._prepare()
+
+        plan = self._prepare()
+
+        self.assertEqual(self._terraform_calls(), ["init", "plan", "show"] * 2)
+        self.assertEqual(plan["main_tf"], "v2")
+
+    def test_changed_environment_runs_terraform(self):
+        self._prepare()
+
+        with patch.dict(os.environ, {"TF_VAR_name": "value"}):
+            self._prepare()
+
+        self.assertEqual(self._terraform_calls(), ["init", "plan", "show"] * 2)
+
+    def test_disabled_cache_always_runs_terraform(self):
+        self._prepare()
+
+        with patch.dict(os.environ, {"SAM_CLI_TERRAFORM_PLAN_CACHE": "0"}):
+            prepare({"IACProjectPath": self.app_dir, "OutputDirPath": self.output_dir})
+
+        self.assertEqual(self._terraform_calls(), ["init", "plan", "show"] * 2)
@@ -0,0 +1,40 @@
+"""Test the Terraform prepare hook translation of large synthetic plans"""
+
+from unittest import TestCase
+from unittest.mock import patch
+
+from samcli.hook_packages.terraform.hooks.prepare.resources import apigw
+from samcli.hook_packages.terraform.hooks.prepare.translate import translate_to_cfn
+from samcli.hook_packages.terraform.lib.utils import build_cfn_logical_id
+from tests.unit.hook_packages.terraform.hooks.prepare.plan_generator import generate_terraform_plan
+
+
+class TestTranslateLargePlan(TestCase):
+    def _translate(self, size):
+        return translate_to_cfn(generate_terraform_plan(size), "/output/dir", "/app/root", "/project/root")
+
+    def test_links_all_resources(self):
+        resources = self._translate(2000)["Resources"]
+
+        self.assertEqual(len(resources), 4 * 2000 + 1)
+        for index in [0, 999, 1999]:
+            function = resources[build_cfn_logical_id(f"aws_lambda_function.function{index}")]
+            self.assertEqual(
+                function["Properties"]["Layers"],
+                [{"Ref": build_cfn_logical_id(f"aws_lambda_layer_version.layer{index}")}],
+            )
+            method = resources[build_cfn_logical_id(f"aws_api_gateway_method.method{index}")]
+            self.assertEqual(
+                method["Properties"]["ResourceId"],
+                {"Ref": build_cfn_logical_id(f"aws_api_gateway_resource.resource{index}")},
+            )
+            self.assertEqual(method["Properties"]["Integration"]["Uri"], f"function{index}_invoke_arn")
+
+    def test_identifies_each_gateway_integration_once(self):
+        with patch.object(
+            apigw, "_gateway_method_integration_identifier", wraps=apigw._gateway_method_integration_identifier
+        ) as identifier_mock:
+            self._translate(500)
+
+        # each method looks up its integration and its integration response, each integration is indexed once
+        self.assertEqual(identifier_mock.call_count, 3 * 500)
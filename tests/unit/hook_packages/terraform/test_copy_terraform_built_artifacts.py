@@ -0,0 +1,166 @@
+"""Test the batched apply of the Terraform build script"""
+
+import importlib.util
+import json
+import os
+import shutil
+import stat
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest import TestCase, skipIf
+from unittest.mock import patch
+
+from samcli.hook_packages.terraform.hooks.prepare.makefile_generator import (
+    TERRAFORM_BUILD_SCRIPT,
+    TF_BACKEND_OVERRIDE_FILENAME,
+    TF_BATCH_TARGETS_FILENAME,
+    remove_batch_apply_state,
+)
+from samcli.lib.build.constants import HOOK_BUILD_ALL_RESOURCES_ENV_VAR
+from tests.testing_utils import IS_WINDOWS
+
+SAMCLI_ROOT = Path(__file__).parents[4].joinpath("samcli")
+
+# terraform stand-in which records its commands, fails the applies of more than FAIL_BATCH_OVER targets, and shows
+# a state where the sam metadata resource "null_resource.<name>" has the built output path "<name>"
+STUB_TERRAFORM = """#!/bin/sh
+echo "$*" >> "{calls_file}"
+targets=$(echo "$*" | grep -o -- "-target" | wc -l)
+if [ "$1" = "apply" ] && [ -n "$FAIL_BATCH_OVER" ] && [ $targets -gt $FAIL_BATCH_OVER ]; then
+    exit 1
+fi
+if [ "$1" = "show" ]; then
+    printf '{{"values": {{"root_module": {{"resources": [
+        {{"address": "null_resource.func1", "values": {{"triggers": {{"built_output_path": "func1"}}}}}},
+        {{"address": "null_resource.func2", "values": {{"triggers": {{"built_output_path": "func2"}}}}}}
+    ]}}}}}}'
+fi
+"""
+
+TARGETS = ["null_resource.func1", "null_resource.func2"]
+
+
+@skipIf(IS_WINDOWS, "The stub terraform executable is a shell script")
+class TestBatchedApply(TestCase):
+    def setUp(self):
+        self.app_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.app_dir)
+        self.metadata_dir = os.path.join(self.app_dir, ".aws-sam-iacs", "iacs_metadata")
+        os.makedirs(self.metadata_dir)
+        shutil.copy(SAMCLI_ROOT.joinpath("hook_packages", "terraform", TERRAFORM_BUILD_SCRIPT), self.metadata_dir)
+        shutil.copy(SAMCLI_ROOT.joinpath("local", "lambdafn", "zip.py"), self.metadata_dir)
+        Path(self.metadata_dir, TF_BACKEND_OVERRIDE_FILENAME).write_text("terraform {}")
+        Path(self.metadata_dir, TF_BATCH_TARGETS_FILENAME).write_text(json.dumps(TARGETS))
+
+        for name in ["func1", "func2"]:
+            Path(self.app_dir, name).mkdir()
+            Path(self.app_dir, name, "app.py").write_text(name)
+
+        bin_dir = os.path.join(self.app_dir, "bin")
+        os.mkdir(bin_dir)
+        self.calls_file = os.path.join(self.app_dir, "terraform-calls.log")
+        terraform = Path(bin_dir, "terraform")
+        terraform.write_text(STUB_TERRAFORM.format(calls_file=self.calls_file))
+        terraform.chmod(terraform.stat().st_mode | stat.S_IEXEC)
+        self.env = {
+            **os.environ,
+            "PATH": f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}",
+            HOOK_BUILD_ALL_RESOURCES_ENV_VAR: "build1",
+        }
+
+    def _build(self, name, batch=True):
+        artifacts_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, artifacts_dir)
+        command = [
+            sys.executable,
+            os.path.join(self.metadata_dir, TERRAFORM_BUILD_SCRIPT),
+            "--expression",
+            f'|values|root_module|resources|[?address=="null_resource.{name}"]|values|triggers|built_output_path',
+            "--directory",
+            artifacts_dir,
+            "--target",
+            f"null_resource.{name}",
+        ]
+        if batch:
+            command.append("--batch")
+        subprocess.run(command, check=True, capture_output=True, cwd=self.app_dir, env=self.env)
+        return Path(artifacts_dir, "app.py").read_text()
+
+    def _terraform_commands(self):
+        return [line.split()[0] for line in Path(self.calls_file).read_text().splitlines()]
+
+    def test_applies_all_targets_once(self):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            artifacts = list(executor.map(self._build, ["func1", "func2"]))
+
+        self.assertEqual(artifacts, ["func1", "func2"])
+        self.assertEqual(self._terraform_commands(), ["init", "apply", "show"])
+        apply_command = Path(self.calls_file).read_text().splitlines()[1]
+        self.assertEqual(
+            apply_command,
+            "apply -target null_resource.func1 -replace null_resource.func1 "
+            "-target null_resource.func2 -replace null_resource.func2 -auto-approve",
+        )
+        self.assertFalse(os.path.exists(os.path.join(self.metadata_dir, "terraform_batch_output.build1.lock")))
+
+    def test_applies_again_in_the_next_build(self):
+        self._build("func1")
+        self.env[HOOK_BUILD_ALL_RESOURCES_ENV_VAR] = "build2"
+        self._build("func2")
+
+        self.assertEqual(self._terraform_commands(), ["init", "apply", "show"] * 2)
+
+    def test_ignores_the_lock_left_by_a_killed_build(self):
+        Path(self.metadata_dir, "terraform_batch_output.build0.lock").touch()
+
+        self.assertEqual(self._build("func1"), "func1")
+        self.assertEqual(self._terraform_commands(), ["init", "apply", "show"])
+        self.assertEqual(len(Path(self.calls_file).read_text().splitlines()[1].split("-target")), 3)
+
+        remove_batch_apply_state(self.metadata_dir)
+        self.assertFalse([name for name in os.listdir(self.metadata_dir) if name.startswith("terraform_batch_output")])
+
+    def test_falls_back_to_the_target_when_the_lock_times_out(self):
+        Path(self.metadata_dir, "terraform_batch_output.build1.lock").touch()
+        spec = importlib.util.spec_from_file_location(
+            "copy_terraform_built_artifacts", os.path.join(self.metadata_dir, TERRAFORM_BUILD_SCRIPT)
+        )
+        script = importlib.util.module_from_spec(spec)
+        with patch.object(sys, "path", [self.metadata_dir] + sys.path):
+            spec.loader.exec_module(script)
+
+        with patch.object(script, "BATCH_LOCK_TIMEOUT", 0), patch.object(script, "apply_all_targets") as apply_mock:
+            self.assertIsNone(script.get_batched_terraform_output("build1"))
+
+        apply_mock.assert_not_called()
+        # the lock of the other build is left to it
+        self.assertTrue(os.path.exists(os.path.join(self.metadata_dir, "terraform_batch_output.build1.lock")))
+
+    def test_falls_back_to_each_target_when_batch_fails(self):
+        self.env["FAIL_BATCH_OVER"] = "1"
+
+        artifacts = [self._build("func1"), self._build("func2")]
+
+        self.assertEqual(artifacts, ["func1", "func2"])
+        # the failed batch isn't attempted again by the second build
+        self.assertEqual(
+            self._terraform_commands(), ["init", "apply", "init", "apply", "show", "init", "apply", "show"]
+        )
+
+    def test_applies_each_target_without_batch(self):
+        self._build("func1", batch=False)
+        self._build("func2", batch=False)
+
+        self.assertEqual(self._terraform_commands(), ["init", "apply", "show"] * 2)
+
+    def test_applies_each_target_when_not_building_all_resources(self):
+        del self.env[HOOK_BUILD_ALL_RESOURCES_ENV_VAR]
+
+        self._build("func1")
+        self._build("func2")
+
+        self.assertEqual(self._terraform_commands(), ["init", "apply", "show"] * 2)
+        self.assertNotIn("null_resource.func2", Path(self.calls_file).read_text().splitlines()[1])
@@ -1,3 +1,4 @@
+import hashlib
 import itertools
 from copy import deepcopy
 from typing import List, Dict
@@ -16,9 +17,11 @@ from samcli.lib.build.build_strategy import (
     CachedBuildStrategy,
     CachedOrIncrementalBuildStrategyWrapper,
     IncrementalBuildStrategy,
+    SOURCE_DIGEST_FILE_SUFFIX,
     clean_redundant_folders,
 )
 from samcli.lib.utils import osutils
+from samcli.lib.utils.hash import dir_checksum
 from pathlib import Path
 
 from samcli.lib.utils.packagetype import ZIP, IMAGE
@@ -380,14 +383,18 @@ class CachedBuildStrategyTest(BuildStrategyBaseTest):
         cache_build_strategy = CachedBuildStrategy(
             self.build_graph, default_build_strategy, "base_dir", given_build_dir, "cache_dir"
         )
-        cache_build_strategy.build()
+        with patch("samcli.lib.build.build_strategy.load_directory_digest") as load_directory_digest_mock:
+            load_directory_digest_mock.return_value = (Mock(digest="hash"), None)
+            cache_build_strategy.build()
         mock_function_build.assert_called()
         mock_layer_build.assert_called()
 
     @patch("samcli.lib.build.build_strategy.osutils.copytree")
     @patch("samcli.lib.build.build_strategy.pathlib.Path.exists")
-    @patch("samcli.lib.build.build_strategy.dir_checksum")
-    def test_if_cached_valid_when_build_single_function_definition(self, dir_checksum_mock, exists_mock, copytree_mock):
+    @patch("samcli.lib.build.build_strategy.load_directory_digest")
+    def test_if_cached_valid_when_build_single_function_definition(
+        self, load_directory_digest_mock, exists_mock, copytree_mock
+    ):
         with osutils.mkdir_temp() as temp_base_dir:
             build_dir = Path(temp_base_dir, ".aws-sam", "build")
             build_dir.mkdir(parents=True)
@@ -395,7 +402,7 @@ class CachedBuildStrategyTest(BuildStrategyBaseTest):
             cache_dir.mkdir(parents=True)
 
             exists_mock.return_value = True
-            dir_checksum_mock.return_value = CachedBuildStrategyTest.SOURCE_HASH
+            load_directory_digest_mock.return_value = (Mock(digest=CachedBuildStrategyTest.SOURCE_HASH), None)
 
             build_graph_path = Path(build_dir.parent, "build.toml")
             build_graph_path.write_text(CachedBuildStrategyTest.BUILD_GRAPH_CONTENTS)
@@ -426,11 +433,17 @@ class CachedBuildStrategyTest(BuildStrategyBaseTest):
     @parameterized.expand([(True,), (False,)])
     @patch("samcli.lib.build.build_strategy.osutils.copytree")
     @patch("samcli.lib.build.build_strategy.pathlib.Path.exists")
-    @patch("samcli.lib.build.build_strategy.dir_checksum")
+    @patch("samcli.lib.build.build_strategy.load_directory_digest")
     @patch("samcli.lib.utils.osutils.os")
     @patch("samcli.lib.build.build_strategy.is_experimental_enabled")
     def test_if_cached_valid_when_build_single_function_definition_with_build_improvements_22(
-        self, should_raise_os_error, patch_is_experimental, patch_os, dir_checksum_mock, exists_mock, copytree_mock
+        self,
+        should_raise_os_error,
+        patch_is_experimental,
+        patch_os,
+        load_directory_digest_mock,
+        exists_mock,
+        copytree_mock,
     ):
         patch_is_experimental.return_value = True
         if should_raise_os_error:
@@ -442,7 +455,7 @@ class CachedBuildStrategyTest(BuildStrategyBaseTest):
             cache_dir.mkdir(parents=True)
 
             exists_mock.return_value = True
-            dir_checksum_mock.return_value = CachedBuildStrategyTest.SOURCE_HASH
+            load_directory_digest_mock.return_value = (Mock(digest=CachedBuildStrategyTest.SOURCE_HASH), None)
 
             build_graph_path = Path(build_dir.parent, "build.toml")
             build_graph_path.write_text(CachedBuildStrategyTest.BUILD_GRAPH_CONTENTS)
@@ -542,6 +555,49 @@ class CachedBuildStrategyTest(BuildStrategyBaseTest):
             cached_build_strategy._clean_redundant_cached()
             self.assertTrue(not redundant_cache_folder.exists())
 
+    def test_redundant_source_digests_should_be_clean(self):
+        with osutils.mkdir_temp() as temp_base_dir:
+            build_dir = Path(temp_base_dir, ".aws-sam", "build")
+            build_dir.mkdir(parents=True)
+            build_graph_path = Path(build_dir.parent, "build.toml")
+            build_graph_path.write_text(CachedBuildStrategyTest.BUILD_GRAPH_CONTENTS)
+            build_graph = BuildGraph(str(build_dir))
+            cache_dir = Path(temp_base_dir, ".aws-sam", "cache")
+            cache_dir.mkdir(parents=True)
+            function_uuid = build_graph.get_function_build_definitions()[0].uuid
+            source_digest = Path(cache_dir, f"{function_uuid}{SOURCE_DIGEST_FILE_SUFFIX}")
+            source_digest.write_text("{}")
+            redundant_source_digest = Path(cache_dir, f"redundant{SOURCE_DIGEST_FILE_SUFFIX}")
+            redundant_source_digest.write_text("{}")
+
+            cached_build_strategy = CachedBuildStrategy(build_graph, Mock(), temp_base_dir, build_dir, cache_dir)
+            cached_build_strategy._clean_redundant_cached()
+
+            self.assertTrue(source_digest.exists())
+            self.assertFalse(redundant_source_digest.exists())
+
+    def test_source_hash_is_persisted_between_builds(self):
+        with osutils.mkdir_temp() as temp_base_dir:
+            code_dir = Path(temp_base_dir, "code")
+            code_dir.mkdir()
+            Path(code_dir, "app.py").write_text("def handler(event, context): pass")
+            cache_dir = Path(temp_base_dir, ".aws-sam", "cache")
+            build_definition = Mock(uuid="uuid")
+
+            cached_build_strategy = CachedBuildStrategy(Mock(), Mock(), temp_base_dir, "build_dir", str(cache_dir))
+            source_hash = cached_build_strategy._calculate_source_hash(build_definition, str(code_dir))
+
+            self.assertEqual(
+                source_hash, dir_checksum(str(code_dir), ignore_list=[".aws-sam"], hash_generator=hashlib.sha256())
+            )
+            self.assertTrue(Path(cache_dir, f"uuid{SOURCE_DIGEST_FILE_SUFFIX}").exists())
+
+            Path(code_dir, "app.py").write_text("def handler(event, context): return event")
+            self.assertEqual(
+                cached_build_strategy._calculate_source_hash(build_definition, str(code_dir)),
+                dir_checksum(str(code_dir), ignore_list=[".aws-sam"], hash_generator=hashlib.sha256()),
+            )
+
 
 class ParallelBuildStrategyTest(BuildStrategyBaseTest):
     @patch("samcli.lib.build.build_strategy.AsyncContext")
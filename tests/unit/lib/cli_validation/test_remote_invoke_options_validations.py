@@ -72,7 +72,8 @@ class TestEventFileValidation(TestCase):
             event_and_event_file_options_validation(mock_func)()
 
         self.assertIn(
-            "Only one of '--event-file', '--event' and '--test-event-name' can be provided.", ex.exception.message
+            "Only one of '--event-file', '--event', '--events-file' and '--test-event-name' can be provided.",
+            ex.exception.message,
         )
 
         mock_func.assert_not_called()
@@ -91,7 +92,8 @@ class TestEventFileValidation(TestCase):
             event_and_event_file_options_validation(mock_func)()
 
         self.assertIn(
-            "Only one of '--event-file', '--event' and '--test-event-name' can be provided.", ex.exception.message
+            "Only one of '--event-file', '--event', '--events-file' and '--test-event-name' can be provided.",
+            ex.exception.message,
         )
 
         mock_func.assert_not_called()
@@ -110,7 +112,8 @@ class TestEventFileValidation(TestCase):
             event_and_event_file_options_validation(mock_func)()
 
         self.assertIn(
-            "Only one of '--event-file', '--event' and '--test-event-name' can be provided.", ex.exception.message
+            "Only one of '--event-file', '--event', '--events-file' and '--test-event-name' can be provided.",
+            ex.exception.message,
         )
 
         mock_func.assert_not_called()
@@ -1028,6 +1028,118 @@ class TestDeployer(CustomTestCase):
         self.assertEqual(patched_pow.call_count, 3)
         self.assertEqual(patched_pow.call_args_list, [call(2, 1), call(2, 2), call(2, 1)])
 
+    @patch("time.sleep")
+    @patch("samcli.lib.deploy.deployer.pprint_columns")
+    def test_describe_stack_events_backs_off_while_no_events(self, patched_pprint_columns, patched_time):
+        start_timestamp = datetime(2022, 1, 1, 16, 42, 0, 0, timezone.utc)
+        root_event = {
+            "StackId": "arn:aws:cloudformation:region:accountId:stack/test/uuid",
+            "StackName": "test",
+            "LogicalResourceId": "test",
+            "PhysicalResourceId": "arn:aws:cloudformation:region:accountId:stack/test/uuid",
+            "ResourceType": "AWS::CloudFormation::Stack",
+        }
+        no_events = MockPaginator([{"StackEvents": []}])
+        self.deployer._client.get_paginator = MagicMock(
+            side_effect=[no_events] * 5
+            + [
+                MockPaginator(
+                    [
+                        {
+                            "StackEvents": [
+                                {
+                                    **root_event,
+                                    "EventId": str(uuid.uuid4()),
+                                    "Timestamp": start_timestamp,
+                                    "ResourceStatus": "UPDATE_IN_PROGRESS",
+                                }
+                            ]
+                        }
+                    ]
+                ),
+                no_events,
+                MockPaginator(
+                    [
+                        {
+                            "StackEvents": [
+                                {
+                                    **root_event,
+                                    "EventId": str(uuid.uuid4()),
+                                    "Timestamp": start_timestamp + timedelta(seconds=20),
+                                    "ResourceStatus": "UPDATE_COMPLETE",
+                                }
+                            ]
+                        }
+                    ]
+                ),
+            ]
+        )
+
+        stack_status = self.deployer.describe_stack_events("test", utc_to_timestamp(start_timestamp) - 1)
+
+        self.assertEqual(stack_status, "UPDATE_COMPLETE")
+        self.assertEqual(
+            patched_time.call_args_list,
+            [call(0.5), call(1.0), call(2.0), call(4.0), call(5), call(5), call(0.5), call(1.0)],
+        )
+
+    @patch("time.sleep")
+    @patch("samcli.lib.deploy.deployer.pprint_columns")
+    def test_describe_stack_events_streams_nested_stacks(self, patched_pprint_columns, patched_time):
+        start_timestamp = datetime(2022, 1, 1, 16, 42, 0, 0, timezone.utc)
+        root_stack_id = "arn:aws:cloudformation:region:accountId:stack/test/uuid"
+        nested_stack_id = "arn:aws:cloudformation:region:accountId:stack/test-Nested-1/uuid"
+        root_stack_events = [
+            {
+                "StackId": root_stack_id,
+                "EventId": str(uuid.uuid4()),
+                "StackName": "test",
+                "LogicalResourceId": "test",
+                "PhysicalResourceId": root_stack_id,
+                "ResourceType": "AWS::CloudFormation::Stack",
+                "Timestamp": start_timestamp + timedelta(seconds=3),
+                "ResourceStatus": "CREATE_COMPLETE",
+            },
+            {
+                "StackId": root_stack_id,
+                "EventId": str(uuid.uuid4()),
+                "StackName": "test",
+                "LogicalResourceId": "Nested",
+                "PhysicalResourceId": nested_stack_id,
+                "ResourceType": "AWS::CloudFormation::Stack",
+                "Timestamp": start_timestamp + timedelta(seconds=1),
+                "ResourceStatus": "CREATE_IN_PROGRESS",
+            },
+        ]
+        nested_stack_events = [
+            {
+                "StackId": nested_stack_id,
+                "EventId": str(uuid.uuid4()),
+                "StackName": "test-Nested-1",
+                "LogicalResourceId": "Function",
+                "PhysicalResourceId": "function",
+                "ResourceType": "AWS::Lambda::Function",
+                "Timestamp": start_timestamp + timedelta(seconds=2),
+                "ResourceStatus": "CREATE_COMPLETE",
+            }
+        ]
+        self.deployer._client.get_paginator = MagicMock(
+            side_effect=[
+                MockPaginator([{"StackEvents": root_stack_events[1:]}]),
+                MockPaginator([{"StackEvents": nested_stack_events}]),
+                MockPaginator([{"StackEvents": root_stack_events}]),
+                MockPaginator([{"StackEvents": nested_stack_events}]),
+            ]
+        )
+
+        stack_status = self.deployer.describe_stack_events("test", utc_to_timestamp(start_timestamp) - 1)
+
+        self.assertEqual(stack_status, "CREATE_COMPLETE")
+        self.assertEqual(
+            [pprint_call[1]["columns"][2] for pprint_call in patched_pprint_columns.call_args_list],
+            ["Nested", "Nested/Function", "test"],
+        )
+
     def test_check_stack_status(self):
         self.assertEqual(self.deployer._check_stack_not_in_progress("CREATE_COMPLETE"), True)
         self.assertEqual(self.deployer._check_stack_not_in_progress("CREATE_FAILED"), True)
@@ -1049,7 +1161,7 @@ class TestDeployer(CustomTestCase):
 
     @patch("time.sleep")
     def test_wait_for_execute(self, patched_time):
-        self.deployer.describe_stack_events = MagicMock()
+        self.deployer.describe_stack_events = MagicMock(return_value=None)
         self.deployer._client.get_waiter = MagicMock(return_value=MockCreateUpdateWaiter())
         self.deployer.wait_for_execute("test", "CREATE", False)
         self.deployer.wait_for_execute("test", "UPDATE", True)
@@ -1076,6 +1188,28 @@ class TestDeployer(CustomTestCase):
         with self.assertRaises(DeployStackOutPutFailedError):
             self.deployer.wait_for_execute("test", "CREATE", False)
 
+    @patch("time.sleep")
+    def test_wait_for_execute_returns_when_events_show_completion(self, patched_time):
+        self.deployer.describe_stack_events = MagicMock(return_value="UPDATE_COMPLETE")
+        self.deployer._client.get_waiter = MagicMock()
+        self.deployer.get_stack_outputs = MagicMock(return_value=None)
+
+        self.deployer.wait_for_execute("test", "UPDATE", False)
+
+        self.deployer._client.get_waiter.assert_not_called()
+
+    @patch("samcli.lib.deploy.deployer.LOG")
+    @patch("time.sleep")
+    def test_wait_for_execute_fails_when_events_show_failure(self, patched_time, patched_log):
+        self.deployer.describe_stack_events = MagicMock(return_value="UPDATE_FAILED")
+        self.deployer._client.get_waiter = MagicMock()
+
+        with self.assertRaises(DeployFailedError):
+            self.deployer.wait_for_execute("test", "UPDATE", True)
+
+        self.deployer._client.get_waiter.assert_not_called()
+        patched_log.info.assert_called_once()
+
     def test_create_and_wait_for_changeset(self):
         self.deployer.create_changeset = MagicMock(return_value=({"Id": "test"}, "create"))
         self.deployer.wait_for_changeset = MagicMock()
@@ -1171,7 +1305,7 @@ class TestDeployer(CustomTestCase):
 
     @patch("time.sleep")
     def test_wait_for_execute_no_outputs(self, patched_time):
-        self.deployer.describe_stack_events = MagicMock()
+        self.deployer.describe_stack_events = MagicMock(return_value=None)
         self.deployer._client.get_waiter = MagicMock(return_value=MockCreateUpdateWaiter())
         self.deployer._display_stack_outputs = MagicMock()
         self.deployer.get_stack_outputs = MagicMock(return_value=None)
@@ -1180,7 +1314,7 @@ class TestDeployer(CustomTestCase):
 
     @patch("time.sleep")
     def test_wait_for_execute_with_outputs(self, patched_time):
-        self.deployer.describe_stack_events = MagicMock()
+        self.deployer.describe_stack_events = MagicMock(return_value=None)
         outputs = {
             "Stacks": [
                 {
@@ -0,0 +1,262 @@
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+from unittest.mock import patch
+
+from botocore.exceptions import ClientError
+
+from samcli.lib.deploy.stack_event_streamer import StackEventStreamer
+from samcli.lib.utils.time import utc_to_timestamp
+
+START_TIMESTAMP = datetime(2022, 1, 1, 16, 42, 0, 0, timezone.utc)
+ROOT_STACK_ID = "arn:aws:cloudformation:region:accountId:stack/test/uuid"
+NESTED_STACK_ID = "arn:aws:cloudformation:region:accountId:stack/test-Nested-1/uuid"
+OTHER_NESTED_STACK_ID = "arn:aws:cloudformation:region:accountId:stack/test-Other-1/uuid"
+
+
+def stack_event(stack_id, logical_id, status, seconds, resource_type="AWS::Lambda::Function", physical_id=""):
+    return {
+        "StackId": stack_id,
+        "EventId": str(uuid.uuid4()),
+        "StackName": stack_id.split("/")[1],
+        "LogicalResourceId": logical_id,
+        "PhysicalResourceId": physical_id,
+        "ResourceType": resource_type,
+        "Timestamp": START_TIMESTAMP + timedelta(seconds=seconds),
+        "ResourceStatus": status,
+    }
+
+
+class StubCloudFormationClient:
+    """
+    CloudFormation client returning the events added to it, in reverse chronological order as CloudFormation does
+    """
+
+    def __init__(self):
+        self.events = {}
+        self.errors = {}
+        self.on_describe = None
+
+    def add_events(self, stack_id, *events):
+        self.events.setdefault(stack_id, []).extend(events)
+
+    def get_paginator(self, operation_name):
+        assert operation_name == "describe_stack_events"
+        return self
+
+    def paginate(self, StackName):
+        if self.on_describe:
+            self.on_describe(StackName)
+        if StackName in self.errors:
+            raise self.errors[StackName]
+        events = sorted(self.events.get(StackName, []), key=lambda event: event["Timestamp"], reverse=True)
+        # two events per page
+        return [{"StackEvents": events[index : index + 2]} for index in range(0, len(events), 2)]
+
+
+class TestStackEventStreamer(TestCase):
+    def setUp(self):
+        self.client = StubCloudFormationClient()
+        self.streamer = StackEventStreamer(self.client, ROOT_STACK_ID, utc_to_timestamp(START_TIMESTAMP))
+        self.addCleanup(self.streamer.close)
+        self.described_stacks = []
+        self.client.on_describe = self.described_stacks.append
+
+    def _add_nested_stack_operation(self, root_status, nested_status, seconds):
+        self.client.add_events(
+            ROOT_STACK_ID,
+            stack_event(ROOT_STACK_ID, "Nested", root_status, seconds, "AWS::CloudFormation::Stack", NESTED_STACK_ID),
+        )
+        self.client.add_events(
+            NESTED_STACK_ID,
+            stack_event(NESTED_STACK_ID, "Function", nested_status, seconds + 1),
+            stack_event(
+                NESTED_STACK_ID,
+                "test-Nested-1",
+                nested_status.replace("IN_PROGRESS", "COMPLETE"),
+                seconds + 2,
+                "AWS::CloudFormation::Stack",
+                NESTED_STACK_ID,
+            ),
+        )
+
+    def test_poll_returns_new_events_in_chronological_order(self):
+        old_event = stack_event(ROOT_STACK_ID, "Function", "CREATE_COMPLETE", -10)
+        self.client.add_events(
+            ROOT_STACK_ID,
+            old_event,
+            stack_event(ROOT_STACK_ID, "Function", "CREATE_IN_PROGRESS", 1),
+            stack_event(ROOT_STACK_ID, "Function", "CREATE_COMPLETE", 2),
+        )
+
+        events = self.streamer.poll()
+        self.assertEqual([event["ResourceStatus"] for event in events], ["CREATE_IN_PROGRESS", "CREATE_COMPLETE"])
+
+        self.assertEqual(self.streamer.poll(), [])
+
+        self.client.add_events(ROOT_STACK_ID, stack_event(ROOT_STACK_ID, "Function", "DELETE_IN_PROGRESS", 3))
+        self.assertEqual([event["ResourceStatus"] for event in self.streamer.poll()], ["DELETE_IN_PROGRESS"])
+
+    def test_poll_streams_nested_stack_events(self):
+        self.client.add_events(
+            ROOT_STACK_ID,
+            stack_event(
+                ROOT_STACK_ID, "Nested", "CREATE_IN_PROGRESS", 1, "AWS::CloudFormation::Stack", NESTED_STACK_ID
+            ),
+        )
+        self.client.add_events(
+            NESTED_STACK_ID,
+            stack_event(
+                NESTED_STACK_ID,
+                "test-Nested-1",
+                "CREATE_IN_PROGRESS",
+                2,
+                "AWS::CloudFormation::Stack",
+                NESTED_STACK_ID,
+            ),
+            stack_event(NESTED_STACK_ID, "Function", "CREATE_IN_PROGRESS", 3),
+        )
+
+        events = self.streamer.poll()
+
+        # the event of the nested stack about itself is reported by the root stack
+        self.assertEqual(
+            [(event["LogicalResourceId"], event["ResourceStatus"]) for event in events],
+            [("Nested", "CREATE_IN_PROGRESS"), ("Nested/Function", "CREATE_IN_PROGRESS")],
+        )
+
+        self.client.add_events(NESTED_STACK_ID, stack_event(NESTED_STACK_ID, "Function", "CREATE_COMPLETE", 4))
+        self.assertEqual(
+            [(event["LogicalResourceId"], event["ResourceStatus"]) for event in self.streamer.poll()],
+            [("Nested/Function", "CREATE_COMPLETE")],
+        )
+
+    def test_poll_describes_nested_stacks_concurrently(self):
+        for stack_id, logical_id in [(NESTED_STACK_ID, "Nested"), (OTHER_NESTED_STACK_ID, "Other")]:
+            self.client.add_events(
+                ROOT_STACK_ID,
+                stack_event(ROOT_STACK_ID, logical_id, "UPDATE_IN_PROGRESS", 1, "AWS::CloudFormation::Stack", stack_id),
+            )
+            self.client.add_events(stack_id, stack_event(stack_id, "Function", "UPDATE_IN_PROGRESS", 2))
+        # both nested stacks must be described at the same time to get through the barrier
+        barrier = threading.Barrier(2, timeout=10)
+        self.client.on_describe = lambda stack_name: barrier.wait() if stack_name != ROOT_STACK_ID else None
+
+        events = self.streamer.poll()
+
+        self.assertEqual(
+            sorted(event["LogicalResourceId"] for event in events),
+            ["Nested", "Nested/Function", "Other", "Other/Function"],
+        )
+
+    def test_poll_streams_nested_stacks_of_nested_stacks(self):
+        nested_nested_stack_id = "arn:aws:cloudformation:region:accountId:stack/test-Nested-1-Inner-1/uuid"
+        self.client.add_events(
+            ROOT_STACK_ID,
+            stack_event(
+                ROOT_STACK_ID, "Nested", "CREATE_IN_PROGRESS", 1, "AWS::CloudFormation::Stack", NESTED_STACK_ID
+            ),
+        )
+        self.client.add_events(
+            NESTED_STACK_ID,
+            stack_event(
+                NESTED_STACK_ID, "Inner", "CREATE_IN_PROGRESS", 2, "AWS::CloudFormation::Stack", nested_nested_stack_id
+            ),
+        )
+        self.client.add_events(
+            nested_nested_stack_id, stack_event(nested_nested_stack_id, "Function", "CREATE_IN_PROGRESS", 3)
+        )
+
+        self.assertEqual([event["LogicalResourceId"] for event in self.streamer.poll()], ["Nested", "Nested/Inner"])
+        self.assertEqual([event["LogicalResourceId"] for event in self.streamer.poll()], ["Nested/Inner/Function"])
+
+    def test_poll_ignores_nested_stack_errors(self):
+        self.client.add_events(
+            ROOT_STACK_ID,
+            stack_event(
+                ROOT_STACK_ID, "Nested", "CREATE_IN_PROGRESS", 1, "AWS::CloudFormation::Stack", NESTED_STACK_ID
+            ),
+        )
+        self.client.add_events(NESTED_STACK_ID, stack_event(NESTED_STACK_ID, "Function", "CREATE_IN_PROGRESS", 2))
+        self.client.errors[NESTED_STACK_ID] = ClientError(
+            error_response={"Error": {"Message": "Rate Exceeded"}}, operation_name="describe_stack_events"
+        )
+
+        self.assertEqual([event["LogicalResourceId"] for event in self.streamer.poll()], ["Nested"])
+
+        del self.client.errors[NESTED_STACK_ID]
+        self.assertEqual([event["LogicalResourceId"] for event in self.streamer.poll()], ["Nested/Function"])
+
+    def test_poll_stops_describing_finished_nested_stacks(self):
+        self._add_nested_stack_operation("CREATE_IN_PROGRESS", "CREATE_IN_PROGRESS", 1)
+
+        self.assertEqual([event["LogicalResourceId"] for event in self.streamer.poll()], ["Nested", "Nested/Function"])
+        self.described_stacks.clear()
+        self.streamer.poll()
+
+        self.assertEqual(self.described_stacks, [ROOT_STACK_ID])
+
+    def test_poll_streams_finished_nested_stack_again_when_updated_again(self):
+        self._add_nested_stack_operation("UPDATE_IN_PROGRESS", "UPDATE_IN_PROGRESS", 1)
+        self.streamer.poll()
+        self.client.add_events(
+            ROOT_STACK_ID,
+            stack_event(ROOT_STACK_ID, "Nested", "UPDATE_COMPLETE", 4, "AWS::CloudFormation::Stack", NESTED_STACK_ID),
+        )
+        self.assertEqual([event["LogicalResourceId"] for event in self.streamer.poll()], ["Nested"])
+
+        # the update is rolled back
+        self._add_nested_stack_operation("UPDATE_IN_PROGRESS", "UPDATE_ROLLBACK_IN_PROGRESS", 10)
+
+        self.assertEqual(
+            [(event["LogicalResourceId"], event["ResourceStatus"]) for event in self.streamer.poll()],
+            [("Nested", "UPDATE_IN_PROGRESS"), ("Nested/Function", "UPDATE_ROLLBACK_IN_PROGRESS")],
+        )
+
+    def test_poll_keeps_describing_nested_stack_updated_again_before_its_completion_is_seen(self):
+        self._add_nested_stack_operation("UPDATE_IN_PROGRESS", "UPDATE_IN_PROGRESS", 1)
+        # the root stack starts rolling the nested stack back before the nested stack is described
+        self.client.add_events(
+            ROOT_STACK_ID,
+            stack_event(
+                ROOT_STACK_ID, "Nested", "UPDATE_IN_PROGRESS", 10, "AWS::CloudFormation::Stack", NESTED_STACK_ID
+            ),
+        )
+        self.streamer.poll()
+
+        self.client.add_events(NESTED_STACK_ID, stack_event(NESTED_STACK_ID, "Function", "UPDATE_IN_PROGRESS", 11))
+
+        self.assertEqual([event["LogicalResourceId"] for event in self.streamer.poll()], ["Nested/Function"])
+
+    def test_poll_reuses_the_nested_stacks_executor(self):
+        self.client.add_events(
+            ROOT_STACK_ID,
+            stack_event(
+                ROOT_STACK_ID, "Nested", "CREATE_IN_PROGRESS", 1, "AWS::CloudFormation::Stack", NESTED_STACK_ID
+            ),
+        )
+
+        with patch(
+            "samcli.lib.deploy.stack_event_streamer.ThreadPoolExecutor", wraps=ThreadPoolExecutor
+        ) as executor_mock:
+            with StackEventStreamer(self.client, ROOT_STACK_ID, utc_to_timestamp(START_TIMESTAMP)) as streamer:
+                for seconds in range(2, 5):
+                    self.client.add_events(
+                        NESTED_STACK_ID, stack_event(NESTED_STACK_ID, "Function", "CREATE_IN_PROGRESS", seconds)
+                    )
+                    streamer.poll()
+                executor = streamer._executor
+
+        executor_mock.assert_called_once()
+        self.assertIsNone(streamer._executor)
+        self.assertTrue(executor._shutdown)
+
+    def test_poll_raises_root_stack_errors(self):
+        self.client.errors[ROOT_STACK_ID] = ClientError(
+            error_response={"Error": {"Message": "Rate Exceeded"}}, operation_name="describe_stack_events"
+        )
+
+        with self.assertRaises(ClientError):
+            self.streamer.poll()
@@ -901,6 +901,86 @@ class TestIntrinsicFnIfResolver(TestCase):
             self.resolver.intrinsic_property_resolver({"Fn::If": ["InvalidCondition", "test", "test"]}, True)
 
 
+class TestConditionResolution(TestCase):
+    def _resolver(self, conditions, resources=None):
+        template = {"Conditions": conditions, "Resources": resources or {}}
+        symbol_resolver = IntrinsicsSymbolTable(template=template, logical_id_translator={"EnvironmentType": "prod"})
+        return IntrinsicResolver(template=template, symbol_resolver=symbol_resolver)
+
+    def test_each_condition_evaluated_once(self):
+        # every condition refers twice to the previous one, which takes an exponential time to evaluate recursively
+        conditions = {"Condition0": {"Fn::Equals": [{"Ref": "EnvironmentType"}, "prod"]}}
+        for index in range(1, 300):
+            previous = {"Condition": f"Condition{index - 1}"}
+            conditions[f"Condition{index}"] = {"Fn::And": [previous, {"Fn::Or": [previous, {"Fn::Not": [previous]}]}]}
+        resources = {
+            f"Function{index}": {"Properties": {"Timeout": {"Fn::If": ["Condition299", 10, 3]}}} for index in range(100)
+        }
+        resolver = self._resolver(conditions, resources)
+
+        with patch.object(resolver, "_evaluate_condition", wraps=resolver._evaluate_condition) as evaluate_mock:
+            resolved_resources = resolver.resolve_template()["Resources"]
+
+        self.assertEqual(evaluate_mock.call_count, 300)
+        self.assertEqual(resolved_resources["Function99"], {"Properties": {"Timeout": 10}})
+
+    def test_long_chain_of_conditions(self):
+        conditions = {"Condition0": {"Fn::Equals": [{"Ref": "EnvironmentType"}, "dev"]}}
+        for index in range(1, 5000):
+            conditions[f"Condition{index}"] = {"Fn::Not": [{"Condition": f"Condition{index - 1}"}]}
+
+        result = self._resolver(conditions).intrinsic_property_resolver({"Fn::If": ["Condition4999", 1, 2]}, False)
+
+        self.assertEqual(result, 1)
+
+    @parameterized.expand(
+        [
+            ({"Fn::If": ["ConditionA", 1, 2]}, "ConditionA -> ConditionB -> ConditionC -> ConditionA"),
+            ({"Fn::If": ["ConditionD", 1, 2]}, "ConditionA -> ConditionB -> ConditionC -> ConditionA"),
+            ({"Fn::Not": [{"Condition": "ConditionE"}]}, "ConditionE -> ConditionE"),
+        ]
+    )
+    def test_circular_conditions(self, intrinsic, cycle):
+        conditions = {
+            "ConditionA": {"Fn::Not": [{"Condition": "ConditionB"}]},
+            "ConditionB": {"Fn::Or": [{"Condition": "ConditionC"}, {"Fn::Equals": ["a", "b"]}]},
+            "ConditionC": {"Fn::And": [{"Fn::Equals": ["a", "a"]}, {"Condition": "ConditionA"}]},
+            "ConditionD": {"Fn::Not": [{"Condition": "ConditionA"}]},
+            "ConditionE": {"Fn::Not": [{"Condition": "ConditionE"}]},
+        }
+
+        with self.assertRaises(InvalidIntrinsicException) as context:
+            self._resolver(conditions).intrinsic_property_resolver(intrinsic, False)
+
+        self.assertEqual(str(context.exception), f"Circular dependency between the conditions {cycle}")
+
+    def test_circular_conditions_left_unresolved_when_ignoring_errors(self):
+        resources = {"Function": {"Properties": {"Timeout": {"Fn::If": ["ConditionA", 10, 3]}}}}
+        resolver = self._resolver({"ConditionA": {"Fn::Not": [{"Condition": "ConditionA"}]}}, resources)
+
+        self.assertEqual(resolver.resolve_template(ignore_errors=True)["Resources"], resources)
+
+    def test_unneeded_invalid_dependency_ignored(self):
+        conditions = {
+            "FalseCondition": {"Fn::Equals": ["a", "b"]},
+            "InvalidCondition": {"Fn::ImportValue": "SharedValue"},
+            "Condition": {"Fn::And": [{"Condition": "FalseCondition"}, {"Condition": "InvalidCondition"}]},
+        }
+
+        result = self._resolver(conditions).intrinsic_property_resolver({"Fn::If": ["Condition", 1, 2]}, False)
+
+        self.assertEqual(result, 2)
+
+    def test_needed_invalid_dependency_fails(self):
+        conditions = {
+            "InvalidCondition": {"Fn::ImportValue": "SharedValue"},
+            "Condition": {"Fn::Not": [{"Condition": "InvalidCondition"}]},
+        }
+
+        with self.assertRaises(InvalidIntrinsicException):
+            self._resolver(conditions).intrinsic_property_resolver({"Fn::If": ["Condition", 1, 2]}, False)
+
+
 class TestIntrinsicAttribteResolution(TestCase):
     def setUp(self):
         self.maxDiff = None
@@ -1096,6 +1176,28 @@ class TestResolveTemplate(TestCase):
         expected_template = self.load_test_data(output)
         self.assertEqual(processed_template, expected_template)
 
+    def test_resolved_template_independent_of_template(self):
+        template = {
+            "Parameters": {"Runtime": {"Default": "python3.12", "AllowedValues": ["python3.12"]}},
+            "Resources": {
+                "Function": {"Type": "AWS::Lambda::Function", "Properties": {"Environment": {}, "Layers": ["arn"]}},
+                "Api": {"Type": "AWS::ApiGateway::RestApi", "Properties": {"Body": {"Fn::ImportValue": "Body"}}},
+            },
+            "Outputs": {},
+        }
+        original_template = deepcopy(template)
+        symbol_resolver = IntrinsicsSymbolTable(template=template, logical_id_translator={})
+        resolver = IntrinsicResolver(template=template, symbol_resolver=symbol_resolver)
+
+        processed_template = resolver.resolve_template(ignore_errors=True)
+        processed_template["Parameters"]["Runtime"]["AllowedValues"].append("python3.13")
+        processed_template["Resources"]["Function"]["Properties"]["Environment"]["Variables"] = {}
+        processed_template["Resources"]["Function"]["Properties"]["Layers"].append("other-arn")
+        processed_template["Resources"]["Api"]["Properties"]["Body"]["Fn::ImportValue"] = "OtherBody"
+        processed_template["Outputs"]["Output"] = "value"
+
+        self.assertEqual(template, original_template)
+
 
 class TestIntrinsicResolverInitialization(TestCase):
     def test_conditional_key_function_map(self):
@@ -39,6 +39,25 @@ class TestCWPrettyPrintFormatter(TestCase):
         self.colored.yellow.has_calls()
         self.colored.cyan.assert_called_with(self.stream_name)
 
+    def test_must_serialize_batch_of_events_coloring_each_value_once(self):
+        self.colored.yellow.side_effect = lambda value: f"yellow({value})"
+        self.colored.cyan.side_effect = lambda value: f"cyan({value})"
+        event_dicts = [
+            {"timestamp": 1, "message": "message 1", "logStreamName": "stream 1"},
+            {"timestamp": 1, "message": "message 2", "logStreamName": "stream 2"},
+            {"timestamp": 2, "message": "message 3", "logStreamName": "stream 1"},
+        ]
+
+        expected = [
+            self.pretty_print_formatter.map(CWLogEvent(self.group_name, event)).message for event in event_dicts
+        ]
+        self.colored.reset_mock()
+        result = self.pretty_print_formatter.map_all([CWLogEvent(self.group_name, event) for event in event_dicts])
+
+        self.assertEqual([event.message for event in result], expected)
+        self.assertEqual(self.colored.yellow.call_count, 2)
+        self.assertEqual(self.colored.cyan.call_count, 2)
+
 
 class TestCWColorizeErrorsFormatter(TestCase):
     def setUp(self):
@@ -88,6 +107,16 @@ class CWCWKeywordHighlighterFormatter(TestCase):
         self.assertEqual(result.message, expected_msg)
         self.colored.underline.assert_called_with(keyword)
 
+    def test_must_highlight_all_keywords_of_batch(self):
+        formatter = CWKeywordHighlighterFormatter(self.colored, "keyword")
+        self.colored.underline.return_value = "colored"
+        events = [CWLogEvent("group_name", {"message": "keyword one"}), CWLogEvent("group_name", {"message": "two"})]
+
+        result = formatter.map_all(events)
+
+        self.assertEqual([event.message for event in result], ["colored one", "two"])
+        self.colored.underline.assert_called_once_with("keyword")
+
     def test_must_ignore_if_keyword_is_absent(self):
         input_msg = "this keyword some keyword other keyword"
         event = CWLogEvent("group_name", {"message": input_msg})
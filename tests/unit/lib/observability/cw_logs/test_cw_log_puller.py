@@ -7,7 +7,7 @@ import botocore.session
 from botocore.stub import Stubber
 
 from samcli.lib.observability.cw_logs.cw_log_event import CWLogEvent
-from samcli.lib.observability.cw_logs.cw_log_puller import CWLogPuller
+from samcli.lib.observability.cw_logs.cw_log_puller import CWLogPuller, CWLogTailCursor
 from samcli.lib.utils.time import to_timestamp, to_datetime
 
 LOG_CLIENT = botocore.session.get_session().create_client("logs", region_name="us-east-1")
@@ -83,7 +83,7 @@ class TestCWLogPuller_load_time_period(TestCWLogPullerBase):
         with self.client_stubber:
             self.fetcher.load_time_period()
 
-            call_args = [args[0] for (args, _) in self.consumer.consume.call_args_list]
+            call_args = [event for (args, _) in self.consumer.consume_all.call_args_list for event in args[0]]
             for event in self.expected_events:
                 self.assertIn(event, call_args)
 
@@ -105,7 +105,7 @@ class TestCWLogPuller_load_time_period(TestCWLogPullerBase):
         with self.client_stubber:
             self.fetcher.load_time_period(start_time=start, end_time=end, filter_pattern=pattern)
 
-            call_args = [args[0] for (args, _) in self.consumer.consume.call_args_list]
+            call_args = [event for (args, _) in self.consumer.consume_all.call_args_list for event in args[0]]
             for event in self.expected_events:
                 self.assertIn(event, call_args)
 
@@ -164,7 +164,7 @@ class TestCWLogPuller_load_time_period(TestCWLogPullerBase):
         with self.client_stubber:
             self.fetcher.load_time_period()
 
-            call_args = [args[0] for (args, _) in self.consumer.consume.call_args_list]
+            call_args = [event for (args, _) in self.consumer.consume_all.call_args_list for event in args[0]]
             for event in expected_events_result:
                 self.assertIn(event, call_args)
 
@@ -229,7 +229,7 @@ class TestCWLogPuller_tail(TestCWLogPullerBase):
         expected_params_second_try = {
             "logGroupName": self.log_group_name,
             "interleaved": True,
-            "startTime": 13,
+            "startTime": 12,
             "filterPattern": self.filter_pattern,
         }
 
@@ -253,15 +253,17 @@ class TestCWLogPuller_tail(TestCWLogPullerBase):
                     # First fetch returns data
                     call(self.start_time, filter_pattern=self.filter_pattern),
                     # Three empty fetches
-                    call(to_datetime(13), filter_pattern=self.filter_pattern),
-                    call(to_datetime(13), filter_pattern=self.filter_pattern),
-                    call(to_datetime(13), filter_pattern=self.filter_pattern),
+                    call(to_datetime(12), filter_pattern=self.filter_pattern),
+                    call(to_datetime(12), filter_pattern=self.filter_pattern),
+                    call(to_datetime(12), filter_pattern=self.filter_pattern),
                 ]
 
                 # One per poll
                 expected_sleep_calls = [call(self.poll_interval) for _ in expected_load_time_period_calls]
 
-                consumer_call_args = [args[0] for (args, _) in self.consumer.consume.call_args_list]
+                consumer_call_args = [
+                    event for (args, _) in self.consumer.consume_all.call_args_list for event in args[0]
+                ]
 
                 self.assertEqual(self.mock_events1, consumer_call_args)
                 self.assertEqual(expected_sleep_calls, time_mock.sleep.call_args_list)
@@ -278,13 +280,13 @@ class TestCWLogPuller_tail(TestCWLogPullerBase):
         expected_params_second_try = {
             "logGroupName": self.log_group_name,
             "interleaved": True,
-            "startTime": 13,
+            "startTime": 12,
             "filterPattern": self.filter_pattern,
         }
         expected_params_third_try = {
             "logGroupName": self.log_group_name,
             "interleaved": True,
-            "startTime": 15,
+            "startTime": 14,
             "filterPattern": self.filter_pattern,
         }
 
@@ -299,13 +301,13 @@ class TestCWLogPuller_tail(TestCWLogPullerBase):
             # First fetch returns data
             call(self.start_time, filter_pattern=self.filter_pattern),
             # This fetch was empty
-            call(to_datetime(13), filter_pattern=self.filter_pattern),
+            call(to_datetime(12), filter_pattern=self.filter_pattern),
             # This fetch returned data
-            call(to_datetime(13), filter_pattern=self.filter_pattern),
+            call(to_datetime(12), filter_pattern=self.filter_pattern),
             # Three empty fetches
-            call(to_datetime(15), filter_pattern=self.filter_pattern),
-            call(to_datetime(15), filter_pattern=self.filter_pattern),
-            call(to_datetime(15), filter_pattern=self.filter_pattern),
+            call(to_datetime(14), filter_pattern=self.filter_pattern),
+            call(to_datetime(14), filter_pattern=self.filter_pattern),
+            call(to_datetime(14), filter_pattern=self.filter_pattern),
         ]
 
         # One per poll
@@ -317,7 +319,9 @@ class TestCWLogPuller_tail(TestCWLogPullerBase):
             with self.client_stubber:
                 self.fetcher.tail(start_time=self.start_time, filter_pattern=self.filter_pattern)
 
-                expected_consumer_call_args = [args[0] for (args, _) in self.consumer.consume.call_args_list]
+                expected_consumer_call_args = [
+                    event for (args, _) in self.consumer.consume_all.call_args_list for event in args[0]
+                ]
 
                 self.assertEqual(self.mock_events1 + self.mock_events2, expected_consumer_call_args)
                 self.assertEqual(expected_load_time_period_calls, patched_load_time_period.call_args_list)
@@ -353,14 +357,17 @@ class TestCWLogPuller_tail(TestCWLogPullerBase):
                     filter_pattern=self.filter_pattern,
                 )
 
-                expected_consumer_call_args = [args[0] for (args, _) in self.consumer.consume.call_args_list]
+                expected_consumer_call_args = [
+                    event for (args, _) in self.consumer.consume_all.call_args_list for event in args[0]
+                ]
 
                 self.assertEqual([], expected_consumer_call_args)
                 self.assertEqual(expected_load_time_period_calls, patched_load_time_period.call_args_list)
                 self.assertEqual(expected_sleep_calls, time_mock.sleep.call_args_list)
 
+    @patch("samcli.lib.utils.retry.random.uniform", side_effect=lambda low, high: high)
     @patch("samcli.lib.observability.cw_logs.cw_log_puller.time")
-    def test_with_throttling(self, time_mock):
+    def test_with_throttling(self, time_mock, uniform_mock):
         expected_params = {
             "logGroupName": self.log_group_name,
             "interleaved": True,
@@ -375,7 +382,8 @@ class TestCWLogPuller_tail(TestCWLogPullerBase):
 
         expected_load_time_period_calls = [call(to_datetime(0), filter_pattern=ANY) for _ in range(self.max_retries)]
 
-        expected_time_calls = [call(2), call(4), call(16)]
+        # exponential backoff, with the jitter patched to its maximum
+        expected_time_calls = [call(2), call(4), call(8)]
 
         with patch.object(
             self.fetcher, "load_time_period", wraps=self.fetcher.load_time_period
@@ -383,6 +391,63 @@ class TestCWLogPuller_tail(TestCWLogPullerBase):
             with self.client_stubber:
                 self.fetcher.tail(filter_pattern=self.filter_pattern)
 
-                self.consumer.consume.assert_not_called()
+                self.consumer.consume_all.assert_not_called()
                 self.assertEqual(expected_load_time_period_calls, patched_load_time_period.call_args_list)
                 time_mock.sleep.assert_has_calls(expected_time_calls, any_order=True)
+
+    @patch("samcli.lib.observability.cw_logs.cw_log_puller.time")
+    def test_must_consume_events_of_same_millisecond_exactly_once(self, time_mock):
+        expected_params = {
+            "logGroupName": self.log_group_name,
+            "interleaved": True,
+            "startTime": 12,
+            "filterPattern": self.filter_pattern,
+        }
+        event1 = {"eventId": "id1", "timestamp": 12, "message": "message 1"}
+        event2 = {"eventId": "id2", "timestamp": 12, "message": "message 2"}
+
+        # event2 is ingested after the first poll, the second poll returns event1 again
+        self.client_stubber.add_response("filter_log_events", {"events": [event1]}, expected_params)
+        self.client_stubber.add_response("filter_log_events", {"events": [event1, event2]}, expected_params)
+        for _ in range(self.max_retries):
+            self.client_stubber.add_response("filter_log_events", {"events": [event1, event2]}, expected_params)
+
+        with self.client_stubber:
+            self.fetcher.tail(start_time=to_datetime(12), filter_pattern=self.filter_pattern)
+
+        consumed_events = [event for (args, _) in self.consumer.consume_all.call_args_list for event in args[0]]
+        self.assertEqual(
+            consumed_events, [CWLogEvent(self.log_group_name, event1), CWLogEvent(self.log_group_name, event2)]
+        )
+
+
+class TestCWLogTailCursor(TestCase):
+    def test_skips_events_loaded_already(self):
+        cursor = CWLogTailCursor(10)
+
+        self.assertTrue(cursor.add({"eventId": "id1", "timestamp": 10}))
+        self.assertFalse(cursor.add({"eventId": "id1", "timestamp": 10}))
+        self.assertTrue(cursor.add({"eventId": "id2", "timestamp": 10}))
+        self.assertEqual(cursor.latest_event_time, 10)
+
+    def test_moves_to_latest_event(self):
+        cursor = CWLogTailCursor(10)
+
+        self.assertTrue(cursor.add({"eventId": "id1", "timestamp": 11}))
+        self.assertTrue(cursor.add({"eventId": "id2", "timestamp": 10}))
+        self.assertEqual(cursor.latest_event_time, 11)
+        self.assertFalse(cursor.add({"eventId": "id1", "timestamp": 11}))
+
+    def test_keeps_event_ids_of_latest_timestamp_only(self):
+        cursor = CWLogTailCursor()
+
+        for index in range(100):
+            cursor.add({"eventId": f"id{index}", "timestamp": index})
+
+        self.assertEqual(cursor._latest_event_ids, {"id99"})
+
+    def test_events_without_id_are_always_new(self):
+        cursor = CWLogTailCursor()
+
+        self.assertTrue(cursor.add({"timestamp": 10}))
+        self.assertTrue(cursor.add({"timestamp": 10}))
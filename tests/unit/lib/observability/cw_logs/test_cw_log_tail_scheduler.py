@@ -0,0 +1,232 @@
+import threading
+import time
+from datetime import datetime
+from typing import List
+from unittest import TestCase
+from unittest.mock import ANY, Mock, patch
+
+from botocore.exceptions import ClientError
+
+from samcli.lib.observability.cw_logs.cw_log_tail_scheduler import (
+    CWLogTailScheduler,
+    CWLogTailTransport,
+    FilterLogEventsTransport,
+    _RequestBudget,
+    _TailedLogGroup,
+)
+from samcli.lib.utils.time import to_timestamp
+
+
+def _client_error(code):
+    return ClientError({"Error": {"Code": code, "Message": code}}, "FilterLogEvents")
+
+
+class RecordingTransport(CWLogTailTransport):
+    """
+    Transport which records the fetches, returns the results configured for each puller and then no new events
+    """
+
+    def __init__(self, results=None, fetch_time=0.0):
+        self.results = results or {}
+        self.fetch_time = fetch_time
+        self.fetched: List[str] = []
+        self.concurrent_fetches = 0
+        self.max_concurrent_fetches = 0
+        self._lock = threading.Lock()
+
+    def fetch(self, pullers, filter_pattern=None):
+        with self._lock:
+            self.concurrent_fetches += 1
+            self.max_concurrent_fetches = max(self.max_concurrent_fetches, self.concurrent_fetches)
+            self.fetched.extend(puller.cw_log_group for puller in pullers)
+        time.sleep(self.fetch_time)
+        results = []
+        with self._lock:
+            for puller in pullers:
+                puller_results = self.results.get(puller.cw_log_group, [])
+                result = puller_results.pop(0) if puller_results else False
+                if isinstance(result, Exception):
+                    self.concurrent_fetches -= 1
+                    raise result
+                results.append(result)
+            self.concurrent_fetches -= 1
+        return results
+
+
+def _puller(name, max_retries=3):
+    return Mock(cw_log_group=name, poll_interval=0.001, max_retries=max_retries, latest_event_time=0)
+
+
+class TestCWLogTailScheduler(TestCase):
+    def _scheduler(self, pullers, transport, **kwargs):
+        kwargs.setdefault("max_requests_per_second", 10000)
+        kwargs.setdefault("max_idle_poll_interval", 0.005)
+        kwargs.setdefault("max_throttled_poll_interval", 0.01)
+        return CWLogTailScheduler(pullers, transport, **kwargs)
+
+    def test_tails_every_log_group_until_out_of_retries(self):
+        transport = RecordingTransport()
+        scheduler = self._scheduler([_puller("group1"), _puller("group2")], transport)
+
+        scheduler.tail()
+
+        self.assertEqual(sorted(transport.fetched), ["group1"] * 3 + ["group2"] * 3)
+
+    def test_new_events_reset_retries(self):
+        transport = RecordingTransport(results={"group1": [False, True]})
+        scheduler = self._scheduler([_puller("group1")], transport)
+
+        scheduler.tail()
+
+        # the second poll found new events, 3 more polls without new events follow it
+        self.assertEqual(transport.fetched, ["group1"] * 5)
+
+    def test_start_time_sets_latest_event_time_of_pullers(self):
+        pullers = [_puller("group1"), _puller("group2")]
+        start_time = datetime(2021, 1, 1)
+
+        self._scheduler(pullers, RecordingTransport()).tail(start_time)
+
+        for puller in pullers:
+            self.assertEqual(puller.latest_event_time, to_timestamp(start_time))
+
+    def test_limits_concurrent_requests(self):
+        transport = RecordingTransport(fetch_time=0.01)
+        pullers = [_puller(f"group{index}", max_retries=2) for index in range(6)]
+        scheduler = self._scheduler(pullers, transport, max_concurrent_requests=2)
+
+        scheduler.tail()
+
+        self.assertEqual(len(transport.fetched), 12)
+        self.assertEqual(transport.max_concurrent_fetches, 2)
+
+    def test_limits_request_rate(self):
+        transport = RecordingTransport()
+        pullers = [_puller(f"group{index}", max_retries=1) for index in range(60)]
+        scheduler = self._scheduler(pullers, transport, max_requests_per_second=50)
+
+        started = time.monotonic()
+        scheduler.tail()
+
+        # a burst of one second of requests, then one request every 20ms
+        self.assertGreaterEqual(time.monotonic() - started, 0.19)
+        self.assertEqual(len(transport.fetched), 60)
+
+    def test_batches_log_groups_up_to_transport_batch_size(self):
+        transport = RecordingTransport()
+        transport.max_batch_size = 2
+        transport.fetch = Mock(side_effect=lambda pullers, filter_pattern: [False] * len(pullers))
+        pullers = [_puller(f"group{index}", max_retries=1) for index in range(3)]
+
+        self._scheduler(pullers, transport).tail(filter_pattern="pattern")
+
+        batch_sizes = sorted(len(call_args[0][0]) for call_args in transport.fetch.call_args_list)
+        self.assertEqual(batch_sizes, [1, 2])
+        transport.fetch.assert_called_with(ANY, "pattern")
+
+    @patch("samcli.lib.observability.cw_logs.cw_log_tail_scheduler.exponential_backoff", return_value=0.02)
+    def test_throttling_pauses_all_log_groups(self, backoff_mock):
+        transport = RecordingTransport(results={"group1": [_client_error("ThrottlingException")]})
+        pullers = [_puller("group1", max_retries=2), _puller("group2", max_retries=2)]
+        scheduler = self._scheduler(pullers, transport, max_concurrent_requests=1)
+
+        started = time.monotonic()
+        scheduler.tail()
+
+        self.assertGreaterEqual(time.monotonic() - started, 0.02)
+        backoff_mock.assert_called_once_with(1, 0.002, 0.01)
+        # the throttled poll counts as a poll without new events
+        self.assertEqual(sorted(transport.fetched), ["group1"] * 2 + ["group2"] * 2)
+
+    def test_raises_other_errors(self):
+        transport = RecordingTransport(results={"group1": [_client_error("AccessDeniedException")]})
+        scheduler = self._scheduler([_puller("group1")], transport)
+
+        with self.assertRaises(ClientError):
+            scheduler.tail()
+
+    def test_polls_recently_active_log_groups_first(self):
+        transport = RecordingTransport()
+        scheduler = self._scheduler([], transport, max_concurrent_requests=1)
+        idle_group = _TailedLogGroup(_puller("idle"), remaining_polls=3, last_active_time=1.0)
+        active_group = _TailedLogGroup(_puller("active"), remaining_polls=3, last_active_time=2.0)
+        executor = Mock()
+        in_flight = {}
+
+        scheduler._dispatch([idle_group, active_group], in_flight, _RequestBudget(10), executor, None)
+
+        executor.submit.assert_called_once_with(transport.fetch, [active_group.puller], None)
+        self.assertTrue(active_group.in_flight)
+        self.assertFalse(idle_group.in_flight)
+        self.assertEqual(active_group.remaining_polls, 2)
+
+    @patch("samcli.lib.observability.cw_logs.cw_log_tail_scheduler.time.monotonic", return_value=100.0)
+    def test_idle_log_groups_are_polled_less_often(self, _):
+        scheduler = self._scheduler([], RecordingTransport(), max_idle_poll_interval=0.004)
+        group = _TailedLogGroup(_puller("group"), remaining_polls=3)
+        future = Mock()
+        future.result.return_value = [False]
+
+        poll_intervals = []
+        for _ in range(4):
+            scheduler._complete([group], future)
+            poll_intervals.append(round(group.next_poll_time - 100.0, 6))
+
+        self.assertEqual(poll_intervals, [0.002, 0.004, 0.004, 0.004])
+
+        future.result.return_value = [True]
+        scheduler._complete([group], future)
+        self.assertAlmostEqual(group.next_poll_time, 100.001)
+        self.assertEqual(group.remaining_polls, 3)
+        self.assertEqual(group.idle_polls, 0)
+
+    def test_stop_tailing(self):
+        pullers = [_puller("group1", max_retries=1000)]
+        scheduler = self._scheduler(pullers, RecordingTransport())
+
+        tail_thread = threading.Thread(target=scheduler.tail)
+        tail_thread.start()
+        scheduler.stop_tailing()
+        tail_thread.join(timeout=5)
+
+        self.assertFalse(tail_thread.is_alive())
+        self.assertTrue(scheduler.cancelled)
+        pullers[0].stop_tailing.assert_called_once()
+
+    def test_load_time_period(self):
+        pullers = [_puller("group1"), _puller("group2")]
+        start_time = datetime(2021, 1, 1)
+        end_time = datetime(2021, 1, 2)
+
+        self._scheduler(pullers, RecordingTransport()).load_time_period(start_time, end_time, "pattern")
+
+        for puller in pullers:
+            puller.load_time_period.assert_called_once_with(start_time, end_time, "pattern")
+
+
+class TestFilterLogEventsTransport(TestCase):
+    def test_polls_each_puller(self):
+        pullers = [Mock(), Mock()]
+        pullers[0].poll.return_value = True
+        pullers[1].poll.return_value = False
+
+        self.assertEqual(FilterLogEventsTransport().fetch(pullers, "pattern"), [True, False])
+        for puller in pullers:
+            puller.poll.assert_called_once_with("pattern")
+
+
+class TestRequestBudget(TestCase):
+    def test_allows_a_burst_then_the_rate(self):
+        budget = _RequestBudget(2)
+
+        self.assertTrue(budget.try_acquire(10.0))
+        self.assertTrue(budget.try_acquire(10.0))
+        self.assertFalse(budget.try_acquire(10.0))
+        self.assertEqual(budget.time_until_available(10.0), 0.5)
+        self.assertFalse(budget.try_acquire(10.25))
+        self.assertTrue(budget.try_acquire(10.5))
+        # the burst is capped to one second of requests
+        self.assertEqual(budget.time_until_available(100.0), 0)
+        self.assertTrue(budget.try_acquire(100.0))
+        self.assertTrue(budget.try_acquire(100.0))
+        self.assertFalse(budget.try_acquire(100.0))
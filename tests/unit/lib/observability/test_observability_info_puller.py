@@ -4,8 +4,10 @@ from unittest.mock import Mock, patch, call
 from parameterized import parameterized, param
 
 from samcli.lib.observability.observability_info_puller import (
+    ObservabilityEventConsumer,
     ObservabilityEventConsumerDecorator,
     ObservabilityCombinedPuller,
+    ObservabilityEventMapper,
 )
 
 
@@ -52,6 +54,37 @@ class TestObservabilityEventConsumerDecorator(TestCase):
         for mapper in mappers:
             mapper.map.assert_called_with(event)
 
+    def test_decorator_with_batch_of_events(self):
+        actual_consumer = Mock()
+        events = [Mock(), Mock()]
+        mapped_events = [Mock(), Mock()]
+        mapper = Mock()
+        mapper.map_all.return_value = mapped_events
+
+        consumer_decorator = ObservabilityEventConsumerDecorator([mapper], actual_consumer)
+        consumer_decorator.consume_all(events)
+
+        mapper.map_all.assert_called_once_with(events)
+        mapper.map.assert_not_called()
+        actual_consumer.consume_all.assert_called_once_with(mapped_events)
+
+    def test_batch_defaults_to_single_events(self):
+        class UpperCaseMapper(ObservabilityEventMapper):
+            def map(self, event):
+                return event.upper()
+
+        class ListConsumer(ObservabilityEventConsumer):
+            def __init__(self):
+                self.events = []
+
+            def consume(self, event):
+                self.events.append(event)
+
+        consumer = ListConsumer()
+        ObservabilityEventConsumerDecorator([UpperCaseMapper()], consumer).consume_all(["a", "b"])
+
+        self.assertEqual(consumer.events, ["A", "B"])
+
 
 class TestObservabilityCombinedPuller(TestCase):
     @patch("samcli.lib.observability.observability_info_puller.AsyncContext")
@@ -11,8 +11,9 @@ import unittest
 from contextlib import contextmanager, closing
 from unittest import mock
 from unittest.mock import call, patch, Mock, MagicMock
+from parameterized import parameterized
 
-from samcli.commands.package.exceptions import ExportFailedError
+from samcli.commands.package.exceptions import DockerPushFailedError, ExportFailedError
 from samcli.lib.package.permissions import (
     WindowsFilePermissionPermissionMapper,
     WindowsDirPermissionPermissionMapper,
@@ -1351,6 +1352,87 @@ class TestArtifactExporter(unittest.TestCase):
             resource_type2_class.assert_called_once_with(self.uploaders_mock, self.code_signer_mock)
             resource_type2_instance.export.assert_called_once_with("Resource2", mock.ANY, template_dir)
 
+    @parameterized.expand(
+        [
+            (["image1:latest", "image2:latest"], True),
+            (["image1:latest", "123456789012.dkr.ecr.us-east-1.amazonaws.com/repo:image2"], False),
+            (["image1:latest"], False),
+        ]
+    )
+    @patch("samcli.lib.package.artifact_exporter.yaml_parse")
+    def test_template_export_uploads_images_together(self, images, uploaded_together, yaml_parse_mock):
+        image_resource_class = Mock()
+        image_resource_class.RESOURCE_TYPE = "AWS::Serverless::Function"
+        image_resource_class.PROPERTY_NAME = "ImageUri"
+        image_resource_class.ARTIFACT_TYPE = IMAGE
+        image_resource_class.EXPORT_DESTINATION = Destination.ECR
+        template_dict = {
+            "Resources": {
+                f"Function{index}": {
+                    "Type": "AWS::Serverless::Function",
+                    "Properties": {"PackageType": IMAGE, "ImageUri": image},
+                }
+                for index, image in enumerate(images)
+            }
+        }
+        template_dict["Resources"]["ZipFunction"] = {
+            "Type": "AWS::Serverless::Function",
+            "Properties": {"CodeUri": "image3:latest"},
+        }
+        yaml_parse_mock.return_value = template_dict
+
+        with patch("samcli.lib.package.artifact_exporter.open", mock.mock_open(read_data="")):
+            template_exporter = Template(
+                os.path.join(os.path.sep, "template.yaml"),
+                os.path.sep,
+                self.uploaders_mock,
+                self.code_signer_mock,
+                [image_resource_class],
+            )
+            template_exporter.export()
+
+        if uploaded_together:
+            self.uploaders_mock.ecr.upload_images.assert_called_once_with(
+                {"Function0": "image1:latest", "Function1": "image2:latest"}
+            )
+        else:
+            self.uploaders_mock.ecr.upload_images.assert_not_called()
+        self.assertEqual(image_resource_class.return_value.export.call_count, len(images))
+
+    @parameterized.expand([(DockerPushFailedError(msg="push failed"), None), (AttributeError(), AttributeError)])
+    @patch("samcli.lib.package.artifact_exporter.yaml_parse")
+    def test_template_export_only_ignores_image_upload_errors(self, error, expected_error, yaml_parse_mock):
+        image_resource_class = Mock()
+        image_resource_class.RESOURCE_TYPE = "AWS::Serverless::Function"
+        image_resource_class.PROPERTY_NAME = "ImageUri"
+        image_resource_class.ARTIFACT_TYPE = IMAGE
+        yaml_parse_mock.return_value = {
+            "Resources": {
+                f"Function{index}": {
+                    "Type": "AWS::Serverless::Function",
+                    "Properties": {"PackageType": IMAGE, "ImageUri": f"image{index}:latest"},
+                }
+                for index in range(2)
+            }
+        }
+        self.uploaders_mock.ecr.upload_images.side_effect = error
+
+        with patch("samcli.lib.package.artifact_exporter.open", mock.mock_open(read_data="")):
+            template_exporter = Template(
+                os.path.join(os.path.sep, "template.yaml"),
+                os.path.sep,
+                self.uploaders_mock,
+                self.code_signer_mock,
+                [image_resource_class],
+            )
+            if expected_error:
+                with self.assertRaises(expected_error):
+                    template_exporter.export()
+            else:
+                template_exporter.export()
+                # the exporters upload the images again and report the errors
+                self.assertEqual(image_resource_class.return_value.export.call_count, 2)
+
     @patch("samcli.lib.package.artifact_exporter.yaml_parse")
     def test_cdk_template_export(self, yaml_parse_mock):
         parent_dir = os.path.sep
@@ -0,0 +1,132 @@
+import json
+import os
+import shutil
+import tempfile
+import zipfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from samcli.lib.package.delta_zip import MANIFEST_SUFFIX, BaseArchive
+from samcli.lib.package.utils import make_zip_with_lambda_permissions
+
+
+class TestDeltaZip(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+        self.source_dir = os.path.join(self.temp_dir, "source")
+        self.base_zip = os.path.join(self.temp_dir, "cache", "Function.sync.zip")
+        self.builds = 0
+        for index in range(20):
+            self._write_file(os.path.join("package", f"module{index}.py"), f"def handler{index}():\n    pass\n" * 100)
+        self._write_file("app.py", "import package\n")
+
+    def _write_file(self, relative_path, content):
+        path = os.path.join(self.source_dir, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as source_file:
+            source_file.write(content)
+
+    def _build(self, base_zip=None):
+        self.builds += 1
+        zip_path = make_zip_with_lambda_permissions(
+            os.path.join(self.temp_dir, f"data-{self.builds}"), self.source_dir, base_zip=base_zip
+        )
+        with open(zip_path, "rb") as zip_file:
+            return zip_file.read()
+
+    def _build_with_base(self):
+        """
+        Returns the archive built with the base archive, and the names of the entries which were compressed
+        """
+        with patch.object(zipfile.ZipFile, "writestr", autospec=True, side_effect=zipfile.ZipFile.writestr) as mock:
+            archive = self._build(self.base_zip)
+        return archive, {call.args[1].filename for call in mock.call_args_list}
+
+    def test_first_build_is_identical_to_clean_build(self):
+        archive, compressed_entries = self._build_with_base()
+
+        self.assertEqual(archive, self._build())
+        self.assertEqual(len(compressed_entries), 21)
+        self.assertTrue(os.path.exists(self.base_zip))
+        with open(self.base_zip + MANIFEST_SUFFIX) as manifest_file:
+            self.assertEqual(len(json.load(manifest_file)["entries"]), 21)
+
+    def test_unchanged_entries_are_copied(self):
+        self._build_with_base()
+
+        archive, compressed_entries = self._build_with_base()
+
+        self.assertEqual(archive, self._build())
+        self.assertEqual(compressed_entries, set())
+
+    def test_only_modified_and_added_files_are_compressed(self):
+        self._build_with_base()
+        self._write_file(os.path.join("package", "module3.py"), "def handler():\n    return 3\n")
+        self._write_file(os.path.join("package", "module20.py"), "def handler():\n    return 20\n")
+        os.remove(os.path.join(self.source_dir, "package", "module7.py"))
+
+        archive, compressed_entries = self._build_with_base()
+
+        self.assertEqual(archive, self._build())
+        self.assertEqual(compressed_entries, {"package/module3.py", "package/module20.py"})
+        with zipfile.ZipFile(self.base_zip) as base_archive:
+            self.assertIsNone(base_archive.testzip())
+            self.assertEqual(base_archive.read("package/module3.py"), b"def handler():\n    return 3\n")
+
+    def test_files_with_changed_permissions_are_compressed(self):
+        self._build_with_base()
+        os.chmod(os.path.join(self.source_dir, "app.py"), 0o700)
+
+        archive, compressed_entries = self._build_with_base()
+
+        self.assertEqual(archive, self._build())
+        self.assertEqual(compressed_entries, {"app.py"})
+
+    def test_base_archive_of_another_zlib_is_ignored(self):
+        self._build_with_base()
+
+        with patch("samcli.lib.package.delta_zip.zlib.ZLIB_RUNTIME_VERSION", "0.0"):
+            archive, compressed_entries = self._build_with_base()
+
+        self.assertEqual(archive, self._build())
+        self.assertEqual(len(compressed_entries), 21)
+
+    def test_base_archive_without_manifest_is_ignored(self):
+        self._build_with_base()
+        os.remove(self.base_zip + MANIFEST_SUFFIX)
+
+        archive, compressed_entries = self._build_with_base()
+
+        self.assertEqual(archive, self._build())
+        self.assertEqual(len(compressed_entries), 21)
+
+    def test_corrupted_base_archive_is_ignored(self):
+        self._build_with_base()
+        with open(self.base_zip, "wb") as base_zip_file:
+            base_zip_file.write(b"not a zip file")
+
+        archive, compressed_entries = self._build_with_base()
+
+        self.assertEqual(archive, self._build())
+        self.assertEqual(len(compressed_entries), 21)
+
+    def test_entries_not_matching_manifest_are_compressed(self):
+        self._build_with_base()
+        with open(self.base_zip + MANIFEST_SUFFIX) as manifest_file:
+            manifest = json.load(manifest_file)
+        manifest["entries"]["app.py"] = "0" * 64
+        with open(self.base_zip + MANIFEST_SUFFIX, "w") as manifest_file:
+            json.dump(manifest, manifest_file)
+
+        archive, compressed_entries = self._build_with_base()
+
+        self.assertEqual(archive, self._build())
+        self.assertEqual(compressed_entries, {"app.py"})
+
+    def test_base_archive_is_not_kept_if_it_cannot_be_written(self):
+        base_archive = BaseArchive(os.path.join(self.temp_dir, "missing", "base.zip"))
+        with patch("samcli.lib.package.delta_zip.shutil.copyfile", side_effect=OSError("disk full")):
+            base_archive.save(os.path.join(self.temp_dir, "data.zip"))
+
+        self.assertEqual(os.listdir(os.path.join(self.temp_dir, "missing")), [])
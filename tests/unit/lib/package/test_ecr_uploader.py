@@ -1,5 +1,6 @@
+import threading
 from unittest import TestCase
-from unittest.mock import MagicMock, patch, call
+from unittest.mock import ANY, MagicMock, patch, call
 
 from botocore.exceptions import ClientError
 from docker.errors import APIError, BuildError
@@ -320,3 +321,149 @@ class TestECRUploader(TestCase):
             result = ECRUploader.parse_image_url(image_uri=config["url"])
 
             self.assertEqual(result, config["result"])
+
+    def _create_uploader(self, images):
+        docker_images = {}
+        for image, image_id in images.items():
+            docker_images[image] = MagicMock(id=image_id)
+        self.docker_client.images.get.side_effect = lambda image: docker_images[image]
+        self.docker_client.api.push.side_effect = lambda repository, tag, **kwargs: iter(
+            [{"id": "layer", "status": "Pushing", "progress": ""}, {"id": "layer", "status": "Pushed"}]
+        )
+        self.ecr_client.batch_get_image.return_value = {"images": []}
+        ecr_uploader = ECRUploader(
+            docker_client=self.docker_client,
+            ecr_client=self.ecr_client,
+            ecr_repo=self.ecr_repo,
+            ecr_repo_multi=None,
+            tag=self.tag,
+        )
+        ecr_uploader.login = MagicMock()
+        return ecr_uploader, docker_images
+
+    def test_upload_images_pushes_shared_image_once(self):
+        ecr_uploader, docker_images = self._create_uploader({"myimage:v1": "sha256:1234567890abcdef"})
+
+        uris = ecr_uploader.upload_images({"Function1": "myimage:v1", "Function2": "myimage:v1"})
+
+        expected_uri = f"{self.ecr_repo}:myimage-1234567890ab-v1"
+        self.assertEqual(uris, {"Function1": expected_uri, "Function2": expected_uri})
+        self.docker_client.api.push.assert_called_once()
+        # an image which was uploaded before isn't pushed again
+        self.assertEqual(ecr_uploader.upload("myimage:v1", "Function3"), expected_uri)
+        self.docker_client.api.push.assert_called_once()
+
+    def test_upload_images_pushes_distinct_images_concurrently(self):
+        ecr_uploader, docker_images = self._create_uploader(
+            {"image1:v1": "sha256:1111111111111111", "image2:v1": "sha256:2222222222222222"}
+        )
+        ecr_uploader.log_streamer = MagicMock()
+        streamed_logs = []
+        ecr_uploader.log_streamer.stream_progress.side_effect = lambda logs: streamed_logs.extend(logs)
+
+        uris = ecr_uploader.upload_images({"Function1": "image1:v1", "Function2": "image2:v1"})
+
+        self.assertEqual(
+            uris,
+            {
+                "Function1": f"{self.ecr_repo}:image1-111111111111-v1",
+                "Function2": f"{self.ecr_repo}:image2-222222222222-v1",
+            },
+        )
+        self.assertEqual(self.docker_client.api.push.call_count, 2)
+        ecr_uploader.log_streamer.stream_progress.assert_called_once()
+        # the progress of each image is reported on its own lines
+        self.assertEqual(
+            {log["id"] for log in streamed_logs}, {"image1-111111111111-v1 layer", "image2-222222222222-v1 layer"}
+        )
+
+    def test_upload_images_raises_push_failure(self):
+        ecr_uploader, docker_images = self._create_uploader(
+            {"image1:v1": "sha256:1111111111111111", "image2:v1": "sha256:2222222222222222"}
+        )
+        self.docker_client.api.push.side_effect = lambda repository, tag, **kwargs: iter(
+            [{"error": "Network Error!"}] if tag.startswith("image2") else [{"status": "Pushed"}]
+        )
+
+        with self.assertRaises(DockerPushFailedError):
+            ecr_uploader.upload_images({"Function1": "image1:v1", "Function2": "image2:v1"})
+        self.assertEqual(ecr_uploader.upload("image1:v1", "Function1"), f"{self.ecr_repo}:image1-111111111111-v1")
+        # failed pushes aren't remembered, the image is pushed again
+        with self.assertRaises(DockerPushFailedError):
+            ecr_uploader.upload("image2:v1", "Function2")
+        self.assertEqual(self.docker_client.api.push.call_count, 3)
+
+    def test_upload_of_image_being_pushed_waits_for_the_push(self):
+        ecr_uploader, docker_images = self._create_uploader(
+            {"image1:v1": "sha256:1111111111111111", "image2:v1": "sha256:2222222222222222"}
+        )
+        push_started = threading.Event()
+        finish_push = threading.Event()
+
+        def push(repository, tag, **kwargs):
+            if tag.startswith("image1"):
+                push_started.set()
+                finish_push.wait(10)
+            return iter([{"status": "Pushed"}])
+
+        self.docker_client.api.push.side_effect = push
+        uris = {}
+        uploads = [
+            threading.Thread(target=lambda name=name: uris.update(ecr_uploader.upload_images({name: "image1:v1"})))
+            for name in ["Function1", "Function2"]
+        ]
+        uploads[0].start()
+        self.assertTrue(push_started.wait(10))
+        uploads[1].start()
+
+        # other images can be uploaded while image1 is being pushed
+        self.assertEqual(ecr_uploader.upload("image2:v1", "Function3"), f"{self.ecr_repo}:image2-222222222222-v1")
+        finish_push.set()
+        for upload in uploads:
+            upload.join(10)
+
+        expected_uri = f"{self.ecr_repo}:image1-111111111111-v1"
+        self.assertEqual(uris, {"Function1": expected_uri, "Function2": expected_uri})
+        self.assertEqual(self.docker_client.api.push.call_count, 2)
+
+    @parameterized.expand(
+        [
+            ({"imageId": {"imageDigest": "sha256:other"}, "imageManifest": '{"config": {"digest": "sha256:1234"}}'},),
+            ({"imageId": {"imageDigest": "sha256:1234"}, "imageManifest": "{}"},),
+        ]
+    )
+    def test_upload_skips_image_in_repository(self, remote_image):
+        ecr_uploader, docker_images = self._create_uploader({"myimage:v1": "sha256:1234"})
+        ecr_uploader.ecr_repo = "123456789012.dkr.ecr.us-east-1.amazonaws.com/repo"
+        self.ecr_client.batch_get_image.return_value = {"images": [remote_image]}
+
+        uri = ecr_uploader.upload("myimage:v1", "Function1")
+
+        self.assertEqual(uri, "123456789012.dkr.ecr.us-east-1.amazonaws.com/repo:myimage-1234-v1")
+        self.ecr_client.batch_get_image.assert_called_once_with(
+            repositoryName="repo",
+            imageIds=[{"imageTag": "myimage-1234-v1"}],
+            acceptedMediaTypes=ANY,
+            registryId="123456789012",
+        )
+        self.docker_client.api.push.assert_not_called()
+        docker_images["myimage:v1"].tag.assert_not_called()
+
+    @parameterized.expand(
+        [
+            ({"images": [{"imageId": {"imageDigest": "sha256:other"}, "imageManifest": "{}"}]},),
+            (ClientError(error_response={"Error": {"Message": "denied"}}, operation_name="batch_get_image"),),
+        ]
+    )
+    def test_upload_pushes_image_not_in_repository(self, batch_get_image_result):
+        ecr_uploader, docker_images = self._create_uploader({"myimage:v1": "sha256:1234"})
+        if isinstance(batch_get_image_result, Exception):
+            self.ecr_client.batch_get_image.side_effect = batch_get_image_result
+        else:
+            self.ecr_client.batch_get_image.return_value = batch_get_image_result
+
+        uri = ecr_uploader.upload("myimage:v1", "Function1")
+
+        self.assertEqual(uri, f"{self.ecr_repo}:myimage-1234-v1")
+        docker_images["myimage:v1"].tag.assert_called_once_with(repository=self.ecr_repo, tag="myimage-1234-v1")
+        self.docker_client.api.push.assert_called_once()
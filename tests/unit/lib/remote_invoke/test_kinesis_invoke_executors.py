@@ -1,6 +1,9 @@
+from typing import Any
 from unittest import TestCase
 from unittest.mock import patch, Mock
 
+import botocore.session
+from botocore.stub import ANY, Stubber
 from parameterized import parameterized, parameterized_class
 from samcli.lib.remote_invoke.kinesis_invoke_executors import (
     RemoteInvokeOutputFormat,
@@ -140,3 +143,58 @@ class TestKinesisPutDataExecutor(TestCase):
             self.kinesis_put_data_executor.validate_action_parameters({})
             for _ in self.kinesis_put_data_executor._execute_action(given_input_message):
                 pass
+
+
+class TestKinesisPutDataExecutorSendBatch(TestCase):
+    def setUp(self) -> None:
+        self.kinesis_client: Any = botocore.session.get_session().create_client("kinesis", region_name="us-east-1")
+        self.stubber = Stubber(self.kinesis_client)
+        self.stream_name = "mock-stream-name"
+        self.executor = KinesisPutDataExecutor(self.kinesis_client, self.stream_name, RemoteInvokeOutputFormat.TEXT)
+
+    def test_send_batch_puts_records_with_random_partition_keys(self):
+        self.executor.validate_action_parameters({"SequenceNumberForOrdering": "1"})
+        self.stubber.add_response(
+            "put_records",
+            {
+                "FailedRecordCount": 1,
+                "Records": [
+                    {"SequenceNumber": "1", "ShardId": "shard"},
+                    {"ErrorCode": "ProvisionedThroughputExceededException", "ErrorMessage": "Rate exceeded"},
+                ],
+            },
+            {
+                "StreamName": self.stream_name,
+                "Records": [{"Data": "hello", "PartitionKey": ANY}, {"Data": "{}", "PartitionKey": ANY}],
+            },
+        )
+
+        with self.stubber, patch.object(
+            self.kinesis_client, "put_records", wraps=self.kinesis_client.put_records
+        ) as put:
+            errors = self.executor.send_batch(["hello", ""])
+
+        self.assertEqual(errors, [None, "ProvisionedThroughputExceededException"])
+        partition_keys = [record["PartitionKey"] for record in put.call_args.kwargs["Records"]]
+        self.assertEqual(len(set(partition_keys)), 2)
+        self.assertNotIn(self.executor.request_parameters["PartitionKey"], partition_keys)
+
+    def test_send_batch_keeps_given_partition_key(self):
+        self.executor.validate_action_parameters({"PartitionKey": "key", "ExplicitHashKey": "1"})
+        self.stubber.add_response(
+            "put_records",
+            {"Records": [{"SequenceNumber": "1", "ShardId": "shard"}]},
+            {
+                "StreamName": self.stream_name,
+                "Records": [{"Data": "hello", "PartitionKey": "key", "ExplicitHashKey": "1"}],
+            },
+        )
+
+        with self.stubber:
+            self.assertEqual(self.executor.send_batch(["hello"]), [None])
+
+    def test_payload_size_includes_partition_key(self):
+        self.executor.validate_action_parameters({"PartitionKey": "key"})
+
+        self.assertEqual(self.executor.max_batch_payload_size, 5 * 1024 * 1024)
+        self.assertEqual(self.executor.get_payload_size("hello"), len("hello") + len("key"))
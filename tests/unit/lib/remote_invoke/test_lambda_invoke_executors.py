@@ -90,6 +90,27 @@ class CommonTestsLambdaInvokeExecutor:
             self.lambda_invoke_executor.validate_action_parameters(parameters)
             self.assertEqual(self.lambda_invoke_executor.request_parameters, expected_boto_parameters)
 
+        def test_send_batch_invokes_function_and_reports_function_errors(self):
+            response_payload = Mock()
+            self.lambda_client.invoke.side_effect = [
+                {"StatusCode": 200, "Payload": response_payload},
+                {"StatusCode": 200, "Payload": response_payload, "FunctionError": "Unhandled"},
+            ]
+            self.lambda_invoke_executor.validate_action_parameters({"Qualifier": "live"})
+
+            errors = self.lambda_invoke_executor.send_batch(["event1", "event2"])
+
+            self.assertEqual(errors, [None, "FunctionError: Unhandled"])
+            self.lambda_client.invoke.assert_called_with(
+                InvocationType="RequestResponse",
+                LogType="Tail",
+                Qualifier="live",
+                FunctionName=self.function_name,
+                Payload="event2",
+            )
+            self.assertEqual(response_payload.read.call_count, 2)
+            self.assertNotIn("Payload", self.lambda_invoke_executor.request_parameters)
+
 
 class TestLambdaInvokeExecutor(CommonTestsLambdaInvokeExecutor.AbstractLambdaInvokeExecutorTest):
     def setUp(self) -> None:
@@ -4,8 +4,12 @@ from typing import List
 from unittest import TestCase
 from unittest.mock import Mock, patch
 
+from botocore.exceptions import ParamValidationError
+
+from samcli.lib.remote_invoke.exceptions import InvalidResourceBotoParameterException
 from samcli.lib.remote_invoke.remote_invoke_executors import (
     RemoteInvokeExecutionInfo,
+    BatchBotoActionExecutor,
     BotoActionExecutor,
     RemoteInvokeExecutor,
     ResponseObjectToJsonStringMapper,
@@ -69,6 +73,11 @@ class ExampleBotoActionExecutor(BotoActionExecutor):
         pass
 
 
+class ExampleBatchBotoActionExecutor(ExampleBotoActionExecutor, BatchBotoActionExecutor):
+    def send_batch(self, payloads):
+        return [None] * len(payloads)
+
+
 class TestBotoActionExecutor(TestCase):
     def setUp(self) -> None:
         self.boto_action_executor = ExampleBotoActionExecutor()
@@ -183,6 +192,50 @@ class TestRemoteInvokeExecutor(TestCase):
         for response_mapper in self.mock_response_mappers:
             response_mapper.map.assert_not_called()
 
+    @patch("samcli.lib.remote_invoke.remote_invoke_executors.RemoteInvokeLoadGenerator")
+    def test_execute_load_maps_inputs_once_and_repeats_them(self, patched_load_generator):
+        for request_mapper in self.mock_request_mappers:
+            request_mapper.map.side_effect = lambda remote_invoke_input: remote_invoke_input
+        sent_payloads = []
+        given_report = Mock()
+        patched_load_generator.return_value.run.side_effect = (
+            lambda payloads: sent_payloads.extend(payloads) or given_report
+        )
+        parameters = {"ExampleParameter": "ExampleValue"}
+        inputs = [
+            RemoteInvokeExecutionInfo("event1", None, parameters, RemoteInvokeOutputFormat.TEXT),
+            RemoteInvokeExecutionInfo("event2", None, parameters, RemoteInvokeOutputFormat.TEXT),
+        ]
+
+        report = self.test_executor.execute_load(inputs, 3, 5, 100.0)
+
+        self.assertEqual(report, given_report)
+        patched_load_generator.assert_called_once_with(self.mock_boto_action_executor, 5, 100.0)
+        self.assertEqual(sent_payloads, ["event1", "event2"] * 3)
+        self.mock_boto_action_executor.validate_action_parameters.assert_called_once_with(parameters)
+        for request_mapper in self.mock_request_mappers:
+            self.assertEqual(request_mapper.map.call_count, 2)
+
+    def test_supports_load_with_batch_executors_only(self):
+        for boto_action_executor, supports_load in [
+            (ExampleBotoActionExecutor(), False),
+            (ExampleBatchBotoActionExecutor(), True),
+        ]:
+            remote_invoke_executor = RemoteInvokeExecutor([], [], boto_action_executor, Mock(), Mock())
+            self.assertEqual(remote_invoke_executor.supports_load, supports_load)
+
+    def test_batch_executor_counts_payload_bytes(self):
+        self.assertEqual(ExampleBatchBotoActionExecutor().get_payload_size("héllo"), 6)
+
+    @patch("samcli.lib.remote_invoke.remote_invoke_executors.RemoteInvokeLoadGenerator")
+    def test_execute_load_invalid_parameters(self, patched_load_generator):
+        patched_load_generator.return_value.run.side_effect = ParamValidationError(report="Invalid parameters")
+
+        with self.assertRaises(InvalidResourceBotoParameterException):
+            self.test_executor.execute_load(
+                [RemoteInvokeExecutionInfo("event", None, {}, RemoteInvokeOutputFormat.TEXT)], 1, 1
+            )
+
 
 class TestResponseObjectToJsonStringMapper(TestCase):
     def test_mapper(self):
@@ -0,0 +1,175 @@
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import patch
+
+from botocore.exceptions import ClientError, EndpointConnectionError, ParamValidationError
+
+from samcli.lib.remote_invoke.remote_invoke_load_generator import RemoteInvokeLoadGenerator, RemoteInvokeLoadReport
+
+
+class StubBatchExecutor:
+    """
+    Batch executor which records the batches it sends, and fails the events configured in errors
+    """
+
+    def __init__(self, max_batch_size, errors=None, send_time=0.0, max_batch_payload_size=None):
+        self.max_batch_size = max_batch_size
+        self.max_batch_payload_size = max_batch_payload_size
+        self.errors = errors or {}
+        self.send_time = send_time
+        self.batches = []
+        self.concurrent_sends = 0
+        self.max_concurrent_sends = 0
+        self._lock = threading.Lock()
+
+    def get_payload_size(self, payload):
+        return len(payload)
+
+    def send_batch(self, payloads):
+        with self._lock:
+            self.batches.append(payloads)
+            self.concurrent_sends += 1
+            self.max_concurrent_sends = max(self.max_concurrent_sends, self.concurrent_sends)
+        time.sleep(self.send_time)
+        with self._lock:
+            self.concurrent_sends -= 1
+        error = self.errors.get(payloads[0])
+        if isinstance(error, Exception):
+            raise error
+        return [self.errors.get(payload) for payload in payloads]
+
+
+class TestRemoteInvokeLoadGenerator(TestCase):
+    def test_sends_all_payloads_in_batches(self):
+        executor = StubBatchExecutor(max_batch_size=10)
+
+        report = RemoteInvokeLoadGenerator(executor, concurrency=3).run(str(index) for index in range(25))
+
+        self.assertEqual(sorted(len(batch) for batch in executor.batches), [5, 10, 10])
+        self.assertEqual(
+            sorted(payload for batch in executor.batches for payload in batch), sorted(map(str, range(25)))
+        )
+        self.assertEqual(report.events, 25)
+        self.assertEqual(report.failed_events, 0)
+        self.assertEqual(len(report.latencies), 3)
+
+    def test_splits_batches_by_payload_size(self):
+        executor = StubBatchExecutor(max_batch_size=10, max_batch_payload_size=10)
+
+        RemoteInvokeLoadGenerator(executor, concurrency=1).run(["aaaa", "bbbb", "cc", "dddddd", "eeeeeeeeeeee", "f"])
+
+        # an event larger than the limit is sent on its own
+        self.assertEqual(executor.batches, [["aaaa", "bbbb", "cc"], ["dddddd"], ["eeeeeeeeeeee"], ["f"]])
+
+    def test_limits_requests_in_flight(self):
+        executor = StubBatchExecutor(max_batch_size=1, send_time=0.01)
+
+        report = RemoteInvokeLoadGenerator(executor, concurrency=2).run(["event"] * 8)
+
+        self.assertEqual(report.events, 8)
+        self.assertEqual(executor.max_concurrent_sends, 2)
+
+    def test_sends_events_at_rate(self):
+        executor = StubBatchExecutor(max_batch_size=2)
+
+        started = time.monotonic()
+        report = RemoteInvokeLoadGenerator(executor, concurrency=4, rate=100).run(["event"] * 10)
+
+        # the last batch is sent once 8 events were sent, 80ms after the start
+        self.assertGreaterEqual(time.monotonic() - started, 0.08)
+        self.assertGreaterEqual(report.duration, 0.08)
+        self.assertEqual(report.events, 10)
+
+    def test_counts_failed_events_by_error(self):
+        executor = StubBatchExecutor(
+            max_batch_size=2,
+            errors={
+                "throttled": "ThrottlingException",
+                "denied": ClientError({"Error": {"Code": "AccessDenied", "Message": ""}}, "SendMessageBatch"),
+                "offline": EndpointConnectionError(endpoint_url="https://sqs"),
+            },
+        )
+
+        report = RemoteInvokeLoadGenerator(executor, concurrency=1).run(
+            ["ok", "throttled", "denied", "ok", "offline", "ok"]
+        )
+
+        self.assertEqual(report.events, 6)
+        self.assertEqual(report.failed_events, 5)
+        self.assertEqual(
+            dict(report.errors), {"ThrottlingException": 1, "AccessDenied": 2, "EndpointConnectionError": 2}
+        )
+
+    def test_raises_invalid_parameters(self):
+        executor = StubBatchExecutor(max_batch_size=1, errors={"event": ParamValidationError(report="Invalid")})
+
+        with self.assertRaises(ParamValidationError):
+            RemoteInvokeLoadGenerator(executor, concurrency=2).run(["event"] * 5)
+
+
+class TestRemoteInvokeLoadReport(TestCase):
+    def setUp(self):
+        self.report = RemoteInvokeLoadReport(duration=2.0)
+        for latency in [0.004, 0.008, 0.015, 0.03, 0.04]:
+            self.report.add_request(latency, [None, None])
+        self.report.add_request(0.35, [None, "ThrottlingException"])
+
+    def test_error_rate(self):
+        self.assertEqual(self.report.events, 12)
+        self.assertEqual(self.report.failed_events, 1)
+        self.assertAlmostEqual(self.report.error_rate, 1 / 12)
+        self.assertEqual(RemoteInvokeLoadReport().error_rate, 0.0)
+
+    def test_latency_percentile(self):
+        self.assertEqual(self.report.latency_percentile(0), 0.004)
+        self.assertEqual(self.report.latency_percentile(50), 0.015)
+        self.assertEqual(self.report.latency_percentile(90), 0.35)
+        self.assertEqual(self.report.latency_percentile(100), 0.35)
+        self.assertEqual(RemoteInvokeLoadReport().latency_percentile(50), 0.0)
+
+    def test_latency_histogram(self):
+        histogram = dict(self.report.latency_histogram())
+
+        self.assertEqual(histogram[5], 1)
+        self.assertEqual(histogram[10], 1)
+        self.assertEqual(histogram[20], 1)
+        self.assertEqual(histogram[50], 2)
+        self.assertEqual(histogram[500], 1)
+        self.assertEqual(histogram[None], 0)
+        self.assertEqual(sum(histogram.values()), 6)
+
+    def test_latency_histogram_slowest_bucket(self):
+        report = RemoteInvokeLoadReport()
+        report.add_request(30.0, [None])
+
+        self.assertEqual(report.latency_histogram()[-1], (None, 1))
+
+    def test_to_dict(self):
+        report_dict = self.report.to_dict()
+
+        self.assertEqual(report_dict["Events"], 12)
+        self.assertEqual(report_dict["FailedEvents"], 1)
+        self.assertEqual(report_dict["Errors"], {"ThrottlingException": 1})
+        self.assertEqual(report_dict["Requests"], 6)
+        self.assertEqual(report_dict["LatencyMilliseconds"]["P50"], 15.0)
+        self.assertIn({"UpperBoundMilliseconds": 50, "Count": 2}, report_dict["LatencyHistogram"])
+
+    def test_format(self):
+        lines = self.report.format().splitlines()
+
+        self.assertEqual(lines[0], "Events: 12 sent, 11 succeeded, 1 failed (8.33% error rate)")
+        self.assertEqual(lines[1], "Requests: 6 in 2.00 seconds (6.0 events/second)")
+        self.assertEqual(lines[2], "Latency (ms): min 4.0, p50 15.0, p90 350.0, p99 350.0, max 350.0")
+        self.assertEqual(lines[3:5], ["Errors:", "  ThrottlingException: 1"])
+        self.assertEqual(lines[5], "Latency histogram (ms):")
+        # buckets from the fastest to the slowest request
+        self.assertTrue(lines[6].startswith("      <= 5 | ####################"))
+        self.assertTrue(lines[-1].startswith("    <= 500 | ####################"))
+        self.assertTrue(lines[-2].strip().startswith("<= 200 |"))
+
+    def test_format_without_requests(self):
+        self.assertEqual(
+            RemoteInvokeLoadReport().format(),
+            "Events: 0 sent, 0 succeeded, 0 failed (0.00% error rate)\nRequests: 0 in 0.00 seconds (0.0 events/second)",
+        )
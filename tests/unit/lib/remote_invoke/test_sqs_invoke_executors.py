@@ -1,6 +1,9 @@
+from typing import Any
 from unittest import TestCase
 from unittest.mock import patch, Mock
 
+import botocore.session
+from botocore.stub import Stubber
 from parameterized import parameterized, parameterized_class
 from samcli.lib.remote_invoke.sqs_invoke_executors import (
     RemoteInvokeOutputFormat,
@@ -182,6 +185,58 @@ class TestSqsSendMessageExecutor(TestCase):
                 pass
 
 
+class TestSqsSendMessageExecutorSendBatch(TestCase):
+    def setUp(self) -> None:
+        self.sqs_client: Any = botocore.session.get_session().create_client("sqs", region_name="us-east-1")
+        self.stubber = Stubber(self.sqs_client)
+        self.sqs_url = "https://sqs.us-east-1.amazonaws.com/12345678910/mock-queue-name"
+        self.executor = SqsSendMessageExecutor(self.sqs_client, self.sqs_url, RemoteInvokeOutputFormat.TEXT)
+
+    def test_send_batch_sends_messages_with_parameters(self):
+        self.executor.validate_action_parameters({"DelaySeconds": "5", "MessageGroupId": "group"})
+        self.stubber.add_response(
+            "send_message_batch",
+            {
+                "Successful": [
+                    {"Id": "0", "MessageId": "id0", "MD5OfMessageBody": "md5"},
+                    {"Id": "2", "MessageId": "id2", "MD5OfMessageBody": "md5"},
+                ],
+                "Failed": [{"Id": "1", "SenderFault": False, "Code": "InternalError"}],
+            },
+            {
+                "QueueUrl": self.sqs_url,
+                "Entries": [
+                    {"Id": "0", "MessageBody": "hello", "DelaySeconds": 5, "MessageGroupId": "group"},
+                    {"Id": "1", "MessageBody": "{}", "DelaySeconds": 5, "MessageGroupId": "group"},
+                    {"Id": "2", "MessageBody": "world", "DelaySeconds": 5, "MessageGroupId": "group"},
+                ],
+            },
+        )
+
+        with self.stubber:
+            errors = self.executor.send_batch(["hello", "", "world"])
+
+        self.assertEqual(errors, [None, "InternalError", None])
+        self.assertEqual(self.executor.request_parameters, {"DelaySeconds": 5, "MessageGroupId": "group"})
+
+    def test_send_batch_raises_request_errors(self):
+        self.stubber.add_client_error(
+            "send_message_batch", service_error_code="AWS.SimpleQueueService.NonExistentQueue"
+        )
+
+        with self.stubber, self.assertRaises(ClientError):
+            self.executor.send_batch(["hello"])
+
+    def test_payload_size_includes_message_attributes(self):
+        self.executor.validate_action_parameters(
+            {"MessageAttributes": '{"Attr": {"DataType": "String", "StringValue": "value"}}'}
+        )
+
+        self.assertEqual(self.executor.max_batch_payload_size, 256 * 1024)
+        self.assertEqual(self.executor.get_payload_size("hello"), len("hello") + len("Attr" "String" "value"))
+        self.assertEqual(self.executor.get_payload_size(""), len("{}") + len("Attr" "String" "value"))
+
+
 class TestSQSInvokeExecutorUtilities(TestCase):
     def test_get_queue_url_from_arn_successful(self):
         given_sqs_client = Mock()
@@ -1,10 +1,12 @@
 from unittest import TestCase
-from unittest.mock import patch, Mock
+from unittest.mock import call, patch, Mock
 
 from parameterized import parameterized, parameterized_class
 from samcli.lib.remote_invoke.stepfunctions_invoke_executors import (
     SfnDescribeExecutionResponseConverter,
     RemoteInvokeOutputFormat,
+    SFN_EXECUTION_MIN_WAIT_TIME,
+    SFN_EXECUTION_WAIT_TIME,
     InvalideBotoResponseException,
     StepFunctionsStartExecutionExecutor,
     ParamValidationError,
@@ -31,6 +33,17 @@ class TestStepFunctionsStartExecutionExecutor(TestCase):
             self.stepfunctions_client, self.state_machine_arn, self.output
         )
 
+    def _history_event(self, event_id, event_type, state_name=None):
+        history_event = {"id": event_id, "type": event_type, "timestamp": datetime(2023, 7, 10, 7, 26, event_id)}
+        if state_name:
+            history_event["stateEnteredEventDetails"] = {"name": state_name}
+        return history_event
+
+    def _expected_logs(self, log_lines):
+        if self.output == RemoteInvokeOutputFormat.TEXT:
+            return [RemoteInvokeLogOutput(log_line) for log_line in log_lines]
+        return []
+
     @patch("samcli.lib.remote_invoke.stepfunctions_invoke_executors.time")
     def test_execute_action_successful(self, patched_time):
         patched_time.sleep = Mock()
@@ -43,22 +56,38 @@ class TestStepFunctionsStartExecutionExecutor(TestCase):
             "output": '{"output_key": "mock_output"}',
         }
         self.stepfunctions_client.start_execution.return_value = {"executionArn": mock_exec_arn}
-        self.stepfunctions_client.describe_execution.side_effect = [
-            {"executionArn": mock_exec_arn, "status": "RUNNING"},
-            mock_response,
+        self.stepfunctions_client.get_execution_history.side_effect = [
+            {"events": [self._history_event(1, "ExecutionStarted")]},
+            {
+                "events": [
+                    self._history_event(2, "PassStateEntered", "MyState"),
+                    self._history_event(1, "ExecutionStarted"),
+                ]
+            },
+            {"events": [self._history_event(3, "ExecutionSucceeded"), self._history_event(2, "PassStateEntered")]},
         ]
+        self.stepfunctions_client.describe_execution.return_value = mock_response
         self.stepfunctions_invoke_executor.validate_action_parameters({"name": mock_exec_name})
         result = self.stepfunctions_invoke_executor._execute_action(given_input)
 
+        expected_logs = self._expected_logs(
+            [
+                "2023-07-10 07:26:01 ExecutionStarted\n",
+                "2023-07-10 07:26:02 PassStateEntered: MyState\n",
+                "2023-07-10 07:26:03 ExecutionSucceeded\n",
+            ]
+        )
         if self.output == RemoteInvokeOutputFormat.JSON:
             self.assertEqual(list(result), [RemoteInvokeResponse(mock_response)])
         else:
-            self.assertEqual(list(result), [RemoteInvokeResponse(mock_response["output"])])
+            self.assertEqual(list(result), expected_logs + [RemoteInvokeResponse(mock_response["output"])])
 
         self.stepfunctions_client.start_execution.assert_called_with(
             stateMachineArn=self.state_machine_arn, input=given_input, name=mock_exec_name
         )
-        self.stepfunctions_client.describe_execution.assert_called()
+        self.stepfunctions_client.describe_execution.assert_called_once_with(executionArn=mock_exec_arn)
+        # polls tightly first, then backs off
+        patched_time.sleep.assert_has_calls([call(SFN_EXECUTION_MIN_WAIT_TIME), call(SFN_EXECUTION_MIN_WAIT_TIME * 2)])
 
     @patch("samcli.lib.remote_invoke.stepfunctions_invoke_executors.time")
     def test_execute_action_not_successful(self, patched_time):
@@ -70,10 +99,11 @@ class TestStepFunctionsStartExecutionExecutor(TestCase):
         given_input = '{"input_key": "value"}'
         mock_response = {"executionArn": mock_exec_arn, "status": "FAILED", "error": mock_error, "cause": mock_cause}
         self.stepfunctions_client.start_execution.return_value = {"executionArn": mock_exec_arn}
-        self.stepfunctions_client.describe_execution.side_effect = [
-            {"executionArn": mock_exec_arn, "status": "RUNNING"},
-            mock_response,
+        self.stepfunctions_client.get_execution_history.side_effect = [
+            {"events": []},
+            {"events": [self._history_event(1, "ExecutionFailed")]},
         ]
+        self.stepfunctions_client.describe_execution.return_value = mock_response
         self.stepfunctions_invoke_executor.validate_action_parameters({"name": mock_exec_name})
         result = self.stepfunctions_invoke_executor._execute_action(given_input)
 
@@ -81,7 +111,65 @@ class TestStepFunctionsStartExecutionExecutor(TestCase):
         if self.output == RemoteInvokeOutputFormat.JSON:
             self.assertEqual(list(result), [RemoteInvokeResponse(mock_response)])
         else:
-            self.assertEqual(list(result), [RemoteInvokeLogOutput(expected_response)])
+            self.assertEqual(
+                list(result),
+                self._expected_logs(["2023-07-10 07:26:01 ExecutionFailed\n"])
+                + [RemoteInvokeLogOutput(expected_response)],
+            )
+
+    @patch("samcli.lib.remote_invoke.stepfunctions_invoke_executors.time")
+    def test_history_is_read_newest_first_until_events_read_already(self, patched_time):
+        self.stepfunctions_client.get_execution_history.side_effect = [
+            {"events": [self._history_event(2, "PassStateEntered")], "nextToken": "token"},
+            {"events": [self._history_event(1, "ExecutionStarted")]},
+            {"events": [self._history_event(4, "ExecutionSucceeded")], "nextToken": "token2"},
+            {"events": [self._history_event(3, "PassStateExited"), self._history_event(2, "PassStateEntered")]},
+        ]
+
+        history_events = list(self.stepfunctions_invoke_executor._wait_for_execution("MockArn"))
+
+        self.assertEqual([history_event["id"] for history_event in history_events], [1, 2, 3, 4])
+        self.stepfunctions_client.get_execution_history.assert_has_calls(
+            [
+                call(executionArn="MockArn", reverseOrder=True),
+                call(executionArn="MockArn", reverseOrder=True, nextToken="token"),
+                call(executionArn="MockArn", reverseOrder=True),
+                call(executionArn="MockArn", reverseOrder=True, nextToken="token2"),
+            ]
+        )
+
+    @patch("samcli.lib.remote_invoke.stepfunctions_invoke_executors.time")
+    def test_wait_time_backs_off_up_to_maximum(self, patched_time):
+        self.stepfunctions_client.get_execution_history.side_effect = [{"events": []}] * 6 + [
+            {"events": [self._history_event(1, "ExecutionAborted")]}
+        ]
+
+        list(self.stepfunctions_invoke_executor._wait_for_execution("MockArn"))
+
+        self.assertEqual(
+            patched_time.sleep.call_args_list,
+            [call(0.25), call(0.5), call(1)] + [call(SFN_EXECUTION_WAIT_TIME)] * 3,
+        )
+
+    def test_asynchronous_execution_returns_once_started(self):
+        mock_exec_arn = "MockArn"
+        start_date = datetime(2023, 7, 10, 7, 26, 25)
+        self.stepfunctions_client.start_execution.return_value = {
+            "executionArn": mock_exec_arn,
+            "startDate": start_date,
+            "ResponseMetadata": {},
+        }
+        remote_invoke_input = RemoteInvokeExecutionInfo("input", None, {}, self.output, asynchronous=True)
+
+        self.stepfunctions_invoke_executor.validate_action_parameters({})
+        result = list(self.stepfunctions_invoke_executor.execute(remote_invoke_input))
+
+        if self.output == RemoteInvokeOutputFormat.JSON:
+            self.assertEqual(result, [RemoteInvokeResponse({"executionArn": mock_exec_arn, "startDate": start_date})])
+        else:
+            self.assertEqual(result, [RemoteInvokeResponse(mock_exec_arn)])
+        self.stepfunctions_client.get_execution_history.assert_not_called()
+        self.stepfunctions_client.describe_execution.assert_not_called()
 
     @parameterized.expand(
         [
@@ -33,7 +33,7 @@ class TestFunctionSyncFlow(TestCase):
         return sync_flow
 
     @patch("samcli.lib.sync.sync_flow.get_boto_client_provider_from_session_with_config")
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.sync.sync_flow.boto3.Session")
     @patch.multiple(FunctionSyncFlow, __abstractmethods__=set())
     def test_sets_up_clients(self, session_mock, client_provider_mock):
         sync_flow = self.create_function_sync_flow()
@@ -42,7 +42,7 @@ class TestFunctionSyncFlow(TestCase):
         sync_flow._lambda_client.get_waiter.assert_called_once_with("function_updated")
 
     @patch("samcli.lib.sync.flows.function_sync_flow.AliasVersionSyncFlow")
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.sync.sync_flow.boto3.Session")
     @patch.multiple(FunctionSyncFlow, __abstractmethods__=set())
     def test_gather_dependencies(self, session_mock, alias_version_mock):
         sync_flow = self.create_function_sync_flow()
@@ -22,13 +22,13 @@ class TestHttpApiSyncFlow(TestCase):
         return sync_flow
 
     @patch("samcli.lib.sync.sync_flow.get_boto_client_provider_from_session_with_config")
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.sync.sync_flow.boto3.Session")
     def test_set_up(self, session_mock, client_provider_mock):
         sync_flow = self.create_sync_flow()
         sync_flow.set_up()
         client_provider_mock.return_value.assert_any_call("apigatewayv2")
 
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.sync.sync_flow.boto3.Session")
     def test_sync_direct(self, session_mock):
         sync_flow = self.create_sync_flow()
 
@@ -102,7 +102,7 @@ class TestHttpApiSyncFlow(TestCase):
             data = sync_flow._process_definition_file()
             self.assertEqual(data, '{"key": "value"}'.encode("utf-8"))
 
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.sync.sync_flow.boto3.Session")
     def test_gather_resources_generate_local_sha(self, session_mock):
         sync_flow = self.create_sync_flow()
 
@@ -123,7 +123,7 @@ class TestHttpApiSyncFlow(TestCase):
 
         self.assertEqual(sync_flow._local_sha, str_checksum('{"key": "value"}', hashlib.sha256()))
 
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.sync.sync_flow.boto3.Session")
     def test_failed_gather_resources(self, session_mock):
         sync_flow = self.create_sync_flow()
 
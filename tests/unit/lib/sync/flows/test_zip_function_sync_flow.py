@@ -23,6 +23,7 @@ class TestZipFunctionSyncFlow(TestCase):
 
     def create_function_sync_flow(self):
         self.build_context_mock = MagicMock()
+        self.build_context_mock.cache_dir = "cache_dir"
         self.function_identifier = "Function1"
         sync_flow = ZipFunctionSyncFlow(
             self.function_identifier,
@@ -37,7 +38,7 @@ class TestZipFunctionSyncFlow(TestCase):
         return sync_flow
 
     @patch("samcli.lib.sync.sync_flow.get_boto_client_provider_from_session_with_config")
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.sync.sync_flow.boto3.Session")
     def test_set_up(self, session_mock, client_provider_mock):
         sync_flow = self.create_function_sync_flow()
         sync_flow.set_up()
@@ -51,7 +52,7 @@ class TestZipFunctionSyncFlow(TestCase):
     @patch("samcli.lib.sync.flows.zip_function_sync_flow.tempfile.gettempdir")
     @patch("samcli.lib.sync.flows.zip_function_sync_flow.ApplicationBuilder")
     @patch("samcli.lib.sync.flows.zip_function_sync_flow.rmtree_if_exists")
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.sync.sync_flow.boto3.Session")
     def test_gather_resources(
         self,
         session_mock,
@@ -85,7 +86,11 @@ class TestZipFunctionSyncFlow(TestCase):
             rmtree_if_exists_mock.assert_not_called()
             get_mock.assert_not_called()
             self.assertEqual(sync_flow._artifact_folder, build_folder)
-            make_zip_mock.assert_called_once_with("temp_folder" + os.sep + "data-uuid_value", build_folder)
+            make_zip_mock.assert_called_once_with(
+                "temp_folder" + os.sep + "data-uuid_value",
+                build_folder,
+                base_zip=os.path.join("cache_dir", "Function1.sync.zip"),
+            )
             sync_flow._get_lock_chain.assert_not_called()
             sync_flow._get_lock_chain.return_value.__enter__.assert_not_called()
             sync_flow._get_lock_chain.return_value.__exit__.assert_not_called()
@@ -95,7 +100,11 @@ class TestZipFunctionSyncFlow(TestCase):
             )
             get_mock.assert_called_once_with("Function1")
             self.assertEqual(sync_flow._artifact_folder, "ArtifactFolder1")
-            make_zip_mock.assert_called_once_with("temp_folder" + os.sep + "data-uuid_value", "ArtifactFolder1")
+            make_zip_mock.assert_called_once_with(
+                "temp_folder" + os.sep + "data-uuid_value",
+                "ArtifactFolder1",
+                base_zip=os.path.join("cache_dir", "Function1.sync.zip"),
+            )
             sync_flow._get_lock_chain.assert_called_once()
             sync_flow._get_lock_chain.return_value.__enter__.assert_called_once()
             sync_flow._get_lock_chain.return_value.__exit__.assert_called_once()
@@ -104,7 +113,7 @@ class TestZipFunctionSyncFlow(TestCase):
         self.assertEqual("sha256_value", sync_flow._local_sha)
 
     @patch("samcli.lib.sync.flows.zip_function_sync_flow.base64.b64decode")
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.sync.sync_flow.boto3.Session")
     def test_compare_remote_true(self, session_mock, b64decode_mock):
         b64decode_mock.return_value.hex.return_value = "sha256_value"
         sync_flow = self.create_function_sync_flow()
@@ -124,7 +133,7 @@ class TestZipFunctionSyncFlow(TestCase):
         self.assertTrue(result)
 
     @patch("samcli.lib.sync.flows.zip_function_sync_flow.base64.b64decode")
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.sync.sync_flow.boto3.Session")
     def test_compare_remote_false(self, session_mock, b64decode_mock):
         b64decode_mock.return_value.hex.return_value = "sha256_value_2"
         sync_flow = self.create_function_sync_flow()
@@ -149,7 +158,7 @@ class TestZipFunctionSyncFlow(TestCase):
     @patch("samcli.lib.sync.flows.zip_function_sync_flow.os.path.exists")
     @patch("samcli.lib.sync.flows.zip_function_sync_flow.S3Uploader")
     @patch("samcli.lib.sync.flows.zip_function_sync_flow.os.path.getsize")
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.sync.sync_flow.boto3.Session")
     def test_sync_direct(self, session_mock, getsize_mock, uploader_mock, exists_mock, remove_mock, wait_mock):
         getsize_mock.return_value = 49 * 1024 * 1024
         exists_mock.return_value = True
@@ -180,7 +189,7 @@ class TestZipFunctionSyncFlow(TestCase):
     @patch("samcli.lib.sync.flows.zip_function_sync_flow.os.path.exists")
     @patch("samcli.lib.sync.flows.zip_function_sync_flow.S3Uploader")
     @patch("samcli.lib.sync.flows.zip_function_sync_flow.os.path.getsize")
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.sync.sync_flow.boto3.Session")
     def test_sync_s3(self, session_mock, getsize_mock, uploader_mock, exists_mock, remove_mock, wait_mock):
         getsize_mock.return_value = 51 * 1024 * 1024
         exists_mock.return_value = True
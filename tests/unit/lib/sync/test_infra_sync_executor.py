@@ -18,7 +18,7 @@ class TestInfraSyncExecutor(TestCase):
 
     @parameterized.expand([(True,), (False,)])
     @patch("samcli.lib.sync.infra_sync_executor.InfraSyncExecutor._auto_skip_infra_sync")
-    @patch("samcli.lib.sync.infra_sync_executor.Session")
+    @patch("samcli.lib.sync.infra_sync_executor.boto3.Session")
     @patch("samcli.lib.sync.infra_sync_executor.datetime")
     def test_execute_infra_sync(self, auto_skip_infra_sync, datetime_mock, session_mock, auto_skip_infra_sync_mock):
         datetime_mock.utcnow.return_value = datetime(2023, 2, 8, 12, 12, 12)
@@ -55,7 +55,7 @@ class TestInfraSyncExecutor(TestCase):
         self.assertEqual(executed, not auto_skip_infra_sync)
 
     @patch("samcli.lib.sync.infra_sync_executor.InfraSyncExecutor._auto_skip_infra_sync")
-    @patch("samcli.lib.sync.infra_sync_executor.Session")
+    @patch("samcli.lib.sync.infra_sync_executor.boto3.Session")
     @patch("samcli.lib.sync.infra_sync_executor.datetime")
     def test_7_days_auto_execute_infra_sync(self, datetime_mock, session_mock, auto_skip_infra_sync_mock):
         datetime_mock.utcnow.return_value = datetime(2023, 2, 8, 12, 12, 12)
@@ -85,7 +85,7 @@ class TestInfraSyncExecutor(TestCase):
 
     @patch("samcli.lib.sync.infra_sync_executor.SYNC_FLOW_THRESHOLD", 1)
     @patch("samcli.lib.sync.infra_sync_executor.InfraSyncExecutor._auto_skip_infra_sync")
-    @patch("samcli.lib.sync.infra_sync_executor.Session")
+    @patch("samcli.lib.sync.infra_sync_executor.boto3.Session")
     @patch("samcli.lib.sync.infra_sync_executor.datetime")
     def test_execute_infra_sync_exceed_threshold(self, datetime_mock, session_mock, auto_skip_infra_sync_mock):
         datetime_mock.utcnow.return_value = datetime(2023, 2, 8, 12, 12, 12)
@@ -114,7 +114,7 @@ class TestInfraSyncExecutor(TestCase):
 
     @patch("samcli.lib.sync.infra_sync_executor.is_local_path")
     @patch("samcli.lib.sync.infra_sync_executor.get_template_data")
-    @patch("samcli.lib.sync.infra_sync_executor.Session")
+    @patch("samcli.lib.sync.infra_sync_executor.boto3.Session")
     def test_auto_skip_infra_sync_basic(self, session_mock, get_template_mock, local_path_mock):
         built_template_dict = {
             "Resources": {
@@ -146,7 +146,7 @@ class TestInfraSyncExecutor(TestCase):
 
     @patch("samcli.lib.sync.infra_sync_executor.is_local_path")
     @patch("samcli.lib.sync.infra_sync_executor.get_template_data")
-    @patch("samcli.lib.sync.infra_sync_executor.Session")
+    @patch("samcli.lib.sync.infra_sync_executor.boto3.Session")
     def test_auto_skip_infra_sync_all_resources(self, session_mock, get_template_mock, local_path_mock):
         built_template_dict = {
             "Resources": {
@@ -297,7 +297,7 @@ class TestInfraSyncExecutor(TestCase):
 
     @patch("samcli.lib.sync.infra_sync_executor.is_local_path")
     @patch("samcli.lib.sync.infra_sync_executor.get_template_data")
-    @patch("samcli.lib.sync.infra_sync_executor.Session")
+    @patch("samcli.lib.sync.infra_sync_executor.boto3.Session")
     def test_auto_skip_infra_sync_nested_stack(self, session_mock, get_template_mock, local_path_mock):
         built_template_dict = {
             "Resources": {
@@ -385,7 +385,7 @@ class TestInfraSyncExecutor(TestCase):
     @parameterized.expand([(True, "sar_id"), (False, "sar_id_2")])
     @patch("samcli.lib.sync.infra_sync_executor.is_local_path")
     @patch("samcli.lib.sync.infra_sync_executor.get_template_data")
-    @patch("samcli.lib.sync.infra_sync_executor.Session")
+    @patch("samcli.lib.sync.infra_sync_executor.boto3.Session")
     def test_auto_skip_infra_sync_nested_stack_with_sar(
         self, expected_result, sar_id, session_mock, get_template_mock, local_path_mock
     ):
@@ -434,7 +434,7 @@ class TestInfraSyncExecutor(TestCase):
         self.assertEqual(infra_sync_executor.code_sync_resources, set())
 
     @patch("samcli.lib.sync.infra_sync_executor.get_template_data")
-    @patch("samcli.lib.sync.infra_sync_executor.Session")
+    @patch("samcli.lib.sync.infra_sync_executor.boto3.Session")
     def test_auto_skip_infra_sync_http_template_location(self, session_mock, get_template_mock):
         built_template_dict = {
             "Resources": {
@@ -497,7 +497,7 @@ class TestInfraSyncExecutor(TestCase):
 
     @patch("samcli.lib.sync.infra_sync_executor.is_local_path")
     @patch("samcli.lib.sync.infra_sync_executor.get_template_data")
-    @patch("samcli.lib.sync.infra_sync_executor.Session")
+    @patch("samcli.lib.sync.infra_sync_executor.boto3.Session")
     def test_auto_skip_infra_sync_exception(self, session_mock, get_template_mock, local_path_mock):
         template_dict = {
             "Resources": {
@@ -533,7 +533,7 @@ class TestInfraSyncExecutor(TestCase):
     )
     @patch("samcli.lib.sync.infra_sync_executor.is_local_path")
     @patch("samcli.lib.sync.infra_sync_executor.get_template_data")
-    @patch("samcli.lib.sync.infra_sync_executor.Session")
+    @patch("samcli.lib.sync.infra_sync_executor.boto3.Session")
     def test_auto_skip_infra_sync_param_overrides(
         self, param_overrides, expect_skip_infra_sync, session_mock, get_template_mock, local_path_mock
     ):
@@ -575,7 +575,7 @@ class TestInfraSyncExecutor(TestCase):
         )
 
     @patch("samcli.lib.sync.infra_sync_executor.is_local_path")
-    @patch("samcli.lib.sync.infra_sync_executor.Session")
+    @patch("samcli.lib.sync.infra_sync_executor.boto3.Session")
     def test_sanitize_template(self, session_mock, local_path_mock):
         built_template_dict = {
             "Resources": {
@@ -773,7 +773,7 @@ class TestInfraSyncExecutor(TestCase):
         self.assertEqual(downloaded_template_dict, expected_dict)
 
     @patch("samcli.lib.sync.infra_sync_executor.is_local_path")
-    @patch("samcli.lib.sync.infra_sync_executor.Session")
+    @patch("samcli.lib.sync.infra_sync_executor.boto3.Session")
     def test_remove_metadata(self, session_mock, local_path_mock):
         template_dict = {
             "Resources": {
@@ -805,7 +805,7 @@ class TestInfraSyncExecutor(TestCase):
 
     @parameterized.expand([(True, []), (False, ["ServerlessFunction"])])
     @patch("samcli.lib.sync.infra_sync_executor.is_local_path")
-    @patch("samcli.lib.sync.infra_sync_executor.Session")
+    @patch("samcli.lib.sync.infra_sync_executor.boto3.Session")
     def test_remove_resource_field(self, is_local_path, linked_resources, session_mock, local_path_mock):
         built_resource_dict = {
             "Type": "AWS::Serverless::Function",
@@ -839,7 +839,7 @@ class TestInfraSyncExecutor(TestCase):
 
     @parameterized.expand([(True, []), (False, ["LambdaFunction"])])
     @patch("samcli.lib.sync.infra_sync_executor.is_local_path")
-    @patch("samcli.lib.sync.infra_sync_executor.Session")
+    @patch("samcli.lib.sync.infra_sync_executor.boto3.Session")
     def test_remove_resource_field_lambda_function(
         self, is_local_path, linked_resources, session_mock, local_path_mock
     ):
@@ -878,7 +878,7 @@ class TestInfraSyncExecutor(TestCase):
 
     @parameterized.expand([(True, []), (False, ["LambdaFunction"])])
     @patch("samcli.lib.sync.infra_sync_executor.is_local_path")
-    @patch("samcli.lib.sync.infra_sync_executor.Session")
+    @patch("samcli.lib.sync.infra_sync_executor.boto3.Session")
     def test_remove_resource_field_lambda_function_code_string(
         self, is_local_path, linked_resources, session_mock, local_path_mock
     ):
@@ -914,7 +914,7 @@ class TestInfraSyncExecutor(TestCase):
 
     @patch("samcli.lib.sync.infra_sync_executor.get_template_data")
     @patch("samcli.lib.sync.infra_sync_executor.InfraSyncExecutor._get_remote_template_data")
-    @patch("samcli.lib.sync.infra_sync_executor.Session")
+    @patch("samcli.lib.sync.infra_sync_executor.boto3.Session")
     def test_get_templates(self, session_mock, get_remote_template_mock, get_template_mock):
         infra_sync_executor = InfraSyncExecutor(
             self.build_context, self.package_context, self.deploy_context, self.sync_context
@@ -926,7 +926,7 @@ class TestInfraSyncExecutor(TestCase):
         infra_sync_executor.get_template("https://s3.com/key/value")
         get_remote_template_mock.assert_called_once_with("https://s3.com/key/value")
 
-    @patch("samcli.lib.sync.infra_sync_executor.Session")
+    @patch("samcli.lib.sync.infra_sync_executor.boto3.Session")
     def test_get_remote_template(self, sessiion_mock):
         self.template_dict = {
             "Resources": {
@@ -45,7 +45,7 @@ class TestSyncFlow(TestCase):
 
     @parameterized.expand([(None,), ("local_sha",)])
     @patch("samcli.lib.sync.sync_flow.SyncFlow.sync_state_identifier", new_callable=PropertyMock)
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.sync.sync_flow.boto3.Session")
     @patch.multiple(SyncFlow, __abstractmethods__=set())
     def test_update_local_hash(self, local_sha, session_mock, patched_sync_state_identifier):
         sync_flow = self.create_sync_flow(False)
@@ -62,7 +62,7 @@ class TestSyncFlow(TestCase):
             else:
                 patched_sync_context.update_resource_sync_state.assert_not_called()
 
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.sync.sync_flow.boto3.Session")
     @patch.multiple(SyncFlow, __abstractmethods__=set())
     def test_execute_all_steps(self, session_mock):
         sync_flow = self.create_sync_flow()
@@ -79,7 +79,7 @@ class TestSyncFlow(TestCase):
         sync_flow.gather_dependencies.assert_called_once()
         self.assertEqual(result, ["A"])
 
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.sync.sync_flow.boto3.Session")
     @patch.multiple(SyncFlow, __abstractmethods__=set())
     def test_execute_skip_after_compare_local(self, session_mock):
         sync_flow = self.create_sync_flow()
@@ -96,7 +96,7 @@ class TestSyncFlow(TestCase):
         sync_flow.gather_dependencies.assert_not_called()
         self.assertEqual(result, [])
 
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.sync.sync_flow.boto3.Session")
     @patch.multiple(SyncFlow, __abstractmethods__=set())
     def test_execute_skip_after_compare_remote(self, session_mock):
         sync_flow = self.create_sync_flow()
@@ -113,7 +113,7 @@ class TestSyncFlow(TestCase):
         sync_flow.gather_dependencies.assert_not_called()
         self.assertEqual(result, [])
 
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.sync.sync_flow.boto3.Session")
     @patch.multiple(SyncFlow, __abstractmethods__=set())
     def test_get_sync_flow(self, session_mock):
         sync_flow = self.create_sync_flow()
@@ -156,7 +156,7 @@ class TestSyncFlow(TestCase):
             given_client_generator.assert_called_with(client_name)
             self.assertEqual(client, given_client)
 
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.sync.sync_flow.boto3.Session")
     @patch.multiple(SyncFlow, __abstractmethods__=set())
     def test_set_locks_with_distributor(self, session_mock):
         sync_flow = self.create_sync_flow()
@@ -187,7 +187,7 @@ class TestSyncFlow(TestCase):
         self.assertEqual(sorted(result), sorted(["A_Build", "B_UpdateFunctionConfiguration"]))
 
     @patch("samcli.lib.sync.sync_flow.LockChain")
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.sync.sync_flow.boto3.Session")
     @patch.multiple(SyncFlow, __abstractmethods__=set())
     def test_get_lock_chain(self, session_mock, lock_chain_mock):
         sync_flow = self.create_sync_flow()
@@ -267,7 +267,7 @@ class TestSyncFlow(TestCase):
         definition_path = get_definition_path(resource, "identifier", True, "base_dir", [])
         self.assertEqual(definition_path, Path("base_dir").joinpath("test_uri"))
 
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.sync.sync_flow.boto3.Session")
     @patch("samcli.lib.sync.sync_flow.SyncFlow.sync_state_identifier", new_callable=PropertyMock)
     @patch.multiple(SyncFlow, __abstractmethods__=set())
     def test_compare_local(self, patched_session, patched_sync_state_identifier):
@@ -2,7 +2,7 @@ import platform
 import time
 
 from unittest import TestCase
-from unittest.mock import patch, Mock, ANY, call
+from unittest.mock import patch, Mock, MagicMock, ANY, call
 
 import pytest
 import click
@@ -14,6 +14,7 @@ from samcli.lib.telemetry.event import EventTracker
 
 import samcli.lib.telemetry.metric
 from samcli.lib.telemetry.cicd import CICDPlatform
+from samcli.lib.utils.timings import SpanTracer
 from samcli.lib.telemetry.metric import (
     capture_return_value,
     _get_metric,
@@ -154,6 +155,54 @@ class TestTrackCommand(TestCase):
 
         run_metrics_mock.assert_called_with(self.context_mock, ANY, "success", 0)
 
+    @patch("samcli.lib.telemetry.metric.click.echo")
+    @patch("samcli.lib.telemetry.metric.get_tracer")
+    @patch("samcli.lib.telemetry.metric.Context")
+    @patch("samcli.lib.telemetry.metric._send_command_run_metrics")
+    def test_must_report_timings_when_enabled(self, run_metrics_mock, context_mock, get_tracer_mock, click_mock):
+        context_mock.get_current_context.return_value = self.context_mock
+        tracer = SpanTracer()
+        tracer.enabled = True
+        get_tracer_mock.return_value = tracer
+
+        def real_fn():
+            with tracer.span("template.load"):
+                pass
+
+        track_command(real_fn)()
+
+        self.assertEqual(tracer.root_spans[0].name, "fakesam local invoke")
+        self.assertEqual(tracer.root_spans[0].children[0].name, "template.load")
+        click_mock.assert_called_once_with(tracer.format_report(), err=True)
+
+    @patch("samcli.lib.telemetry.metric.click.echo")
+    @patch("samcli.lib.telemetry.metric.Context")
+    @patch("samcli.lib.telemetry.metric._send_command_run_metrics")
+    def test_must_not_report_timings_when_disabled(self, run_metrics_mock, context_mock, click_mock):
+        context_mock.get_current_context.return_value = self.context_mock
+
+        track_command(lambda: None)()
+
+        click_mock.assert_not_called()
+
+    @patch("samcli.lib.telemetry.metric.os")
+    @patch("samcli.lib.telemetry.metric.click.echo")
+    @patch("samcli.lib.telemetry.metric.get_tracer")
+    @patch("samcli.lib.telemetry.metric.Context")
+    @patch("samcli.lib.telemetry.metric._send_command_run_metrics")
+    def test_must_export_chrome_trace_when_requested(
+        self, run_metrics_mock, context_mock, get_tracer_mock, click_mock, os_mock
+    ):
+        context_mock.get_current_context.return_value = self.context_mock
+        tracer = MagicMock()
+        tracer.enabled = True
+        get_tracer_mock.return_value = tracer
+        os_mock.environ = {"SAM_CLI_TIMINGS_TRACE_FILE": "trace.json"}
+
+        track_command(lambda: None)()
+
+        tracer.export_chrome_trace.assert_called_once_with("trace.json")
+
     @pytest.mark.flaky(reruns=3)
     @patch("samcli.lib.telemetry.metric.Context")
     @patch("samcli.lib.telemetry.metric._send_command_run_metrics")
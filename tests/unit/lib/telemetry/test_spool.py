@@ -0,0 +1,114 @@
+import json
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from samcli.lib.telemetry.spool import SPOOL_FILE_NAME, TelemetrySpool, main
+
+
+class TestTelemetrySpool(TestCase):
+    def setUp(self):
+        self.spool_dir = Path(tempfile.mkdtemp())
+        self.spool = TelemetrySpool(self.spool_dir, max_batch_size=2)
+
+    def tearDown(self):
+        shutil.rmtree(self.spool_dir)
+
+    def _spooled_metrics(self):
+        if not self.spool.spool_file.exists():
+            return []
+        return [json.loads(line) for line in self.spool.spool_file.read_text().splitlines()]
+
+    def test_append_must_write_one_metric_per_line(self):
+        self.assertTrue(self.spool.append({"m1": {"a": 1}}))
+        self.assertTrue(self.spool.append({"m2": {"b": 2}}))
+
+        self.assertEqual(self._spooled_metrics(), [{"m1": {"a": 1}}, {"m2": {"b": 2}}])
+        self.assertTrue(self.spool.has_pending())
+
+    def test_append_must_create_spool_dir(self):
+        spool = TelemetrySpool(self.spool_dir.joinpath("nested"))
+
+        self.assertTrue(spool.append({"m1": {}}))
+        self.assertTrue(spool.spool_file.exists())
+
+    def test_append_must_return_false_when_spool_is_not_writable(self):
+        with patch("samcli.lib.telemetry.spool.open", side_effect=OSError()):
+            self.assertFalse(self.spool.append({"m1": {}}))
+
+    def test_append_must_drop_oldest_metrics_when_full(self):
+        line_size = len(json.dumps({"m0": {}})) + 1
+        spool = TelemetrySpool(self.spool_dir, max_size_bytes=line_size * 3)
+
+        for index in range(5):
+            spool.append({f"m{index}": {}})
+
+        self.assertEqual(self._spooled_metrics(), [{"m2": {}}, {"m3": {}}, {"m4": {}}])
+
+    def test_flush_must_send_in_batches(self):
+        for index in range(5):
+            self.spool.append({f"m{index}": {}})
+        send_mock = Mock(return_value=True)
+
+        delivered = self.spool.flush(send_mock)
+
+        self.assertEqual(delivered, 5)
+        self.assertEqual([len(call[0][0]) for call in send_mock.call_args_list], [2, 2, 1])
+        self.assertFalse(self.spool.has_pending())
+        self.assertEqual(os.listdir(self.spool_dir), [])
+
+    def test_flush_must_requeue_undelivered_metrics(self):
+        for index in range(5):
+            self.spool.append({f"m{index}": {}})
+        send_mock = Mock(side_effect=[True, False])
+
+        delivered = self.spool.flush(send_mock)
+
+        self.assertEqual(delivered, 2)
+        self.assertEqual(self._spooled_metrics(), [{"m2": {}}, {"m3": {}}, {"m4": {}}])
+        self.assertEqual(os.listdir(self.spool_dir), [SPOOL_FILE_NAME])
+
+    def test_flush_must_keep_metrics_appended_during_delivery(self):
+        self.spool.append({"m0": {}})
+
+        def send(batch):
+            self.spool.append({"m1": {}})
+            return True
+
+        self.spool.flush(send)
+
+        self.assertEqual(self._spooled_metrics(), [{"m1": {}}])
+
+    def test_flush_must_claim_stale_in_flight_files_only(self):
+        stale_file = self.spool_dir.joinpath(f"{SPOOL_FILE_NAME}.stale.sending")
+        stale_file.write_text(json.dumps({"stale": {}}) + "\n")
+        stale_time = time.time() - 3600
+        os.utime(stale_file, (stale_time, stale_time))
+        active_file = self.spool_dir.joinpath(f"{SPOOL_FILE_NAME}.active.sending")
+        active_file.write_text(json.dumps({"active": {}}) + "\n")
+        send_mock = Mock(return_value=True)
+
+        delivered = self.spool.flush(send_mock)
+
+        self.assertEqual(delivered, 1)
+        send_mock.assert_called_once_with([{"stale": {}}])
+        self.assertTrue(active_file.exists())
+
+    def test_flush_with_empty_spool_must_not_send(self):
+        send_mock = Mock()
+
+        self.assertEqual(self.spool.flush(send_mock), 0)
+        send_mock.assert_not_called()
+
+    @patch("samcli.lib.telemetry.telemetry.Telemetry")
+    def test_main_must_flush_given_spool(self, telemetry_mock):
+        main(["--url", "http://localhost", "--spool-dir", str(self.spool_dir)])
+
+        spool = telemetry_mock.call_args[1]["spool"]
+        self.assertEqual(telemetry_mock.call_args[1]["url"], "http://localhost")
+        self.assertEqual(spool.spool_dir, self.spool_dir)
+        telemetry_mock.return_value.flush.assert_called_once_with()
@@ -1,9 +1,16 @@
+import runpy
+import sys
+import threading
+from pathlib import Path
+
 import requests
 
 from unittest.mock import patch, Mock, ANY
 from unittest import TestCase
 
-from samcli.lib.telemetry.telemetry import Telemetry
+import samcli
+from samcli.lib.telemetry.spool import SENDER_COMMAND
+from samcli.lib.telemetry.telemetry import Telemetry, _schedule_background_sender, _start_sender_process
 
 
 class TestTelemetry(TestCase):
@@ -24,9 +31,12 @@ class TestTelemetry(TestCase):
     def tearDown(self):
         self.global_config_patcher.stop()
 
+    @patch("samcli.lib.telemetry.telemetry._schedule_background_sender")
     @patch("samcli.lib.telemetry.telemetry.requests")
-    def test_must_add_metric_with_attributes_to_registry(self, requests_mock):
-        telemetry = Telemetry(url=self.url)
+    def test_must_spool_metric_with_attributes(self, requests_mock, schedule_mock):
+        spool_mock = Mock()
+        spool_mock.append.return_value = True
+        telemetry = Telemetry(url=self.url, spool=spool_mock)
 
         metric_name = "mymetric"
         attrs = {"a": 1, "b": 2}
@@ -37,16 +47,71 @@ class TestTelemetry(TestCase):
 
         telemetry.emit(metric_mock)
 
-        expected = {"metrics": [{metric_name: {"a": 1, "b": 2}}]}
-        requests_mock.post.assert_called_once_with(ANY, json=expected, timeout=ANY)
+        spool_mock.append.assert_called_once_with({metric_name: {"a": 1, "b": 2}})
+        schedule_mock.assert_called_once_with(telemetry)
+        requests_mock.post.assert_not_called()
+
+    @patch("samcli.lib.telemetry.telemetry._schedule_background_sender")
+    @patch("samcli.lib.telemetry.telemetry.requests")
+    def test_must_send_directly_if_spool_is_not_writable(self, requests_mock, schedule_mock):
+        spool_mock = Mock()
+        spool_mock.append.return_value = False
+        telemetry = Telemetry(url=self.url, spool=spool_mock)
+
+        telemetry.emit(self.metric_mock)
+
+        expected = {"metrics": [{"metric_name": {"a": "1", "b": "2"}}]}
+        requests_mock.post.assert_called_once_with(ANY, json=expected, timeout=(2, 0.1))
+        schedule_mock.assert_not_called()
+
+    @patch("samcli.lib.telemetry.telemetry.requests")
+    def test_must_not_spool_if_endpoint_not_configured(self, requests_mock):
+        spool_mock = Mock()
+        telemetry = Telemetry(url=self.url, spool=spool_mock)
+        telemetry._url = ""
+
+        telemetry.emit(self.metric_mock)
+
+        spool_mock.append.assert_not_called()
+        requests_mock.post.assert_not_called()
 
     @patch("samcli.lib.telemetry.telemetry.requests")
     def test_default_request_should_be_fire_and_forget(self, requests_mock):
         telemetry = Telemetry(url=self.url)
 
-        telemetry.emit(self.metric_mock)
+        telemetry._send(self.metric_mock)
         requests_mock.post.assert_called_once_with(ANY, json=ANY, timeout=(2, 0.1))  # 100ms response timeout
 
+    @patch("samcli.lib.telemetry.telemetry.requests")
+    def test_must_send_batch_in_single_request(self, requests_mock):
+        telemetry = Telemetry(url=self.url)
+        requests_mock.post.return_value.ok = True
+
+        result = telemetry._send_batch([{"m1": {}}, {"m2": {}}], wait_for_response=True)
+
+        self.assertTrue(result)
+        requests_mock.post.assert_called_once_with(ANY, json={"metrics": [{"m1": {}}, {"m2": {}}]}, timeout=(2, 2))
+
+    @patch("samcli.lib.telemetry.telemetry.requests")
+    def test_batch_must_fail_on_server_error(self, requests_mock):
+        telemetry = Telemetry(url=self.url)
+        requests_mock.post.return_value.ok = False
+        requests_mock.post.return_value.status_code = 503
+
+        self.assertFalse(telemetry._send_batch([{"m1": {}}]))
+
+    def test_flush_must_deliver_spool_waiting_for_response(self):
+        spool_mock = Mock()
+        spool_mock.flush.return_value = 3
+        telemetry = Telemetry(url=self.url, spool=spool_mock)
+        telemetry._send_batch = Mock(return_value=True)
+
+        self.assertEqual(telemetry.flush(), 3)
+
+        send = spool_mock.flush.call_args[0][0]
+        send([{"m1": {}}])
+        telemetry._send_batch.assert_called_once_with([{"m1": {}}], wait_for_response=True)
+
     @patch("samcli.lib.telemetry.telemetry.requests")
     def test_request_must_wait_for_2_seconds_for_response(self, requests_mock):
         telemetry = Telemetry(url=self.url)
@@ -69,7 +134,7 @@ class TestTelemetry(TestCase):
         requests_mock.exceptions.ConnectionError = requests.exceptions.ConnectionError
         requests_mock.post.side_effect = requests.exceptions.Timeout()
 
-        telemetry.emit(self.metric_mock)
+        self.assertFalse(telemetry._send_batch([{"metric_name": {}}]))
 
     @patch("samcli.lib.telemetry.telemetry.requests")
     def test_must_swallow_connection_error_exception(self, requests_mock):
@@ -79,7 +144,7 @@ class TestTelemetry(TestCase):
         requests_mock.exceptions.ConnectionError = requests.exceptions.ConnectionError
         requests_mock.post.side_effect = requests.exceptions.ConnectionError()
 
-        telemetry.emit(self.metric_mock)
+        self.assertFalse(telemetry._send_batch([{"metric_name": {}}]))
 
     @patch("samcli.lib.telemetry.telemetry.requests")
     def test_must_raise_on_other_requests_exception(self, requests_mock):
@@ -90,7 +155,7 @@ class TestTelemetry(TestCase):
         requests_mock.post.side_effect = IOError()
 
         with self.assertRaises(IOError):
-            telemetry.emit(self.metric_mock)
+            telemetry._send(self.metric_mock)
 
     @patch("samcli.lib.telemetry.telemetry.DEFAULT_ENDPOINT_URL")
     def test_must_use_default_endpoint_url_if_not_customized(self, default_endpoint_url_mock):
@@ -98,18 +163,83 @@ class TestTelemetry(TestCase):
 
         self.assertEqual(telemetry._url, default_endpoint_url_mock)
 
-    @patch("samcli.lib.telemetry.telemetry.requests")
+    @patch("samcli.lib.telemetry.telemetry._schedule_background_sender")
     @patch("samcli.lib.telemetry.telemetry.GlobalConfig")
-    def test_must_not_send_when_telemetry_disabled(self, gc_mock, requests_mock):
-        telemetry = Telemetry(url=self.url)
+    def test_must_not_send_when_telemetry_disabled(self, gc_mock, schedule_mock):
+        spool_mock = Mock()
+        telemetry = Telemetry(url=self.url, spool=spool_mock)
         gc_mock.return_value.telemetry_enabled = False
         telemetry.emit(self.metric_mock)
-        requests_mock.post.assert_not_called()
+        spool_mock.append.assert_not_called()
 
-    @patch("samcli.lib.telemetry.telemetry.requests")
+    @patch("samcli.lib.telemetry.telemetry._schedule_background_sender")
     @patch("samcli.lib.telemetry.telemetry.GlobalConfig")
-    def test_must_send_when_telemetry_disabled_but_forced(self, gc_mock, requests_mock):
-        telemetry = Telemetry(url=self.url)
+    def test_must_send_when_telemetry_disabled_but_forced(self, gc_mock, schedule_mock):
+        spool_mock = Mock()
+        telemetry = Telemetry(url=self.url, spool=spool_mock)
         gc_mock.return_value.telemetry_enabled = False
         telemetry.emit(self.metric_mock, force_emit=True)
-        requests_mock.post.assert_called()
+        spool_mock.append.assert_called_once()
+
+
+class TestBackgroundSender(TestCase):
+    def setUp(self):
+        self.scheduled_patcher = patch("samcli.lib.telemetry.telemetry._background_sender_scheduled", threading.Event())
+        self.scheduled_patcher.start()
+
+    def tearDown(self):
+        self.scheduled_patcher.stop()
+
+    @patch("samcli.lib.telemetry.telemetry.sys")
+    @patch("samcli.lib.telemetry.telemetry.atexit")
+    def test_must_start_sender_process_at_exit_once(self, atexit_mock, sys_mock):
+        sys_mock.frozen = False
+        telemetry = Mock()
+        telemetry._url = "url"
+        telemetry.spool.spool_dir = "spool_dir"
+
+        _schedule_background_sender(telemetry)
+        _schedule_background_sender(telemetry)
+
+        atexit_mock.register.assert_called_once_with(_start_sender_process, "url", "spool_dir")
+
+    @patch("samcli.lib.telemetry.telemetry.sys")
+    @patch("samcli.lib.telemetry.telemetry.atexit")
+    def test_must_start_sender_process_at_exit_when_frozen(self, atexit_mock, sys_mock):
+        sys_mock.frozen = True
+        telemetry = Mock()
+        telemetry._url = "url"
+        telemetry.spool.spool_dir = "spool_dir"
+
+        _schedule_background_sender(telemetry)
+
+        atexit_mock.register.assert_called_once_with(_start_sender_process, "url", "spool_dir")
+
+    @patch("samcli.lib.telemetry.telemetry.subprocess.Popen")
+    def test_sender_process_runs_spool_module(self, popen_mock):
+        _start_sender_process("url", "spool_dir")
+
+        command = popen_mock.call_args[0][0]
+        self.assertEqual(command[1:], ["-m", "samcli.lib.telemetry.spool", "--url", "url", "--spool-dir", "spool_dir"])
+
+    @patch.object(sys, "executable", "/usr/local/bin/sam")
+    @patch.object(sys, "frozen", True, create=True)
+    @patch("samcli.lib.telemetry.telemetry.subprocess.Popen")
+    def test_sender_process_runs_sender_command_when_frozen(self, popen_mock):
+        _start_sender_process("url", "spool_dir")
+
+        command = popen_mock.call_args[0][0]
+        self.assertEqual(command, ["/usr/local/bin/sam", SENDER_COMMAND, "--url", "url", "--spool-dir", "spool_dir"])
+
+    @patch("samcli.lib.telemetry.spool.main")
+    def test_sender_command_runs_sender_instead_of_cli(self, sender_main_mock):
+        with patch.object(sys, "argv", ["sam", SENDER_COMMAND, "--url", "url", "--spool-dir", "spool_dir"]):
+            runpy.run_path(str(Path(samcli.__file__).parent.joinpath("__main__.py")), run_name="__main__")
+
+        sender_main_mock.assert_called_once_with(["--url", "url", "--spool-dir", "spool_dir"])
+
+    @patch("samcli.lib.telemetry.telemetry.subprocess.Popen")
+    def test_sender_process_failure_is_ignored(self, popen_mock):
+        popen_mock.side_effect = OSError()
+
+        _start_sender_process("url", "spool_dir")
@@ -2,6 +2,7 @@
 Unit tests for file observer
 """
 
+import threading
 from unittest import TestCase
 from unittest.mock import Mock, patch, call
 
@@ -41,6 +42,11 @@ class FileObserver_watch(TestCase):
         SingletonFileObserver._Singleton__instance = None
         self.observer = FileObserver(self.on_change)
 
+        # the observed paths are fake, they must not be resolved against the current directory
+        isdir_patcher = patch("samcli.lib.utils.file_observer.os.path.isdir", return_value=False)
+        isdir_patcher.start()
+        self.addCleanup(isdir_patcher.stop)
+
     def test_init_successfully(self):
         self.assertEqual(self.observer._single_file_observer._observed_paths_per_group, {self.group1: {}})
         self.assertEqual(self.observer._single_file_observer._observed_watches, {})
@@ -338,6 +344,7 @@ class FileObserver_on_change(TestCase):
         path_mock.exists.return_value = True
 
         self.observer._single_file_observer.on_change(event)
+        self.observer._single_file_observer._flush_events()
 
         self.assertEqual(
             self.observer._single_file_observer._observed_paths_per_group,
@@ -367,6 +374,7 @@ class FileObserver_on_change(TestCase):
         path_mock.exists.return_value = True
 
         self.observer._single_file_observer.on_change(event)
+        self.observer._single_file_observer._flush_events()
 
         self.assertEqual(
             self.observer._single_file_observer._observed_paths_per_group,
@@ -395,6 +403,7 @@ class FileObserver_on_change(TestCase):
         path_mock.exists.side_effect = [False, True]
 
         self.observer._single_file_observer.on_change(event)
+        self.observer._single_file_observer._flush_events()
 
         self.assertEqual(
             self.observer._single_file_observer._observed_paths_per_group,
@@ -407,6 +416,83 @@ class FileObserver_on_change(TestCase):
         )
         self.on_change.assert_called_once_with(["parent_path1/path1"])
 
+    @patch("samcli.lib.utils.file_observer.Path")
+    @patch("samcli.lib.utils.file_observer.calculate_checksum")
+    def test_events_are_not_processed_on_the_watchdog_thread(self, calculate_checksum_mock, PathMock):
+        event = Mock()
+        event.src_path = "parent_path1/path1/sub_path"
+
+        self.observer._single_file_observer.on_change(event)
+
+        calculate_checksum_mock.assert_not_called()
+        self.on_change.assert_not_called()
+
+    @patch("samcli.lib.utils.file_observer.Path")
+    @patch("samcli.lib.utils.file_observer.calculate_checksum")
+    def test_events_of_the_same_path_are_coalesced(self, calculate_checksum_mock, PathMock):
+        path_mock = Mock()
+        PathMock.return_value = path_mock
+        path_mock.exists.return_value = True
+        calculate_checksum_mock.return_value = "123456543"
+
+        for sub_path in ["sub_path1", "sub_path2", "sub_path1"]:
+            event = Mock()
+            event.src_path = f"parent_path1/path1/{sub_path}"
+            self.observer._single_file_observer.on_change(event)
+        self.observer._single_file_observer._flush_events()
+
+        calculate_checksum_mock.assert_called_once_with("parent_path1/path1")
+        self.on_change.assert_called_once_with(["parent_path1/path1"])
+
+    def test_opened_events_are_ignored(self):
+        event = Mock()
+        event.event_type = "opened"
+        event.src_path = "parent_path1/path1/sub_path"
+
+        self.observer._single_file_observer.on_change(event)
+
+        self.assertEqual(self.observer._single_file_observer._pending_events, {})
+
+    @patch("samcli.lib.utils.file_observer.Path")
+    def test_directory_digest_is_updated_with_changed_paths(self, PathMock):
+        path_mock = Mock()
+        PathMock.return_value = path_mock
+        path_mock.exists.return_value = True
+        directory_digest = Mock()
+        directory_digest.digest = "123456543"
+        self.observer._single_file_observer._directory_digests["parent_path1/path1"] = directory_digest
+
+        event = Mock()
+        event.src_path = "parent_path1/path1/sub_path"
+        self.observer._single_file_observer.on_change(event)
+        self.observer._single_file_observer._flush_events()
+
+        directory_digest.update.assert_called_once_with(["parent_path1/path1/sub_path"])
+        self.on_change.assert_called_once_with(["parent_path1/path1"])
+
+    @patch("samcli.lib.utils.file_observer.FILE_EVENTS_DEBOUNCE_INTERVAL", 0.05)
+    @patch("samcli.lib.utils.file_observer.Path")
+    @patch("samcli.lib.utils.file_observer.calculate_checksum")
+    def test_burst_of_events_is_processed_once_by_the_events_thread(self, calculate_checksum_mock, PathMock):
+        path_mock = Mock()
+        PathMock.return_value = path_mock
+        path_mock.exists.return_value = True
+        calculate_checksum_mock.return_value = "123456543"
+        processed = threading.Event()
+        self.on_change.side_effect = lambda paths: processed.set()
+        self.watchdog_observer_mock.is_alive.return_value = False
+
+        self.observer.start()
+        for index in range(100):
+            event = Mock()
+            event.src_path = f"parent_path1/path1/sub_path{index}"
+            self.observer._single_file_observer.on_change(event)
+
+        self.assertTrue(processed.wait(5))
+        self.observer.stop()
+        calculate_checksum_mock.assert_called_once_with("parent_path1/path1")
+        self.on_change.assert_called_once_with(["parent_path1/path1"])
+
 
 class FileObserver_start(TestCase):
     @patch("samcli.lib.utils.file_observer.uuid.uuid4")
@@ -1,6 +1,8 @@
+import shutil
 import subprocess
+import tempfile
 from pathlib import Path
-from unittest import TestCase
+from unittest import TestCase, skipIf
 from unittest.mock import patch, MagicMock, ANY, call
 import os
 from samcli.lib.utils.git_repo import (
@@ -267,3 +269,134 @@ class TestGitRepo(TestCase):
             "https://docs.aws.amazon.com/serverless-application-model/latest/developerguide/install-sam-cli.html"
         )
         self.assertEqual(str(ex.exception), expected_msg)
+
+    @patch("samcli.lib.utils.git_repo.Path.exists")
+    @patch("samcli.lib.utils.git_repo.shutil")
+    @patch("samcli.lib.utils.git_repo.check_output")
+    @patch("samcli.lib.utils.git_repo.subprocess.Popen")
+    @patch("samcli.lib.utils.git_repo.platform.system")
+    def test_shallow_clone_fetches_the_commit_only(
+        self, platform_mock, popen_mock, check_output_mock, shutil_mock, path_exist_mock
+    ):
+        platform_mock.return_value = "Not Windows"
+        path_exist_mock.return_value = False
+        self.repo.clone(clone_dir=self.local_clone_dir, clone_name=REPO_NAME, commit=COMMIT, shallow=True)
+        self.assertEqual(
+            [command_call.args[0] for command_call in check_output_mock.call_args_list],
+            [
+                ["git", "init", "--quiet"],
+                ["git", "remote", "add", "origin", REPO_URL],
+                ["git", "sparse-checkout", "set", "--cone"],
+                ["git", "fetch", "--quiet", "--depth", "1", "--filter=blob:none", "origin", COMMIT],
+                ["git", "checkout", "--quiet", "FETCH_HEAD"],
+            ],
+        )
+        shutil_mock.copytree.assert_called_with(ANY, EXPECTED_DEFAULT_CLONE_PATH)
+
+    @patch("samcli.lib.utils.git_repo.Path.exists")
+    @patch("samcli.lib.utils.git_repo.shutil")
+    @patch("samcli.lib.utils.git_repo.check_output")
+    @patch("samcli.lib.utils.git_repo.subprocess.Popen")
+    @patch("samcli.lib.utils.git_repo.platform.system")
+    def test_shallow_clone_falls_back_to_full_clone(
+        self, platform_mock, popen_mock, check_output_mock, shutil_mock, path_exist_mock
+    ):
+        platform_mock.return_value = "Not Windows"
+        path_exist_mock.return_value = False
+
+        def run(command, cwd, stderr):
+            if command[1] == "fetch":
+                raise subprocess.CalledProcessError(128, command, b"Server does not allow request for unadvertised")
+            return b""
+
+        check_output_mock.side_effect = run
+        self.repo.clone(clone_dir=self.local_clone_dir, clone_name=REPO_NAME, commit=COMMIT, shallow=True)
+        check_output_mock.assert_has_calls(
+            [
+                call(["git", "clone", self.repo.url, REPO_NAME], cwd=ANY, stderr=subprocess.STDOUT),
+                call(["git", "checkout", COMMIT], cwd=ANY, stderr=subprocess.STDOUT),
+            ]
+        )
+        shutil_mock.rmtree.assert_called_once_with(ANY, onerror=rmtree_callback)
+        shutil_mock.copytree.assert_called_with(ANY, EXPECTED_DEFAULT_CLONE_PATH)
+
+    @patch("samcli.lib.utils.git_repo.check_output")
+    @patch("samcli.lib.utils.git_repo.subprocess.Popen")
+    def test_checkout_paths(self, popen_mock, check_output_mock):
+        self.repo.local_path = Path(CLONE_DIR)
+        self.repo.checkout_paths(["template-a", "template-b"])
+        self.repo.checkout_paths()
+        check_output_mock.assert_has_calls(
+            [
+                call(
+                    ["git", "sparse-checkout", "add", "template-a", "template-b"],
+                    cwd=Path(CLONE_DIR),
+                    stderr=subprocess.STDOUT,
+                ),
+                call(["git", "sparse-checkout", "disable"], cwd=Path(CLONE_DIR), stderr=subprocess.STDOUT),
+            ]
+        )
+
+    @patch("samcli.lib.utils.git_repo.check_output")
+    @patch("samcli.lib.utils.git_repo.subprocess.Popen")
+    def test_checkout_paths_fails(self, popen_mock, check_output_mock):
+        check_output_mock.side_effect = subprocess.CalledProcessError(128, "fail", b"fatal: no sparse-checkout")
+        self.repo.local_path = Path(CLONE_DIR)
+        with self.assertRaises(CloneRepoException):
+            self.repo.checkout_paths(["template-a"])
+
+    def test_checkout_paths_without_clone(self):
+        with self.assertRaises(CloneRepoException):
+            self.repo.checkout_paths(["template-a"])
+
+
+@skipIf(shutil.which("git") is None, "git is not installed")
+class TestGitRepoShallowCloneFromLocalRepository(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.remote_dir = Path(self.temp_dir, "remote")
+        for path, content in [
+            ("manifest.json", "{}"),
+            ("template-a/cookiecutter.json", "a"),
+            ("template-b/cookiecutter.json", "b"),
+        ]:
+            Path(self.remote_dir, path).parent.mkdir(parents=True, exist_ok=True)
+            Path(self.remote_dir, path).write_text(content)
+        self._git("init", "--quiet")
+        # what GitHub allows, to fetch a commit by hash with a filter
+        self._git("config", "uploadpack.allowFilter", "true")
+        self._git("config", "uploadpack.allowAnySHA1InWant", "true")
+        self._git("add", ".")
+        self._git("-c", "user.name=sam", "-c", "user.email=sam@example.com", "commit", "--quiet", "-m", "first")
+        self.commit = self._git("rev-parse", "HEAD")
+        Path(self.remote_dir, "manifest.json").write_text('{"latest": true}')
+        self._git("-c", "user.name=sam", "-c", "user.email=sam@example.com", "commit", "--quiet", "-am", "second")
+        self.repo = GitRepo(url=self.remote_dir.as_uri())
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _git(self, *args):
+        return subprocess.check_output(["git"] + list(args), cwd=self.remote_dir).decode("utf-8").strip()
+
+    def test_shallow_clone_checks_out_root_files_of_the_commit(self):
+        local_path = self.repo.clone(Path(self.temp_dir), "clone", commit=self.commit, shallow=True)
+
+        self.assertEqual(Path(local_path, "manifest.json").read_text(), "{}")
+        self.assertFalse(Path(local_path, "template-a").exists())
+        self.assertFalse(Path(local_path, "template-b").exists())
+        head = subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=local_path).decode("utf-8").strip()
+        self.assertEqual(head, self.commit)
+        # the older commit is the only one fetched
+        log = subprocess.check_output(["git", "log", "--format=%H"], cwd=local_path).decode("utf-8").split()
+        self.assertEqual(log, [self.commit])
+
+    def test_checkout_paths_fetches_on_demand(self):
+        local_path = self.repo.clone(Path(self.temp_dir), "clone", commit=self.commit, shallow=True)
+
+        self.repo.checkout_paths(["template-a"])
+        self.assertEqual(Path(local_path, "template-a", "cookiecutter.json").read_text(), "a")
+        self.assertFalse(Path(local_path, "template-b").exists())
+
+        self.repo.checkout_paths()
+        self.assertEqual(Path(local_path, "template-b", "cookiecutter.json").read_text(), "b")
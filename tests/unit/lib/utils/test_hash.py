@@ -3,10 +3,11 @@ import os
 import shutil
 import sys
 import tempfile
+import time
 from unittest import TestCase
 from unittest.mock import patch
 
-from samcli.lib.utils.hash import dir_checksum, str_checksum
+from samcli.lib.utils.hash import DirectoryDigest, dir_checksum, file_checksum, load_directory_digest, str_checksum
 
 
 class TestHash(TestCase):
@@ -131,3 +132,134 @@ class TestHash(TestCase):
             patched_hashlib.md5.assert_called_with(usedforsecurity=False)
         else:
             patched_hashlib.md5.assert_called_with()
+
+
+class TestDirectoryDigest(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        for path in ["app.py", os.path.join("lib", "module.py"), os.path.join("lib", "nested", "data.json")]:
+            self._write(path, path)
+        self.digest = DirectoryDigest(self.temp_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _write(self, path, content, modification_time=None):
+        full_path = os.path.join(self.temp_dir, path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        with open(full_path, "w") as fp:
+            fp.write(content)
+        # files modified in the last seconds are always re-hashed
+        modification_time = modification_time or time.time() - 60
+        os.utime(full_path, (modification_time, modification_time))
+        return full_path
+
+    def test_digest_matches_dir_checksum(self):
+        self.assertEqual(self.digest.digest, dir_checksum(self.temp_dir))
+
+    def test_changed_file_is_rehashed(self):
+        changed_file = self._write(os.path.join("lib", "module.py"), "changed")
+
+        with patch("samcli.lib.utils.hash.file_checksum", wraps=file_checksum) as file_checksum_mock:
+            self.assertTrue(self.digest.update([changed_file]))
+
+        file_checksum_mock.assert_called_once_with(changed_file)
+        self.assertEqual(self.digest.digest, dir_checksum(self.temp_dir))
+
+    def test_unchanged_content_keeps_digest(self):
+        previous_digest = self.digest.digest
+
+        self.assertFalse(self.digest.update([self._write("app.py", "app.py")]))
+        self.assertEqual(self.digest.digest, previous_digest)
+
+    def test_deleted_file_and_directory_are_removed(self):
+        os.remove(os.path.join(self.temp_dir, "app.py"))
+        shutil.rmtree(os.path.join(self.temp_dir, "lib", "nested"))
+
+        self.assertTrue(
+            self.digest.update([os.path.join(self.temp_dir, "app.py"), os.path.join(self.temp_dir, "lib", "nested")])
+        )
+        self.assertEqual(self.digest.digest, dir_checksum(self.temp_dir))
+
+    def test_directory_update_only_rehashes_new_files(self):
+        new_file = self._write(os.path.join("lib", "new", "new.py"), "new")
+
+        with patch("samcli.lib.utils.hash.file_checksum", wraps=file_checksum) as file_checksum_mock:
+            self.assertTrue(self.digest.update([os.path.join(self.temp_dir, "lib")]))
+
+        file_checksum_mock.assert_called_once_with(new_file)
+        self.assertEqual(self.digest.digest, dir_checksum(self.temp_dir))
+
+    def test_paths_outside_of_directory_are_ignored(self):
+        self.assertFalse(self.digest.update([os.path.dirname(self.temp_dir)]))
+
+    def test_ignored_paths(self):
+        self._write(os.path.join(".aws-sam", "build", "app.py"), "built")
+        digest = DirectoryDigest(self.temp_dir, ignore_list=[".aws-sam"], algorithm="sha256")
+
+        self.assertEqual(
+            digest.digest, dir_checksum(self.temp_dir, ignore_list=[".aws-sam"], hash_generator=hashlib.sha256())
+        )
+        self.assertEqual(digest.update([self._write(os.path.join(".aws-sam", "build", "app.py"), "changed")]), [])
+
+    def test_subtree_digest(self):
+        self.assertEqual(self.digest.subtree_digest("lib"), dir_checksum(os.path.join(self.temp_dir, "lib")))
+
+        self.digest.update([self._write(os.path.join("lib", "nested", "data.json"), "changed")])
+
+        self.assertEqual(
+            self.digest.subtree_digest(os.path.join("lib", "nested")),
+            dir_checksum(os.path.join(self.temp_dir, "lib", "nested")),
+        )
+        self.assertEqual(self.digest.subtree_digest("lib"), dir_checksum(os.path.join(self.temp_dir, "lib")))
+
+    def test_changed_files(self):
+        previous = DirectoryDigest(self.temp_dir)
+        self._write("app.py", "changed")
+        self._write("new.py", "new")
+        os.remove(os.path.join(self.temp_dir, "lib", "module.py"))
+
+        self.assertEqual(
+            DirectoryDigest(self.temp_dir).changed_files(previous),
+            ["app.py", "lib/module.py".replace("/", os.sep), "new.py"],
+        )
+
+    def test_save_and_load(self):
+        digest_path = os.path.join(self.temp_dir, ".digest", "digest.json")
+        self.digest.save(digest_path)
+
+        loaded = DirectoryDigest.load(digest_path)
+
+        self.assertEqual(loaded.files, self.digest.files)
+        self.assertEqual(loaded.digest, self.digest.digest)
+
+    def test_load_unreadable_digest(self):
+        digest_path = os.path.join(self.temp_dir, "digest.json")
+        with open(digest_path, "w") as fp:
+            fp.write("{")
+
+        self.assertIsNone(DirectoryDigest.load(digest_path))
+        self.assertIsNone(DirectoryDigest.load(os.path.join(self.temp_dir, "missing.json")))
+
+    def test_load_directory_digest_only_rehashes_changed_files(self):
+        digest_path = os.path.join(tempfile.mkdtemp(), "digest.json")
+        self.addCleanup(shutil.rmtree, os.path.dirname(digest_path))
+        _, previous = load_directory_digest(digest_path, self.temp_dir)
+        self.assertIsNone(previous)
+        changed_file = self._write("app.py", "changed")
+
+        with patch("samcli.lib.utils.hash.file_checksum", wraps=file_checksum) as file_checksum_mock:
+            digest, previous = load_directory_digest(digest_path, self.temp_dir)
+
+        file_checksum_mock.assert_called_once_with(changed_file)
+        self.assertEqual(digest.changed_files(previous), ["app.py"])
+        self.assertEqual(digest.digest, dir_checksum(self.temp_dir))
+
+    def test_recently_modified_files_are_rehashed(self):
+        recent_file = self._write("recent.py", "recent", modification_time=time.time())
+        self.digest.update([self.temp_dir])
+
+        with patch("samcli.lib.utils.hash.file_checksum", wraps=file_checksum) as file_checksum_mock:
+            self.digest.update([self.temp_dir])
+
+        file_checksum_mock.assert_called_once_with(recent_file)
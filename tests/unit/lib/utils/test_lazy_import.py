@@ -0,0 +1,98 @@
+import importlib
+import os
+import shutil
+import sys
+import tempfile
+import threading
+from unittest import TestCase
+
+from samcli.lib.utils.lazy_import import lazy_import
+
+
+class TestLazyImport(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        package_dir = os.path.join(self.temp_dir, "lazy_import_package")
+        os.makedirs(package_dir)
+        with open(os.path.join(package_dir, "__init__.py"), "w") as fp:
+            fp.write("")
+        with open(os.path.join(package_dir, "heavy.py"), "w") as fp:
+            fp.write(
+                "import sys\nsys.lazy_import_executions = getattr(sys, 'lazy_import_executions', 0) + 1\nVALUE = 42\n"
+            )
+        with open(os.path.join(package_dir, "slow.py"), "w") as fp:
+            fp.write(
+                "import sys, time\n"
+                "sys.lazy_import_executions = getattr(sys, 'lazy_import_executions', 0) + 1\n"
+                "time.sleep(0.2)\n"
+                "VALUE = 42\n"
+            )
+        sys.path.insert(0, self.temp_dir)
+
+    def tearDown(self):
+        sys.path.remove(self.temp_dir)
+        for name in ["lazy_import_package.heavy", "lazy_import_package.slow", "lazy_import_package"]:
+            sys.modules.pop(name, None)
+        if hasattr(sys, "lazy_import_executions"):
+            del sys.lazy_import_executions
+        shutil.rmtree(self.temp_dir)
+
+    def test_module_is_executed_on_first_attribute_access(self):
+        module = lazy_import("lazy_import_package.heavy")
+
+        self.assertFalse(hasattr(sys, "lazy_import_executions"))
+        self.assertEqual(module.VALUE, 42)
+        self.assertEqual(sys.lazy_import_executions, 1)
+
+    def test_concurrent_first_accesses_wait_for_the_module_to_be_executed(self):
+        module = lazy_import("lazy_import_package.slow")
+        thread_count = 16
+        barrier = threading.Barrier(thread_count)
+        values = []
+        errors = []
+
+        def access_module():
+            barrier.wait()
+            try:
+                values.append(module.VALUE)
+            except Exception as ex:
+                errors.append(ex)
+
+        threads = [threading.Thread(target=access_module) for _ in range(thread_count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(values, [42] * thread_count)
+        self.assertEqual(sys.lazy_import_executions, 1)
+
+    def test_module_failing_to_execute_is_executed_again(self):
+        with open(os.path.join(self.temp_dir, "lazy_import_package", "broken.py"), "w") as fp:
+            fp.write("raise ValueError('broken')\n")
+        self.addCleanup(sys.modules.pop, "lazy_import_package.broken", None)
+        module = lazy_import("lazy_import_package.broken")
+
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                module.VALUE
+
+    def test_module_is_registered_like_a_regular_import(self):
+        module = lazy_import("lazy_import_package.heavy")
+
+        package = importlib.import_module("lazy_import_package")
+
+        self.assertIs(importlib.import_module("lazy_import_package.heavy"), module)
+        self.assertIs(package.heavy, module)
+        self.assertEqual(package.heavy.VALUE, 42)
+        self.assertEqual(sys.lazy_import_executions, 1)
+
+    def test_imported_module_is_returned_as_is(self):
+        module = importlib.import_module("lazy_import_package.heavy")
+
+        self.assertIs(lazy_import("lazy_import_package.heavy"), module)
+
+    def test_missing_module_raises(self):
+        with self.assertRaises(ModuleNotFoundError):
+            lazy_import("lazy_import_package.missing")
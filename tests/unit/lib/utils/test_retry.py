@@ -0,0 +1,22 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from samcli.lib.utils.retry import exponential_backoff
+
+
+class TestExponentialBackoff(TestCase):
+    @patch("samcli.lib.utils.retry.random.uniform", side_effect=lambda low, high: high)
+    def test_doubles_up_to_max_delay(self, _):
+        delays = [exponential_backoff(attempt, 1, 10) for attempt in range(1, 7)]
+
+        self.assertEqual(delays, [1, 2, 4, 8, 10, 10])
+
+    def test_jitters_second_half_of_delay(self):
+        for _ in range(100):
+            delay = exponential_backoff(3, 1, 10)
+            self.assertGreaterEqual(delay, 2)
+            self.assertLessEqual(delay, 4)
+
+    def test_large_attempts_get_max_delay(self):
+        self.assertLessEqual(exponential_backoff(10000, 0.5, 60), 60)
+        self.assertGreaterEqual(exponential_backoff(10000, 0.5, 60), 30)
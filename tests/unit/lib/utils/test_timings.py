@@ -0,0 +1,115 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+from unittest import TestCase
+
+from samcli.lib.utils.timings import SpanTracer
+
+
+class TestSpanTracer(TestCase):
+    def setUp(self):
+        self.tracer = SpanTracer()
+        self.tracer.enabled = True
+
+    def test_disabled_tracer_records_nothing(self):
+        self.tracer.enabled = False
+
+        with self.tracer.span("command") as current:
+            self.assertIsNone(current)
+
+        self.assertEqual(self.tracer.root_spans, [])
+
+    def test_spans_are_nested(self):
+        with self.tracer.span("command"):
+            with self.tracer.span("template.load"):
+                pass
+            with self.tracer.span("build.function", function="HelloWorld"):
+                with self.tracer.span("container.create"):
+                    pass
+
+        (root,) = self.tracer.root_spans
+        self.assertEqual(root.name, "command")
+        self.assertEqual([child.name for child in root.children], ["template.load", "build.function"])
+        self.assertEqual(root.children[1].attributes, {"function": "HelloWorld"})
+        self.assertEqual(root.children[1].children[0].name, "container.create")
+        self.assertIsNotNone(root.end)
+        self.assertGreaterEqual(root.duration, root.children[1].duration)
+
+    def test_spans_of_worker_threads_are_attached_to_command_span(self):
+        def build():
+            with self.tracer.span("build.function"):
+                pass
+
+        with self.tracer.span("command"):
+            workers = [threading.Thread(target=build) for _ in range(3)]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+
+        (root,) = self.tracer.root_spans
+        self.assertEqual([child.name for child in root.children], ["build.function"] * 3)
+
+    def test_span_is_closed_on_exception(self):
+        with self.assertRaises(ValueError):
+            with self.tracer.span("command"):
+                raise ValueError()
+
+        self.assertIsNotNone(self.tracer.root_spans[0].end)
+
+    def test_traced_decorator(self):
+        @self.tracer.traced("deploy.changeset.create")
+        def create_changeset(value):
+            return value
+
+        with self.tracer.span("command"):
+            self.assertEqual(create_changeset(1), 1)
+
+        self.assertEqual(self.tracer.root_spans[0].children[0].name, "deploy.changeset.create")
+
+    def test_report_groups_sibling_spans(self):
+        with self.tracer.span("command"):
+            for _ in range(3):
+                with self.tracer.span("hash.dir_checksum"):
+                    pass
+            with self.tracer.span("build.function", function="A"):
+                pass
+
+        report = self.tracer.format_report().splitlines()
+
+        self.assertEqual(report[0], "Timings:")
+        self.assertTrue(report[1].endswith("  command"))
+        self.assertTrue(report[2].endswith("  hash.dir_checksum x3"))
+        self.assertTrue(report[3].endswith("  build.function (function=A)"))
+        self.assertTrue(report[2].startswith("    "))
+
+    def test_chrome_trace_export(self):
+        with self.tracer.span("command"):
+            with self.tracer.span("build.function", function="A"):
+                pass
+
+        temp_dir = tempfile.mkdtemp()
+        try:
+            trace_file = os.path.join(temp_dir, "trace.json")
+            self.tracer.export_chrome_trace(trace_file)
+            with open(trace_file, encoding="utf-8") as fp:
+                trace = json.load(fp)
+        finally:
+            shutil.rmtree(temp_dir)
+
+        events = trace["traceEvents"]
+        self.assertEqual([event["name"] for event in events], ["command", "build.function"])
+        self.assertEqual(events[1]["ph"], "X")
+        self.assertEqual(events[1]["cat"], "build")
+        self.assertEqual(events[1]["args"], {"function": "A"})
+        self.assertLessEqual(events[0]["ts"], events[1]["ts"])
+
+    def test_reset(self):
+        with self.tracer.span("command"):
+            pass
+
+        self.tracer.reset()
+
+        self.assertEqual(self.tracer.root_spans, [])
@@ -53,7 +53,7 @@ class TestVersionChecker(TestCase):
         mock_fetch_and_compare_versions.assert_not_called()
         mock_update_last_check.assert_not_called()
 
-    @patch("samcli.lib.utils.version_checker.get")
+    @patch("samcli.lib.utils.version_checker.requests.get")
     @patch("samcli.cli.global_config.GlobalConfig._get_value")
     def test_actual_function_should_return_on_exception(self, get_value_mock, get_mock):
         get_value_mock.return_value = None
@@ -61,7 +61,7 @@ class TestVersionChecker(TestCase):
         actual = real_fn("Hello", "World")
         self.assertEqual(actual, "Hello World")
 
-    @patch("samcli.lib.utils.version_checker.get")
+    @patch("samcli.lib.utils.version_checker.requests.get")
     @patch("samcli.lib.utils.version_checker.LOG")
     @patch("samcli.lib.utils.version_checker.installed_version", "1.9.0")
     def test_compare_invalid_response(self, mock_log, get_mock):
@@ -76,7 +76,7 @@ class TestVersionChecker(TestCase):
             ]
         )
 
-    @patch("samcli.lib.utils.version_checker.get")
+    @patch("samcli.lib.utils.version_checker.requests.get")
     @patch("samcli.lib.utils.version_checker.LOG")
     @patch("samcli.lib.utils.version_checker.installed_version", "1.9.0")
     def test_fetch_and_compare_versions_same(self, mock_log, get_mock):
@@ -91,7 +91,7 @@ class TestVersionChecker(TestCase):
             ]
         )
 
-    @patch("samcli.lib.utils.version_checker.get")
+    @patch("samcli.lib.utils.version_checker.requests.get")
     @patch("samcli.lib.utils.version_checker.click")
     @patch("samcli.lib.utils.version_checker.installed_version", "1.9.0")
     def test_fetch_and_compare_versions_different(self, mock_click, get_mock):
@@ -705,6 +705,19 @@ class TestContainer_wait_for_result(TestCase):
         else:
             stdout_mock.write_str.assert_called_with(rie_response.decode("utf-8"))
 
+    @patch("samcli.local.docker.container.requests")
+    def test_wait_for_http_response_sends_bytes_event_as_is(self, mock_requests):
+        event = b'{"key": "value"}'
+        response = Mock()
+        response.content = b'{"hello":"world"}'
+        response.headers = {"Content-Type": "application/json"}
+        mock_requests.post.return_value = response
+
+        result = self.container.wait_for_http_response(self.name, event, Mock())
+
+        self.assertEqual(result, ('{"hello": "world"}', False))
+        self.assertIs(mock_requests.post.call_args.kwargs["data"], event)
+
     @patch("socket.socket")
     @patch("samcli.local.docker.container.requests")
     @patch("time.sleep")
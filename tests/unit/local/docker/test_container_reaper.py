@@ -0,0 +1,165 @@
+"""
+Tests the background teardown of the containers
+"""
+
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import patch
+
+from docker.errors import APIError, NotFound
+
+from samcli.local.docker.container import Container
+from samcli.local.docker.container_reaper import ContainerReaper
+from samcli.local.docker.manager import ContainerManager
+
+
+class FakeDockerContainer:
+    def __init__(self, client, container_id):
+        self._client = client
+        self._container_id = container_id
+
+    def remove(self, force=False):
+        self._client.remove(self._container_id)
+
+
+class FakeContainers:
+    def __init__(self, client):
+        self._client = client
+
+    def get(self, container_id):
+        with self._client.lock:
+            if container_id not in self._client.existing_container_ids:
+                raise NotFound("No such container")
+        return FakeDockerContainer(self._client, container_id)
+
+
+class FakeDockerClient:
+    """
+    Docker client whose container removal waits for the removals to be allowed, and records the removed containers
+    """
+
+    def __init__(self, container_ids, failing_container_ids=()):
+        self.lock = threading.Lock()
+        self.containers = FakeContainers(self)
+        self.existing_container_ids = set(container_ids)
+        self.failing_container_ids = set(failing_container_ids)
+        self.removed = []
+        self.removals_allowed = threading.Event()
+        self.removals_allowed.set()
+        self.concurrent_removals = 0
+        self.max_concurrent_removals = 0
+
+    def remove(self, container_id):
+        with self.lock:
+            self.concurrent_removals += 1
+            self.max_concurrent_removals = max(self.max_concurrent_removals, self.concurrent_removals)
+        try:
+            self.removals_allowed.wait(5)
+            if container_id in self.failing_container_ids:
+                raise APIError("Removal failed")
+            with self.lock:
+                self.existing_container_ids.discard(container_id)
+                self.removed.append(container_id)
+        finally:
+            with self.lock:
+                self.concurrent_removals -= 1
+
+
+class TestContainerReaper(TestCase):
+    def setUp(self):
+        self.container_ids = [f"container{index}" for index in range(6)]
+        self.docker_client = FakeDockerClient(self.container_ids, failing_container_ids=["container5"])
+        self.manager = ContainerManager(docker_client=self.docker_client)
+        self.reaper = ContainerReaper(self.manager, max_pending_teardowns=3, max_workers=2)
+
+    def _container(self, container_id):
+        container = Container("image", "cmd", "/var/task", "/host/dir", docker_client=self.docker_client)
+        container.id = container_id
+        return container
+
+    def _reap_in_thread(self, container):
+        reaped = threading.Event()
+
+        def reap():
+            self.reaper.reap(container)
+            reaped.set()
+
+        threading.Thread(target=reap, daemon=True).start()
+        return reaped
+
+    def test_reap_returns_before_teardown(self):
+        self.docker_client.removals_allowed.clear()
+        containers = [self._container(container_id) for container_id in self.container_ids[:3]]
+
+        started = time.monotonic()
+        for container in containers:
+            self.reaper.reap(container)
+
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertEqual(self.docker_client.removed, [])
+
+        self.docker_client.removals_allowed.set()
+        self.reaper.drain()
+
+        self.assertEqual(sorted(self.docker_client.removed), self.container_ids[:3])
+        self.assertTrue(all(container.id is None for container in containers))
+        self.assertLessEqual(self.docker_client.max_concurrent_removals, 2)
+
+    def test_reap_blocks_when_too_many_pending_teardowns(self):
+        self.docker_client.removals_allowed.clear()
+        for container_id in self.container_ids[:3]:
+            self.reaper.reap(self._container(container_id))
+
+        reaped = self._reap_in_thread(self._container("container3"))
+        self.assertFalse(reaped.wait(0.2))
+
+        self.docker_client.removals_allowed.set()
+        self.assertTrue(reaped.wait(5))
+        self.reaper.drain()
+        self.assertEqual(sorted(self.docker_client.removed), self.container_ids[:4])
+
+    def test_teardown_failure_does_not_stop_reaper(self):
+        with patch("samcli.local.docker.container_reaper.LOG") as log_mock:
+            for container_id in ["container5", "container0", "container1", "container2"]:
+                self.reaper.reap(self._container(container_id))
+            self.reaper.drain()
+
+        self.assertEqual(sorted(self.docker_client.removed), self.container_ids[:3])
+        log_mock.warning.assert_called_once()
+
+    def test_reap_after_drain_tears_down_before_returning(self):
+        self.reaper.drain()
+
+        self.reaper.reap(self._container("container0"))
+
+        self.assertEqual(self.docker_client.removed, ["container0"])
+        self.assertEqual(self.reaper._workers, [])
+
+    def test_workers_finish_teardowns_before_interpreter_exit(self):
+        self.docker_client.removals_allowed.clear()
+        self.reaper.reap(self._container("container0"))
+
+        self.assertTrue(self.reaper._workers)
+        # the interpreter waits for the non daemon threads, even if drain is interrupted by Ctrl+C
+        self.assertTrue(all(not worker.daemon for worker in self.reaper._workers))
+
+        self.docker_client.removals_allowed.set()
+        self.reaper.drain()
+        self.assertEqual(self.reaper._workers, [])
+
+    @patch("samcli.local.docker.container_reaper._WORKER_IDLE_TIMEOUT", 0.05)
+    def test_idle_workers_exit(self):
+        self.reaper.reap(self._container("container0"))
+        workers = list(self.reaper._workers)
+
+        for worker in workers:
+            worker.join(5)
+
+        self.assertEqual(self.docker_client.removed, ["container0"])
+        self.assertEqual(self.reaper._workers, [])
+
+        # a new worker is started for the next container
+        self.reaper.reap(self._container("container1"))
+        self.reaper.drain()
+        self.assertEqual(self.docker_client.removed, ["container0", "container1"])
@@ -0,0 +1,189 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from samcli.local.lambda_service.event_invoker import EventInvoker
+
+ERROR_RESPONSE = '{"errorMessage": "failed", "errorType": "Exception"}'
+
+
+class FakeLambdaRunner:
+    """
+    Lambda runner which writes the given responses to stdout, in turn, and records the invocations
+    """
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.invocations = []
+        self.invoked = threading.Event()
+        self.invocations_allowed = threading.Event()
+        self.invocations_allowed.set()
+
+    def invoke(self, function_identifier, event, stdout=None, stderr=None):
+        self.invocations.append((function_identifier, event))
+        self.invoked.set()
+        self.invocations_allowed.wait(5)
+        response = self.responses[min(len(self.invocations), len(self.responses)) - 1]
+        if isinstance(response, Exception):
+            raise response
+        stdout.write_str(response)
+
+
+class TestEventInvoker(TestCase):
+    def setUp(self):
+        self.failure_destination = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.failure_destination)
+        self.function = Mock(full_path="Stack/HelloWorld", event_invoke_config=None)
+
+        delay_patch = patch("samcli.local.lambda_service.event_invoker.RETRY_BASE_DELAY_SECONDS", 0)
+        delay_patch.start()
+        self.addCleanup(delay_patch.stop)
+
+    def _invoke(self, lambda_runner, payload='{"key": "value"}'):
+        # without workers, the event is processed before submit returns
+        event_invoker = EventInvoker(lambda_runner, failure_destination=self.failure_destination, max_workers=0)
+        return event_invoker.submit(self.function, payload)
+
+    def _failure_records(self):
+        records = []
+        for name in os.listdir(self.failure_destination):
+            with open(os.path.join(self.failure_destination, name)) as record_file:
+                records.append((name, json.load(record_file)))
+        return records
+
+    def test_must_invoke_function_once_on_success(self):
+        lambda_runner = FakeLambdaRunner('{"statusCode": 200}')
+
+        request_id = self._invoke(lambda_runner)
+
+        self.assertTrue(request_id)
+        self.assertEqual(lambda_runner.invocations, [("Stack/HelloWorld", '{"key": "value"}')])
+        self.assertEqual(self._failure_records(), [])
+
+    def test_must_retry_failed_invocations(self):
+        lambda_runner = FakeLambdaRunner(ERROR_RESPONSE, ERROR_RESPONSE, '{"statusCode": 200}')
+
+        self._invoke(lambda_runner)
+
+        self.assertEqual(len(lambda_runner.invocations), 3)
+        self.assertEqual(self._failure_records(), [])
+
+    def test_must_write_failure_record_when_retries_are_exhausted(self):
+        lambda_runner = FakeLambdaRunner(ERROR_RESPONSE)
+
+        request_id = self._invoke(lambda_runner)
+
+        self.assertEqual(len(lambda_runner.invocations), 3)
+        [(name, record)] = self._failure_records()
+        self.assertEqual(name, f"{request_id}.json")
+        self.assertEqual(
+            record["requestContext"],
+            {
+                "requestId": request_id,
+                "functionArn": "arn:aws:lambda:us-west-2:012345678901:function:Stack/HelloWorld:$LATEST",
+                "condition": "RetriesExhausted",
+                "approximateInvokeCount": 3,
+            },
+        )
+        self.assertEqual(record["requestPayload"], {"key": "value"})
+        self.assertEqual(
+            record["responseContext"], {"statusCode": 200, "executedVersion": "$LATEST", "functionError": "Unhandled"}
+        )
+        self.assertEqual(record["responsePayload"], json.loads(ERROR_RESPONSE))
+
+    def test_must_follow_maximum_retry_attempts_of_function(self):
+        self.function.event_invoke_config = {"MaximumRetryAttempts": 0}
+        lambda_runner = FakeLambdaRunner(ERROR_RESPONSE)
+
+        self._invoke(lambda_runner)
+
+        self.assertEqual(len(lambda_runner.invocations), 1)
+        [(_, record)] = self._failure_records()
+        self.assertEqual(record["requestContext"]["approximateInvokeCount"], 1)
+
+    def test_must_discard_events_exceeding_maximum_age(self):
+        self.function.event_invoke_config = {"MaximumEventAgeInSeconds": 0}
+        lambda_runner = FakeLambdaRunner('{"statusCode": 200}')
+
+        self._invoke(lambda_runner)
+
+        self.assertEqual(lambda_runner.invocations, [])
+        [(_, record)] = self._failure_records()
+        self.assertEqual(record["requestContext"]["condition"], "EventAgeExceeded")
+        self.assertEqual(record["requestContext"]["approximateInvokeCount"], 0)
+        self.assertNotIn("responseContext", record)
+
+    def test_must_treat_invoke_exceptions_as_function_errors(self):
+        self.function.event_invoke_config = {"MaximumRetryAttempts": 1}
+        lambda_runner = FakeLambdaRunner(RuntimeError("container failed"))
+
+        self._invoke(lambda_runner)
+
+        self.assertEqual(len(lambda_runner.invocations), 2)
+        [(_, record)] = self._failure_records()
+        self.assertEqual(record["responsePayload"], {"errorMessage": "container failed", "errorType": "RuntimeError"})
+
+    def test_must_only_log_failures_without_failure_destination(self):
+        self.function.event_invoke_config = {"MaximumRetryAttempts": 0}
+        lambda_runner = FakeLambdaRunner(ERROR_RESPONSE)
+        event_invoker = EventInvoker(lambda_runner, max_workers=0)
+
+        with patch("samcli.local.lambda_service.event_invoker.LOG") as log_mock:
+            event_invoker.submit(self.function, "{}")
+
+        self.assertEqual(len(lambda_runner.invocations), 1)
+        log_mock.warning.assert_called_once()
+        self.assertEqual(self._failure_records(), [])
+
+    def test_must_process_events_in_workers(self):
+        lambda_runner = FakeLambdaRunner(ERROR_RESPONSE, '{"statusCode": 200}')
+        lambda_runner.invocations_allowed.clear()
+        event_invoker = EventInvoker(lambda_runner, failure_destination=self.failure_destination)
+
+        self.assertTrue(event_invoker.submit(self.function, "{}"))
+        self.assertTrue(lambda_runner.invoked.wait(5))
+        lambda_runner.invocations_allowed.set()
+        deadline = time.monotonic() + 5
+        while len(lambda_runner.invocations) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        event_invoker.shutdown()
+
+        self.assertEqual(lambda_runner.invocations, [("Stack/HelloWorld", "{}")] * 2)
+        self.assertEqual(self._failure_records(), [])
+
+    def test_must_reject_events_when_queue_is_full(self):
+        lambda_runner = FakeLambdaRunner('{"statusCode": 200}')
+        lambda_runner.invocations_allowed.clear()
+        event_invoker = EventInvoker(lambda_runner, max_workers=1, max_queued_events=1)
+
+        self.assertTrue(event_invoker.submit(self.function, "{}"))
+        self.assertTrue(lambda_runner.invoked.wait(5))
+        self.assertTrue(event_invoker.submit(self.function, "{}"))
+        self.assertIsNone(event_invoker.submit(self.function, "{}"))
+
+        lambda_runner.invocations_allowed.set()
+        event_invoker.shutdown()
+
+    def test_shutdown_must_stop_retries_and_discard_queued_events(self):
+        lambda_runner = FakeLambdaRunner(ERROR_RESPONSE)
+        lambda_runner.invocations_allowed.clear()
+        event_invoker = EventInvoker(lambda_runner, failure_destination=self.failure_destination, max_workers=1)
+
+        with patch("samcli.local.lambda_service.event_invoker.RETRY_BASE_DELAY_SECONDS", 60):
+            event_invoker.submit(self.function, "{}")
+            event_invoker.submit(self.function, "{}")
+            self.assertTrue(lambda_runner.invoked.wait(5))
+
+            started = time.monotonic()
+            threading.Timer(0.1, lambda_runner.invocations_allowed.set).start()
+            event_invoker.shutdown()
+
+        self.assertLess(time.monotonic() - started, 5)
+        self.assertEqual(len(lambda_runner.invocations), 1)
+        self.assertEqual(self._failure_records(), [])
+        self.assertIsNone(event_invoker.submit(self.function, "{}"))
@@ -58,6 +58,32 @@ class TestLambdaErrorResponses(TestCase):
             500,
         )
 
+    @patch("samcli.local.services.base_local_service.BaseLocalService.service_response")
+    def test_too_many_requests(self, service_response_mock):
+        service_response_mock.return_value = "TooManyRequests"
+
+        response = LambdaErrorResponses.too_many_requests("TooManyRequests")
+
+        self.assertEqual(response, "TooManyRequests")
+        service_response_mock.assert_called_once_with(
+            '{"Type": "User", "Message": "TooManyRequests"}',
+            {"x-amzn-errortype": "TooManyRequests", "Content-Type": "application/json"},
+            429,
+        )
+
+    @patch("samcli.local.services.base_local_service.BaseLocalService.service_response")
+    def test_request_too_large(self, service_response_mock):
+        service_response_mock.return_value = "RequestTooLarge"
+
+        response = LambdaErrorResponses.request_too_large(6291456)
+
+        self.assertEqual(response, "RequestTooLarge")
+        service_response_mock.assert_called_once_with(
+            '{"Type": "User", "Message": "Request must be smaller than 6291456 bytes for the InvokeFunction operation"}',
+            {"x-amzn-errortype": "RequestTooLarge", "Content-Type": "application/json"},
+            413,
+        )
+
     @patch("samcli.local.services.base_local_service.BaseLocalService.service_response")
     def test_not_implemented_locally(self, service_response_mock):
         service_response_mock.return_value = "NotImplementedLocally"
@@ -0,0 +1,108 @@
+"""Test the local Lambda endpoint with large request payloads"""
+
+import io
+import json
+import tracemalloc
+from unittest import TestCase
+
+from samcli.local.lambda_service.local_lambda_invoke_service import LocalLambdaInvokeService
+
+INVOKE_PATH = "/2015-03-31/functions/HelloWorld/invocations"
+PAYLOAD_SIZE = 5 * 1024 * 1024
+
+
+class FakeLambdaRunner:
+    """
+    Lambda runner which records the events it is invoked with, and responds with their size
+    """
+
+    def __init__(self):
+        self.events = []
+
+    def is_debugging(self):
+        return False
+
+    def invoke(self, function_identifier, event, stdout=None, stderr=None):
+        self.events.append(event)
+        stdout.write_str(json.dumps({"size": len(event)}))
+
+
+class UnreadableStream(io.RawIOBase):
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        return 0
+
+    def readinto(self, buffer):
+        raise AssertionError("The request body must not be read")
+
+
+class TestLargePayloads(TestCase):
+    def setUp(self):
+        self.lambda_runner = FakeLambdaRunner()
+        service = LocalLambdaInvokeService(self.lambda_runner, port=3001, host="127.0.0.1")
+        service.create()
+        self.client = service._app.test_client()
+
+    @staticmethod
+    def _payload(size):
+        return json.dumps({"data": "x" * (size - len('{"data": ""}'))}).encode("utf-8")
+
+    def _peak_memory(self, payload, requests):
+        """
+        Returns the peak memory allocated while handling the requests
+        """
+        tracemalloc.start()
+        try:
+            baseline = tracemalloc.get_traced_memory()[0]
+            for _ in range(requests):
+                response = self.client.post(INVOKE_PATH, data=payload)
+                self.assertEqual(response.status_code, 200)
+                self.lambda_runner.events.clear()
+            return tracemalloc.get_traced_memory()[1] - baseline
+        finally:
+            tracemalloc.stop()
+
+    def test_payload_is_passed_to_runner_as_bytes(self):
+        payload = self._payload(PAYLOAD_SIZE)
+
+        response = self.client.post(INVOKE_PATH, data=payload)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.data), {"size": PAYLOAD_SIZE})
+        [event] = self.lambda_runner.events
+        self.assertIsInstance(event, bytes)
+        self.assertEqual(event, payload)
+
+    def test_large_payload_memory(self):
+        peak = self._peak_memory(self._payload(PAYLOAD_SIZE), requests=5)
+
+        # the request body, its text while validated and the data value parsed from it, without any further copy
+        self.assertLess(peak, 3.5 * PAYLOAD_SIZE)
+
+    def test_payload_larger_than_limit_is_rejected_before_being_read(self):
+        response = self.client.post(
+            INVOKE_PATH,
+            input_stream=UnreadableStream(),
+            environ_overrides={"CONTENT_LENGTH": str(LocalLambdaInvokeService.MAX_REQUEST_PAYLOAD_SIZE + 1)},
+        )
+
+        self.assertEqual(response.status_code, 413)
+        self.assertEqual(response.headers["x-amzn-errortype"], "RequestTooLarge")
+        self.assertEqual(
+            json.loads(response.data)["Message"],
+            "Request must be smaller than 6291456 bytes for the InvokeFunction operation",
+        )
+        self.assertEqual(self.lambda_runner.events, [])
+
+    def test_payload_of_limit_size_is_accepted(self):
+        payload = self._payload(LocalLambdaInvokeService.MAX_REQUEST_PAYLOAD_SIZE)
+
+        response = self.client.post(INVOKE_PATH, data=payload)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.lambda_runner.events, [payload])
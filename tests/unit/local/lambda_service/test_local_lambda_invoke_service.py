@@ -31,6 +31,7 @@ class TestLocalLambdaService(TestCase):
         app_mock = Mock()
         flask_mock.return_value = app_mock
         app_mock.url_map.converters = {}
+        app_mock.config = {}
 
         error_handling_mock.return_value = Mock()
 
@@ -47,6 +48,7 @@ class TestLocalLambdaService(TestCase):
             provide_automatic_options=False,
         )
         self.assertEqual({"function_path": FunctionNamePathConverter}, app_mock.url_map.converters)
+        self.assertEqual({"MAX_CONTENT_LENGTH": 6291456}, app_mock.config)
 
     @patch("samcli.local.lambda_service.local_lambda_invoke_service.LocalLambdaInvokeService.service_response")
     @patch("samcli.local.lambda_service.local_lambda_invoke_service.LambdaOutputParser")
@@ -66,7 +68,7 @@ class TestLocalLambdaService(TestCase):
 
         self.assertEqual(response, "request response")
 
-        lambda_runner_mock.invoke.assert_called_once_with("HelloWorld", "{}", stdout=ANY, stderr=None)
+        lambda_runner_mock.invoke.assert_called_once_with("HelloWorld", b"{}", stdout=ANY, stderr=None)
         service_response_mock.assert_called_once_with("hello world", {"Content-Type": "application/json"}, 200)
 
     @patch("samcli.local.lambda_service.local_lambda_invoke_service.LambdaErrorResponses")
@@ -86,7 +88,7 @@ class TestLocalLambdaService(TestCase):
 
         self.assertEqual(response, "Couldn't find Lambda")
 
-        lambda_runner_mock.invoke.assert_called_once_with("NotFound", "{}", stdout=ANY, stderr=None)
+        lambda_runner_mock.invoke.assert_called_once_with("NotFound", b"{}", stdout=ANY, stderr=None)
 
         lambda_error_responses_mock.resource_not_found.assert_called_once_with("NotFound")
 
@@ -107,7 +109,7 @@ class TestLocalLambdaService(TestCase):
 
         self.assertEqual(response, "Inline code is not supported")
 
-        lambda_runner_mock.invoke.assert_called_once_with("FunctionWithInlineCode", "{}", stdout=ANY, stderr=None)
+        lambda_runner_mock.invoke.assert_called_once_with("FunctionWithInlineCode", b"{}", stdout=ANY, stderr=None)
 
         lambda_error_responses_mock.not_implemented_locally.assert_called()
 
@@ -150,9 +152,18 @@ class TestLocalLambdaService(TestCase):
                 call(500, lambda_error_response_mock.generic_service_exception),
                 call(404, lambda_error_response_mock.generic_path_not_found),
                 call(405, lambda_error_response_mock.generic_method_not_allowed),
+                call(413, service._request_too_large),
             ]
         )
 
+    @patch("samcli.local.lambda_service.local_lambda_invoke_service.LambdaErrorResponses")
+    def test_request_too_large(self, lambda_error_response_mock):
+        lambda_error_response_mock.request_too_large.return_value = "RequestTooLarge"
+        service = LocalLambdaInvokeService(lambda_runner=Mock(), port=3000, host="localhost")
+
+        self.assertEqual(service._request_too_large(Mock()), "RequestTooLarge")
+        lambda_error_response_mock.request_too_large.assert_called_once_with(6291456)
+
     @patch("samcli.local.lambda_service.local_lambda_invoke_service.LocalLambdaInvokeService.service_response")
     @patch("samcli.local.lambda_service.local_lambda_invoke_service.LambdaOutputParser")
     def test_invoke_request_handler_with_lambda_that_errors(self, lambda_output_parser_mock, service_response_mock):
@@ -169,7 +180,7 @@ class TestLocalLambdaService(TestCase):
 
         self.assertEqual(response, "request response")
 
-        lambda_runner_mock.invoke.assert_called_once_with("HelloWorld", "{}", stdout=ANY, stderr=None)
+        lambda_runner_mock.invoke.assert_called_once_with("HelloWorld", b"{}", stdout=ANY, stderr=None)
         service_response_mock.assert_called_once_with(
             "hello world", {"Content-Type": "application/json", "x-amz-function-error": "Unhandled"}, 200
         )
@@ -191,10 +202,80 @@ class TestLocalLambdaService(TestCase):
 
         self.assertEqual(response, "request response")
 
-        lambda_runner_mock.invoke.assert_called_once_with("HelloWorld", "{}", stdout=ANY, stderr=None)
+        lambda_runner_mock.invoke.assert_called_once_with("HelloWorld", b"{}", stdout=ANY, stderr=None)
         service_response_mock.assert_called_once_with("hello world", {"Content-Type": "application/json"}, 200)
 
 
+class TestEventInvokeRequestHandling(TestCase):
+    def setUp(self):
+        request_mock = Mock()
+        request_mock.get_data.return_value = b'{"key": "value"}'
+        request_mock.headers = {"X-Amz-Invocation-Type": "Event"}
+        local_lambda_invoke_service.request = request_mock
+
+        self.function = Mock(inlinecode=None)
+        self.lambda_runner_mock = Mock()
+        self.lambda_runner_mock.provider.get.return_value = self.function
+        self.event_invoker_mock = Mock()
+        self.service = LocalLambdaInvokeService(
+            lambda_runner=self.lambda_runner_mock, port=3000, host="localhost", event_invoker=self.event_invoker_mock
+        )
+
+    @patch("samcli.local.lambda_service.local_lambda_invoke_service.LocalLambdaInvokeService.service_response")
+    def test_must_queue_event(self, service_response_mock):
+        self.event_invoker_mock.submit.return_value = "request-id"
+        service_response_mock.return_value = "accepted"
+
+        response = self.service._invoke_request_handler(function_name="HelloWorld")
+
+        self.assertEqual(response, "accepted")
+        self.lambda_runner_mock.provider.get.assert_called_once_with("HelloWorld")
+        self.event_invoker_mock.submit.assert_called_once_with(self.function, b'{"key": "value"}')
+        self.lambda_runner_mock.invoke.assert_not_called()
+        service_response_mock.assert_called_once_with("", {"X-Amzn-RequestId": "request-id"}, 202)
+
+    @patch("samcli.local.lambda_service.local_lambda_invoke_service.LambdaErrorResponses")
+    def test_must_return_not_found(self, lambda_error_responses_mock):
+        self.lambda_runner_mock.provider.get.return_value = None
+        lambda_error_responses_mock.resource_not_found.return_value = "Couldn't find Lambda"
+
+        response = self.service._invoke_request_handler(function_name="NotFound")
+
+        self.assertEqual(response, "Couldn't find Lambda")
+        lambda_error_responses_mock.resource_not_found.assert_called_once_with("NotFound")
+        self.event_invoker_mock.submit.assert_not_called()
+
+    @patch("samcli.local.lambda_service.local_lambda_invoke_service.LambdaErrorResponses")
+    def test_must_reject_inline_code(self, lambda_error_responses_mock):
+        self.function.inlinecode = "exports.handler = async () => {}"
+        lambda_error_responses_mock.not_implemented_locally.return_value = "Inline code is not supported"
+
+        response = self.service._invoke_request_handler(function_name="FunctionWithInlineCode")
+
+        self.assertEqual(response, "Inline code is not supported")
+        self.event_invoker_mock.submit.assert_not_called()
+
+    @patch("samcli.local.lambda_service.local_lambda_invoke_service.LambdaErrorResponses")
+    def test_must_throttle_when_queue_is_full(self, lambda_error_responses_mock):
+        self.event_invoker_mock.submit.return_value = None
+        lambda_error_responses_mock.too_many_requests.return_value = "Throttled"
+
+        response = self.service._invoke_request_handler(function_name="HelloWorld")
+
+        self.assertEqual(response, "Throttled")
+        lambda_error_responses_mock.too_many_requests.assert_called_once()
+
+    @patch("samcli.local.lambda_service.local_lambda_invoke_service.LambdaErrorResponses")
+    def test_must_not_support_event_without_event_invoker(self, lambda_error_responses_mock):
+        lambda_error_responses_mock.not_implemented_locally.return_value = "NotImplementedLocally"
+        service = LocalLambdaInvokeService(lambda_runner=self.lambda_runner_mock, port=3000, host="localhost")
+
+        response = service._invoke_request_handler(function_name="HelloWorld")
+
+        self.assertEqual(response, "NotImplementedLocally")
+        self.lambda_runner_mock.invoke.assert_not_called()
+
+
 class TestValidateRequestHandling(TestCase):
     @patch("samcli.local.lambda_service.local_lambda_invoke_service.LambdaErrorResponses")
     def test_request_with_non_json_data(self, lambda_error_responses_mock):
@@ -215,6 +296,19 @@ class TestValidateRequestHandling(TestCase):
 
         lambda_error_responses_mock.invalid_request_content.assert_called_once_with(expected_called_with)
 
+    @patch("samcli.local.lambda_service.local_lambda_invoke_service.LambdaErrorResponses")
+    def test_request_with_non_utf8_data(self, lambda_error_responses_mock):
+        flask_request = Mock()
+        flask_request.get_data.return_value = '{"key": "välue"}'.encode("latin-1")
+        flask_request.args = {}
+        local_lambda_invoke_service.request = flask_request
+
+        lambda_error_responses_mock.invalid_request_content.return_value = "InvalidRequestContent"
+
+        response = LocalLambdaInvokeService.validate_request()
+
+        self.assertEqual(response, "InvalidRequestContent")
+
     @patch("samcli.local.lambda_service.local_lambda_invoke_service.LambdaErrorResponses")
     def test_request_with_query_strings(self, lambda_error_responses_mock):
         flask_request = Mock()
@@ -269,9 +363,18 @@ class TestValidateRequestHandling(TestCase):
         self.assertEqual(response, "NotImplementedLocally")
 
         lambda_error_responses_mock.not_implemented_locally.assert_called_once_with(
-            "invocation-type: DryRun is not supported. RequestResponse is only supported."
+            "invocation-type: DryRun is not supported. RequestResponse and Event are only supported."
         )
 
+    def test_request_invocation_type_Event(self):
+        flask_request = Mock()
+        flask_request.get_data.return_value = None
+        flask_request.headers = {"X-Amz-Invocation-Type": "Event"}
+        flask_request.args = {}
+        local_lambda_invoke_service.request = flask_request
+
+        self.assertIsNone(LocalLambdaInvokeService.validate_request())
+
     @patch("samcli.local.lambda_service.local_lambda_invoke_service.request")
     def test_request_with_no_data(self, flask_request):
         flask_request.get_data.return_value = None
@@ -11,6 +11,8 @@ from samcli.lib.providers.provider import LayerVersion
 from samcli.local.lambdafn.env_vars import EnvironmentVariables
 from samcli.local.lambdafn.runtime import LambdaRuntime, _unzip_file, WarmLambdaRuntime, _require_container_reloading
 from samcli.local.lambdafn.config import FunctionConfig
+from samcli.local.docker.exceptions import ContainerFailureError
+from samcli.commands.local.lib.debug_context import DebugContext
 
 
 class LambdaRuntime_create(TestCase):
@@ -465,6 +467,64 @@ class LambdaRuntime_invoke(TestCase):
         # Finally block must be called
         self.manager_mock.stop.assert_called_with(container)
 
+    @patch("samcli.local.lambdafn.runtime.LambdaContainer")
+    def test_must_reap_container_with_container_reaper(self, LambdaContainerMock):
+        container = Mock()
+        container_reaper = Mock()
+
+        self.runtime = LambdaRuntime(self.manager_mock, Mock(), container_reaper)
+        self.runtime._get_code_dir = MagicMock()
+        self.runtime._configure_interrupt = Mock()
+        self.runtime._check_exit_state = Mock()
+        self.runtime._clean_decompressed_paths = Mock()
+
+        LambdaContainerMock.return_value = container
+        container.is_running.return_value = False
+
+        self.runtime.invoke(self.func_config, "event")
+
+        container.wait_for_result.assert_called_once()
+        container_reaper.reap.assert_called_once_with(container)
+        self.manager_mock.stop.assert_not_called()
+        self.runtime._clean_decompressed_paths.assert_called_once_with()
+
+    @patch("samcli.local.lambdafn.runtime.LambdaContainer")
+    def test_must_stop_debugged_container_before_returning(self, LambdaContainerMock):
+        container = Mock()
+        container_reaper = Mock()
+        debug_context = DebugContext(debug_ports=(5858,))
+
+        self.runtime = LambdaRuntime(self.manager_mock, Mock(), container_reaper)
+        self.runtime._get_code_dir = MagicMock()
+        self.runtime._configure_interrupt = Mock()
+        self.runtime._check_exit_state = Mock()
+
+        LambdaContainerMock.return_value = container
+        container.is_running.return_value = False
+
+        self.runtime.invoke(self.func_config, "event", debug_context=debug_context)
+
+        # the next invoke binds the same debug port
+        self.manager_mock.stop.assert_called_once_with(container)
+        container_reaper.reap.assert_not_called()
+
+    @patch("samcli.local.lambdafn.runtime.LambdaContainer")
+    def test_must_stop_container_out_of_memory(self, LambdaContainerMock):
+        container = Mock()
+
+        self.runtime = LambdaRuntime(self.manager_mock, Mock())
+        self.runtime._get_code_dir = MagicMock()
+        self.runtime._configure_interrupt = Mock()
+        self.runtime._check_exit_state = Mock(side_effect=ContainerFailureError("out of memory"))
+
+        LambdaContainerMock.return_value = container
+        container.is_running.return_value = False
+
+        with self.assertRaises(ContainerFailureError):
+            self.runtime.invoke(self.func_config, "event")
+
+        self.manager_mock.stop.assert_called_with(container)
+
 
 class TestLambdaRuntime_configure_interrupt(TestCase):
     def setUp(self):
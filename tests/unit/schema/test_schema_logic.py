@@ -89,6 +89,9 @@ class TestSchemaLogic(TestCase):
             ("string", "string"),
             ("integer", "integer"),
             ("number", "number"),
+            ("integer range", "integer"),
+            ("float", "number"),
+            ("float range", "number"),
             ("text", "string"),
             ("path", "string"),
             ("choice", "string"),
@@ -180,12 +183,14 @@ class TestSchemaLogic(TestCase):
     @patch("schema.make_schema.isinstance")
     def test_command_structure_is_retrieved_from_group_cli(self, isinstance_mock, get_params_mock, import_mock):
         mock_module = self._setup_mock_module()
-        mock_module.cli.commands = {}
+        subcommands = {}
         for i in range(2):
             mock_subcommand = MagicMock()
             mock_subcommand.name = f"subcommand{i}"
             mock_subcommand.help = "help text"
-            mock_module.cli.commands.update({f"subcommand{i}": mock_subcommand})
+            subcommands.update({f"subcommand{i}": mock_subcommand})
+        mock_module.cli.list_commands.side_effect = lambda ctx: list(subcommands)
+        mock_module.cli.get_command.side_effect = lambda ctx, name: subcommands[name]
         import_mock.side_effect = lambda _: mock_module
         get_params_mock.return_value = []
 
@@ -12,10 +12,11 @@
 # language governing permissions and limitations under the License.
 import json
 
+import yaml
 from botocore.compat import OrderedDict
 
 from unittest import TestCase
-from samcli.yamlhelper import yaml_parse, yaml_dump
+from samcli.yamlhelper import CfnLoader, yaml_parse, yaml_dump
 
 
 class TestYaml(TestCase):
@@ -183,3 +184,16 @@ class TestYaml(TestCase):
         # Raises a `TypeError` if an unquoted `AWSTemplateFormatVersion` value has been parsed to a
         # `datetime` object and not a string by `yaml_parse` when using `--use-json` argument.
         json.dumps(output)
+
+    def test_parse_does_not_register_constructors_globally(self):
+        yaml_parse(self.yaml_with_tags)
+
+        self.assertNotIn("!", yaml.SafeLoader.yaml_multi_constructors)
+        with self.assertRaises(yaml.constructor.ConstructorError):
+            yaml.safe_load("Key: !Ref Something")
+
+    def test_loader_uses_libyaml_when_available(self):
+        if yaml.__with_libyaml__:
+            self.assertTrue(issubclass(CfnLoader, yaml.CSafeLoader))
+        else:
+            self.assertTrue(issubclass(CfnLoader, yaml.SafeLoader))